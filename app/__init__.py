@@ -6,15 +6,35 @@ It imports data based on a user email address, then analyzes and displays it.
 Code by Zach Wahrer [github.com/zachtheclimber]
 and BenfromEarth [github.com/benjpalmer].
 """
-from flask import Flask, redirect, render_template, request
+import hashlib
+import time
 
+from flask import Flask, Response, abort, g, jsonify, redirect, render_template, request
+
+from .api import api
 from .config import *
 from .errors.error_handlers import errors
 from .errors.exeptions import UnprocessableEntityException
 from .forms.email_form import MPVEmailForm
-from .graphing import height_climbed, pitches_climbed, grade_scatter, get_types
-from .helpers.database_connection import db_close, db_connect, db_load
-from .helpers.mountain_project import MountainProjectHandler
+from .helpers.database_connection import pool_stats
+from .helpers.single_flight import single_flight
+from .helpers.storage import REFERENCE_VALUES
+from .helpers.metrics import collect, metrics, metrics_directory, render, request_timings, request_totals, \
+    server_timing, start_request, timed
+from .jobs import DONE, FAILED, get_job_queue, job_error
+
+
+def build_report(config, email, units, tick_filter=None, progress=None):
+    """Run the /data pipeline, importing pandas and Bokeh the first time.
+
+    Concurrent requests for one email, in any worker, share a single run.
+    """
+    from .pipeline import build_report
+    variant = "report:" + units
+    if tick_filter:
+        variant += ":" + tick_filter.key
+    return single_flight(config, email.strip().lower(), build_report, config, email, units,
+                         tick_filter, progress, variant=variant)
 
 
 def create_app(test_config=None):
@@ -22,6 +42,7 @@ def create_app(test_config=None):
     app = Flask(__name__)
     # Initialize error handlers.
     app.register_blueprint(errors)
+    app.register_blueprint(api)
 
     # If we are in testing env, load the test config.
     if test_config:
@@ -29,11 +50,47 @@ def create_app(test_config=None):
     else:
         app.config.from_object('app.config')
 
+    @app.before_request
+    def start_timing():
+        g.start = time.perf_counter()
+        start_request()
+
+    @app.after_request
+    def record_timing(response):
+        """Add the stage timings to the response and the worker's metrics."""
+        if "start" not in g:
+            return response
+        timings = request_timings()
+        if timings:
+            response.headers["Server-Timing"] = server_timing(timings)
+        endpoint = request.url_rule.rule if request.url_rule else "unmatched"
+        metrics.observe("mpv_request_seconds", time.perf_counter() - g.start, endpoint=endpoint)
+        metrics.inc("mpv_requests_total", endpoint=endpoint, status=str(response.status_code))
+        if endpoint == "/data":
+            queries, downloaded = request_totals()
+            metrics.observe("mpv_request_db_queries", queries)
+            metrics.observe("mpv_request_download_bytes", downloaded)
+        metrics.flush(metrics_directory(app.config))
+        return response
+
+    @app.route("/metrics")
+    def metrics_export():
+        """Export every worker's metrics in the Prometheus text format."""
+        metrics.flush(metrics_directory(app.config))
+        return Response(render(collect(metrics_directory(app.config))),
+                        mimetype="text/plain; version=0.0.4")
+
     @app.route("/", methods=["GET", "POST"])
     def index():
         """Display user input page."""
         form = MPVEmailForm()
-        return render_template("index.html", form=form)
+        return render_template("index.html", form=form, types=REFERENCE_VALUES["type"],
+                               styles=REFERENCE_VALUES["style"])
+
+    @app.route("/status/pool")
+    def pool_status():
+        """Report connection pool usage for the worker serving the request."""
+        return jsonify(pools=pool_stats())
 
     @app.route("/data", methods=["GET", "POST"])
     def data():
@@ -42,6 +99,8 @@ def create_app(test_config=None):
         if request.method == "POST":
             # Check for test link click from input page
             if request.form.get("test") == "yes":
+                if not form.validate_filters():
+                    raise UnprocessableEntityException
                 email = app.config["TEST_ACCT"]
                 units = "feet"
             elif form.validate():
@@ -49,50 +108,43 @@ def create_app(test_config=None):
                 units = form.units.data
             else:
                 raise UnprocessableEntityException
-
-            dev_env = app.config.get("MPV_DEV")
-
-            api = MountainProjectHandler(
-                api_key=app.config.get("MP_KEY"),
-                email=email,
-                dev_env=dev_env
-            )
-            api.fetch_user()
-            user_data = api.parse_user_data(dev_env=dev_env)
-            mp_user_id = user_data.get("mp_id")
-
-            api.fetch_tick_list()
-            csv = api.parse_tick_list(dev_env=dev_env)
-
-            if not dev_env:
-                db_load(mp_user_id, csv.get("data"), config=app.config)
-
-            connection = db_connect(config=app.config)
-            cursor = connection.cursor()
-
-            # Generate the stats and draw graph
-            height = height_climbed(cursor, mp_user_id, units)
-            pitches = pitches_climbed(cursor, mp_user_id)
-            grade_scatters = []
-            for t in get_types(cursor, mp_user_id):
-                reply = grade_scatter(cursor, mp_user_id, t)
-                # Check for empty returns
-                if reply:
-                    grade_scatters.append(reply)
-
-            db_close(cursor, connection)
-
-            return render_template("data.html",
-                                   username=user_data.get("name"),
-                                   total_height=height['total'],
-                                   units=units,
-                                   height=height['plot'],
-                                   total_pitches=pitches['total'],
-                                   pitches=pitches['plot'],
-                                   scatters=grade_scatters)
+            tick_filter = form.tick_filter()
+
+            if app.config.get("JOB_MODE"):
+                # Queue the work and let the browser poll for the page. Only a
+                # hash of the email is written to the job database.
+                email_hash = hashlib.sha1(email.strip().lower().encode("utf-8")).hexdigest()
+                key = "%s:%s:%s" % (email_hash, units, tick_filter.key)
+                job_id = get_job_queue(app.config).submit(
+                    key, build_report, app.config, email, units, tick_filter)
+                return redirect("/data?job=" + job_id, code=303)
+
+            report = build_report(app.config, email, units, tick_filter)
+            with timed("render_template"):
+                return render_template("data.html", **report)
+
+        # Show a queued job's page, or its progress until it is done
+        elif request.args.get("job"):
+            job = get_job_queue(app.config).store.get(request.args["job"])
+            if job is None:
+                abort(404)
+            if job["status"] == DONE:
+                with timed("render_template"):
+                    return render_template("data.html", **job["result"])
+            if job["status"] == FAILED:
+                raise job_error(job)
+            return render_template("pending.html", stage=job["stage"])
 
         # Send them back to the index if they try to GET
         else:
             return redirect('/')
 
+    @app.route("/status/job/<job_id>")
+    def job_status(job_id):
+        """Report a queued job's status and current stage."""
+        job = get_job_queue(app.config).store.get(job_id)
+        if job is None:
+            abort(404)
+        return jsonify(status=job["status"], stage=job["stage"])
+
     return app
@@ -0,0 +1,244 @@
+"""Tick list statistics computed in-process from the parsed export.
+
+These functions produce the same yearly totals and grade data as the SQL
+queries in `app.graphing`, straight from the tick list DataFrame, so the
+graphs can be drawn without a round trip through MySQL.
+"""
+
+import os
+from typing import Dict, List, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from ..helpers.storage import tick_types
+from ..helpers.tick_batch import NO_HEIGHT, TickBatch, parse_dates
+from ..helpers.tick_filter import TickFilter
+
+
+# Height in feet assumed for ticks that don't list one
+DEFAULT_HEIGHTS = {"Aid": 75, "Boulder": 8, "Ice": 100, "Mixed": 100,
+                   "Snow": 200, "Sport": 75, "TR": 50, "Trad": 150}
+
+_GRADE_CODES = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                            "setup", "grade_codes.csv")
+# Mountain Project's stand-in for a tick without a date
+_NULL_YEAR = 1969
+
+_EMPTY_TICKS = pd.DataFrame(columns=["Date", "Route", "Pitches", "Style", "Lead Style",
+                                     "Route Type", "Length", "Rating Code"])
+
+_codes = None
+
+
+def get_codes() -> pd.Series:
+    """Get the grade labels indexed by code id, loaded once per process."""
+    global _codes
+    if _codes is None:
+        codes = pd.read_csv(_GRADE_CODES, header=None, names=["id", "code"],
+                            index_col="id", dtype={"code": str})
+        _codes = codes["code"].sort_index()
+    return _codes
+
+
+def prepare_ticks(df: pd.DataFrame) -> pd.DataFrame:
+    """Clean the parsed tick export into year, type, types, pitches, height and code columns.
+
+    Blank values get the same fix-ups db_load applies, and ticks with a date
+    that won't parse are dropped like TickBatch drops them. `type` is a
+    route's first listed type, which the yearly totals count it as, and
+    `types` all of its types, which the grade histogram counts it under.
+    """
+    dates, valid = parse_dates(df["Date"])
+    if not valid.all():
+        df, dates = df[valid], dates[valid]
+    years = dates.dt.year.fillna(_NULL_YEAR)
+
+    route_types = df["Route Type"].astype(str)
+    types = route_types.str.split(",").str[0].str.strip()
+    types = types.where(types != "", "Blank")
+    route_type, categories = route_types.factorize(sort=False)
+
+    pitches = pd.to_numeric(df["Pitches"], errors="coerce")
+    pitches = pitches.where(pitches > 0, 1)
+
+    return pd.DataFrame({
+        "year": years.astype(int),
+        "type": types,
+        "types": type_lists(categories)[route_type] if len(df) else np.array([], dtype=object),
+        "pitches": pitches.astype(int),
+        "height": pd.to_numeric(df["Length"], errors="coerce"),
+        "code": pd.to_numeric(df["Rating Code"], errors="coerce").fillna(0).astype(int),
+    })
+
+
+def batch_ticks(batch: TickBatch) -> pd.DataFrame:
+    """Build the prepare_ticks() columns straight from a TickBatch's arrays."""
+    first_types = np.array([value.split(",")[0].strip() or "Blank"
+                            for value in batch.route_types], dtype=object)
+    heights = batch.heights.astype(float)
+    heights[batch.heights == NO_HEIGHT] = np.nan
+    return pd.DataFrame({
+        "year": batch.years().astype(int),
+        "type": first_types[batch.route_type] if len(batch) else np.array([], dtype=object),
+        "types": (type_lists(batch.route_types)[batch.route_type] if len(batch)
+                  else np.array([], dtype=object)),
+        "pitches": np.where(batch.pitches > 0, batch.pitches, 1).astype(int),
+        "height": heights,
+        "code": batch.codes.astype(int),
+    })
+
+
+def type_lists(route_types: Sequence[str]) -> np.ndarray:
+    """Get tick_types() for each distinct route type, as an array to index with category codes."""
+    lists = np.empty(len(route_types), dtype=object)
+    for i, route_type in enumerate(route_types):
+        lists[i] = tick_types(route_type)
+    return lists
+
+
+def year_stats(ticks: pd.DataFrame) -> Dict:
+    """Get height, pitch, route and problem totals for every active year.
+
+    Matches the dictionary returned by `app.graphing.get_year_stats`.
+    """
+    return format_year_totals(year_totals(ticks))
+
+
+def year_totals(ticks: pd.DataFrame) -> pd.DataFrame:
+    """Sum height, pitches, routes, problems and all pitches per year."""
+    boulder = ticks["type"] == "Boulder"
+    height = ticks["height"].fillna(ticks["type"].map(DEFAULT_HEIGHTS)).fillna(0)
+    return pd.DataFrame({
+        "year": ticks["year"],
+        "height": height,
+        "pitches": ticks["pitches"].where(~boulder, 0),
+        "routes": (~boulder).astype(int),
+        "problems": ticks["pitches"].where(boulder, 0),
+        "all_pitches": ticks["pitches"],
+    }).groupby("year").sum()
+
+
+def format_year_totals(totals: pd.DataFrame) -> Dict:
+    """Turn summed yearly totals into the year stats dictionary."""
+    totals = totals.sort_index()
+    return {"years": totals.index.tolist(),
+            "height": totals["height"].astype(int).tolist(),
+            "pitches": totals["pitches"].astype(int).tolist(),
+            "routes": totals["routes"].astype(int).tolist(),
+            "problems": totals["problems"].astype(int).tolist(),
+            "total_pitches": int(totals["all_pitches"].sum())}
+
+
+def grade_histogram(ticks: pd.DataFrame) -> pd.DataFrame:
+    """Count ticks per type, year and grade code.
+
+    Codes that aren't in the grade table are dropped, like the SQL join does,
+    and a multi-type tick counts once under each of its types.
+    """
+    known = ticks[ticks["code"].isin(get_codes().index)]
+    known = (known[["types", "year", "code"]].rename(columns={"types": "type"})
+             .explode("type").dropna(subset=["type"]))
+    return (known.groupby(["type", "year", "code"], sort=False)
+                 .size().rename("count").reset_index())
+
+
+def grade_stats(histogram: pd.DataFrame, codes: pd.Series = None) -> Dict[str, Dict]:
+    """Get the grade scatter data for every type in a grade histogram.
+
+    Each value matches the dictionary returned by `app.graphing.get_grade_data`.
+    `codes` are the grade labels indexed by sorted code id, from grade_codes.csv
+    by default.
+    """
+    if codes is None:
+        codes = get_codes()
+    stats = dict()
+    for type, rows in histogram.groupby("type", sort=False):
+        rows = rows.sort_values(["year", "code"])
+        modes = mode_codes(rows)
+        medians = median_codes(rows)
+        stats[type] = {
+            "axis": codes.loc[np.sort(rows["code"].unique())].tolist(),
+            "years": np.repeat(rows["year"].values, rows["count"].values).tolist(),
+            "grades": codes.loc[np.repeat(rows["code"].values, rows["count"].values)].tolist(),
+            "mode_years": modes.index.tolist(),
+            "mode_values": nearest_codes(modes.values, codes),
+            "mean_years": medians.index.tolist(),
+            "mean_values": nearest_codes(medians.values, codes),
+        }
+    return stats
+
+
+class TickSummary:
+    """Running yearly totals and grade histogram over a tick list parsed in chunks.
+
+    Only the per-chunk aggregates are kept, so memory use depends on the
+    number of years, types and grades rather than the number of ticks.
+    """
+
+    def __init__(self, tick_filter: TickFilter = None):
+        self.tick_filter = tick_filter
+        self._totals = None
+        self._histogram = None
+
+    def add(self, chunk: Union[TickBatch, pd.DataFrame]) -> None:
+        """Fold a TickBatch, or a chunk of the raw tick export, into the running aggregates.
+
+        With a tick filter, only the ticks it keeps are folded in.
+        """
+        if self.tick_filter:
+            if not isinstance(chunk, TickBatch):
+                chunk = TickBatch.from_frame(chunk)
+            chunk = chunk.select(self.tick_filter.batch_mask(chunk))
+        ticks = batch_ticks(chunk) if isinstance(chunk, TickBatch) else prepare_ticks(chunk)
+        totals = year_totals(ticks)
+        histogram = grade_histogram(ticks)
+        if self._totals is not None:
+            totals = pd.concat([self._totals, totals]).groupby(level=0).sum()
+            histogram = (pd.concat([self._histogram, histogram])
+                         .groupby(["type", "year", "code"], sort=False)["count"]
+                         .sum().reset_index())
+        self._totals = totals
+        self._histogram = histogram
+
+    def year_stats(self) -> Dict:
+        """Get the year stats for every chunk added so far."""
+        if self._totals is None:
+            return format_year_totals(year_totals(prepare_ticks(_EMPTY_TICKS)))
+        return format_year_totals(self._totals)
+
+    def grade_stats(self) -> Dict[str, Dict]:
+        """Get the grade scatter data for every chunk added so far."""
+        if self._histogram is None:
+            return dict()
+        stats = grade_stats(self._histogram)
+        return self.tick_filter.select_types(stats) if self.tick_filter else stats
+
+
+def mode_codes(rows: pd.DataFrame) -> pd.Series:
+    """Get the most ticked code per year, taking the lowest code on a tie."""
+    ranked = rows.sort_values(["year", "count", "code"],
+                              ascending=[True, False, True])
+    return ranked.drop_duplicates("year").set_index("year")["code"]
+
+
+def median_codes(rows: pd.DataFrame) -> pd.Series:
+    """Get the median code per year from sorted per-code tick counts."""
+    cumulative = rows.groupby("year")["count"].cumsum()
+    totals = rows.groupby("year")["count"].transform("sum")
+    # The middle tick for odd counts, the two middle ticks for even counts
+    low = rows[cumulative >= (totals + 1) // 2].groupby("year")["code"].first()
+    high = rows[cumulative >= totals // 2 + 1].groupby("year")["code"].first()
+    return (low + high) / 2
+
+
+def nearest_codes(values: np.ndarray, codes: pd.Series = None) -> List[str]:
+    """Map code ids, or values between them, to the closest grade label."""
+    if codes is None:
+        codes = get_codes()
+    ids = codes.index.values
+    right = np.clip(np.searchsorted(ids, values), 0, len(ids) - 1)
+    left = np.clip(right - 1, 0, len(ids) - 1)
+    nearest = np.where(np.abs(values - ids[left]) <= np.abs(ids[right] - values),
+                       left, right)
+    return codes.iloc[nearest].tolist()
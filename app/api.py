@@ -0,0 +1,140 @@
+"""The JSON stats API, for clients that draw their own graphs.
+
+`/api/stats` returns the same aggregates the graph page is drawn from, in a
+column-oriented layout: every series is one list, and the grade ticks are a
+histogram of (year, grade, count) columns instead of one entry per tick.
+Responses carry an ETag and are gzipped when the client accepts it. The
+email is posted in the body, like /data, so it stays out of access logs.
+"""
+
+import gzip
+import hashlib
+import json
+from collections import Counter
+from typing import Dict
+
+from flask import Blueprint, Response, current_app, jsonify, request
+from werkzeug.exceptions import HTTPException
+
+from .errors.exeptions import UnprocessableEntityException
+from .forms.email_form import MPVEmailForm
+from .helpers.metrics import timed
+from .helpers.single_flight import single_flight
+from .helpers.tick_filter import TickFilter
+
+
+# Bumped when the payload layout changes
+API_VERSION = 1
+
+api = Blueprint('api', __name__)
+
+
+def build_stats(config: Dict, email: str, tick_filter: TickFilter = None) -> Dict:
+    # The pipeline pulls in pandas and Bokeh, so it is imported on first use
+    from .pipeline import build_stats
+    variant = "stats"
+    if tick_filter:
+        variant += ":" + tick_filter.key
+    return single_flight(config, email.strip().lower(), build_stats, config, email, tick_filter,
+                         variant=variant)
+
+
+def year_columns(year_stats: Dict, units: str) -> Dict:
+    """Get the yearly totals as columns, with heights in the requested units."""
+    height = list(year_stats["height"])
+    if units == "meters":
+        height = [int(value / 3.28) for value in height]
+    return {"year": list(year_stats["years"]), "height": height,
+            "pitches": list(year_stats["pitches"]), "routes": list(year_stats["routes"]),
+            "problems": list(year_stats["problems"])}
+
+
+def grade_columns(data: Dict) -> Dict:
+    """Fold one type's per-tick grade lists into a histogram over its axis.
+
+    `grade` holds indexes into `axis`. The mode and median series keep their
+    labels, since the nearest grade to a median may not be on the axis.
+    """
+    axis = list(data["axis"])
+    index = {label: i for i, label in reversed(list(enumerate(axis)))}
+    counts = Counter(zip(data["years"], (index[label] for label in data["grades"])))
+    cells = sorted(counts.items())
+    return {"axis": axis,
+            "year": [year for (year, grade), count in cells],
+            "grade": [grade for (year, grade), count in cells],
+            "count": [count for cell, count in cells],
+            "mode": {"year": list(data["mode_years"]), "grade": list(data["mode_values"])},
+            "median": {"year": list(data["mean_years"]), "grade": list(data["mean_values"])}}
+
+
+def filter_columns(tick_filter: TickFilter) -> Dict:
+    """Echo the filters a response covers, None for each one not set."""
+    return {"start": tick_filter.start.isoformat() if tick_filter.start else None,
+            "end": tick_filter.end.isoformat() if tick_filter.end else None,
+            "type": tick_filter.type, "style": tick_filter.style}
+
+
+def stats_payload(stats: Dict, units: str, tick_filter: TickFilter = None) -> Dict:
+    # The total is converted once, like the page does, not summed from rounded years
+    total_height = sum(stats["year_stats"]["height"])
+    if units == "meters":
+        total_height = int(total_height / 3.28)
+    return {"version": API_VERSION, "user": stats["username"], "units": units,
+            "filter": filter_columns(tick_filter or TickFilter()),
+            "years": year_columns(stats["year_stats"], units), "total_height": total_height,
+            "total_pitches": stats["year_stats"]["total_pitches"],
+            "grades": {type: grade_columns(data) for type, data in stats["grade_data"].items()}}
+
+
+def json_response(payload: Dict) -> Response:
+    """Serialize compactly, then add the ETag, caching and compression headers."""
+    config = current_app.config
+    body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    etag = hashlib.sha1(body).hexdigest()
+
+    response = Response(body, mimetype="application/json")
+    response.headers["Cache-Control"] = "private, max-age=%d" % (config.get("API_MAX_AGE", 300),)
+    response.vary.add("Accept-Encoding")
+    if (request.accept_encodings["gzip"] and
+            len(body) >= config.get("API_GZIP_MIN_BYTES", 1024)):
+        response.set_data(gzip.compress(body, config.get("API_GZIP_LEVEL", 6)))
+        response.headers["Content-Encoding"] = "gzip"
+        # Each encoding of the body needs its own strong ETag
+        etag += "-gzip"
+    response.set_etag(etag)
+    # Werkzeug only answers If-None-Match on GET and HEAD, and the stats are read with POST
+    if request.if_none_match.contains(etag):
+        not_modified = Response(status=304)
+        for header in ("ETag", "Cache-Control", "Vary"):
+            not_modified.headers[header] = response.headers[header]
+        return not_modified
+    return response
+
+
+@api.route("/api/stats", methods=["POST"])
+def user_stats():
+    """Get a user's yearly totals and grade histograms as columnar JSON.
+
+    Takes the same form fields as /data. `start`, `end`, `type` and `style`
+    narrow the stats like they do there.
+    """
+    form = MPVEmailForm(request.form, meta={"csrf": False})
+    if request.form.get("test") == "yes" and form.validate_filters():
+        email = current_app.config["TEST_ACCT"]
+        units = request.form.get("units", "feet")
+    elif form.validate():
+        email = form.email.data
+        units = form.units.data
+    else:
+        return jsonify(error=UnprocessableEntityException.msg), UnprocessableEntityException.code
+
+    tick_filter = form.tick_filter()
+    try:
+        stats = build_stats(current_app.config, email, tick_filter)
+    except HTTPException as error:
+        headers = dict()
+        if getattr(error, "retry_after", None):
+            headers["Retry-After"] = str(int(error.retry_after))
+        return jsonify(error=getattr(error, "msg", error.description)), error.code, headers
+    with timed("serialize"):
+        return json_response(stats_payload(stats, units, tick_filter))
@@ -0,0 +1,131 @@
+"""Compare row-by-row tick inserts against the batched and incremental db_load paths.
+
+Run from the project root: `python -m app.benchmarks.db_load --rows 20000`.
+Needs the MySQL database from config.py, already set up with db_setup.
+"""
+
+import argparse
+import os
+import time
+from typing import Dict, List
+
+import pandas as pd
+
+from ..config import MYSQL_ADDRESS, MYSQL_PASSWD, MYSQL_TABLE, MYSQL_USER
+from ..helpers.database_connection import (DEFAULT_BATCH_SIZE, db_close,
+                                           db_connect, db_load, keyed_tick,
+                                           normalize_tick)
+
+
+_BENCH_USER = 1
+_TEST_TICKS = os.path.join(os.path.dirname(os.path.dirname(__file__)), "test_ticks.csv")
+_COLUMNS = ["Date", "Route", "Pitches", "Style",
+            "Lead Style", "Route Type", "Length", "Rating Code"]
+
+
+def load_rows(count: int) -> List[List]:
+    """Repeat the test tick list until it has the requested number of rows."""
+    df = pd.read_csv(_TEST_TICKS, usecols=_COLUMNS, na_filter=False)
+    rows = df.values.tolist()
+    repeats = count // len(rows) + 1
+    return (rows * repeats)[:count]
+
+
+def get_pairs(cursor):
+    """Get index/value pair route data identifiers from MySQL tables."""
+    # Set the tables to grab data from
+    tables = ("style", "lead_style", "type")
+    pairs = dict()
+    select = "SELECT * FROM `%s`;"
+    # Loop through each of the tables
+    for i in tables:
+        cursor.execute(select % (i,))
+        # Build the dictionary
+        pairs[i] = dict()
+        while True:
+            row = cursor.fetchone()
+            if row is None:
+                break
+            pairs[i][row[1]] = row[0]
+
+    return pairs
+
+
+def make_sql_insert(cursor, pairs, userid, row):
+    """Insert individual ticks into database, the way db_load() did before batching."""
+    insert = """INSERT INTO `%s` (`date`, `name`, `pitches`, `style`,
+        `lead_style`, `type`, `height`, `code`, `type_mask`, `tick_key`)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s);"""
+    # Set the values tuple
+    values = (userid,) + keyed_tick(normalize_tick(pairs, row))
+
+    # Insert the row
+    cursor.execute(insert, values)
+
+
+def time_row_by_row(config: Dict, rows: List[List]) -> float:
+    """Time the original load path, one INSERT round trip per tick."""
+    # Let db_load build an empty user table for us
+    db_load(_BENCH_USER, [], config=config)
+    connection = db_connect(config=config)
+    cursor = connection.cursor()
+    start = time.perf_counter()
+    pairs = get_pairs(cursor)
+    for row in rows:
+        make_sql_insert(cursor, pairs, _BENCH_USER, row)
+    connection.commit()
+    elapsed = time.perf_counter() - start
+    db_close(cursor, connection)
+    return elapsed
+
+
+def time_batched(config: Dict, rows: List[List]) -> float:
+    """Time the full batched db_load, including the table rebuild."""
+    config = dict(config, DB_INCREMENTAL_SYNC=False)
+    start = time.perf_counter()
+    db_load(_BENCH_USER, rows, config=config)
+    return time.perf_counter() - start
+
+
+def time_resync(config: Dict, rows: List[List]) -> float:
+    """Time an incremental db_load of an export that is already stored."""
+    config = dict(config, DB_INCREMENTAL_SYNC=True)
+    start = time.perf_counter()
+    db_load(_BENCH_USER, rows, config=config)
+    return time.perf_counter() - start
+
+
+def drop_bench_table(config: Dict) -> None:
+    connection = db_connect(config=config)
+    cursor = connection.cursor()
+    cursor.execute("DROP TABLE IF EXISTS `%s`;", (_BENCH_USER,))
+    db_close(cursor, connection)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    config = {"MYSQL_ADDRESS": MYSQL_ADDRESS, "MYSQL_TABLE": MYSQL_TABLE,
+              "MYSQL_USER": MYSQL_USER, "MYSQL_PASSWD": MYSQL_PASSWD,
+              "DB_BATCH_SIZE": args.batch_size}
+    rows = load_rows(args.rows)
+
+    try:
+        before = time_row_by_row(config, rows)
+        after = time_batched(config, rows)
+        resync = time_resync(config, rows)
+    finally:
+        drop_bench_table(config)
+
+    print("Ticks loaded:      %d (batch size %d)" % (len(rows), args.batch_size))
+    print("Row-by-row insert: %8.2fs %10.0f rows/sec" % (before, len(rows) / before))
+    print("Batched db_load:   %8.2fs %10.0f rows/sec" % (after, len(rows) / after))
+    print("Unchanged re-sync: %8.2fs %10.0f rows/sec" % (resync, len(rows) / resync))
+    print("Speedup:           %8.1fx" % (before / after))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""A local stand-in for the Mountain Project API, for load tests.
+
+Run from the project root: `python -m app.benchmarks.fake_mp --port 8099`,
+then set MP_BASE_URL = "http://127.0.0.1:8099" in config.py so the app
+fetches from it instead of mountainproject.com. It serves
+`/data/get-user` and `/user/<id>/<name>/tick-export` for any number of
+synthetic users: every email maps to one of `--users` users, each with
+their own repeatable tick export from app/benchmarks/ticks.py. Responses
+can be slowed down, and a share of them failed, to see how the app copes.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import threading
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from typing import Dict, Tuple
+from urllib.parse import parse_qs, urlparse
+
+from .ticks import generate_export
+
+
+_EXPORT_PATH = re.compile(r"^/user/(\d+)/([^/]+)/tick-export$")
+
+
+class FakeMountainProject(ThreadingMixIn, HTTPServer):
+    """Serves synthetic users and tick exports, one thread per connection.
+
+    Each user has between `min_ticks` and `max_ticks` ticks. Every response
+    waits `latency` seconds, give or take up to `jitter`, and `error_rate` of
+    them are answered with `error_status` instead.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], users: int = 1000, min_ticks: int = 500,
+                 max_ticks: int = 2000, latency: float = 0, jitter: float = 0,
+                 error_rate: float = 0, error_status: int = 503, seed: int = 0):
+        super().__init__(address, FakeMountainProjectHandler)
+        self.users = users
+        self.min_ticks = min_ticks
+        self.max_ticks = max_ticks
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.seed = seed
+        self.counts = dict()
+        self._counts_lock = threading.Lock()
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self.export = lru_cache(maxsize=256)(self._export)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return "http://%s:%d" % (host, port)
+
+    def user_id(self, email: str) -> int:
+        """Map an email onto one of the synthetic users' ids, starting from 1."""
+        digest = hashlib.sha1(email.strip().lower().encode("utf-8")).digest()
+        return int.from_bytes(digest[:8], "big") % self.users + 1
+
+    def tick_count(self, user_id: int) -> int:
+        return random.Random(self.seed * 1000003 + user_id).randint(self.min_ticks, self.max_ticks)
+
+    def _export(self, user_id: int) -> Tuple[bytes, str]:
+        """Get a user's tick export and its ETag."""
+        export = generate_export(self.tick_count(user_id), seed=self.seed * 1000003 + user_id)
+        return export, '"%s"' % (hashlib.sha1(export).hexdigest(),)
+
+    def delay(self) -> float:
+        with self._rng_lock:
+            return max(self.latency + self._rng.uniform(-self.jitter, self.jitter), 0)
+
+    def fails(self) -> bool:
+        with self._rng_lock:
+            return self._rng.random() < self.error_rate
+
+    def count(self, name: str) -> None:
+        with self._counts_lock:
+            self.counts[name] = self.counts.get(name, 0) + 1
+
+
+class FakeMountainProjectHandler(BaseHTTPRequestHandler):
+    server: FakeMountainProject
+    # Keep-alive, like the real API, so the app's connection pool is exercised
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        time.sleep(self.server.delay())
+        if self.server.fails():
+            self.server.count("error")
+            self.send_body(self.server.error_status, b"", "text/plain")
+            return
+
+        if url.path == "/data/get-user":
+            email = parse_qs(url.query).get("email", [""])[0]
+            if not email:
+                self.server.count("not_found")
+                self.send_body(404, b"", "text/plain")
+                return
+            user_id = self.server.user_id(email)
+            self.server.count("get_user")
+            body = json.dumps({"id": user_id, "name": "user-%d" % (user_id,)}).encode("utf-8")
+            self.send_body(200, body, "application/json")
+            return
+
+        match = _EXPORT_PATH.match(url.path)
+        if match and 0 < int(match.group(1)) <= self.server.users:
+            export, etag = self.server.export(int(match.group(1)))
+            if self.headers.get("If-None-Match") == etag:
+                self.server.count("not_modified")
+                self.send_body(304, b"", "text/csv", {"ETag": etag})
+                return
+            self.server.count("tick_export")
+            self.send_body(200, export, "text/csv", {"ETag": etag})
+            return
+
+        self.server.count("not_found")
+        self.send_body(404, b"", "text/plain")
+
+    def send_body(self, status: int, body: bytes, content_type: str, headers: Dict = None) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if body and status != 304:
+            self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        # One line per request would swamp a load test
+        pass
+
+
+def start_server(host: str = "127.0.0.1", port: int = 0, **options) -> FakeMountainProject:
+    """Start a fake server on a background thread. Port 0 picks a free port, see its `url`."""
+    server = FakeMountainProject((host, port), **options)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--users", type=int, default=1000, help="distinct synthetic users")
+    parser.add_argument("--min-ticks", type=int, default=500)
+    parser.add_argument("--max-ticks", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.2, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.1, help="random seconds added to or taken off the latency")
+    parser.add_argument("--error-rate", type=float, default=0, help="share of responses failed, from 0 to 1")
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = FakeMountainProject((args.host, args.port), users=args.users, min_ticks=args.min_ticks,
+                                 max_ticks=args.max_ticks, latency=args.latency, jitter=args.jitter,
+                                 error_rate=args.error_rate, error_status=args.error_status,
+                                 seed=args.seed)
+    print("Serving %d synthetic users at %s, set MP_BASE_URL to it" % (args.users, server.url))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(json.dumps(server.counts))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""Fire concurrent /data requests at a running deployment and report latency percentiles.
+
+Run from the project root against gunicorn, with the app's MP_BASE_URL set
+to the fake Mountain Project server in app/benchmarks/fake_mp.py:
+
+    python -m app.benchmarks.fake_mp --port 8099 &
+    gunicorn --config gunicorn.conf.py "app:create_app()" &
+    python -m app.benchmarks.load --url http://127.0.0.1:5000 --concurrency 16 --requests 500
+
+Each of `--concurrency` clients keeps its own session, reads a CSRF token
+from the index page, then posts the form for emails spread over `--users`
+distinct users. Throughput, p50/p95/p99 latency and the status codes seen
+are printed and written to `load-results.json`. Pass `--compare` an earlier
+results file, e.g. from a run with a different MPV_WORKERS or
+MYSQL_POOL_SIZE, to see the change.
+
+Each email runs the pipeline many times, so turn RATE_LIMIT off in the
+deployment under test, or its 429s will be timed instead of the pipeline.
+"""
+
+import argparse
+import json
+import math
+import re
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+import requests
+
+
+_CSRF_TOKEN = re.compile(r'name="csrf_token"[^>]*value="([^"]+)"')
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Get the nearest-rank percentile of already sorted values, 0 if there are none."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(fraction * len(sorted_values)), 1)
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+class LoadClient:
+    """One simulated user agent: a keep-alive session and its CSRF token."""
+
+    def __init__(self, url: str, path: str, timeout: float):
+        self.url = url.rstrip("/")
+        self.path = path
+        self.timeout = timeout
+        self.session = requests.Session()
+        self._token = None
+
+    def token(self) -> Optional[str]:
+        if self._token is None:
+            page = self.session.get(self.url + "/", timeout=self.timeout)
+            match = _CSRF_TOKEN.search(page.text)
+            # Apps with CSRF protection turned off don't render a token
+            self._token = match.group(1) if match else ""
+        return self._token
+
+    def request(self, email: str, units: str) -> int:
+        data = {"email": email, "units": units}
+        if not self.path.startswith("/api/"):
+            # The API doesn't check CSRF tokens
+            data["csrf_token"] = self.token()
+        response = self.session.post(self.url + self.path, timeout=self.timeout, data=data,
+                                     allow_redirects=False)
+        return response.status_code
+
+
+def run_load(url: str, requests_total: int, concurrency: int, users: int,
+             path: str = "/data", units: str = "feet", timeout: float = 120,
+             warmup: int = 0) -> Dict:
+    """Send `requests_total` requests from `concurrency` clients and summarize their latencies.
+
+    The first `warmup` requests are sent but left out of the results.
+    """
+    clients = [LoadClient(url, path, timeout) for _ in range(concurrency)]
+    free = list(clients)
+    free_lock = threading.Lock()
+    latencies = list()
+    statuses = Counter()
+    results_lock = threading.Lock()
+
+    def send(i: int) -> None:
+        with free_lock:
+            client = free.pop()
+        try:
+            start = time.perf_counter()
+            try:
+                status = str(client.request("user-%d@example.com" % (i % users,), units))
+            except requests.RequestException as e:
+                status = type(e).__name__
+            elapsed = time.perf_counter() - start
+        finally:
+            with free_lock:
+                free.append(client)
+        if i >= warmup:
+            with results_lock:
+                latencies.append(elapsed)
+                statuses[status] += 1
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(send, range(warmup)))
+        start = time.perf_counter()
+        list(executor.map(send, range(warmup, warmup + requests_total)))
+        wall = time.perf_counter() - start
+
+    latencies.sort()
+    return {"url": url, "path": path, "requests": requests_total, "concurrency": concurrency,
+            "users": users, "seconds": wall,
+            "throughput": requests_total / wall if wall else 0.0,
+            "ok": statuses.get("200", 0) + statuses.get("303", 0),
+            "statuses": dict(statuses),
+            "mean": sum(latencies) / len(latencies) if latencies else 0.0,
+            "p50": percentile(latencies, 0.50), "p95": percentile(latencies, 0.95),
+            "p99": percentile(latencies, 0.99), "max": latencies[-1] if latencies else 0.0}
+
+
+def report(result: Dict, old: Dict = None) -> None:
+    print("%d requests, %d at a time, over %d users: %.1f req/s, %d ok" % (
+        result["requests"], result["concurrency"], result["users"], result["throughput"], result["ok"]))
+    print("statuses: %s" % (", ".join("%s x%d" % item for item in sorted(result["statuses"].items())),))
+    if result["statuses"].get("429"):
+        print("Some requests were rate limited, turn RATE_LIMIT off in the deployment under test")
+    for name in ("mean", "p50", "p95", "p99", "max"):
+        line = "%-5s %8.3fs" % (name, result[name])
+        if old and old.get(name):
+            line += " (%+.1f%%)" % ((result[name] - old[name]) / old[name] * 100,)
+        print(line)
+    if old and old.get("throughput"):
+        print("throughput %+.1f%%" % ((result["throughput"] - old["throughput"]) / old["throughput"] * 100,))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://127.0.0.1:5000", help="the deployment to load")
+    parser.add_argument("--path", default="/data", help="/data, or /api/stats")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--users", type=int, default=100, help="distinct emails to spread the requests over")
+    parser.add_argument("--units", default="feet")
+    parser.add_argument("--warmup", type=int, default=0, help="requests sent first and not counted")
+    parser.add_argument("--timeout", type=float, default=120)
+    parser.add_argument("--output", default="load-results.json")
+    parser.add_argument("--compare", help="an earlier results file to compare against")
+    args = parser.parse_args()
+
+    result = run_load(args.url, args.requests, args.concurrency, args.users, path=args.path,
+                      units=args.units, timeout=args.timeout, warmup=args.warmup)
+    old = None
+    if args.compare:
+        with open(args.compare) as compare_file:
+            old = json.load(compare_file)
+    report(result, old)
+    with open(args.output, "w") as output:
+        json.dump(result, output, indent=2)
+    print("Results written to %s" % (args.output,))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""Time every stage of the /data pipeline on synthetic tick exports.
+
+Run from the project root: `python -m app.benchmarks.pipeline`.
+Results are written as JSON, so runs from two commits can be compared with
+`--compare old.json`. The database stages use the MySQL database from
+config.py and are skipped when it can't be reached. `--engine sqlite` runs
+them on a scratch SQLite database instead, to compare the two engines.
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+from unittest import mock
+
+import bokeh
+import pandas as pd
+
+from .. import create_app
+from ..analytics import TickSummary
+from ..errors.exeptions import DatabaseException
+from ..graphing import draw_graphs, get_all_grade_data, get_year_stats, grade_scatter, height_climbed, \
+    pitches_climbed
+from ..helpers.database_connection import db_close, db_connect, db_cursor, db_load, is_shared_storage
+from ..helpers.mountain_project import _TICK_COLUMNS, CachedResponse, MountainProjectHandler
+from ..helpers.storage import dialect
+from ..helpers.tick_batch import TickBatch
+from .ticks import generate_export
+
+
+_BENCH_USER = 1
+_SIZES = [100, 1000, 10000, 100000]
+
+
+class SyntheticSession:
+    """Stands in for the Mountain Project API, serving one synthetic export."""
+
+    def __init__(self, export: bytes):
+        self.export = export
+
+    def get(self, url: str, **kwargs) -> CachedResponse:
+        if url.endswith("/data/get-user"):
+            user = json.dumps({"id": _BENCH_USER, "name": "Bench"}).encode("utf-8")
+            return CachedResponse(200, user, {})
+        return CachedResponse(200, self.export, {})
+
+
+def time_stage(func: Callable, repeat: int) -> List[float]:
+    """Run func `repeat` times and return each run's wall time in seconds."""
+    times = list()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def retained_bytes(func: Callable) -> int:
+    """Get the memory still allocated by what func returns, once it returns."""
+    tracemalloc.start()
+    try:
+        result = func()
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def measure_memory(export: bytes) -> Dict[str, int]:
+    """Compare the parsed tick list held per request as row lists and as a TickBatch."""
+    def rows():
+        df = pd.read_csv(io.BytesIO(export), usecols=_TICK_COLUMNS, na_filter=False)
+        return df, df.values.tolist()
+
+    def batch():
+        df = pd.read_csv(io.BytesIO(export), usecols=_TICK_COLUMNS, na_filter=False)
+        return TickBatch.from_frame(df)
+    return {"row_lists": retained_bytes(rows), "tick_batch": retained_bytes(batch)}
+
+
+def database_available(config: Dict) -> bool:
+    try:
+        connection = db_connect(config=config)
+    except DatabaseException:
+        return False
+    connection.close()
+    return True
+
+
+def bench_size(app, size: int, repeat: int, use_db: bool) -> Dict[str, List[float]]:
+    """Time each stage for one export size."""
+    config = app.config
+    export = generate_export(size)
+    session = SyntheticSession(export)
+    handler = MountainProjectHandler(api_key="", email="bench@example.com", session=session)
+    handler.fetch_user()
+    handler.parse_user_data()
+    handler.fetch_tick_list()
+
+    stages = dict()
+    parsed = dict()
+
+    def parse():
+        parsed.update(handler.parse_tick_list())
+    stages["parse_tick_list"] = time_stage(parse, repeat)
+
+    def stream():
+        for _ in handler.iter_tick_batches(chunksize=5000):
+            pass
+    stages["iter_tick_batches"] = time_stage(stream, repeat)
+
+    summary = TickSummary()
+
+    def summarize():
+        summary.__init__()
+        summary.add(parsed["data"])
+    stages["tick_summary"] = time_stage(summarize, repeat)
+    year_stats = summary.year_stats()
+    stages["year_stats"] = time_stage(summary.year_stats, repeat)
+    grade_data = summary.grade_stats()
+    stages["grade_stats"] = time_stage(summary.grade_stats, repeat)
+
+    stages["height_climbed"] = time_stage(
+        lambda: height_climbed(None, None, "feet", year_stats=year_stats), repeat)
+    stages["pitches_climbed"] = time_stage(
+        lambda: pitches_climbed(None, None, year_stats=year_stats), repeat)
+    stages["grade_scatter"] = time_stage(
+        lambda: [grade_scatter(None, None, type, grade_data=data)
+                 for type, data in grade_data.items()], repeat)
+    stages["draw_graphs"] = time_stage(
+        lambda: draw_graphs(year_stats, grade_data, "feet"), repeat)
+
+    if use_db:
+        rebuild = dict(config, DB_INCREMENTAL_SYNC=False)
+        stages["db_load"] = time_stage(
+            lambda: db_load(_BENCH_USER, parsed["data"], config=rebuild), repeat)
+        stages["db_load_resync"] = time_stage(
+            lambda: db_load(_BENCH_USER, parsed["data"], config=config), repeat)
+
+        def query():
+            connection = db_connect(config=config)
+            cursor = db_cursor(connection)
+            shared = is_shared_storage(config)
+            get_year_stats(cursor, _BENCH_USER, shared)
+            get_all_grade_data(cursor, _BENCH_USER, shared)
+            db_close(cursor, connection)
+        stages["sql_stats"] = time_stage(query, repeat)
+
+    def end_to_end():
+        with mock.patch("app.pipeline.get_session", return_value=session):
+            with app.test_client() as client:
+                response = client.post("/data", data={"test": "yes"})
+        assert response.status_code == 200, response.status
+    stages["data_endpoint"] = time_stage(end_to_end, repeat)
+    return stages
+
+
+def drop_bench_tables(config: Dict) -> None:
+    connection = db_connect(config=config)
+    cursor = db_cursor(connection)
+    cursor.execute("DROP TABLE IF EXISTS `%d`;" % (_BENCH_USER,))
+    if dialect(cursor).table_exists(cursor, "ticks"):
+        cursor.execute("DELETE FROM `ticks` WHERE `user_id` = %s;", (_BENCH_USER,))
+    connection.commit()
+    db_close(cursor, connection)
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"],
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def compare(old: Dict, new: Dict) -> None:
+    """Print each stage's median time in two result files and their ratio."""
+    before = {(row["size"], row["stage"]): row["median"] for row in old["results"]}
+    print("%8s %-18s %10s %10s %8s" % ("ticks", "stage", "before", "after", "ratio"))
+    for row in new["results"]:
+        key = (row["size"], row["stage"])
+        if key in before:
+            print("%8d %-18s %9.4fs %9.4fs %7.2fx" % (row["size"], row["stage"], before[key],
+                                                     row["median"], row["median"] / before[key]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--compare", help="an earlier results file to compare against")
+    parser.add_argument("--no-db", action="store_true", help="skip the database stages")
+    parser.add_argument("--engine", choices=["mysql", "sqlite"],
+                        help="storage engine, the one in config.py by default")
+    args = parser.parse_args()
+
+    app = create_app()
+    # Time the work itself, not the caches in front of it
+    app.config.update(MPV_DEV=False, MP_CACHE=None, GRAPH_CACHE=None, JOB_MODE=False,
+                      RATE_LIMIT=None, SINGLE_FLIGHT=False, TEST_ACCT="bench@example.com")
+    scratch = None
+    if args.engine == "sqlite":
+        scratch = tempfile.TemporaryDirectory()
+        app.config.update(STORAGE_ENGINE="sqlite",
+                          SQLITE_PATH=os.path.join(scratch.name, "bench.sqlite3"))
+    elif args.engine == "mysql":
+        app.config.update(STORAGE_ENGINE="mysql")
+    use_db = not args.no_db and database_available(app.config)
+    if not use_db:
+        # Nothing to store into, so compute the stats in process
+        app.config.update(ANALYTICS_ENGINE="pandas", DB_PERSIST_TICKS=False)
+        print("Database stages skipped", file=sys.stderr)
+
+    results = list()
+    memory = list()
+    try:
+        for size in args.sizes:
+            memory.append(dict(measure_memory(generate_export(size)), size=size))
+            print("%8d %-18s %9.2fMB, %.2fMB as row lists" % (
+                size, "tick_batch_memory", memory[-1]["tick_batch"] / 2 ** 20,
+                memory[-1]["row_lists"] / 2 ** 20))
+            for stage, times in bench_size(app, size, args.repeat, use_db).items():
+                results.append({"size": size, "stage": stage, "runs": len(times),
+                                "min": min(times), "median": statistics.median(times)})
+                print("%8d %-18s %9.4fs" % (size, stage, results[-1]["median"]))
+    finally:
+        if use_db:
+            drop_bench_tables(app.config)
+        if scratch is not None:
+            scratch.cleanup()
+
+    report = {"commit": git_commit(), "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+              "python": platform.python_version(), "platform": platform.platform(),
+              "pandas": pd.__version__, "bokeh": bokeh.__version__,
+              "engine": app.config.get("ANALYTICS_ENGINE", "mysql"), "database": use_db,
+              "storage": app.config.get("STORAGE_ENGINE") or "mysql",
+              "results": results, "memory": memory}
+    with open(args.output, "w") as output:
+        json.dump(report, output, indent=2)
+    print("Results written to %s" % (args.output,))
+
+    if args.compare:
+        with open(args.compare) as old:
+            compare(json.load(old), report)
+
+
+if __name__ == "__main__":
+    main()
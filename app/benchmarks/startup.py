@@ -0,0 +1,149 @@
+"""Measure worker startup time and memory, with and without preloading the app.
+
+Run from the project root: `python -m app.benchmarks.startup --workers 3`.
+Each mode runs in a fresh interpreter that forks workers the way gunicorn
+does. With "lazy" every worker imports the app itself, with "preload" the
+master imports it and runs app.startup.preload() before forking. Each worker
+then serves one /data request for a synthetic tick list. Memory is read from
+/proc, so the PSS and private figures are only reported on Linux.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict
+
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Runs in a fresh interpreter, so nothing is imported before it is measured
+_CHILD = r'''
+import json, os, sys, tempfile, time
+
+sys.path.insert(0, os.getcwd())
+mode, workers, ticks = sys.argv[1], int(sys.argv[2]), int(sys.argv[3])
+
+
+def memory():
+    fields = dict()
+    try:
+        with open("/proc/self/smaps_rollup") as smaps:
+            for line in smaps:
+                parts = line.split()
+                if len(parts) == 3 and parts[2] == "kB":
+                    fields[parts[0].rstrip(":")] = int(parts[1])
+    except OSError:
+        import resource
+        return {"rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}
+    return {"rss_kb": fields.get("Rss", 0), "pss_kb": fields.get("Pss", 0),
+            "private_kb": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0)}
+
+
+def load_app():
+    from app import create_app
+    app = create_app()
+    app.config.update(MPV_DEV=False, MP_CACHE=None, GRAPH_CACHE=None, JOB_MODE=False,
+                      RATE_LIMIT=None, SINGLE_FLIGHT=False, ANALYTICS_ENGINE="pandas", DB_PERSIST_TICKS=False,
+                      TEST_ACCT="bench@example.com", METRICS_DIR=tempfile.mkdtemp())
+    return app
+
+
+start = time.perf_counter()
+app = None
+if mode == "preload":
+    app = load_app()
+    from app.startup import preload
+    preload(app.config)
+master = dict(memory(), load_seconds=time.perf_counter() - start)
+
+pipes = list()
+for _ in range(workers):
+    read, write = os.pipe()
+    if os.fork() == 0:
+        os.close(read)
+        start = time.perf_counter()
+        if app is None:
+            app = load_app()
+        report = {"startup_seconds": time.perf_counter() - start, "after_startup": memory()}
+
+        from unittest import mock
+        from app.benchmarks.ticks import generate_export
+        export = generate_export(ticks)
+
+        class Response:
+            status_code = 200
+            headers = {}
+
+            def __init__(self, content):
+                self.content = content
+
+            def json(self):
+                return json.loads(self.content.decode("utf-8"))
+
+        class Session:
+            def get(self, url, **kwargs):
+                if url.endswith("/data/get-user"):
+                    return Response(b'{"id": 1, "name": "Bench"}')
+                return Response(export)
+
+        start = time.perf_counter()
+        with mock.patch("app.pipeline.get_session", return_value=Session()):
+            status = app.test_client().post("/data", data={"test": "yes"}).status_code
+        report.update(first_request_seconds=time.perf_counter() - start, status=status,
+                      after_request=memory())
+        with os.fdopen(write, "w") as pipe:
+            json.dump(report, pipe)
+        os._exit(0)
+    os.close(write)
+    pipes.append(read)
+
+reports = list()
+for read in pipes:
+    with os.fdopen(read) as pipe:
+        reports.append(json.load(pipe))
+    os.wait()
+print(json.dumps({"mode": mode, "master": master, "workers": reports}))
+'''
+
+
+def run_mode(mode: str, workers: int, ticks: int) -> Dict:
+    output = subprocess.check_output([sys.executable, "-W", "ignore", "-c", _CHILD, mode,
+                                      str(workers), str(ticks)], cwd=_ROOT)
+    return json.loads(output.decode().strip().splitlines()[-1])
+
+
+def mb(kb: int) -> float:
+    return kb / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=3)
+    parser.add_argument("--ticks", type=int, default=1000,
+                        help="synthetic ticks in each worker's first /data request")
+    parser.add_argument("--output", default="startup-results.json")
+    args = parser.parse_args()
+
+    results = [run_mode(mode, args.workers, args.ticks) for mode in ("lazy", "preload")]
+    print("%-8s %8s %9s %10s %9s %9s %9s" % ("mode", "worker", "startup", "first req",
+                                              "rss", "pss", "private"))
+    for result in results:
+        master = result["master"]
+        print("%-8s %8s %8.3fs %10s %8.1fM %8.1fM %8.1fM" % (
+            result["mode"], "master", master["load_seconds"], "",
+            mb(master["rss_kb"]), mb(master.get("pss_kb", 0)), mb(master.get("private_kb", 0))))
+        for i, worker in enumerate(result["workers"]):
+            memory = worker["after_request"]
+            print("%-8s %8d %8.3fs %9.3fs %8.1fM %8.1fM %8.1fM" % (
+                result["mode"], i, worker["startup_seconds"], worker["first_request_seconds"],
+                mb(memory["rss_kb"]), mb(memory.get("pss_kb", 0)), mb(memory.get("private_kb", 0))))
+
+    with open(args.output, "w") as output:
+        json.dump(results, output, indent=2)
+    print("Results written to %s" % (args.output,))
+
+
+if __name__ == "__main__":
+    main()
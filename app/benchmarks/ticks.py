@@ -0,0 +1,85 @@
+"""Synthetic Mountain Project tick exports for benchmarks.
+
+The mix of route types, styles, pitches and grades follows the test tick
+list, with the awkward cases real exports contain: multi-type routes, blank
+types and heights, ticks without a date, and codes outside the grade table.
+"""
+
+import csv
+import io
+import os
+import random
+from typing import List
+
+
+_GRADE_CODES = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                            "setup", "grade_codes.csv")
+_HEADER = ["Date", "Route", "Rating", "Notes", "URL", "Pitches", "Location",
+           "Avg Stars", "Your Stars", "Style", "Lead Style", "Route Type",
+           "Your Rating", "Length", "Rating Code"]
+
+# (route type, weight), roughly the test tick list's distribution
+_TYPES = [("Sport", 45), ("Boulder", 25), ("Trad", 20), ("Trad, TR", 2),
+          ("Trad, Sport", 2), ("Sport, TR", 1.5), ("Boulder, Alpine", 1),
+          ("Trad, Alpine", 1), ("TR", 1), ("Ice", 0.5), ("TR, Ice", 0.3),
+          ("Mixed", 0.2), ("Snow, Alpine", 0.2), ("Aid", 0.2), ("", 0.1)]
+# Code id range per first listed type
+_CODE_RANGES = {"Sport": (1400, 8900), "Trad": (800, 7200), "TR": (1400, 6600),
+                "Boulder": (20000, 20700), "Ice": (32000, 32250), "Snow": (900, 900)}
+_STYLES = [("", 70), ("Lead", 17), ("TR", 4), ("Send", 2), ("Flash", 2),
+           ("Follow", 1.5), ("Solo", 1.2), ("Attempt", 0.3)]
+_LEAD_STYLES = ["Onsight", "Redpoint", "Flash", "Fell/Hung", "Pinkpoint"]
+_PITCHES = [(1, 87), (2, 7), (3, 3), (4, 1.5), (5, 1), (8, 0.5)]
+
+
+def _choice(rng: random.Random, weighted: list):
+    values, weights = zip(*weighted)
+    return rng.choices(values, weights)[0]
+
+
+def load_codes() -> List[tuple]:
+    with open(_GRADE_CODES) as codes_file:
+        return [(int(row[0]), row[1]) for row in csv.reader(codes_file)]
+
+
+def generate_rows(count: int, seed: int = 0) -> List[List]:
+    """Generate `count` tick rows in the full export's column order."""
+    rng = random.Random(seed)
+    codes = load_codes()
+    rows = list()
+    for i in range(count):
+        route_type = _choice(rng, _TYPES)
+        first = route_type.split(",")[0]
+        low, high = _CODE_RANGES.get(first, (0, 0))
+        candidates = [code for code in codes if low <= code[0] <= high] or [(0, "")]
+        code, rating = rng.choice(candidates)
+        if rng.random() < 0.002:
+            # MP's no-code bug
+            code, rating = 0, ""
+
+        if rng.random() < 0.003:
+            date = "0000-00-00"
+        else:
+            date = "%04d-%02d-%02d" % (rng.randint(1995, 2024), rng.randint(1, 12),
+                                       rng.randint(1, 28))
+        pitches = 1 if first == "Boulder" else _choice(rng, _PITCHES)
+        style = _choice(rng, _STYLES)
+        lead_style = rng.choice(_LEAD_STYLES) if style == "Lead" else ""
+        # About a fifth of ticks have no height
+        length = "" if rng.random() < 0.2 else str(rng.randint(8, 120) * pitches)
+
+        rows.append([date, "Route %d" % (i,), rating, "", "https://example.com/route/%d" % (i,),
+                     pitches, "Area %d" % (i % 97,), "2.0", "2", style, lead_style,
+                     route_type, rating, length, code])
+    # Exports are newest first
+    rows.sort(key=lambda row: row[0], reverse=True)
+    return rows
+
+
+def generate_export(count: int, seed: int = 0) -> bytes:
+    """Generate a tick export CSV with `count` ticks."""
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(_HEADER)
+    writer.writerows(generate_rows(count, seed))
+    return output.getvalue().encode("utf-8")
@@ -12,3 +12,40 @@ MYSQL_TABLE = "mpv"
 MP_KEY = "Your_MountainProject_API_Key_Here"
 TEST_ACCT = "Your_MountainProject_Email_Acount_Here"
 MPV_DEV = False
+DB_BATCH_SIZE = 1000
+DB_INCREMENTAL_SYNC = True
+TICK_STORAGE = "table"
+ANALYTICS_ENGINE = "mysql"
+DB_PERSIST_TICKS = True
+MYSQL_POOL_SIZE = 5
+MYSQL_POOL_OVERFLOW = 5
+MYSQL_POOL_TIMEOUT = 10
+MYSQL_POOL_RECYCLE = 3600
+MP_POOL_SIZE = 10
+MP_RETRIES = 3
+MP_BACKOFF = 0.5
+MP_CONNECT_TIMEOUT = 5
+MP_READ_TIMEOUT = 30
+CACHE_DIR = "/var/cache/mpv"
+MP_CACHE = "file"
+MP_CACHE_TTL = 300
+MP_CACHE_MAX_ENTRIES = 256
+MP_CACHE_MAX_BYTES = 268435456
+GRAPH_CACHE = "file"
+GRAPH_CACHE_TTL = 86400
+GRAPH_CACHE_MAX_ENTRIES = 128
+GRAPH_CACHE_MAX_BYTES = 268435456
+TICK_CHUNK_SIZE = 5000
+JOB_MODE = False
+JOB_WORKERS = 2
+JOB_RESULT_TTL = 300
+JOB_TIMEOUT = 600
+METRICS_DIR = "/var/cache/mpv/metrics"
+STORAGE_ENGINE = "mysql"
+SQLITE_PATH = "/var/lib/mpv/mpv.sqlite3"
+API_MAX_AGE = 300
+API_GZIP_MIN_BYTES = 1024
+SINGLE_FLIGHT = True
+SINGLE_FLIGHT_MAX_BYTES = 67108864
+RATE_LIMIT_WINDOW = 60
+MP_BASE_URL = "https://www.mountainproject.com"
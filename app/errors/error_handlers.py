@@ -33,6 +33,15 @@ def handle_422(error: UnprocessableEntityException):
     return render_template("error.html", data=UnprocessableEntityException.msg), 422
 
 
+@errors.app_errorhandler(TooManyRequestsException)
+def handle_429(error: TooManyRequestsException):
+    logging.warning(error)
+    headers = dict()
+    if getattr(error, "retry_after", None):
+        headers["Retry-After"] = str(int(error.retry_after))
+    return render_template("error.html", data=TooManyRequestsException.msg), 429, headers
+
+
 @errors.app_errorhandler(DatabaseException)
 def handle_503(error: DatabaseException):
     logging.exception(error)
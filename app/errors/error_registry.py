@@ -1,5 +1,7 @@
 from enum import Enum
 
+from werkzeug.exceptions import HTTPException
+
 from .exeptions import *
 
 
@@ -8,3 +10,11 @@ class ExceptionRegistry(Enum):
     DatabaseException = DatabaseException()
     RequestException = RequestException()
     UnprocessableEntityException = UnprocessableEntityException()
+    TooManyRequestsException = TooManyRequestsException()
+
+
+def registered_exception(name: str) -> HTTPException:
+    """Get the registered exception with a class name, or RequestException if there is none."""
+    if name in ExceptionRegistry.__members__:
+        return ExceptionRegistry[name].value
+    return ExceptionRegistry.RequestException.value
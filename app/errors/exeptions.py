@@ -1,4 +1,4 @@
-from werkzeug.exceptions import BadRequest, Forbidden, ServiceUnavailable, UnprocessableEntity
+from werkzeug.exceptions import BadRequest, Forbidden, ServiceUnavailable, TooManyRequests, UnprocessableEntity
 
 
 class MPAPIException(Forbidden):
@@ -21,3 +21,9 @@ class RequestException(BadRequest):
 class UnprocessableEntityException(UnprocessableEntity):
     status_code = UnprocessableEntity.code
     msg = "An error occurred. Please make sure you provided a registered MP email address."
+
+
+class TooManyRequestsException(TooManyRequests):
+    status_code = TooManyRequests.code
+    msg = "That email address was looked up too many times in a short while. " \
+        "Please wait a minute and try again."
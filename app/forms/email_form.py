@@ -1,8 +1,34 @@
 from flask_wtf import FlaskForm
-from wtforms import StringField
-from wtforms.validators import DataRequired, Email
+from wtforms import DateField, StringField, ValidationError
+from wtforms.validators import AnyOf, DataRequired, Email, Optional
+
+from ..helpers.storage import REFERENCE_VALUES
+from ..helpers.tick_filter import TickFilter
 
 
 class MPVEmailForm(FlaskForm):
     email = StringField(label='Email', validators=[DataRequired(), Email()])
     units = StringField(label='Units', validators=[DataRequired()])
+    # Optional filters, a report covers every tick without them
+    start = DateField(label='From', format='%Y-%m-%d', validators=[Optional()])
+    end = DateField(label='To', format='%Y-%m-%d', validators=[Optional()])
+    type = StringField(label='Type', validators=[Optional(), AnyOf(REFERENCE_VALUES["type"])])
+    style = StringField(label='Style', validators=[Optional(), AnyOf(REFERENCE_VALUES["style"])])
+
+    def validate_end(self, field):
+        if field.data and self.start.data and field.data < self.start.data:
+            raise ValidationError("The end date must not be before the start date.")
+
+    def validate_filters(self) -> bool:
+        """Validate the filter fields alone, for the test account, which has no email to check."""
+        valid = True
+        for field in (self.start, self.end, self.type, self.style):
+            inline = getattr(type(self), "validate_" + field.name, None)
+            if not field.validate(self, [inline] if inline else ()):
+                valid = False
+        return valid
+
+    def tick_filter(self) -> TickFilter:
+        """Get the filters submitted with the form."""
+        return TickFilter(start=self.start.data, end=self.end.data,
+                          type=self.type.data, style=self.style.data)
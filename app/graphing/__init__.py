@@ -1,46 +1,92 @@
-"""Graphing functions for the MPV web app."""
+"""Graphing functions for the MPV web app.
 
-import statistics
-from bokeh.embed import components
-from bokeh.models import ColumnDataSource, HoverTool
-from bokeh.plotting import figure
-from bokeh.transform import dodge
-from mysql.connector import MySQLConnection
+Bokeh's plotting modules are imported by the functions that draw, so the
+stats queries and a cached page don't pay for loading them. A cached page
+only imports the bokeh package, for the version in the cache key. pandas
+is loaded with this module, as app.analytics needs it anyway, and the
+routes only import the pipeline, and so this module, on first use.
+"""
 
-TOOLS = "reset,pan,wheel_zoom,box_zoom,save"
+import hashlib
+from typing import Dict, Iterable, Optional, Union
+
+import pandas as pd
+from mysql.connector import MySQLConnection
 
+from ..analytics import grade_stats
+from ..helpers.database_connection import tick_source
+from ..helpers.metrics import timed
+from ..helpers.summary import GRADE_COUNTS, YEAR_TOTALS, default_heights_sql, read_grade_summary, \
+    read_year_summary, summaries_available
+from ..helpers.reference_data import get_reference_data
+from ..helpers.storage import dialect
+from ..helpers.tick_batch import TickBatch
+from ..helpers.tick_filter import TickFilter
 
-def height_climbed(cursor: MySQLConnection.cursor, mp_user_id: int, units: str) -> dict:
+TOOLS = "reset,pan,wheel_zoom,box_zoom,save"
+# Bump when the figures change, so cached graphs are rebuilt
+GRAPH_VERSION = 1
+
+
+def draw_graphs(year_stats: dict, grade_data: dict, units: str) -> dict:
+    """Draw every graph on the data page from precomputed stats."""
+    with timed("height_climbed"):
+        height = height_climbed(None, None, units, year_stats=year_stats)
+    with timed("pitches_climbed"):
+        pitches = pitches_climbed(None, None, year_stats=year_stats)
+    scatters = list()
+    for type in grade_data:
+        with timed("grade_scatter"):
+            reply = grade_scatter(None, None, type, grade_data=grade_data[type])
+        # Check for empty returns
+        if reply:
+            scatters.append(reply)
+    return {"total_height": height["total"], "height": height["plot"],
+            "total_pitches": pitches["total"], "pitches": pitches["plot"],
+            "scatters": scatters}
+
+
+def tick_digest(ticks: Union[TickBatch, Iterable], digest=None):
+    """Fold a TickBatch, or tick rows, into a running SHA-1, starting a new one if none is given."""
+    if digest is None:
+        digest = hashlib.sha1()
+    if isinstance(ticks, TickBatch):
+        ticks.update_digest(digest)
+        return digest
+    for row in ticks:
+        digest.update(repr(row).encode("utf-8"))
+    return digest
+
+
+def graph_cache_key(digest, units: str, tick_filter: TickFilter = None) -> str:
+    """Fingerprint everything the drawn graphs depend on.
+
+    `digest` is the tick_digest() of the user's tick rows.
+    """
+    from bokeh import __version__ as bokeh_version
+
+    key = "graphs:%s:%d:%s:%s" % (bokeh_version, GRAPH_VERSION, units,
+                                   digest.hexdigest())
+    if tick_filter:
+        key += ":" + tick_filter.key
+    return key
+
+
+def height_climbed(cursor: MySQLConnection.cursor, mp_user_id: int, units: str,
+                   shared: bool = False, year_stats: dict = None) -> dict:
     """Compute height climbed and return a graph."""
-    # Get the years the current user user was active
-    years = get_years(cursor, mp_user_id)
-    # Set vars for ticks with no heights
-    year_height = dict()
-    defaults = {"Aid": 75, "Boulder": 8, "Ice": 100, "Mixed": 100,
-                "Snow": 200, "Sport": 75, "TR": 50, "Trad": 150}
-    # Get ticks for each year
-    for year in years:
-        select = """SELECT `height`, `type`.`type` FROM `%s`
-                 JOIN `mpv`.`type` ON `mpv`.`type`.`id` = `%s`.`type`
-                 WHERE YEAR(`date`) = '%s';"""
-        cursor.execute(select, (mp_user_id, mp_user_id, year))
-        ticks = cursor.fetchall()
-        # Check that climbs have heights, set defualts if not
-        for row in ticks:
-            if row[0] is None:
-                for key in defaults:
-                    if row[1] == key:
-                        year_height = add_to_year(year,
-                                                  defaults[key], year_height)
-            else:
-                year_height = add_to_year(year, row[0], year_height)
+    from bokeh.embed import components
+    from bokeh.models import HoverTool
+    from bokeh.plotting import figure
 
-    # Calculate total height climbed
-    total_height = int()
-    for year in year_height.keys():
-        total_height += year_height[year]
+    # Get the per-year totals, unless the caller already has them
+    if year_stats is None:
+        year_stats = get_year_stats(cursor, mp_user_id, shared)
+    years = year_stats["years"]
+    height = list(year_stats["height"])
 
-    height = list(year_height.values())
+    # Calculate total height climbed
+    total_height = sum(height)
 
     # Convert height to meters if required
     if units == "meters":
@@ -71,41 +117,21 @@ def height_climbed(cursor: MySQLConnection.cursor, mp_user_id: int, units: str)
     return {"total": total_height, "plot": [script, div]}
 
 
-def pitches_climbed(cursor: MySQLConnection.cursor, mp_user_id: int) -> dict:
+def pitches_climbed(cursor: MySQLConnection.cursor, mp_user_id: int,
+                    shared: bool = False, year_stats: dict = None) -> dict:
     """Pitches, routes, problems graph and info."""
-    pitches = list()
-    routes = list()
-    problems = list()
-
-    # Get all-time pitch count
-    select = "SELECT SUM(`pitches`) FROM `%s`;"
-    cursor.execute(select, (mp_user_id,))
-    sum = cursor.fetchone()
-
-    # Get the years the current user user was active
-    years = get_years(cursor, mp_user_id)
-
-    # Get total routes climbed for each year
-    select = """SELECT COUNT('name') from `%s`
-                JOIN `mpv`.`type` ON `mpv`.`type`.`id` = `%s`.`type`
-                WHERE YEAR(`date`) = '%s' AND `type`.`type` != 'Boulder';"""
-    for year in years:
-        cursor.execute(select, (mp_user_id, mp_user_id, year))
-        routes.append(cursor.fetchone())
-
-    # Get all pitches/problems for a given year
-    types = ["!= 'Boulder';", "= 'Boulder';"]
-    select = """SELECT SUM(`pitches`) FROM `%s`
-                JOIN `mpv`.`type` ON `mpv`.`type`.`id` = `%s`.`type`
-                WHERE YEAR(`date`) = '%s' AND `type`.`type` %s"""
-    for type in types:
-        for year in years:
-            cursor.execute(select % (mp_user_id, mp_user_id, year, type))
-            if type == "= 'Boulder';":
-                problems.append(cursor.fetchone())
-            else:
-                tmp = cursor.fetchone()
-                pitches.append(tmp[0])
+    from bokeh.embed import components
+    from bokeh.models import ColumnDataSource, HoverTool
+    from bokeh.plotting import figure
+    from bokeh.transform import dodge
+
+    # Get the per-year totals, unless the caller already has them
+    if year_stats is None:
+        year_stats = get_year_stats(cursor, mp_user_id, shared)
+    years = year_stats["years"]
+    pitches = year_stats["pitches"]
+    routes = year_stats["routes"]
+    problems = year_stats["problems"]
 
     # Generate the graph
     TOOLTIPS = [
@@ -145,71 +171,43 @@ def pitches_climbed(cursor: MySQLConnection.cursor, mp_user_id: int) -> dict:
     plot.add_tools(HoverTool(tooltips=TOOLTIPS, renderers=[re1, re2]))
     script, div = components(plot)
 
-    return {"total": sum[0], "plot": [script, div]}
+    return {"total": year_stats["total_pitches"], "plot": [script, div]}
 
 
-def grade_scatter(cursor: MySQLConnection.cursor, mp_user_id: int, type: str) -> list:
+def grade_scatter(cursor: MySQLConnection.cursor, mp_user_id: int, type: str,
+                  shared: bool = False, grade_data: dict = None) -> list:
     """Create grade scatter graph."""
-    # Get grades ticked each year
-    years = get_years(cursor, mp_user_id)
-    grades = get_grades(cursor, mp_user_id, type)
-    grade_data = list()
-    year_data = list()
-    mean_values = list()
-    mode_values = list()
-    mean_years = list()
-    mode_years = list()
-    select = """SELECT `code`.`id`, `code`.`code` FROM `%s`
-            JOIN `mpv`.`type` ON `mpv`.`type`.`id` = `%s`.`type`
-            JOIN `mpv`.`code` ON `mpv`.`code`.`id` = `%s`.`code`
-            WHERE YEAR(`date`) = '%s' AND `type`.`type` = '%s'
-            ORDER BY `code`.`id` ASC;"""
-    for year in years:
-        tmp_grades = list()
-        cursor.execute(select % (mp_user_id, mp_user_id, mp_user_id, year, type))
-        for row in cursor.fetchall():
-            grade_data.append(row[1])
-            year_data.append(year)
-            tmp_grades.append(row[0])
-
-        # Get mode/mean grade ticked for year
-        if tmp_grades:
-            mode = max(tmp_grades, key=tmp_grades.count)
-            mean = statistics.median(tmp_grades)
-            query = """SELECT `code` FROM `code`
-                    ORDER BY ABS(`code`.`id` - '%s') LIMIT 1;"""
-            cursor.execute(query % (mode,))
-            for row in cursor.fetchone():
-                mode_values.append(row)
-                mode_years.append(year)
-            cursor.execute(query % (mean,))
-            for row in cursor.fetchone():
-                mean_values.append(row)
-                mean_years.append(year)
+    from bokeh.embed import components
+    from bokeh.models import ColumnDataSource, HoverTool
+    from bokeh.plotting import figure
+
+    # Get grades ticked each year, unless the caller already has them
+    if grade_data is None:
+        grade_data = get_grade_data(cursor, mp_user_id, type, shared)
 
     # Check for MP no code bug, return nothing if so
-    if not grade_data:
+    if not grade_data["grades"]:
         return False
 
     # Generate graph
-    data = {"years": year_data,
-            "grades": grade_data}
-    mean_mode = {"mode_years": mode_years,
-                 "mean_years": mean_years,
-                 "mode_values": mode_values,
-                 "mean_values": mean_values}
+    data = {"years": grade_data["years"],
+            "grades": grade_data["grades"]}
+    mean_mode = {"mode_years": grade_data["mode_years"],
+                 "mean_years": grade_data["mean_years"],
+                 "mode_values": grade_data["mode_values"],
+                 "mean_values": grade_data["mean_values"]}
     TOOLTIPS = [
         ("Year:", "@mode_years"),
         ("Most Ticked:", "@mode_values"),
         ("Average Grade:", "@mean_values")
     ]
 
-    plot = figure(title=(type + " Grades By Year"), y_range=grades,
+    plot = figure(title=(type + " Grades By Year"), y_range=grade_data["axis"],
                   sizing_mode='stretch_both', tools=TOOLS)
     plot.scatter('years', 'grades', size=14, alpha=0.2,
                  source=ColumnDataSource(data=data))
     # Don't draw mean/mode if only 1 year of data
-    if len(mode_years) > 1:
+    if len(grade_data["mode_years"]) > 1:
         re = plot.line("mode_years", "mode_values", line_width=2,
                        line_color="red", legend_label="Most Ticked",
                        source=ColumnDataSource(data=mean_mode))
@@ -232,13 +230,132 @@ def grade_scatter(cursor: MySQLConnection.cursor, mp_user_id: int, type: str) ->
     return [script, div]
 
 
-def get_grades(cursor: MySQLConnection.cursor, mp_user_id: int, type: str) -> list:
+def get_grade_data(cursor: MySQLConnection.cursor, mp_user_id: int, type: str,
+                   shared: bool = False) -> dict:
+    """Get every grade ticked of a type, plus the yearly mode and median grade.
+
+    "grades"/"years" hold one entry per tick, "axis" the distinct grades in
+    order, and "mode_*"/"mean_*" the per-year most ticked and median grade.
+    """
+    stats = get_all_grade_data(cursor, mp_user_id, shared, type=type)
+    return stats.get(type, {"axis": [], "years": [], "grades": [],
+                            "mode_years": [], "mode_values": [],
+                            "mean_years": [], "mean_values": []})
+
+
+def get_all_grade_data(cursor: MySQLConnection.cursor, mp_user_id: int,
+                       shared: bool = False, type: str = None,
+                       tick_filter: TickFilter = None) -> Dict[str, dict]:
+    """Get the grade data for every type the user has ticked, from one query.
+
+    Returns a get_grade_data() dictionary per type, with the yearly mode and
+    median worked out in one vectorized pass over the grade histogram.
+    """
+    reference = get_reference_data(cursor)
+    codes = pd.Series(reference.code_labels, index=reference.code_ids)
+    if tick_filter and tick_filter.type is not None:
+        type = tick_filter.type
+    return grade_stats(get_grade_histogram(cursor, mp_user_id, shared, type, tick_filter), codes)
+
+
+def get_grade_histogram(cursor: MySQLConnection.cursor, mp_user_id: int,
+                        shared: bool = False, type: str = None,
+                        tick_filter: TickFilter = None) -> pd.DataFrame:
+    """Count the user's ticks per type, year and grade code, optionally for one type and filtered."""
+    table, user = tick_source(mp_user_id, shared)
+    predicates, params = "", ()
+    if type is not None:
+        predicates, params = " AND `type`.`type` = %s", (type,)
+    if tick_filter:
+        extra, extra_params = tick_filter.sql(get_reference_data(cursor).pairs)
+        predicates, params = predicates + extra, params + extra_params
+    select = GRADE_COUNTS % {"prefix": "", "type": "`type`.`type`", "table": table, "user": user,
+                             "filter": predicates}
+    select += " ORDER BY `type`.`id`, YEAR(`t`.`date`), `t`.`code`;"
+    if params:
+        cursor.execute(select, params)
+    else:
+        cursor.execute(select)
+    return histogram_frame(cursor.fetchall())
+
+
+def histogram_frame(rows: list) -> pd.DataFrame:
+    return pd.DataFrame([tuple(row) for row in rows],
+                        columns=["type", "year", "code", "count"])
+
+
+def get_year_stats(cursor: MySQLConnection.cursor, mp_user_id: int,
+                   shared: bool = False, tick_filter: TickFilter = None) -> dict:
+    """Get height, pitch, route and problem totals for every active year.
+
+    One grouped query covers all years, or only the ticks `tick_filter`
+    keeps. Ticks without a height get the default height for their type,
+    and Boulder ticks count as problems rather than pitches and routes.
+    """
+    table, user = tick_source(mp_user_id, shared)
+    predicates, params = "", ()
+    if tick_filter:
+        predicates, params = tick_filter.sql(get_reference_data(cursor).pairs)
+    select = YEAR_TOTALS % {"prefix": "", "table": table, "user": user, "filter": predicates,
+                            "default_height": default_heights_sql(),
+                            "first_type": dialect(cursor).first_type}
+    if params:
+        cursor.execute(select + " ORDER BY `year` ASC;", params)
+    else:
+        cursor.execute(select + " ORDER BY `year` ASC;")
+    return year_stats_from_rows(cursor.fetchall())
+
+
+def year_stats_from_rows(rows: list) -> dict:
+    """Build the year stats from (year, height, all pitches, pitches, routes, problems) rows."""
+    stats = {"years": [], "height": [], "pitches": [], "routes": [],
+             "problems": [], "total_pitches": 0}
+    for year, height, all_pitches, pitches, routes, problems in rows:
+        stats["years"].append(int(year))
+        stats["height"].append(int(height or 0))
+        stats["pitches"].append(int(pitches or 0))
+        stats["routes"].append(int(routes or 0))
+        stats["problems"].append(int(problems or 0))
+        stats["total_pitches"] += int(all_pitches or 0)
+    return stats
+
+
+def get_summary_stats(cursor: MySQLConnection.cursor, mp_user_id: int,
+                      tick_filter: TickFilter = None) -> Optional[tuple]:
+    """Get the year stats and grade data from the summary tables db_load maintains.
+
+    Two primary key lookups replace aggregating every tick. A filter on
+    whole years slices the same rows. Returns None if the summary tables
+    haven't been created, have no rows for the user, or can't answer the
+    filter.
+    """
+    years = None
+    if tick_filter:
+        years = tick_filter.whole_years()
+        if years is None:
+            return None
+    if not summaries_available(cursor):
+        return None
+    year_rows = read_year_summary(cursor, mp_user_id, years)
+    # Not summarized, e.g. in dev mode, which doesn't load ticks
+    if not year_rows:
+        return None
+    year_stats = year_stats_from_rows(year_rows)
+    reference = get_reference_data(cursor)
+    codes = pd.Series(reference.code_labels, index=reference.code_ids)
+    grade_data = grade_stats(histogram_frame(read_grade_summary(cursor, mp_user_id, years)), codes)
+    return year_stats, grade_data
+
+
+def get_grades(cursor: MySQLConnection.cursor, mp_user_id: int, type: str,
+               shared: bool = False) -> list:
     """Get all grades user has ticked of specified type."""
-    select = """SELECT DISTINCT `code`.`code`, `code`.`id` FROM `%s`
-             JOIN `mpv`.`type` ON `mpv`.`type`.`id` = `%s`.`type`
-             JOIN `mpv`.`code` ON `mpv`.`code`.`id` = `%s`.`code`
-             WHERE `type`.`type` = '%s' ORDER BY `code`.`id` ASC;"""
-    cursor.execute(select % (mp_user_id, mp_user_id, mp_user_id, type))
+    table, user = tick_source(mp_user_id, shared)
+    select = """SELECT DISTINCT `code`.`code`, `code`.`id` FROM %s AS `t`
+             JOIN `type` ON (`t`.`type_mask` & (1 << (`type`.`id` - 1))) != 0
+             JOIN `code` ON `code`.`id` = `t`.`code`
+             WHERE %s AND `type`.`type` = %%s ORDER BY `code`.`id` ASC;"""
+    cursor.execute(select % (table, user), (type,))
     grades = cursor.fetchall()
     # Format the grades
     for i in range(0, len(grades)):
@@ -246,34 +363,16 @@ def get_grades(cursor: MySQLConnection.cursor, mp_user_id: int, type: str) -> li
     return grades
 
 
-def get_years(cursor: MySQLConnection.cursor, mp_user_id: int) -> list:
-    """Get all years a user was active."""
-    select = "SELECT DISTINCT YEAR(`date`) FROM `%s`;"
-    cursor.execute(select, (mp_user_id,))
-    years = cursor.fetchall()
-    # Format the years
-    for i in range(0, len(years)):
-        years[i] = years[i][0]
-    years.sort()
-    return years
-
-
-def get_types(cursor: MySQLConnection.cursor, mp_user_id: int) -> list:
+def get_types(cursor: MySQLConnection.cursor, mp_user_id: int,
+              shared: bool = False) -> list:
     """Get all of the types of climbing a user has done."""
-    select = """SELECT DISTINCT `type`.`type` FROM `%s`
-                JOIN `mpv`.`type` ON `mpv`.`type`.`id` = `%s`.`type`;"""
-    cursor.execute(select, (mp_user_id, mp_user_id))
+    table, user = tick_source(mp_user_id, shared)
+    select = """SELECT DISTINCT `type`.`type` FROM %s AS `t`
+                JOIN `type` ON (`t`.`type_mask` & (1 << (`type`.`id` - 1))) != 0
+                WHERE %s;"""
+    cursor.execute(select % (table, user))
     types = cursor.fetchall()
     # Format the types
     for i in range(0, len(types)):
         types[i] = types[i][0]
     return types
-
-
-def add_to_year(year: int, height: int, year_height: dict) -> dict:
-    """Add height to a given year."""
-    if year in year_height:
-        year_height[year] = year_height[year] + height
-    else:
-        year_height.update({year: height})
-    return year_height
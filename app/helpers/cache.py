@@ -0,0 +1,190 @@
+"""Small TTL caches with LRU eviction, in memory or on disk.
+
+MemoryCache is private to one process. FileCache keeps entries as files in
+a directory, so every gunicorn worker on the host shares them. Expired
+entries are kept until evicted, so callers can still revalidate them.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from stat import S_ISDIR
+from typing import Any, Optional, Tuple, Union
+
+
+class MemoryCache:
+    """An in-process cache holding at most `max_entries` entries."""
+
+    def __init__(self, ttl: float = 300, max_entries: int = 256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a value that hasn't expired yet."""
+        value, fresh = self.lookup(key)
+        return value if fresh else None
+
+    def lookup(self, key: str) -> Tuple[Optional[Any], bool]:
+        """Get a value, expired or not, and whether it is still fresh."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, False
+            self._entries.move_to_end(key)
+        expires, value = entry
+        return value, time.time() < expires
+
+    def set(self, key: str, value: Any, ttl: float = None) -> None:
+        expires = time.time() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class FileCache:
+    """A cache shared between processes through files in `directory`.
+
+    Reading an entry updates its modification time, and the least recently
+    used files are removed once there are more than `max_entries` of them
+    or they add up to more than `max_bytes` (0 for no byte limit).
+    """
+
+    def __init__(self, directory: str, ttl: float = 300, max_entries: int = 256,
+                 max_bytes: int = 0):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a value that hasn't expired yet."""
+        value, fresh = self.lookup(key)
+        return value if fresh else None
+
+    def lookup(self, key: str) -> Tuple[Optional[Any], bool]:
+        """Get a value, expired or not, and whether it is still fresh."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as entry_file:
+                expires, value = pickle.load(entry_file)
+            os.utime(path)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None, False
+        return value, time.time() < expires
+
+    def set(self, key: str, value: Any, ttl: float = None) -> None:
+        expires = time.time() + (self.ttl if ttl is None else ttl)
+        # Write to a temporary file first so readers never see half an entry
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as entry_file:
+                pickle.dump((expires, value), entry_file, pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self._path(key))
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            return
+        self._evict()
+
+    def clear(self) -> None:
+        for name, _, _ in self._entries():
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory,
+                            hashlib.sha1(key.encode("utf-8")).hexdigest() + ".cache")
+
+    def _entries(self) -> list:
+        """List (name, last used, size) for every entry, least recently used first."""
+        entries = list()
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".cache"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((entry.name, stat.st_mtime, stat.st_size))
+        entries.sort(key=lambda entry: entry[1])
+        return entries
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        total = sum(size for _, _, size in entries)
+        while entries and (len(entries) > self.max_entries
+                           or (self.max_bytes and total > self.max_bytes)):
+            name, _, size = entries.pop(0)
+            total -= size
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                # Another worker got to it first
+                pass
+
+
+Cache = Union[MemoryCache, FileCache]
+
+
+def cache_directory(directory: str = None) -> str:
+    """Get the directory for state shared between workers, `directory` if it is set.
+
+    The default, `mpv-cache` in the system temp directory, could be created
+    first by anyone on the host, and what is kept there is unpickled. So it
+    is made private to this user, and refused if someone else owns it or
+    can write to it.
+    """
+    if directory:
+        return directory
+    directory = os.path.join(tempfile.gettempdir(), "mpv-cache")
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    if hasattr(os, "getuid"):
+        status = os.lstat(directory)
+        if not S_ISDIR(status.st_mode) or status.st_uid != os.getuid() or status.st_mode & 0o022:
+            raise PermissionError("%s is not private to this user, set CACHE_DIR" % (directory,))
+        if status.st_mode & 0o077:
+            os.chmod(directory, 0o700)
+    return directory
+
+
+_caches = dict()
+_caches_lock = threading.Lock()
+
+
+def get_cache(backend: Optional[str], namespace: str, directory: str = None,
+              ttl: float = 300, max_entries: int = 256, max_bytes: int = 0) -> Optional[Cache]:
+    """Get this process's cache for a namespace, or None if caching is off.
+
+    `backend` is "memory", "file" or None. File caches live in a
+    subdirectory of `directory` (see cache_directory() for the default).
+    """
+    if not backend:
+        return None
+    key = (os.getpid(), backend, namespace, directory)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            if backend == "file":
+                path = os.path.join(cache_directory(directory), namespace)
+                cache = FileCache(path, ttl=ttl, max_entries=max_entries,
+                                  max_bytes=max_bytes)
+            else:
+                cache = MemoryCache(ttl=ttl, max_entries=max_entries)
+            _caches[key] = cache
+    return cache
@@ -1,12 +1,248 @@
-from typing import Dict, Union
+import hashlib
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple, Union
 
 from mysql.connector import connect, Error, MySQLConnection, CMySQLConnection
 
 from ..errors.exeptions import DatabaseException
+from .metrics import count_queries
+from .reference_data import get_reference_data
+from .storage import DB_ERRORS, dialect, sqlite_connect, storage_engine, type_mask
+from .summary import has_summary, refresh_summaries, summaries_available
+from .tick_batch import NO_HEIGHT, TickBatch
 
 
-def db_connect(config: Dict) -> Union[MySQLConnection, CMySQLConnection]:
-    """Create connection to database."""
+DEFAULT_BATCH_SIZE = 1000
+
+_BATCH_INSERT = """INSERT INTO `%d` (`date`, `name`, `pitches`, `style`,
+    `lead_style`, `type`, `height`, `code`, `type_mask`, `tick_key`)
+    VALUES (%%s, %%s, %%s, %%s, %%s, %%s, %%s, %%s, %%s, %%s)"""
+
+_SHARED_INSERT = """INSERT INTO `ticks` (`user_id`, `date`, `name`, `pitches`,
+    `style`, `lead_style`, `type`, `height`, `code`, `type_mask`, `tick_key`)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"""
+
+# For date range filters. Index names are global in SQLite, so each carries its table's name
+_USER_DATE_INDEX = "CREATE INDEX `%d_date` ON `%d` (`date`);"
+
+
+class PooledConnection:
+    """A MySQL connection borrowed from a ConnectionPool.
+
+    Behaves like the wrapped connection, except close() hands it back to the
+    pool. Call invalidate() first if it failed, so the pool opens a fresh one.
+    """
+
+    def __init__(self, pool: "ConnectionPool", connection: Union[MySQLConnection, CMySQLConnection]):
+        self._pool = pool
+        self._connection = connection
+        self._invalid = False
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+    def invalidate(self) -> None:
+        self._invalid = True
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._pool.release(self._connection, discard=self._invalid)
+            self._connection = None
+
+
+class CountingCursor:
+    """A cursor that counts the statements it runs for the metrics endpoint."""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def execute(self, operation, params=None, *args, **kwargs):
+        count_queries()
+        return self._cursor.execute(operation, params, *args, **kwargs)
+
+    def executemany(self, operation, seq_params):
+        count_queries()
+        return self._cursor.executemany(operation, seq_params)
+
+
+def db_cursor(connection) -> CountingCursor:
+    """Open a cursor whose statements are counted in the metrics."""
+    return CountingCursor(connection.cursor())
+
+
+class ConnectionPool:
+    """A per-process pool of MySQL connections.
+
+    Keeps up to `size` idle connections and opens up to `max_overflow` extra
+    ones under load, which are closed again when returned. Borrowers wait up
+    to `timeout` seconds for a free connection. Idle connections are pinged
+    before reuse and replaced once older than `recycle` seconds.
+    """
+
+    def __init__(self, factory: Callable, size: int = 5, max_overflow: int = 5,
+                 timeout: float = 10, recycle: float = 3600, pre_ping: bool = True):
+        self._factory = factory
+        self.size = size
+        self.max_overflow = max_overflow
+        self.timeout = timeout
+        self.recycle = recycle
+        self.pre_ping = pre_ping
+        self._idle = list()
+        self._created = dict()
+        self._opened = 0
+        self._in_use = 0
+        self._lock = threading.Condition()
+        self._stats = {"borrowed": 0, "waits": 0, "wait_seconds": 0.0,
+                       "max_wait_seconds": 0.0, "timeouts": 0, "recycled": 0}
+
+    def get(self) -> PooledConnection:
+        """Borrow a connection, opening or waiting for one if none are idle."""
+        start = time.monotonic()
+        deadline = start + self.timeout
+        waited = False
+        with self._lock:
+            while not self._idle and self._opened >= self.size + self.max_overflow:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats["timeouts"] += 1
+                    raise DatabaseException
+                waited = True
+                self._lock.wait(remaining)
+            connection = self._idle.pop() if self._idle else None
+            if connection is None:
+                # Reserve the slot now, open the connection outside the lock
+                self._opened += 1
+            self._in_use += 1
+            self._stats["borrowed"] += 1
+            if waited:
+                wait = time.monotonic() - start
+                self._stats["waits"] += 1
+                self._stats["wait_seconds"] += wait
+                self._stats["max_wait_seconds"] = max(self._stats["max_wait_seconds"], wait)
+
+        try:
+            if connection is not None and not self._healthy(connection):
+                self._close(connection)
+                with self._lock:
+                    self._stats["recycled"] += 1
+                connection = None
+            if connection is None:
+                connection = self._factory()
+                self._created[id(connection)] = time.monotonic()
+        except Exception:
+            with self._lock:
+                self._opened -= 1
+                self._in_use -= 1
+                self._lock.notify()
+            raise
+        return PooledConnection(self, connection)
+
+    def release(self, connection: Union[MySQLConnection, CMySQLConnection], discard: bool = False) -> None:
+        """Return a borrowed connection, closing it if it failed or is overflow."""
+        if not discard:
+            try:
+                # Never hand an open transaction to the next borrower
+                connection.rollback()
+            except Error:
+                discard = True
+        with self._lock:
+            self._in_use -= 1
+            if discard or len(self._idle) >= self.size:
+                self._opened -= 1
+                keep = False
+            else:
+                self._idle.append(connection)
+                keep = True
+            if discard:
+                self._stats["recycled"] += 1
+            self._lock.notify()
+        if not keep:
+            self._close(connection)
+
+    def stats(self) -> Dict:
+        """Get pool sizing and wait time counters for this process."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats.update({"size": self.size, "max_overflow": self.max_overflow,
+                          "open": self._opened, "in_use": self._in_use,
+                          "idle": len(self._idle)})
+        stats["utilization"] = stats["in_use"] / (self.size + self.max_overflow)
+        return stats
+
+    def _healthy(self, connection: Union[MySQLConnection, CMySQLConnection]) -> bool:
+        created = self._created.get(id(connection), 0)
+        if self.recycle and time.monotonic() - created > self.recycle:
+            return False
+        if self.pre_ping:
+            try:
+                return connection.is_connected()
+            except Error:
+                return False
+        return True
+
+    def _close(self, connection: Union[MySQLConnection, CMySQLConnection]) -> None:
+        self._created.pop(id(connection), None)
+        try:
+            connection.close()
+        except Error:
+            pass
+
+
+# One pool per process and database, built lazily so each gunicorn worker gets its own
+_pools = dict()
+_pools_lock = threading.Lock()
+
+
+def get_pool(config: Dict) -> ConnectionPool:
+    """Get this process's connection pool for the configured database."""
+    key = (os.getpid(), config.get("MYSQL_ADDRESS"), config.get("MYSQL_TABLE"),
+           config.get("MYSQL_USER"))
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = ConnectionPool(
+                factory=lambda: _connect(config),
+                size=config.get("MYSQL_POOL_SIZE", 5),
+                max_overflow=config.get("MYSQL_POOL_OVERFLOW", 5),
+                timeout=config.get("MYSQL_POOL_TIMEOUT", 10),
+                recycle=config.get("MYSQL_POOL_RECYCLE", 3600),
+                pre_ping=config.get("MYSQL_POOL_PRE_PING", True))
+            _pools[key] = pool
+    return pool
+
+
+def pool_stats() -> List[Dict]:
+    """Get the stats of every connection pool in this process."""
+    pid = os.getpid()
+    with _pools_lock:
+        pools = [(key, pool) for key, pool in _pools.items() if key[0] == pid]
+    return [dict(pool.stats(), pid=pid, database=key[2]) for key, pool in pools]
+
+
+def db_connect(config: Dict) -> Union[MySQLConnection, CMySQLConnection, PooledConnection]:
+    """Create connection to database.
+
+    With STORAGE_ENGINE set to "sqlite" this opens the embedded database.
+    Otherwise, when MYSQL_POOL_SIZE is configured, the connection is borrowed
+    from this process's pool and db_close() returns it.
+    """
+    if storage_engine(config) == "sqlite":
+        return sqlite_connect(config)
+    if config and config.get("MYSQL_POOL_SIZE"):
+        return get_pool(config).get()
+    return _connect(config)
+
+
+def _connect(config: Dict) -> Union[MySQLConnection, CMySQLConnection]:
     try:
         connection = connect(
             host=config.get("MYSQL_ADDRESS"), database=config.get("MYSQL_TABLE"),
@@ -25,88 +261,246 @@ def db_close(cursor: MySQLConnection.cursor, connection: Union[MySQLConnection,
     connection.close()
 
 
+def db_abort(cursor: MySQLConnection.cursor, connection: Union[MySQLConnection, CMySQLConnection]) -> None:
+    """Roll back and close the connection after an error, keeping it out of the pool."""
+    if isinstance(connection, PooledConnection):
+        connection.invalidate()
+    try:
+        connection.rollback()
+        if cursor is not None:
+            cursor.close()
+    except DB_ERRORS:
+        pass
+    connection.close()
+
+
 def db_load(userid, data, config=None):
-    """Load CSV file into MySQL database."""
+    """Load CSV file into the database.
+
+    `data` is a TickBatch, an iterable of TickBatches, or CSV row lists.
+
+    By default only the difference between the stored ticks and the new
+    export is written. Set DB_INCREMENTAL_SYNC to False to always rebuild.
+    With TICK_STORAGE set to "shared", ticks go into the shared `ticks` table
+    instead of a table per user. Returns the number of ticks inserted and
+    deleted.
+    """
+    batch_size = get_batch_size(config)
+    incremental = config.get("DB_INCREMENTAL_SYNC", True) if config else True
+    shared = is_shared_storage(config)
     # Connect to database
+    connection = db_connect(config=config)
+    cursor = None
     try:
-        connection = db_connect(config=config)
-        cursor = connection.cursor()
-
-        # Drop current user table if it exists
-        cursor.execute("SHOW TABLES LIKE '%s';", (userid,))
-        if cursor.fetchone():
-            cursor.execute("DROP TABLE `%s`;", (userid,))
-
-        # Create new user table
-        create = """CREATE TABLE `%s`(
-            `id` MEDIUMINT UNSIGNED NOT NULL AUTO_INCREMENT,
-            `date` DATE NOT NULL,
-            `name` CHAR(100) CHARACTER SET utf8 NOT NULL,
-            `pitches` SMALLINT UNSIGNED NOT NULL,
-            `style` TINYINT UNSIGNED NULL,
-            `lead_style` TINYINT UNSIGNED NULL,
-            `type` VARCHAR(18) CHARACTER SET utf8 NOT NULL,
-            `height` MEDIUMINT UNSIGNED NULL,
-            `code` MEDIUMINT UNSIGNED NOT NULL,
-            PRIMARY KEY(`id`))"""
-        cursor.execute(create, (userid,))
-
-        # Get value pairs for index tables
-        pairs = get_pairs(cursor)
-
-        # Load data into table
-        for row in data:
-            make_sql_insert(cursor, pairs, userid, row)
+        cursor = db_cursor(connection)
+
+        # Get value pairs for index tables, cached for the whole process
+        pairs = get_reference_data(cursor).pairs
+        # Normalize lazily, so a streamed tick list is never held in full
+        ticks = (keyed_tick(tick) for tick in normalize_ticks(pairs, data))
+
+        if shared:
+            # The shared table always exists and always has tick keys
+            if incremental:
+                counts = sync_ticks(cursor, userid, ticks, batch_size,
+                                    shared=True)
+            else:
+                cursor.execute("DELETE FROM `ticks` WHERE `user_id` = %s;",
+                               (userid,))
+                counts = {"deleted": cursor.rowcount,
+                          "inserted": insert_batches(cursor, userid, ticks,
+                                                     batch_size, shared=True)}
+            update_summaries(cursor, userid, counts, shared=True)
+            db_close(cursor, connection)
+            return counts
 
+        # Check for a current user table we can sync against
+        table_exists = dialect(cursor).table_exists(cursor, int(userid))
+        if table_exists and incremental and has_current_columns(cursor, userid):
+            counts = sync_ticks(cursor, userid, ticks, batch_size)
+        else:
+            # Drop current user table if it exists
+            if table_exists:
+                cursor.execute("DROP TABLE `%d`;" % (int(userid),))
+
+            # Create new user table
+            cursor.execute(dialect(cursor).create_user_table % (int(userid),))
+            cursor.execute(_USER_DATE_INDEX % (int(userid), int(userid)))
+
+            # Load data into table, one multi-row insert per batch
+            counts = {"inserted": insert_batches(cursor, userid, ticks,
+                                                 batch_size),
+                      "deleted": 0}
+
+        update_summaries(cursor, userid, counts)
         # Close database
         db_close(cursor, connection)
         # Return success
-        return
+        return counts
 
     # Handle database errors if they occur
-    except Error as e:
-        db_close(cursor, connection)
+    except DB_ERRORS as e:
+        db_abort(cursor, connection)
         raise DatabaseException
+    # Anything else, like a failed tick list parse, must not leave a transaction open
+    except Exception:
+        db_abort(cursor, connection)
+        raise
 
 
-def get_pairs(cursor):
-    """Get index/value pair route data identifiers from MySQL tables."""
-    # Set the tables to grab data from
-    tables = ("style", "lead_style", "type")
-    pairs = dict()
-    select = "SELECT * FROM `%s`;"
-    # Loop through each of the tables
-    for i in tables:
-        cursor.execute(select % (i,))
-        # Build the dictionary
-        pairs[i] = dict()
-        while True:
-            row = cursor.fetchone()
-            if row is None:
-                break
-            pairs[i][row[1]] = row[0]
-
-    return pairs
-
-
-def make_sql_insert(cursor, pairs, userid, row):
-    """Insert individual ticks into database."""
-    insert = """INSERT INTO `%s` (`date`, `name`, `pitches`, `style`,
-        `lead_style`, `type`, `height`, `code`)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s);"""
-    # Find the right id in each dictionary
-    s_id = pairs["style"].get(row[3])
-    ls_id = pairs["lead_style"].get(row[4])
+def update_summaries(cursor: MySQLConnection.cursor, userid: int, counts: Dict,
+                     shared: bool = False) -> None:
+    """Rebuild the user's summary rows unless the load left their ticks untouched."""
+    if not summaries_available(cursor):
+        return
+    if counts["inserted"] or counts["deleted"] or not has_summary(cursor, userid):
+        refresh_summaries(cursor, userid, *tick_source(userid, shared))
+
+
+def is_shared_storage(config: Dict = None) -> bool:
+    """Check whether ticks are kept in the shared `ticks` table."""
+    return bool(config) and config.get("TICK_STORAGE") == "shared"
+
+
+def tick_source(userid: int, shared: bool = False) -> Tuple[str, str]:
+    """Get the table holding a user's ticks and the condition that selects them."""
+    if shared:
+        return "`ticks`", "`user_id` = %d" % int(userid)
+    return "`%d`" % int(userid), "TRUE"
+
+
+def has_current_columns(cursor: MySQLConnection.cursor, userid: int) -> bool:
+    """Check that a user table was built with the tick_key and type_mask columns.
+
+    Older tables are rebuilt rather than synced.
+    """
+    return all(dialect(cursor).column_exists(cursor, int(userid), column)
+               for column in ("tick_key", "type_mask"))
+
+
+def sync_ticks(cursor: MySQLConnection.cursor, userid: int, ticks: Iterable[Tuple],
+               batch_size: int = DEFAULT_BATCH_SIZE, shared: bool = False) -> Dict:
+    """Bring a user's stored ticks in line with the export, touching only changed ticks.
+
+    Ticks are matched on tick_key. Duplicate ticks (same route, same day) are
+    matched one for one, so an unchanged export writes nothing at all.
+    """
+    table, user = tick_source(userid, shared)
+    cursor.execute("SELECT `id`, `tick_key` FROM %s WHERE %s;" % (table, user))
+    stored = defaultdict(list)
+    for row_id, key in cursor.fetchall():
+        stored[key].append(row_id)
+
+    def new_ticks():
+        for tick in ticks:
+            if stored.get(tick[-1]):
+                stored[tick[-1]].pop()
+            else:
+                yield tick
+
+    # New ticks are inserted as they are found, then anything left in stored
+    # after matching has been removed from the export
+    inserted = insert_batches(cursor, userid, new_ticks(), batch_size, shared)
+    removed = [row_id for row_ids in stored.values() for row_id in row_ids]
+
+    delete = "DELETE FROM %s WHERE `id` IN (%s);"
+    for start in range(0, len(removed), batch_size):
+        chunk = removed[start:start + batch_size]
+        cursor.execute(delete % (table, ", ".join(["%s"] * len(chunk))),
+                       chunk)
+
+    return {"inserted": inserted, "deleted": len(removed)}
+
 
+def tick_key(tick: Tuple) -> str:
+    """Fingerprint a normalized tick so it can be matched across exports."""
+    joined = "\x1f".join(str(value) for value in tick)
+    return hashlib.sha1(joined.encode("utf-8")).hexdigest()
+
+
+def keyed_tick(tick: Tuple) -> Tuple:
+    """Append the type_mask and tick_key columns to a normalized tick.
+
+    The key only covers the normalized columns, so it matches keys stored
+    before type_mask was added.
+    """
+    return tick + (type_mask(tick[5]), tick_key(tick))
+
+
+def get_batch_size(config: Dict = None) -> int:
+    """Get the number of ticks sent to MySQL per insert statement."""
+    batch_size = DEFAULT_BATCH_SIZE
+    if config:
+        batch_size = config.get("DB_BATCH_SIZE", DEFAULT_BATCH_SIZE)
+    return max(int(batch_size), 1)
+
+
+def insert_batches(cursor: MySQLConnection.cursor, userid: int,
+                   ticks: Iterable[Tuple], batch_size: int = DEFAULT_BATCH_SIZE,
+                   shared: bool = False) -> int:
+    """Insert normalized ticks in chunks, returning the number of rows written."""
+    if shared:
+        insert = _SHARED_INSERT
+        ticks = ((userid,) + tick for tick in ticks)
+    else:
+        # The table name can't be a bound parameter here, because executemany
+        # only folds plain `VALUES (%s, ...)` inserts into a multi-row statement.
+        insert = _BATCH_INSERT % (int(userid),)
+    count = 0
+    batch = list()
+    for tick in ticks:
+        batch.append(tick)
+        if len(batch) >= batch_size:
+            cursor.executemany(insert, batch)
+            count += len(batch)
+            batch = list()
+    if batch:
+        cursor.executemany(insert, batch)
+        count += len(batch)
+    return count
+
+
+def normalize_ticks(pairs: Dict, data: Union[TickBatch, Iterable]) -> Iterator[Tuple]:
+    """Lazily normalize ticks into insertable tuples.
+
+    `data` is a TickBatch, or an iterable of TickBatches or CSV row lists.
+    """
+    if isinstance(data, TickBatch):
+        data = (data,)
+    for item in data:
+        if isinstance(item, TickBatch):
+            yield from normalize_batch(pairs, item)
+        else:
+            yield normalize_tick(pairs, item)
+
+
+def normalize_batch(pairs: Dict, batch: TickBatch) -> Iterator[Tuple]:
+    """Normalize a TickBatch into the same tuples normalize_tick() builds from rows.
+
+    The lookups are done once per distinct value, not once per tick.
+    """
+    styles = [pairs["style"].get(value) for value in batch.styles]
+    lead_styles = [pairs["lead_style"].get(value) for value in batch.lead_styles]
+    types = [type_id(pairs, value) for value in batch.route_types]
+    columns = zip(batch.date_strings(), batch.iter_names(), batch.pitches.tolist(),
+                  batch.style.tolist(), batch.lead_style.tolist(), batch.route_type.tolist(),
+                  batch.heights.tolist(), batch.codes.tolist())
+    for date, name, pitches, style, lead_style, route_type, height, code in columns:
+        yield (date, name or "None", pitches, styles[style], lead_styles[lead_style],
+               types[route_type], None if height == NO_HEIGHT else height, code)
+
+
+def type_id(pairs: Dict, route_type: str) -> Union[int, str]:
+    """Get the type id for a route type, or a csv of ids for a multi-type route."""
     # Special processing for csv values in type
-    if row[5]:
-        t_id = pairs["type"].get(row[5])
+    if route_type:
+        t_id = pairs["type"].get(route_type)
         # This runs if there is no match found, ie. var is multi-type
         if t_id is None:
             t_id = ""
             # Thanks Sean Vieira for this list comprehension
             # (via StackOverflow)
-            split = [x.strip() for x in row[5].split(',')]
+            split = [x.strip() for x in route_type.split(',')]
             # Build the id field as a csv
             for i in split:
                 t_id += str(pairs["type"].get(i))
@@ -115,6 +509,19 @@ def make_sql_insert(cursor, pairs, userid, row):
     # Assign blank id if type import is blank
     else:
         t_id = pairs["type"].get("Blank")
+    return t_id
+
+
+def normalize_tick(pairs: Dict, row: List) -> Tuple:
+    """Map a CSV row onto the user table columns, fixing up blank values.
+
+    Returns (date, name, pitches, style, lead_style, type, height, code).
+    """
+    # Find the right id in each dictionary
+    s_id = pairs["style"].get(row[3])
+    ls_id = pairs["lead_style"].get(row[4])
+
+    t_id = type_id(pairs, row[5])
 
     # Make correction for 0000-00-00 date
     if row[0] == "0000-00-00" or not row[0]:
@@ -147,9 +554,4 @@ def make_sql_insert(cursor, pairs, userid, row):
     else:
         code = 0
 
-    # Set the values tuple
-    values = (userid, date, name, pitches, s_id,
-              ls_id, t_id, height, code)
-
-    # Insert the row
-    cursor.execute(insert, values)
+    return (date, name, pitches, s_id, ls_id, t_id, height, code)
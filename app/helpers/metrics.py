@@ -0,0 +1,207 @@
+"""Stage timings, counters and histograms, exported in Prometheus text format.
+
+Each worker process keeps its own series and writes them to a file named
+after its pid in the metrics directory after every request. `/metrics`
+adds up every worker's file, so the totals cover the whole gunicorn server
+whichever worker answers the scrape.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+
+from .cache import cache_directory
+
+
+# Seconds, from a cached lookup to a very slow MP download
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+BYTE_BUCKETS = (1024, 16384, 131072, 1048576, 4194304, 16777216, 67108864)
+COUNT_BUCKETS = (0, 1, 5, 10, 25, 50, 100, 250, 1000)
+
+_HELP = {
+    "mpv_stage_seconds": ("histogram", "Time spent in each /data pipeline stage."),
+    "mpv_request_seconds": ("histogram", "Time spent handling each request."),
+    "mpv_request_db_queries": ("histogram", "MySQL statements run per request."),
+    "mpv_request_download_bytes": ("histogram", "Bytes downloaded from Mountain Project per request."),
+    "mpv_requests_total": ("counter", "Requests handled."),
+    "mpv_db_queries_total": ("counter", "MySQL statements run."),
+    "mpv_download_bytes_total": ("counter", "Bytes downloaded from Mountain Project."),
+}
+_BUCKETS = {"mpv_request_db_queries": COUNT_BUCKETS,
+            "mpv_request_download_bytes": BYTE_BUCKETS}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Metrics:
+    """This process's counters and histograms."""
+
+    def __init__(self):
+        self._counters = dict()
+        self._histograms = dict()
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels) -> None:
+        """Add a value to a histogram, as bucket counts plus a sum and count."""
+        buckets = _BUCKETS.get(name, DEFAULT_BUCKETS)
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            series = self._histograms.get(key)
+            if series is None:
+                series = self._histograms[key] = [0] * (len(buckets) + 2)
+            for i, bound in enumerate(buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {"counters": [[name, list(labels), value]
+                                 for (name, labels), value in self._counters.items()],
+                    "histograms": [[name, list(labels), list(series)]
+                                   for (name, labels), series in self._histograms.items()]}
+
+    def flush(self, directory: str) -> None:
+        """Write this process's series to its file in `directory`."""
+        os.makedirs(directory, exist_ok=True)
+        handle, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "w") as metrics_file:
+                json.dump(self.snapshot(), metrics_file)
+            os.replace(temp_path, os.path.join(directory, "%d.json" % (os.getpid(),)))
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+
+metrics = Metrics()
+
+# Per-request timings and totals, for the Server-Timing header
+_request = threading.local()
+
+
+def start_request() -> None:
+    _request.timings = list()
+    _request.queries = 0
+    _request.downloaded = 0
+
+
+def request_timings() -> List[Tuple[str, float]]:
+    return getattr(_request, "timings", [])
+
+
+def request_totals() -> Tuple[int, int]:
+    """Get the MySQL statements run and bytes downloaded by this request so far."""
+    return getattr(_request, "queries", 0), getattr(_request, "downloaded", 0)
+
+
+@contextmanager
+def timed(stage: str) -> Iterator[None]:
+    """Time a pipeline stage into the stage histogram and the request's timings."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        metrics.observe("mpv_stage_seconds", elapsed, stage=stage)
+        if hasattr(_request, "timings"):
+            _request.timings.append((stage, elapsed))
+
+
+def count_queries(count: int = 1) -> None:
+    metrics.inc("mpv_db_queries_total", count)
+    if hasattr(_request, "queries"):
+        _request.queries += count
+
+
+def count_download(size: int) -> None:
+    metrics.inc("mpv_download_bytes_total", size)
+    if hasattr(_request, "downloaded"):
+        _request.downloaded += size
+
+
+def server_timing(timings: List[Tuple[str, float]]) -> str:
+    """Format stage timings as a Server-Timing header, adding up repeated stages."""
+    totals = dict()
+    for stage, elapsed in timings:
+        totals[stage] = totals.get(stage, 0) + elapsed
+    return ", ".join("%s;dur=%.1f" % (stage, elapsed * 1000)
+                     for stage, elapsed in totals.items())
+
+
+def collect(directory: str) -> Dict:
+    """Add up the series written by every worker in `directory`."""
+    counters = dict()
+    histograms = dict()
+    try:
+        names = [name for name in os.listdir(directory) if name.endswith(".json")]
+    except OSError:
+        names = list()
+    for name in names:
+        try:
+            with open(os.path.join(directory, name)) as metrics_file:
+                snapshot = json.load(metrics_file)
+        except (OSError, ValueError):
+            continue
+        for metric, labels, value in snapshot["counters"]:
+            key = (metric, tuple(tuple(label) for label in labels))
+            counters[key] = counters.get(key, 0) + value
+        for metric, labels, series in snapshot["histograms"]:
+            key = (metric, tuple(tuple(label) for label in labels))
+            total = histograms.setdefault(key, [0] * len(series))
+            for i, value in enumerate(series):
+                total[i] += value
+    return {"counters": counters, "histograms": histograms}
+
+
+def _labels(labels: Labels, extra: Labels = ()) -> str:
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    return "{%s}" % ",".join('%s="%s"' % (name, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+                            for name, value in pairs)
+
+
+def render(collected: Dict) -> str:
+    """Format collected series in the Prometheus text exposition format."""
+    lines = list()
+    described = set()
+
+    def describe(name):
+        if name not in described and name in _HELP:
+            kind, text = _HELP[name]
+            lines.append("# HELP %s %s" % (name, text))
+            lines.append("# TYPE %s %s" % (name, kind))
+            described.add(name)
+
+    for (name, labels), value in sorted(collected["counters"].items()):
+        describe(name)
+        lines.append("%s%s %s" % (name, _labels(labels), repr(value)))
+    for (name, labels), series in sorted(collected["histograms"].items()):
+        describe(name)
+        buckets = _BUCKETS.get(name, DEFAULT_BUCKETS)
+        # observe() already counts a value into every bucket it fits under
+        for bound, count in zip(buckets, series):
+            lines.append("%s_bucket%s %d" % (name, _labels(labels, (("le", repr(float(bound))),)),
+                                             count))
+        lines.append("%s_bucket%s %d" % (name, _labels(labels, (("le", "+Inf"),)), series[-1]))
+        lines.append("%s_sum%s %s" % (name, _labels(labels), repr(series[-2])))
+        lines.append("%s_count%s %d" % (name, _labels(labels), series[-1]))
+    return "\n".join(lines) + "\n"
+
+
+def metrics_directory(config: Dict) -> str:
+    return config.get("METRICS_DIR") or os.path.join(
+        cache_directory(config.get("CACHE_DIR")), "metrics")
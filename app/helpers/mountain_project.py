@@ -1,24 +1,158 @@
 import io
+import json
 import os
-from typing import Dict, Optional, Union
+import random
+import tempfile
+from typing import Callable, Dict, Iterator, Optional, Tuple, Union
 
 import pandas as pd
 import requests
 from requests import ConnectionError, ConnectTimeout, HTTPError, ReadTimeout, Timeout
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RetryError
+from urllib3.util.retry import Retry
 from pandas.errors import EmptyDataError, ParserError
 
+from .cache import Cache
+from .metrics import count_download
+from .tick_batch import TickBatch
 from ..errors.exeptions import *
 
 
 _DEV_USER_DATA = {"status": 0, "name": "Dev", "mp_id": 1111}
+MP_BASE_URL = "https://www.mountainproject.com"
 _DEV_TEST_TICKS = os.path.join(os.getcwd(), 'test_ticks.csv')
+_TICK_COLUMNS = ["Date", "Route", "Pitches", "Style",
+                 "Lead Style", "Route Type", "Length", "Rating Code"]
+# Seconds to wait for the TCP/TLS connection, then for each read
+_DEFAULT_TIMEOUT = (5, 30)
+# Upstream responses worth retrying: rate limiting and server errors
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_sessions = {}
+
+
+class JitteredRetry(Retry):
+    """Exponential backoff with full jitter, so workers don't retry in lockstep."""
+
+    def get_backoff_time(self) -> float:
+        return random.uniform(0, super().get_backoff_time())
+
+
+def get_session(pool_size: int = 10, retries: int = 3, backoff: float = 0.5) -> requests.Session:
+    """Get this process's keep-alive session for the Mountain Project API.
+
+    Sessions are created lazily per process, so each gunicorn worker reuses
+    its own pooled connections across requests.
+    """
+    key = (os.getpid(), pool_size, retries, backoff)
+    session = _sessions.get(key)
+    if session is None:
+        retry = JitteredRetry(total=retries, backoff_factor=backoff,
+                              status_forcelist=_RETRY_STATUSES,
+                              raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size,
+                              max_retries=retry)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        _sessions[key] = session
+    return session
+
+
+class CachedResponse:
+    """The parts of a Mountain Project response kept in the response cache."""
+
+    def __init__(self, status_code: int, content: bytes, headers: Dict):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+
+    @classmethod
+    def from_response(cls, response: requests.Response, content: bytes = None) -> "CachedResponse":
+        """Keep a response's validators and its body, which is `content` if it was read already."""
+        headers = {name: response.headers[name] for name in ("ETag", "Last-Modified")
+                   if name in response.headers}
+        return cls(response.status_code, response.content if content is None else content, headers)
+
+    def json(self) -> Dict:
+        return json.loads(self.content.decode("utf-8"))
+
+
+class CachingStream(io.RawIOBase):
+    """A streamed response body that is cached once it has been read to the end.
+
+    The bytes read are copied to a temporary file rather than kept in memory,
+    so a streamed parse still only holds one chunk at a time.
+    """
+
+    def __init__(self, response: requests.Response, cache: Cache, cache_key: str):
+        super().__init__()
+        self._response = response
+        self._raw = response.raw
+        # Let urllib3 undo any gzip transfer encoding as we read
+        self._raw.decode_content = True
+        self._cache = cache
+        self._cache_key = cache_key
+        self._spool = tempfile.TemporaryFile()
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._raw.read(len(buffer))
+        if not data:
+            self._store()
+            return 0
+        self._spool.write(data)
+        buffer[:len(data)] = data
+        return len(data)
+
+    def tell(self) -> int:
+        # Bytes read off the wire, before any gzip decoding
+        return self._raw.tell()
+
+    def close(self) -> None:
+        self._spool.close()
+        super().close()
+
+    def _store(self) -> None:
+        if self._spool.closed:
+            return
+        self._spool.seek(0)
+        cached = CachedResponse.from_response(self._response, self._spool.read())
+        self._spool.close()
+        self._cache.set(self._cache_key, cached)
+
+
+class CachingResponse:
+    """A live response whose body is read from `raw`, and cached when it has all been read."""
+
+    def __init__(self, response: requests.Response, cache: Cache, cache_key: str):
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.raw = CachingStream(response, cache, cache_key)
+
+    @property
+    def content(self) -> bytes:
+        return self.raw.read()
+
+
+def record_download(response) -> None:
+    """Count a live response's body in the download metrics, skipping cached ones."""
+    if isinstance(response, CachedResponse):
+        return
+    content = getattr(response, "content", None)
+    if isinstance(content, bytes):
+        count_download(len(content))
 
 
 class MountainProjectParser:
     """Responsible for the processing and temporary storage of Mountain Project API data. """
-    api_data = {}
 
     def __init__(self):
+        # Per handler, so concurrent requests in one worker don't read each other's responses
+        self.api_data = {}
         self._mp_id = None
         self._mp_username = None
 
@@ -28,7 +162,9 @@ class MountainProjectParser:
             return _DEV_USER_DATA
         else:
             try:
-                user_data = self.api_data.get('user_data').json()
+                response = self.api_data.get('user_data')
+                user_data = response.json()
+                record_download(response)
             except ValueError:
                 # In case the JSON decoding fails, r.json() raises a ValueError.
                 raise MPAPIException
@@ -38,40 +174,121 @@ class MountainProjectParser:
             return {"status": 0, "name": self._mp_username, "mp_id": self._mp_id}
 
     def parse_tick_list(self, dev_env: bool = False) -> Dict:
-        """Parse the request data into a Pandas dataframe to clean."""
-        columns = ["Date", "Route", "Pitches", "Style",
-                   "Lead Style", "Route Type", "Length", "Rating Code"]
+        """Parse the request data into a compact TickBatch for db_load and the analytics."""
+        columns = _TICK_COLUMNS
         if dev_env:
             with open(_DEV_TEST_TICKS) as tick_list_file:
                 df = pd.read_csv(tick_list_file, usecols=columns,
                                  na_filter=False)
         else:
             try:
-                tick_list = self.api_data.get("tick_list").content.decode("utf-8")
+                response = self.api_data.get("tick_list")
+                tick_list = response.content.decode("utf-8")
+                record_download(response)
                 df = pd.read_csv(io.StringIO(tick_list),
                                  usecols=columns, na_filter=False)
             except (AttributeError, UnicodeDecodeError, EmptyDataError, ParserError) as e:
                 raise MPAPIException
 
-        return {"status": 0, "data": df.values.tolist()}
+        return {"status": 0, "data": TickBatch.from_frame(df)}
+
+    def iter_tick_batches(self, chunksize: int = 5000, dev_env: bool = False) -> Iterator[TickBatch]:
+        """Parse the tick list in TickBatch chunks, reading the response as it streams in.
+
+        Only one chunk is held at a time. Length is always read as text so
+        every chunk is parsed the same way as a full parse_tick_list().
+        """
+        if dev_env:
+            source = open(_DEV_TEST_TICKS, "rb")
+        else:
+            response = self.api_data.get("tick_list")
+            source = getattr(response, "raw", None)
+            if source is not None:
+                # Let urllib3 undo any gzip transfer encoding as we read
+                source.decode_content = True
+            else:
+                # Cached responses are already in memory
+                source = io.BytesIO(getattr(response, "content", b""))
+
+        try:
+            reader = pd.read_csv(source, usecols=_TICK_COLUMNS, na_filter=False,
+                                 dtype={"Length": str}, encoding="utf-8",
+                                 chunksize=chunksize)
+            for chunk in reader:
+                yield TickBatch.from_frame(chunk)
+            if not dev_env and hasattr(source, "tell") and not isinstance(response, CachedResponse):
+                # Bytes read off the wire, before any gzip decoding
+                count_download(source.tell())
+        except (AttributeError, UnicodeDecodeError, EmptyDataError, ParserError, ValueError):
+            raise MPAPIException
+        finally:
+            if dev_env:
+                source.close()
 
 
 class MountainProjectHandler(MountainProjectParser):
-    """Responsible for interacting with the Mountain Project api."""
+    """Responsible for interacting with the Mountain Project api.
+
+    `before_fetch` is called once, just before the first request that goes
+    to Mountain Project rather than being served from the cache.
+    """
 
-    def __init__(self, api_key: str = None, email: str = None, dev_env: bool = False):
+    def __init__(self, api_key: str = None, email: str = None, dev_env: bool = False,
+                 session: requests.Session = None, timeout: Tuple[float, float] = _DEFAULT_TIMEOUT,
+                 cache: Cache = None, base_url: str = MP_BASE_URL,
+                 before_fetch: Callable[[], None] = None):
         super().__init__()
         self._api_key = api_key
         self._email = email
-        self.base_url = "https://www.mountainproject.com"
+        self.base_url = base_url.rstrip("/")
         self.dev_env = dev_env
+        self._session = session or get_session()
+        self.timeout = timeout
+        self._cache = cache
+        self._before_fetch = before_fetch
+
+    def _mp_generic_request(self, obj_key: str,  url: str, params: Dict = None,
+                            timeout: Tuple[float, float] = None, cache_key: str = None,
+                            stream: bool = False):
+        # Serve fresh cache entries without touching the network
+        cached = None
+        if self._cache is not None and cache_key:
+            cached, fresh = self._cache.lookup(cache_key)
+            if fresh:
+                self.api_data.update({obj_key: cached})
+                return cached
+
+        # Revalidate expired entries if upstream gave us validators
+        headers = dict()
+        if cached is not None:
+            if "ETag" in cached.headers:
+                headers["If-None-Match"] = cached.headers["ETag"]
+            if "Last-Modified" in cached.headers:
+                headers["If-Modified-Since"] = cached.headers["Last-Modified"]
+
+        if self._before_fetch is not None:
+            before_fetch, self._before_fetch = self._before_fetch, None
+            before_fetch()
 
-    def _mp_generic_request(self, obj_key: str,  url: str, params: Dict = None, timeout: int = 30):
         try:
-            mp_request = requests.get(url, params, timeout=timeout, stream=True)
-        except (ReadTimeout, ConnectTimeout, HTTPError, Timeout, ConnectionError):
+            mp_request = self._session.get(url, params=params, timeout=timeout or self.timeout,
+                                           stream=True, headers=headers or None)
+        except (ReadTimeout, ConnectTimeout, HTTPError, Timeout, ConnectionError, RetryError):
             raise RequestException
 
+        if self._cache is not None and cache_key:
+            if cached is not None and mp_request.status_code == 304:
+                mp_request = cached
+            if mp_request.status_code == 200 and isinstance(mp_request, CachedResponse):
+                self._cache.set(cache_key, mp_request)
+            elif mp_request.status_code == 200 and stream:
+                # Cached as iter_tick_batches() reads it, not read into memory up front
+                mp_request = CachingResponse(mp_request, self._cache, cache_key)
+            elif mp_request.status_code == 200:
+                mp_request = CachedResponse.from_response(mp_request)
+                count_download(len(mp_request.content))
+                self._cache.set(cache_key, mp_request)
+
         # add response to super class dictionary for processing.
         self.api_data.update({obj_key: mp_request})
         return mp_request
@@ -85,15 +302,22 @@ class MountainProjectHandler(MountainProjectParser):
         return self._mp_generic_request(
             url=f"{self.base_url}/data/get-user",
             params=params,
-            obj_key='user_data'
+            obj_key='user_data',
+            cache_key=f"user:{str(self._email).strip().lower()}"
         )
 
-    def fetch_tick_list(self) -> Optional["requests"]:
-        """Executes request to /user/<mp_id>/<mp_username>/tick-export."""
+    def fetch_tick_list(self, stream: bool = False) -> Optional["requests"]:
+        """Executes request to /user/<mp_id>/<mp_username>/tick-export.
+
+        Pass `stream` when the export will be read with iter_tick_batches(),
+        so a live response is never read into memory whole.
+        """
         if self.dev_env:
             return
 
         return self._mp_generic_request(
             url=f"{self.base_url}/user/{self._mp_id}/{self._mp_username}/tick-export",
-            obj_key='tick_list'
+            obj_key='tick_list',
+            cache_key=f"ticks:{self._mp_id}",
+            stream=stream
         )
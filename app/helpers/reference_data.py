@@ -0,0 +1,75 @@
+"""Process-wide cache of the small, static lookup tables.
+
+The `style`, `lead_style`, `type` and `code` tables only change when
+`app.setup.db_setup` rebuilds them, which also writes a new
+`reference_version` stamp to the `meta` table. Each worker loads the tables
+once and only re-checks the stamp every `max_age` seconds.
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from mysql.connector import MySQLConnection
+
+from .storage import DB_ERRORS
+
+
+class ReferenceData:
+    """Lookup dictionaries for ticks, plus the grade codes as sorted arrays."""
+
+    def __init__(self, pairs: Dict[str, Dict[str, int]], codes: List[Tuple[int, str]],
+                 version: Optional[str] = None):
+        self.pairs = pairs
+        self.version = version
+        codes = sorted(codes)
+        self.code_ids = [row[0] for row in codes]
+        self.code_labels = [row[1] for row in codes]
+        self.loaded = time.monotonic()
+
+
+_reference = None
+_checked = 0.0
+_lock = threading.Lock()
+
+
+def get_reference_data(cursor: MySQLConnection.cursor, max_age: float = 60) -> ReferenceData:
+    """Get this process's reference data, reloading it if db_setup has stamped a new version."""
+    global _reference, _checked
+    with _lock:
+        now = time.monotonic()
+        if _reference is not None and now - _checked < max_age:
+            return _reference
+        version = get_version(cursor)
+        if _reference is None or version != _reference.version:
+            _reference = load_reference_data(cursor, version)
+        _checked = now
+        return _reference
+
+
+def clear_reference_data() -> None:
+    """Forget the cached tables, so the next call reloads them."""
+    global _reference, _checked
+    with _lock:
+        _reference = None
+        _checked = 0.0
+
+
+def get_version(cursor: MySQLConnection.cursor) -> Optional[str]:
+    """Get the reference version stamp, or None on a database set up before stamps."""
+    try:
+        cursor.execute("SELECT `value` FROM `meta` WHERE `name` = 'reference_version';")
+        rows = cursor.fetchall()
+    except DB_ERRORS:
+        return None
+    return rows[0][0] if rows else None
+
+
+def load_reference_data(cursor: MySQLConnection.cursor, version: Optional[str] = None) -> ReferenceData:
+    """Read the lookup tables from the database."""
+    pairs = dict()
+    for table in ("style", "lead_style", "type"):
+        cursor.execute("SELECT * FROM `%s`;" % (table,))
+        pairs[table] = {row[1]: row[0] for row in cursor.fetchall()}
+    cursor.execute("SELECT `id`, `code` FROM `code`;")
+    return ReferenceData(pairs, cursor.fetchall(), version)
@@ -0,0 +1,243 @@
+"""Coalesce concurrent runs of the pipeline for one email, across every worker.
+
+A double-clicked submit or an impatient reload sends the same email several
+times at once. Without coordination each request downloads the tick export
+again and rebuilds the same user table while the others read it. Here the
+first request takes a file lock for the email and runs the pipeline. Any
+request for that email arriving meanwhile, in any worker, waits on the lock
+and then reuses the result the first one left behind.
+
+A run that actually goes to Mountain Project also counts against a
+per-email rate limit, kept in a SQLite file, so nobody can hammer the
+Mountain Project API through us.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:
+    # Not on Windows, where runs aren't coalesced
+    fcntl = None
+
+from ..errors.error_registry import registered_exception
+from ..errors.exeptions import RequestException, TooManyRequestsException
+from .cache import FileCache, cache_directory
+
+
+_CREATE_RATE_LIMITS = """CREATE TABLE IF NOT EXISTS `rate_limits`(
+    `key` TEXT PRIMARY KEY,
+    `window` INTEGER NOT NULL,
+    `count` INTEGER NOT NULL)"""
+
+# Seconds between attempts to take a lock another run holds
+_POLL = 0.05
+
+
+class RateLimiter:
+    """Allows `limit` runs per key in each `window` seconds, counted in a shared SQLite file."""
+
+    def __init__(self, path: str, limit: int, window: float = 60):
+        self.path = path
+        self.limit = limit
+        self.window = window
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        connection = self._connect()
+        try:
+            connection.execute(_CREATE_RATE_LIMITS)
+        finally:
+            connection.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL;")
+        return connection
+
+    def hit(self, key: str) -> Optional[float]:
+        """Count a run for a key. Returns None if it is allowed, or the seconds until it would be."""
+        now = time.time()
+        window = int(now // self.window)
+        connection = self._connect()
+        try:
+            connection.execute("BEGIN IMMEDIATE;")
+            connection.execute("DELETE FROM `rate_limits` WHERE `window` < ?;", (window,))
+            row = connection.execute("SELECT `count` FROM `rate_limits` WHERE `key` = ?;",
+                                     (key,)).fetchone()
+            if row is not None and row[0] >= self.limit:
+                connection.execute("COMMIT;")
+                return (window + 1) * self.window - now
+            connection.execute("REPLACE INTO `rate_limits` (`key`, `window`, `count`) VALUES (?, ?, ?);",
+                               (key, window, (row[0] if row else 0) + 1))
+            connection.execute("COMMIT;")
+            return None
+        except sqlite3.Error:
+            connection.execute("ROLLBACK;")
+            raise
+        finally:
+            connection.close()
+
+
+class SingleFlight:
+    """Runs one function per key at a time, sharing each result with the runs that waited on it.
+
+    Results, or the name of the exception a run raised, are kept for
+    `result_ttl` seconds, but are only handed to runs that started before
+    they were stored. The least recently used results are evicted once they
+    add up to more than `max_bytes` (0 for no limit). A run waits at most
+    `wait` seconds for the lock.
+    """
+
+    def __init__(self, directory: str, result_ttl: float = 60, wait: float = 120,
+                 max_bytes: int = 0):
+        self.directory = directory
+        self.wait = wait
+        self._results = FileCache(os.path.join(directory, "results"), ttl=result_ttl,
+                                  max_bytes=max_bytes)
+        os.makedirs(os.path.join(directory, "locks"), exist_ok=True)
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[None]:
+        """Hold the key's file lock, shared by every thread and worker, for the block."""
+        if fcntl is None:
+            yield
+            return
+        deadline = time.monotonic() + self.wait
+        path = os.path.join(self.directory, "locks", hashlib.sha1(key.encode("utf-8")).hexdigest() + ".lock")
+        while True:
+            lock_file = open(path, "a")
+            try:
+                while True:
+                    try:
+                        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                        break
+                    except OSError:
+                        if time.monotonic() > deadline:
+                            raise RequestException
+                        time.sleep(_POLL)
+                # The file may have been evicted while we waited, then lock the one now in its place
+                try:
+                    if os.stat(path).st_ino == os.fstat(lock_file.fileno()).st_ino:
+                        break
+                except OSError:
+                    pass
+            except BaseException:
+                lock_file.close()
+                raise
+            lock_file.close()
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+            lock_file.close()
+
+    def run(self, key: str, func: Callable, *args, variant: str = "", **kwargs):
+        """Get func(*args, **kwargs), or the result of a run for the key that finished while we waited.
+
+        Runs for one key are serialized whatever their `variant`, but only
+        share results with runs of the same variant.
+        """
+        started = time.time()
+        result_key = "%s\x1f%s" % (key, variant)
+        with self.lock(key):
+            shared = self._results.get(result_key)
+            if shared is not None and shared[0] >= started:
+                finished, result, error = shared
+                if error is not None:
+                    raise registered_exception(error)
+                return result
+
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                self._store(result_key, (time.time(), None, type(e).__name__))
+                raise
+            self._store(result_key, (time.time(), result, None))
+            return result
+
+    def _store(self, result_key: str, shared: tuple) -> None:
+        """Keep a run's result, evicting old results and the lock files no run holds."""
+        self._results.set(result_key, shared)
+        if fcntl is None:
+            return
+        directory = os.path.join(self.directory, "locks")
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            try:
+                with open(path, "a") as lock_file:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    # Removed while locked, so a run waiting on it takes a new file
+                    os.remove(path)
+            except OSError:
+                # Held by a run, or removed by another worker
+                pass
+
+
+_flights = dict()
+_flights_lock = threading.Lock()
+
+
+def get_single_flight(config: Dict) -> Optional[SingleFlight]:
+    """Get this process's single-flight runner, or None if SINGLE_FLIGHT is off."""
+    if not config.get("SINGLE_FLIGHT", True):
+        return None
+    directory = os.path.join(cache_directory(config.get("CACHE_DIR")),
+                             "single-flight")
+    key = (os.getpid(), directory)
+    with _flights_lock:
+        flight = _flights.get(key)
+        if flight is None:
+            flight = SingleFlight(directory, result_ttl=config.get("SINGLE_FLIGHT_TTL", 60),
+                                  wait=config.get("SINGLE_FLIGHT_WAIT", 120),
+                                  max_bytes=config.get("SINGLE_FLIGHT_MAX_BYTES", 0))
+            _flights[key] = flight
+    return flight
+
+
+_limiters = dict()
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(config: Dict) -> Optional[RateLimiter]:
+    """Get this process's rate limiter, or None if RATE_LIMIT isn't set."""
+    if not config.get("RATE_LIMIT"):
+        return None
+    path = os.path.join(cache_directory(config.get("CACHE_DIR")),
+                        "single-flight", "rate_limits.sqlite3")
+    key = (os.getpid(), path, config.get("RATE_LIMIT"), config.get("RATE_LIMIT_WINDOW", 60))
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = RateLimiter(path, limit=config.get("RATE_LIMIT"),
+                                  window=config.get("RATE_LIMIT_WINDOW", 60))
+            _limiters[key] = limiter
+    return limiter
+
+
+def rate_limit(config: Dict, email: str) -> None:
+    """Count a run for an email against RATE_LIMIT, raising TooManyRequestsException past it.
+
+    The TEST_ACCT is never limited, since every visitor trying the app shares it.
+    """
+    limiter = get_rate_limiter(config)
+    email = str(email).strip().lower()
+    if limiter is None or email == str(config.get("TEST_ACCT", "")).strip().lower():
+        return
+    retry_after = limiter.hit(hashlib.sha1(email.encode("utf-8")).hexdigest())
+    if retry_after is not None:
+        error = TooManyRequestsException()
+        error.retry_after = max(int(retry_after), 1)
+        raise error
+
+
+def single_flight(config: Dict, key: str, func: Callable, *args, variant: str = "", **kwargs):
+    """Run func(*args, **kwargs) for a key through this process's single-flight runner."""
+    flight = get_single_flight(config)
+    if flight is None:
+        return func(*args, **kwargs)
+    return flight.run(key, func, *args, variant=variant, **kwargs)
@@ -0,0 +1,291 @@
+"""Storage engines for ticks: MySQL, or an embedded SQLite database.
+
+The SQL elsewhere is written once, for MySQL. SQLite connections accept it
+as is: their cursors translate `%s` placeholders and a YEAR() function is
+registered on every connection. The few statements that really differ,
+like table DDL and checks for existing tables, live on the dialect classes.
+"""
+
+import csv
+import os
+import sqlite3
+import threading
+import uuid
+from typing import Dict, Tuple
+
+from mysql.connector import Error
+
+
+# Errors from either engine, for code that handles both
+DB_ERRORS = (Error, sqlite3.Error)
+
+_GRADE_CODES = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                            "setup", "grade_codes.csv")
+
+# Rows of the lookup tables, ids are assigned from 1 in this order
+REFERENCE_VALUES = {
+    "style": ["Solo", "TR", "Follow", "Lead", "Flash", "Attempt", "Send"],
+    "lead_style": ["Onsight", "Flash", "Redpoint", "Pinkpoint", "Fell/Hung"],
+    "type": ["Sport", "Trad", "Boulder", "TR", "Aid", "Alpine", "Ice", "Mixed",
+             "Snow", "Blank"],
+}
+
+
+def type_mask(type_ids) -> int:
+    """Get the bitmask of a tick's types, with bit id - 1 set for each type id.
+
+    `type_ids` is the stored `type` value: one id, or a csv of ids for a
+    multi-type route like "2,6". Ids that aren't numbers are skipped.
+    """
+    mask = 0
+    for type_id in str(type_ids).split(","):
+        type_id = type_id.strip()
+        if type_id.isdigit() and int(type_id) > 0:
+            mask |= 1 << (int(type_id) - 1)
+    return mask
+
+
+def tick_types(route_type: str) -> Tuple[str, ...]:
+    """Get every type of a route type value like "Trad, Alpine", as the type_mask column records them.
+
+    Types missing from the `type` table are skipped, and a blank value is "Blank".
+    """
+    parts = [part.strip() for part in route_type.split(",")]
+    if parts == [""]:
+        return ("Blank",)
+    known = REFERENCE_VALUES["type"]
+    return tuple(dict.fromkeys(part for part in parts if part in known))
+
+
+def add_type_masks(cursor, table: str = "ticks") -> bool:
+    """Add and fill in the `type_mask` column on a tick table from before it existed.
+
+    The summary tables are emptied, so each user's are rebuilt with every
+    type of their multi-type ticks on their next load. Returns whether the
+    column was added.
+    """
+    engine = dialect(cursor)
+    if engine.column_exists(cursor, table, "type_mask"):
+        return False
+    cursor.execute(engine.add_type_mask % (table,))
+    # Only a few dozen distinct type lists exist, so update one list at a time
+    cursor.execute("SELECT DISTINCT `type` FROM `%s`;" % (table,))
+    for (type_ids,) in cursor.fetchall():
+        cursor.execute("UPDATE `%s` SET `type_mask` = %%s WHERE `type` = %%s;" % (table,),
+                       (type_mask(type_ids), type_ids))
+    if engine.table_exists(cursor, "grade_summary"):
+        cursor.execute("DELETE FROM `year_summary`;")
+        cursor.execute("DELETE FROM `grade_summary`;")
+    return True
+
+
+class MySQLDialect:
+    name = "mysql"
+
+    create_user_table = """CREATE TABLE `%d`(
+        `id` MEDIUMINT UNSIGNED NOT NULL AUTO_INCREMENT,
+        `date` DATE NOT NULL,
+        `name` CHAR(100) CHARACTER SET utf8 NOT NULL,
+        `pitches` SMALLINT UNSIGNED NOT NULL,
+        `style` TINYINT UNSIGNED NULL,
+        `lead_style` TINYINT UNSIGNED NULL,
+        `type` VARCHAR(18) CHARACTER SET utf8 NOT NULL,
+        `type_mask` SMALLINT UNSIGNED NOT NULL DEFAULT 0,
+        `height` MEDIUMINT UNSIGNED NULL,
+        `code` MEDIUMINT UNSIGNED NOT NULL,
+        `tick_key` CHAR(40) NOT NULL DEFAULT '',
+        PRIMARY KEY(`id`))"""
+
+    add_type_mask = "ALTER TABLE `%s` ADD COLUMN `type_mask` SMALLINT UNSIGNED NOT NULL DEFAULT 0;"
+
+    # Joins `type` on the first id of a tick's `type` list, comparing strings only
+    first_type = "INSTR(CONCAT(`t`.`type`, ','), CONCAT(`type`.`id`, ',')) = 1"
+
+    create_summaries = ["""CREATE TABLE IF NOT EXISTS `year_summary`(
+        `user_id` INT UNSIGNED NOT NULL,
+        `year` SMALLINT UNSIGNED NOT NULL,
+        `height` INT UNSIGNED NOT NULL,
+        `all_pitches` INT UNSIGNED NOT NULL,
+        `pitches` INT UNSIGNED NOT NULL,
+        `routes` INT UNSIGNED NOT NULL,
+        `problems` INT UNSIGNED NOT NULL,
+        PRIMARY KEY(`user_id`, `year`));""",
+        """CREATE TABLE IF NOT EXISTS `grade_summary`(
+        `user_id` INT UNSIGNED NOT NULL,
+        `type` TINYINT UNSIGNED NOT NULL,
+        `year` SMALLINT UNSIGNED NOT NULL,
+        `code` MEDIUMINT UNSIGNED NOT NULL,
+        `count` INT UNSIGNED NOT NULL,
+        PRIMARY KEY(`user_id`, `type`, `year`, `code`));"""]
+
+    def table_exists(self, cursor, table: str) -> bool:
+        cursor.execute("SHOW TABLES LIKE %s;", (str(table),))
+        return bool(cursor.fetchall())
+
+    def column_exists(self, cursor, table: str, column: str) -> bool:
+        cursor.execute("SHOW COLUMNS FROM `%s` LIKE %%s;" % (table,), (column,))
+        return bool(cursor.fetchall())
+
+
+class SQLiteDialect:
+    name = "sqlite"
+
+    create_user_table = """CREATE TABLE `%d`(
+        `id` INTEGER PRIMARY KEY,
+        `date` TEXT NOT NULL,
+        `name` TEXT NOT NULL,
+        `pitches` INTEGER NOT NULL,
+        `style` INTEGER NULL,
+        `lead_style` INTEGER NULL,
+        `type` TEXT NOT NULL,
+        `type_mask` INTEGER NOT NULL DEFAULT 0,
+        `height` INTEGER NULL,
+        `code` INTEGER NOT NULL,
+        `tick_key` TEXT NOT NULL DEFAULT '')"""
+
+    add_type_mask = "ALTER TABLE `%s` ADD COLUMN `type_mask` INTEGER NOT NULL DEFAULT 0;"
+
+    # SQLite reads "2,6" + 0 as 2 without complaint, and can look the id up by key
+    first_type = "`type`.`id` = `t`.`type` + 0"
+
+    create_ticks = """CREATE TABLE IF NOT EXISTS `ticks`(
+        `id` INTEGER PRIMARY KEY,
+        `user_id` INTEGER NOT NULL,
+        `date` TEXT NOT NULL,
+        `name` TEXT NOT NULL,
+        `pitches` INTEGER NOT NULL,
+        `style` INTEGER NULL,
+        `lead_style` INTEGER NULL,
+        `type` TEXT NOT NULL,
+        `type_mask` INTEGER NOT NULL DEFAULT 0,
+        `height` INTEGER NULL,
+        `code` INTEGER NOT NULL,
+        `tick_key` TEXT NOT NULL DEFAULT '');
+        CREATE INDEX IF NOT EXISTS `user_date` ON `ticks` (`user_id`, `date`);
+        CREATE INDEX IF NOT EXISTS `user_type_code` ON `ticks` (`user_id`, `type`, `code`);"""
+
+    create_summaries = ["""CREATE TABLE IF NOT EXISTS `year_summary`(
+        `user_id` INTEGER NOT NULL,
+        `year` INTEGER NOT NULL,
+        `height` INTEGER NOT NULL,
+        `all_pitches` INTEGER NOT NULL,
+        `pitches` INTEGER NOT NULL,
+        `routes` INTEGER NOT NULL,
+        `problems` INTEGER NOT NULL,
+        PRIMARY KEY(`user_id`, `year`)) WITHOUT ROWID;""",
+        """CREATE TABLE IF NOT EXISTS `grade_summary`(
+        `user_id` INTEGER NOT NULL,
+        `type` INTEGER NOT NULL,
+        `year` INTEGER NOT NULL,
+        `code` INTEGER NOT NULL,
+        `count` INTEGER NOT NULL,
+        PRIMARY KEY(`user_id`, `type`, `year`, `code`)) WITHOUT ROWID;"""]
+
+    def table_exists(self, cursor, table: str) -> bool:
+        cursor.execute("SELECT `name` FROM `sqlite_master` WHERE `type` = 'table' AND `name` = %s;",
+                       (str(table),))
+        return bool(cursor.fetchall())
+
+    def column_exists(self, cursor, table: str, column: str) -> bool:
+        cursor.execute("PRAGMA table_info(`%s`);" % (table,))
+        return any(row[1] == column for row in cursor.fetchall())
+
+
+MYSQL = MySQLDialect()
+SQLITE = SQLiteDialect()
+
+
+def dialect(cursor) -> "MySQLDialect":
+    """Get the dialect of the database a cursor belongs to."""
+    return getattr(cursor, "dialect", MYSQL)
+
+
+def storage_engine(config: Dict = None) -> str:
+    """Get the configured engine, "mysql" (the default) or "sqlite"."""
+    return (config.get("STORAGE_ENGINE") if config else None) or "mysql"
+
+
+class SQLiteCursor(sqlite3.Cursor):
+    """Runs the MySQL-style `%s` placeholder SQL used by the rest of the app."""
+    dialect = SQLITE
+
+    def execute(self, operation, params=()):
+        return super().execute(operation.replace("%s", "?"), tuple(params or ()))
+
+    def executemany(self, operation, seq_params):
+        return super().executemany(operation.replace("%s", "?"), (tuple(row) for row in seq_params))
+
+
+class SQLiteConnection(sqlite3.Connection):
+    dialect = SQLITE
+
+    def cursor(self, factory=SQLiteCursor):
+        return super().cursor(factory)
+
+
+def _year(date):
+    return int(date[:4]) if date else None
+
+
+_initialized = set()
+_init_lock = threading.Lock()
+
+
+def sqlite_connect(config: Dict) -> SQLiteConnection:
+    """Open the SQLite database, creating its tables the first time in this process.
+
+    The database runs in WAL mode, so readers don't block the writer, with
+    NORMAL syncing and an in-memory temp store. SQLITE_CACHE_KB and
+    SQLITE_MMAP_BYTES size the page cache and memory map.
+    """
+    path = config.get("SQLITE_PATH") or "mpv.sqlite3"
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    connection = sqlite3.connect(path, timeout=config.get("SQLITE_BUSY_TIMEOUT", 5),
+                                 factory=SQLiteConnection)
+    connection.execute("PRAGMA journal_mode=WAL;")
+    connection.execute("PRAGMA synchronous=NORMAL;")
+    connection.execute("PRAGMA temp_store=MEMORY;")
+    connection.execute("PRAGMA cache_size=-%d;" % int(config.get("SQLITE_CACHE_KB", 16384)))
+    connection.execute("PRAGMA mmap_size=%d;" % int(config.get("SQLITE_MMAP_BYTES", 268435456)))
+    try:
+        connection.create_function("YEAR", 1, _year, deterministic=True)
+    except (TypeError, sqlite3.NotSupportedError):
+        # Python before 3.8, or SQLite before 3.8.3
+        connection.create_function("YEAR", 1, _year)
+
+    key = (os.getpid(), os.path.abspath(path))
+    with _init_lock:
+        if key not in _initialized:
+            create_sqlite_schema(connection)
+            _initialized.add(key)
+    return connection
+
+
+def create_sqlite_schema(connection: sqlite3.Connection) -> None:
+    """Create the lookup, shared tick, summary and meta tables if they are missing."""
+    cursor = connection.cursor()
+    built = False
+    for table, values in REFERENCE_VALUES.items():
+        if not SQLITE.table_exists(cursor, table):
+            cursor.execute("CREATE TABLE `%s`(`id` INTEGER PRIMARY KEY, `%s` TEXT NOT NULL);"
+                           % (table, table))
+            cursor.executemany("INSERT INTO `%s` (`id`, `%s`) VALUES (%%s, %%s);" % (table, table),
+                               enumerate(values, 1))
+            built = True
+    if not SQLITE.table_exists(cursor, "code"):
+        cursor.execute("CREATE TABLE `code`(`id` INTEGER PRIMARY KEY, `code` TEXT NOT NULL);")
+        with open(_GRADE_CODES) as codes_file:
+            cursor.executemany("INSERT INTO `code` (`id`, `code`) VALUES (%s, %s);",
+                               [(int(row[0]), row[1]) for row in csv.reader(codes_file)])
+        built = True
+    connection.executescript(SQLITE.create_ticks)
+    connection.executescript("\n".join(SQLITE.create_summaries))
+    cursor = connection.cursor()
+    add_type_masks(cursor)
+    cursor.execute("CREATE TABLE IF NOT EXISTS `meta`(`name` TEXT PRIMARY KEY, `value` TEXT NOT NULL);")
+    stamp = "REPLACE" if built else "INSERT OR IGNORE"
+    cursor.execute(stamp + " INTO `meta` (`name`, `value`) VALUES ('reference_version', %s);",
+                   (uuid.uuid4().hex,))
+    connection.commit()
+    cursor.close()
@@ -0,0 +1,130 @@
+"""Per-user yearly totals and grade counts, kept up to date by db_load.
+
+`year_summary` holds one row per user and year and `grade_summary` one row
+per user, type, year and grade code. db_load rebuilds a user's rows from
+their ticks in the same transaction as the tick write, so a page view only
+reads a handful of rows by primary key instead of aggregating every tick.
+"""
+
+import threading
+from typing import List, Optional, Tuple
+
+from mysql.connector import MySQLConnection
+
+from .storage import dialect
+
+
+# Totals per year: year, height, all pitches, route pitches, routes, problems.
+# Ticks without a height get their type's default height. The dialect's
+# `first_type` joins a multi-type tick like "2,6" to its first listed type. On
+# MySQL that compares strings, as casting the list to a number is an error
+# in an INSERT ... SELECT under strict mode.
+YEAR_TOTALS = """SELECT %(prefix)sYEAR(`t`.`date`) AS `year`,
+    COALESCE(SUM(COALESCE(`t`.`height`,
+        CASE `type`.`type` %(default_height)s ELSE 0 END)), 0),
+    COALESCE(SUM(`t`.`pitches`), 0),
+    COALESCE(SUM(CASE WHEN `type`.`type` != 'Boulder' THEN `t`.`pitches` ELSE 0 END), 0),
+    COALESCE(SUM(`type`.`type` != 'Boulder'), 0),
+    COALESCE(SUM(CASE WHEN `type`.`type` = 'Boulder' THEN `t`.`pitches` ELSE 0 END), 0)
+    FROM %(table)s AS `t`
+    LEFT JOIN `type` ON %(first_type)s
+    WHERE %(user)s%(filter)s GROUP BY `year`"""
+
+# Ticks per type, year and grade code, skipping codes missing from `code`.
+# A multi-type tick counts once under each of its types, matched by `type_mask`.
+GRADE_COUNTS = """SELECT %(prefix)s%(type)s, YEAR(`t`.`date`), `t`.`code`, COUNT(*)
+    FROM %(table)s AS `t`
+    JOIN `type` ON (`t`.`type_mask` & (1 << (`type`.`id` - 1))) != 0
+    JOIN `code` ON `code`.`id` = `t`.`code`
+    WHERE %(user)s%(filter)s
+    GROUP BY `type`.`id`, `type`.`type`, YEAR(`t`.`date`), `t`.`code`"""
+
+
+def default_heights_sql() -> str:
+    # Imported here so loading ticks doesn't need pandas
+    from ..analytics import DEFAULT_HEIGHTS
+    return " ".join("WHEN '%s' THEN %d" % (key, value)
+                    for key, value in DEFAULT_HEIGHTS.items())
+
+
+_available = set()
+_available_lock = threading.Lock()
+
+
+def summaries_available(cursor: MySQLConnection.cursor) -> bool:
+    """Check that db_setup has created the summary tables.
+
+    A positive answer is remembered for the life of the process.
+    """
+    name = dialect(cursor).name
+    if name in _available:
+        return True
+    found = dialect(cursor).table_exists(cursor, "grade_summary")
+    if found:
+        with _available_lock:
+            _available.add(name)
+    return found
+
+
+def has_summary(cursor: MySQLConnection.cursor, userid: int) -> bool:
+    cursor.execute("SELECT `year` FROM `year_summary` WHERE `user_id` = %s LIMIT 1;",
+                   (int(userid),))
+    return bool(cursor.fetchall())
+
+
+def refresh_summaries(cursor: MySQLConnection.cursor, userid: int, table: str, user: str) -> None:
+    """Rebuild a user's summary rows from the ticks selected by `table` and `user`."""
+    userid = int(userid)
+    cursor.execute("DELETE FROM `year_summary` WHERE `user_id` = %s;", (userid,))
+    cursor.execute("DELETE FROM `grade_summary` WHERE `user_id` = %s;", (userid,))
+    cursor.execute("""INSERT INTO `year_summary` (`user_id`, `year`, `height`,
+                   `all_pitches`, `pitches`, `routes`, `problems`) """
+                   + YEAR_TOTALS % {"prefix": "%d, " % (userid,), "table": table, "user": user,
+                                    "filter": "", "default_height": default_heights_sql(),
+                                    "first_type": dialect(cursor).first_type} + ";")
+    cursor.execute("""INSERT INTO `grade_summary` (`user_id`, `type`, `year`, `code`, `count`) """
+                   + GRADE_COUNTS % {"prefix": "%d, " % (userid,), "type": "`type`.`id`",
+                                     "table": table, "user": user, "filter": ""} + ";")
+
+
+def year_predicate(column: str, years: Optional[Tuple[Optional[int], Optional[int]]]) -> Tuple[str, tuple]:
+    """Get " AND ..." predicates keeping `column` within (first, last) years, either end open."""
+    clauses = list()
+    params = list()
+    first, last = years or (None, None)
+    if first is not None:
+        clauses.append("%s >= %%s" % (column,))
+        params.append(first)
+    if last is not None:
+        clauses.append("%s <= %%s" % (column,))
+        params.append(last)
+    return "".join(" AND " + clause for clause in clauses), tuple(params)
+
+
+def read_year_summary(cursor: MySQLConnection.cursor, userid: int,
+                      years: Tuple[Optional[int], Optional[int]] = None) -> List[Tuple]:
+    """Get (year, height, all pitches, pitches, routes, problems) rows, oldest first.
+
+    `years` limits the rows to a (first, last) range of years.
+    """
+    predicate, params = year_predicate("`year`", years)
+    cursor.execute("""SELECT `year`, `height`, `all_pitches`, `pitches`, `routes`, `problems`
+                   FROM `year_summary` WHERE `user_id` = %%s%s ORDER BY `year` ASC;""" % (predicate,),
+                   (int(userid),) + params)
+    return cursor.fetchall()
+
+
+def read_grade_summary(cursor: MySQLConnection.cursor, userid: int,
+                       years: Tuple[Optional[int], Optional[int]] = None) -> List[Tuple]:
+    """Get (type, year, code, count) rows, ordered like the grade histogram query.
+
+    `years` limits the rows to a (first, last) range of years.
+    """
+    predicate, params = year_predicate("`g`.`year`", years)
+    cursor.execute("""SELECT `type`.`type`, `g`.`year`, `g`.`code`, `g`.`count`
+                   FROM `grade_summary` AS `g`
+                   JOIN `type` ON `type`.`id` = `g`.`type`
+                   WHERE `g`.`user_id` = %%s%s
+                   ORDER BY `g`.`type`, `g`.`year`, `g`.`code`;""" % (predicate,),
+                   (int(userid),) + params)
+    return cursor.fetchall()
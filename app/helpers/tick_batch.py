@@ -0,0 +1,127 @@
+"""A compact, column-oriented batch of parsed ticks.
+
+A tick export parsed into a list of row lists costs a boxed Python object
+per cell. A TickBatch keeps each column as one typed numpy array instead:
+dates as days since the epoch, pitches, heights and codes as integers, the
+style, lead style and route type columns as small category codes, and the
+route names in a single string with offsets into it. The loaders and the
+in-process analytics read these columns directly.
+"""
+
+from typing import TYPE_CHECKING, Iterator, List, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Mountain Project's stand-in for a tick without a date, 1969-12-31
+NULL_DAY = -1
+# Export dates that mean the tick has no date
+NULL_DATES = ("", "0000-00-00")
+# Ticks without a length
+NO_HEIGHT = -1
+
+
+def parse_dates(dates: "pd.Series") -> Tuple["pd.Series", np.ndarray]:
+    """Parse export dates, returning them and which ticks have a usable date.
+
+    A tick without a date is kept, with a NaT date, and counted under 1969
+    like Mountain Project does. A tick with any other date that won't parse
+    is not, and is dropped rather than counted under 1969.
+    """
+    import pandas as pd
+    text = dates.astype(str).str.strip()
+    parsed = pd.to_datetime(text, format="%Y-%m-%d", errors="coerce")
+    return parsed, parsed.notna().values | np.isin(text.values, NULL_DATES)
+
+
+def _categories(values: "pd.Series") -> Tuple[np.ndarray, Tuple[str, ...]]:
+    codes, categories = values.astype(str).factorize(sort=False)
+    return codes.astype(np.int16), tuple(categories)
+
+
+class TickBatch:
+    """The columns db_load and the analytics need from a chunk of the tick export."""
+
+    __slots__ = ("days", "pitches", "heights", "codes", "style", "styles",
+                 "lead_style", "lead_styles", "route_type", "route_types",
+                 "names", "name_ends")
+
+    @classmethod
+    def from_frame(cls, df: "pd.DataFrame") -> "TickBatch":
+        """Build a batch from the export columns read by the parser.
+
+        Blank values get the fix-ups db_load has always applied: no date
+        becomes NULL_DAY, no pitches one pitch, no code code 0. Ticks with
+        a date that won't parse are dropped, see parse_dates().
+        """
+        # Only the parser builds batches, so loading ticks alone doesn't import pandas
+        import pandas as pd
+        batch = cls()
+        dates, valid = parse_dates(df["Date"])
+        if not valid.all():
+            df, dates = df[valid], dates[valid]
+        days = dates.values.astype("datetime64[D]").astype(np.int64)
+        batch.days = np.where(dates.isna().values, NULL_DAY, days).astype(np.int32)
+
+        pitches = pd.to_numeric(df["Pitches"], errors="coerce").fillna(0).astype(np.int32).values
+        batch.pitches = np.where(pitches == 0, 1, pitches).astype(np.int32)
+        heights = pd.to_numeric(df["Length"], errors="coerce")
+        batch.heights = heights.fillna(NO_HEIGHT).astype(np.int32).values
+        batch.codes = pd.to_numeric(df["Rating Code"], errors="coerce").fillna(0).astype(np.int32).values
+
+        batch.style, batch.styles = _categories(df["Style"])
+        batch.lead_style, batch.lead_styles = _categories(df["Lead Style"])
+        batch.route_type, batch.route_types = _categories(df["Route Type"])
+
+        names = [str(name) for name in df["Route"]]
+        batch.names = "".join(names)
+        batch.name_ends = np.cumsum([len(name) for name in names], dtype=np.int64)
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def select(self, keep: np.ndarray) -> "TickBatch":
+        """Get a batch of the ticks where the boolean array `keep` is set."""
+        batch = TickBatch()
+        for column in ("days", "pitches", "heights", "codes", "style", "lead_style", "route_type"):
+            setattr(batch, column, getattr(self, column)[keep])
+        batch.styles, batch.lead_styles, batch.route_types = self.styles, self.lead_styles, self.route_types
+        names = [name for name, kept in zip(self.iter_names(), keep.tolist()) if kept]
+        batch.names = "".join(names)
+        batch.name_ends = np.cumsum([len(name) for name in names], dtype=np.int64)
+        return batch
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the batch's columns."""
+        arrays = (self.days, self.pitches, self.heights, self.codes, self.style,
+                  self.lead_style, self.route_type, self.name_ends)
+        return sum(array.nbytes for array in arrays) + len(self.names.encode("utf-8"))
+
+    def date_strings(self) -> List[str]:
+        """Get every tick's date as YYYY-MM-DD."""
+        return np.datetime_as_string(self.days.astype("datetime64[D]"), unit="D").tolist()
+
+    def years(self) -> np.ndarray:
+        return self.days.astype("datetime64[D]").astype("datetime64[Y]").astype(np.int32) + 1970
+
+    def iter_names(self) -> Iterator[str]:
+        start = 0
+        for end in self.name_ends.tolist():
+            yield self.names[start:end]
+            start = end
+
+    def update_digest(self, digest) -> None:
+        """Fold every column into a running hash, for the graph cache key."""
+        for array in (self.days, self.pitches, self.heights, self.codes):
+            digest.update(array.tobytes())
+        for codes, categories in ((self.style, self.styles), (self.lead_style, self.lead_styles),
+                                  (self.route_type, self.route_types)):
+            digest.update(codes.tobytes())
+            digest.update("\x1f".join(categories).encode("utf-8"))
+        digest.update(self.name_ends.tobytes())
+        digest.update(self.names.encode("utf-8"))
@@ -0,0 +1,107 @@
+"""Narrow a report to a date range, a climb type or a style.
+
+A TickFilter is applied where the ticks are aggregated, so a filtered view
+only reads the ticks it covers. The SQL engines add `date` range and
+`type_mask` predicates to the stats queries, which the (user_id, date)
+index answers, and whole-year ranges are sliced straight out of the summary
+tables. The pandas engine drops the other ticks from each batch before it
+is summarized.
+"""
+
+import datetime
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from .storage import tick_types
+from .tick_batch import TickBatch
+
+
+_EPOCH = datetime.date(1970, 1, 1)
+
+
+class TickFilter:
+    """The ticks a view covers. A part left as None matches every tick.
+
+    `start` and `end` are inclusive dates, `type` a route type and `style`
+    a tick style, both named as in the reference tables.
+    """
+
+    __slots__ = ("start", "end", "type", "style")
+
+    def __init__(self, start: datetime.date = None, end: datetime.date = None,
+                 type: str = None, style: str = None):
+        self.start = start
+        self.end = end
+        self.type = type or None
+        self.style = style or None
+
+    def __bool__(self) -> bool:
+        return any(value is not None for value in (self.start, self.end, self.type, self.style))
+
+    def __repr__(self) -> str:
+        return "TickFilter(%s)" % (self.key,)
+
+    @property
+    def key(self) -> str:
+        """Fingerprint the filter for cache keys, empty when it matches every tick."""
+        if not self:
+            return ""
+        return "%s..%s:%s:%s" % (self.start or "", self.end or "", self.type or "", self.style or "")
+
+    def whole_years(self) -> Optional[Tuple[Optional[int], Optional[int]]]:
+        """Get the (first, last) years of a filter on whole years alone, or None.
+
+        Those filters can be served from the summary tables. An open end is None.
+        """
+        if self.type is not None or self.style is not None:
+            return None
+        if self.start is not None and (self.start.month, self.start.day) != (1, 1):
+            return None
+        if self.end is not None and (self.end.month, self.end.day) != (12, 31):
+            return None
+        return (self.start.year if self.start else None, self.end.year if self.end else None)
+
+    def sql(self, pairs: Dict) -> Tuple[str, tuple]:
+        """Get the predicates on the ticks aliased `t`, as " AND ..." and their parameters.
+
+        `pairs` maps the reference table values to their ids.
+        """
+        clauses = list()
+        params = list()
+        # Plain range predicates on the indexed `date`, never YEAR(`date`)
+        if self.start is not None:
+            clauses.append("`t`.`date` >= %s")
+            params.append(self.start.isoformat())
+        if self.end is not None:
+            clauses.append("`t`.`date` <= %s")
+            params.append(self.end.isoformat())
+        if self.type is not None:
+            clauses.append("(`t`.`type_mask` & %s) != 0")
+            type_id = pairs["type"].get(self.type)
+            params.append(1 << (type_id - 1) if type_id else 0)
+        if self.style is not None:
+            clauses.append("`t`.`style` = %s")
+            params.append(pairs["style"].get(self.style))
+        return "".join(" AND " + clause for clause in clauses), tuple(params)
+
+    def batch_mask(self, batch: TickBatch) -> np.ndarray:
+        """Get which ticks of a batch the filter keeps."""
+        keep = np.ones(len(batch), dtype=bool)
+        if self.start is not None:
+            keep &= batch.days >= (self.start - _EPOCH).days
+        if self.end is not None:
+            keep &= batch.days <= (self.end - _EPOCH).days
+        if self.type is not None:
+            codes = [i for i, value in enumerate(batch.route_types) if self.type in tick_types(value)]
+            keep &= np.isin(batch.route_type, codes)
+        if self.style is not None:
+            codes = [i for i, value in enumerate(batch.styles) if value == self.style]
+            keep &= np.isin(batch.style, codes)
+        return keep
+
+    def select_types(self, grade_data: Dict[str, dict]) -> Dict[str, dict]:
+        """Drop the grade data of other types, which a multi-type tick also counts under."""
+        if self.type is None:
+            return grade_data
+        return {type: data for type, data in grade_data.items() if type == self.type}
@@ -0,0 +1,186 @@
+"""Background jobs for the /data pipeline.
+
+Jobs run on a small thread pool in the worker process that accepted them,
+so a slow tick list doesn't hold a request open. Job state lives in a
+SQLite file, so whichever worker answers a poll can see it, and a second
+request for the same email joins the job that is already running instead of
+starting another one.
+"""
+
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Tuple
+
+from werkzeug.exceptions import HTTPException
+
+from .errors.error_registry import registered_exception
+from .helpers.cache import cache_directory
+
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+_CREATE_JOBS = """CREATE TABLE IF NOT EXISTS `jobs`(
+    `id` TEXT NOT NULL PRIMARY KEY,
+    `key` TEXT NOT NULL,
+    `status` TEXT NOT NULL,
+    `stage` TEXT NOT NULL DEFAULT '',
+    `result` BLOB NULL,
+    `error` TEXT NULL,
+    `created` REAL NOT NULL,
+    `updated` REAL NOT NULL);"""
+_CREATE_JOBS_KEY = "CREATE INDEX IF NOT EXISTS `jobs_key` ON `jobs` (`key`, `updated`);"
+
+
+class JobStore:
+    """Job status and results in a SQLite database shared by every worker.
+
+    Finished jobs are reused for `result_ttl` seconds. A queued or running job
+    that hasn't been updated for `timeout` seconds is treated as lost, e.g.
+    because its worker was restarted.
+    """
+
+    def __init__(self, path: str, result_ttl: float = 300, timeout: float = 600):
+        self.path = path
+        self.result_ttl = result_ttl
+        self.timeout = timeout
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._connect() as connection:
+            connection.execute(_CREATE_JOBS)
+            connection.execute(_CREATE_JOBS_KEY)
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL;")
+        return connection
+
+    def claim(self, key: str) -> Tuple[str, bool]:
+        """Get the live job for a key, or create one. Returns (job id, created)."""
+        now = time.time()
+        connection = self._connect()
+        try:
+            # Take the write lock first, so two workers can't both create a job
+            connection.execute("BEGIN IMMEDIATE;")
+            connection.execute("DELETE FROM `jobs` WHERE `updated` < ?;",
+                               (now - max(self.result_ttl, self.timeout),))
+            row = connection.execute(
+                """SELECT `id` FROM `jobs` WHERE `key` = ? AND (
+                   (`status` IN (?, ?) AND `updated` >= ?)
+                   OR (`status` = ? AND `updated` >= ?))
+                   ORDER BY `created` DESC LIMIT 1;""",
+                (key, QUEUED, RUNNING, now - self.timeout,
+                 DONE, now - self.result_ttl)).fetchone()
+            if row is not None:
+                connection.execute("COMMIT;")
+                return row[0], False
+            job_id = uuid.uuid4().hex
+            connection.execute(
+                """INSERT INTO `jobs` (`id`, `key`, `status`, `created`, `updated`)
+                   VALUES (?, ?, ?, ?, ?);""", (job_id, key, QUEUED, now, now))
+            connection.execute("COMMIT;")
+            return job_id, True
+        except sqlite3.Error:
+            connection.execute("ROLLBACK;")
+            raise
+        finally:
+            connection.close()
+
+    def update(self, job_id: str, status: str = None, stage: str = None,
+               result: object = None, error: str = None) -> None:
+        """Record a job's progress, and its result or error once it ends."""
+        fields = {"updated": time.time()}
+        if status is not None:
+            fields["status"] = status
+        if stage is not None:
+            fields["stage"] = stage
+        if result is not None:
+            fields["result"] = pickle.dumps(result, pickle.HIGHEST_PROTOCOL)
+        if error is not None:
+            fields["error"] = error
+        assignments = ", ".join("`%s` = ?" % (name,) for name in fields)
+        connection = self._connect()
+        try:
+            connection.execute("UPDATE `jobs` SET %s WHERE `id` = ?;" % (assignments,),
+                               tuple(fields.values()) + (job_id,))
+        finally:
+            connection.close()
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """Get a job's status, stage, result and error, or None if it is unknown."""
+        connection = self._connect()
+        try:
+            row = connection.execute(
+                """SELECT `status`, `stage`, `result`, `error`, `created`, `updated`
+                   FROM `jobs` WHERE `id` = ?;""", (job_id,)).fetchone()
+        finally:
+            connection.close()
+        if row is None:
+            return None
+        status, stage, result, error, created, updated = row
+        if status in (QUEUED, RUNNING) and time.time() - updated > self.timeout:
+            status, error = FAILED, "RequestException"
+        return {"id": job_id, "status": status, "stage": stage,
+                "result": pickle.loads(result) if result is not None else None,
+                "error": error, "created": created, "updated": updated}
+
+
+class JobQueue:
+    """Runs claimed jobs on a thread pool in this process."""
+
+    def __init__(self, store: JobStore, workers: int = 2):
+        self.store = store
+        self._executor = ThreadPoolExecutor(max_workers=workers,
+                                            thread_name_prefix="mpv-job")
+
+    def submit(self, key: str, func: Callable, *args) -> str:
+        """Start func(*args, progress=...) for a key unless a job for it already exists."""
+        job_id, created = self.store.claim(key)
+        if created:
+            self._executor.submit(self._run, job_id, func, args)
+        return job_id
+
+    def _run(self, job_id: str, func: Callable, args: tuple) -> None:
+        self.store.update(job_id, status=RUNNING)
+
+        def progress(stage: str) -> None:
+            self.store.update(job_id, stage=stage)
+
+        try:
+            result = func(*args, progress=progress)
+        except Exception as e:
+            logging.exception(e)
+            # Keep the exception's name, the poll re-raises it from the registry
+            self.store.update(job_id, status=FAILED, error=type(e).__name__)
+            return
+        self.store.update(job_id, status=DONE, stage="", result=result)
+
+
+def job_error(job: Dict) -> HTTPException:
+    """Get the exception to show for a failed job."""
+    return registered_exception(job["error"])
+
+
+_queues = dict()
+_queues_lock = threading.Lock()
+
+
+def get_job_queue(config: Dict) -> JobQueue:
+    """Get this process's job queue for the configured job database."""
+    path = os.path.join(cache_directory(config.get("CACHE_DIR")), "jobs.sqlite3")
+    key = (os.getpid(), path)
+    with _queues_lock:
+        queue = _queues.get(key)
+        if queue is None:
+            store = JobStore(path, result_ttl=config.get("JOB_RESULT_TTL", 300),
+                             timeout=config.get("JOB_TIMEOUT", 600))
+            queue = JobQueue(store, workers=config.get("JOB_WORKERS", 2))
+            _queues[key] = queue
+    return queue
@@ -0,0 +1,206 @@
+"""The /data pipeline: fetch a user's ticks, store them, compute stats and draw graphs."""
+
+import hashlib
+from functools import partial
+from typing import Callable, Dict, Iterator, Optional
+
+from .analytics import TickSummary
+from .errors.exeptions import DatabaseException
+from .graphing import GRAPH_VERSION, draw_graphs, get_all_grade_data, get_summary_stats, get_year_stats, graph_cache_key, \
+    tick_digest
+from .helpers.cache import Cache, get_cache
+from .helpers.database_connection import db_abort, db_close, db_connect, db_cursor, db_load, is_shared_storage
+from .helpers.metrics import timed
+from .helpers.mountain_project import MP_BASE_URL, MountainProjectHandler, get_session
+from .helpers.single_flight import rate_limit
+from .helpers.storage import DB_ERRORS
+from .helpers.tick_batch import TickBatch
+from .helpers.tick_filter import TickFilter
+
+
+def build_report(config: Dict, email: str, units: str, tick_filter: TickFilter = None,
+                 progress: Callable[[str], None] = None) -> Dict:
+    """Run the whole pipeline for one email and return the data.html context.
+
+    `progress` is called with the name of each stage as it starts. With a
+    `tick_filter`, the stats and graphs only cover the ticks it keeps.
+    """
+    if progress is None:
+        progress = lambda stage: None
+    loaded = load_ticks(config, email, progress, tick_filter)
+
+    # Reuse the graphs if this exact tick list was drawn before
+    cache = graph_cache(config)
+    cache_key = graph_cache_key(loaded["digest"], units, tick_filter)
+    graphs = cache.get(cache_key) if cache is not None else None
+
+    if graphs is None:
+        year_stats, grade_data = compute_stats(config, loaded, progress)
+        progress("drawing")
+        graphs = draw_graphs(year_stats, grade_data, units)
+        if cache is not None:
+            cache.set(cache_key, graphs)
+
+    return dict(graphs, username=loaded["user"].get("name"), units=units,
+                tick_filter=tick_filter)
+
+
+def build_stats(config: Dict, email: str, tick_filter: TickFilter = None) -> Dict:
+    """Run the pipeline up to the stats, for the JSON API.
+
+    Returns the username, year stats, grade data and the tick list digest.
+    The stats are kept in the graph cache, apart from the drawn graphs.
+    """
+    loaded = load_ticks(config, email, lambda stage: None, tick_filter)
+    digest = loaded["digest"].hexdigest()
+
+    cache = graph_cache(config)
+    cache_key = "stats:%d:%s" % (GRAPH_VERSION, digest)
+    if tick_filter:
+        cache_key += ":" + tick_filter.key
+    stats = cache.get(cache_key) if cache is not None else None
+    if stats is None:
+        stats = compute_stats(config, loaded, lambda stage: None)
+        if cache is not None:
+            cache.set(cache_key, stats)
+
+    year_stats, grade_data = stats
+    return {"username": loaded["user"].get("name"), "year_stats": year_stats,
+            "grade_data": grade_data, "digest": digest}
+
+
+def load_ticks(config: Dict, email: str, progress: Callable[[str], None],
+               tick_filter: TickFilter = None) -> Dict:
+    """Fetch the user's tick list, store it, and fold it into a summary for the pandas engine.
+
+    Every tick is stored, but the summary only keeps those `tick_filter` does.
+    Returns the user data, MP user id, the running TickSummary (None unless the
+    pandas engine is used), the filter and a digest of the tick rows.
+    """
+    dev_env = config.get("MPV_DEV")
+
+    progress("fetching")
+    api = mp_handler(config, email)
+    with timed("fetch_user"):
+        api.fetch_user()
+        user_data = api.parse_user_data(dev_env=dev_env)
+    mp_user_id = user_data.get("mp_id")
+    chunk_size = config.get("TICK_CHUNK_SIZE")
+    with timed("fetch_tick_list"):
+        api.fetch_tick_list(stream=bool(chunk_size))
+
+    # The pandas engine only needs MySQL as an optional store
+    in_process = config.get("ANALYTICS_ENGINE") == "pandas"
+    persist = config.get("DB_PERSIST_TICKS", True)
+    load = not dev_env and (persist or not in_process)
+
+    progress("loading")
+    summary = None
+    if chunk_size:
+        # Stream the export in chunks straight into the loader and summary
+        summary = TickSummary(tick_filter) if in_process else None
+        digest = hashlib.sha1()
+        batches = stream_batches(api, chunk_size, dev_env, summary, digest)
+        # Parsing and loading are interleaved, so they are timed together
+        with timed("stream_tick_list"):
+            if load:
+                db_load(mp_user_id, batches, config=config)
+            else:
+                for _ in batches:
+                    pass
+    else:
+        with timed("parse_tick_list"):
+            csv = api.parse_tick_list(dev_env=dev_env)
+        if load:
+            with timed("db_load"):
+                db_load(mp_user_id, csv.get("data"), config=config)
+        digest = tick_digest(csv.get("data"))
+        if in_process:
+            with timed("tick_summary"):
+                summary = TickSummary(tick_filter)
+                summary.add(csv.get("data"))
+
+    return {"user": user_data, "mp_user_id": mp_user_id, "summary": summary,
+            "tick_filter": tick_filter, "digest": digest}
+
+
+def compute_stats(config: Dict, loaded: Dict, progress: Callable[[str], None]) -> tuple:
+    """Get the year stats and grade data for ticks returned by load_ticks()."""
+    progress("analyzing")
+    with timed("stats"):
+        if loaded["summary"] is not None:
+            return loaded["summary"].year_stats(), loaded["summary"].grade_stats()
+        return query_stats(config, loaded["mp_user_id"], loaded["tick_filter"])
+
+
+def mp_handler(config: Dict, email: str) -> MountainProjectHandler:
+    """Build a Mountain Project API handler from the app config.
+
+    Only runs that go to Mountain Project count against the email's rate limit.
+    """
+    return MountainProjectHandler(
+        api_key=config.get("MP_KEY"),
+        email=email,
+        dev_env=config.get("MPV_DEV"),
+        session=get_session(
+            pool_size=config.get("MP_POOL_SIZE", 10),
+            retries=config.get("MP_RETRIES", 3),
+            backoff=config.get("MP_BACKOFF", 0.5)),
+        timeout=(config.get("MP_CONNECT_TIMEOUT", 5),
+                 config.get("MP_READ_TIMEOUT", 30)),
+        base_url=config.get("MP_BASE_URL") or MP_BASE_URL,
+        cache=get_cache(
+            config.get("MP_CACHE"), "mp",
+            directory=config.get("CACHE_DIR"),
+            ttl=config.get("MP_CACHE_TTL", 300),
+            max_entries=config.get("MP_CACHE_MAX_ENTRIES", 256),
+            max_bytes=config.get("MP_CACHE_MAX_BYTES", 0)),
+        before_fetch=partial(rate_limit, config, email)
+    )
+
+
+def graph_cache(config: Dict) -> Optional[Cache]:
+    """Get the rendered graph cache, or None if it is turned off."""
+    return get_cache(
+        config.get("GRAPH_CACHE"), "graphs",
+        directory=config.get("CACHE_DIR"),
+        ttl=config.get("GRAPH_CACHE_TTL", 86400),
+        max_entries=config.get("GRAPH_CACHE_MAX_ENTRIES", 128),
+        max_bytes=config.get("GRAPH_CACHE_MAX_BYTES", 0))
+
+
+def stream_batches(api: MountainProjectHandler, chunk_size: int, dev_env: bool,
+                   summary: Optional[TickSummary], digest) -> Iterator[TickBatch]:
+    """Yield tick batches as they are parsed, folding each into the summary and digest."""
+    for batch in api.iter_tick_batches(chunksize=chunk_size, dev_env=dev_env):
+        if summary is not None:
+            summary.add(batch)
+        tick_digest(batch, digest)
+        yield batch
+
+
+def query_stats(config: Dict, mp_user_id: int, tick_filter: TickFilter = None) -> tuple:
+    """Read the year stats and grade data from the database.
+
+    The summary tables db_load maintains are used when they exist and can
+    answer the filter, otherwise the stats are aggregated from the stored
+    ticks the filter selects.
+    """
+    connection = db_connect(config=config)
+    cursor = None
+    try:
+        cursor = db_cursor(connection)
+        stats = get_summary_stats(cursor, mp_user_id, tick_filter)
+        if stats is None:
+            shared = is_shared_storage(config)
+            stats = (get_year_stats(cursor, mp_user_id, shared, tick_filter),
+                     get_all_grade_data(cursor, mp_user_id, shared, tick_filter=tick_filter))
+        db_close(cursor, connection)
+        return stats
+    # A failed connection is discarded, not handed back to the pool
+    except DB_ERRORS:
+        db_abort(cursor, connection)
+        raise DatabaseException
+    except Exception:
+        db_abort(cursor, connection)
+        raise
@@ -0,0 +1,249 @@
+"""Load tick export CSVs straight into the database, without going through /data.
+
+Run from the project root: `python -m app.setup.bulk_import exports/`.
+The source is a directory of exports named after their Mountain Project
+user id, like `105324100.csv`, or a manifest CSV of `user_id,path` rows with
+paths relative to the manifest. Exports are parsed into TickBatches in a
+process pool and handed to at most `--connections` threads, each loading one
+user at a time through the batched db_load(). Uses the database settings in
+config.py, so run db_setup first.
+
+Finished files are recorded in a state file, so an interrupted import picks
+up where it stopped when run again. Files that failed, or changed since they
+were loaded, are loaded again. Pass `--restart` to load everything.
+"""
+
+import argparse
+import csv
+import os
+import re
+import sqlite3
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+import pandas as pd
+
+from .. import config
+from ..helpers.database_connection import db_load
+from ..helpers.tick_batch import TickBatch
+
+
+_COLUMNS = ["Date", "Route", "Pitches", "Style",
+            "Lead Style", "Route Type", "Length", "Rating Code"]
+_USER_FILE = re.compile(r"^(\d+)\D*.*\.csv$", re.IGNORECASE)
+
+_CREATE_IMPORTED = """CREATE TABLE IF NOT EXISTS `imported`(
+    `path` TEXT PRIMARY KEY,
+    `user_id` INTEGER NOT NULL,
+    `size` INTEGER NOT NULL,
+    `mtime` REAL NOT NULL,
+    `ticks` INTEGER NOT NULL DEFAULT 0,
+    `inserted` INTEGER NOT NULL DEFAULT 0,
+    `deleted` INTEGER NOT NULL DEFAULT 0,
+    `error` TEXT NULL,
+    `finished` REAL NOT NULL)"""
+
+
+class Export(NamedTuple):
+    user_id: int
+    path: str
+
+
+def file_version(path: str) -> Tuple[int, float]:
+    """Get a file's size and modification time, (-1, 0) if it is missing."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return -1, 0.0
+    return stat.st_size, stat.st_mtime
+
+
+class ImportState:
+    """The files an import has finished, kept in a SQLite file so a rerun can skip them."""
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._connection = sqlite3.connect(path, isolation_level=None)
+        self._connection.execute(_CREATE_IMPORTED)
+
+    def done(self, export: Export) -> bool:
+        """Check that a file was loaded without error and hasn't changed since."""
+        row = self._connection.execute(
+            "SELECT `user_id`, `size`, `mtime`, `error` FROM `imported` WHERE `path` = ?;",
+            (os.path.abspath(export.path),)).fetchone()
+        return row is not None and row == (export.user_id,) + file_version(export.path) + (None,)
+
+    def record(self, export: Export, ticks: int = 0, counts: Dict = None, error: str = None) -> None:
+        counts = counts or {}
+        self._connection.execute(
+            """REPLACE INTO `imported` (`path`, `user_id`, `size`, `mtime`, `ticks`, `inserted`,
+               `deleted`, `error`, `finished`) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?);""",
+            (os.path.abspath(export.path), export.user_id) + file_version(export.path)
+            + (ticks, counts.get("inserted", 0), counts.get("deleted", 0), error, time.time()))
+
+    def clear(self) -> None:
+        self._connection.execute("DELETE FROM `imported`;")
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+def list_exports(source: str) -> List[Export]:
+    """Get the exports in a directory, or listed in a manifest CSV of user_id,path rows."""
+    if os.path.isdir(source):
+        exports = list()
+        for name in sorted(os.listdir(source)):
+            match = _USER_FILE.match(name)
+            if match:
+                exports.append(Export(int(match.group(1)), os.path.join(source, name)))
+        return exports
+
+    base = os.path.dirname(os.path.abspath(source))
+    exports = list()
+    with open(source, newline="") as manifest:
+        for row in csv.reader(manifest):
+            # Skip blank lines and a header row
+            if len(row) < 2 or not row[0].strip().isdigit():
+                continue
+            exports.append(Export(int(row[0]), os.path.join(base, row[1].strip())))
+    return exports
+
+
+def parse_export(path: str) -> TickBatch:
+    """Parse one export file into a TickBatch. Runs in the parser processes."""
+    df = pd.read_csv(path, usecols=_COLUMNS, na_filter=False, dtype={"Length": str},
+                     encoding="utf-8")
+    return TickBatch.from_frame(df)
+
+
+def load_export(settings: Dict, export: Export, batch: TickBatch) -> Dict:
+    """Load one user's parsed ticks. Runs in the loader threads."""
+    return db_load(export.user_id, batch, config=settings)
+
+
+def run_import(settings: Dict, exports: List[Export], state: ImportState, processes: int = None,
+               connections: int = 4, report: Callable[[str], None] = print) -> Dict:
+    """Parse and load every export the state hasn't recorded as done.
+
+    At most `connections` users are loaded at once, and parsing runs only a
+    few files ahead of loading, so memory stays bounded however many files
+    there are. Returns the file, tick and error totals.
+    """
+    pending = [export for export in exports if not state.done(export)]
+    totals = {"files": len(exports), "skipped": len(exports) - len(pending), "loaded": 0,
+              "ticks": 0, "inserted": 0, "deleted": 0, "errors": 0}
+    if totals["skipped"]:
+        report("Skipping %d files loaded by an earlier run" % (totals["skipped"],))
+    if not pending:
+        return totals
+
+    processes = processes or os.cpu_count() or 1
+    ahead = processes + connections * 2
+    queue = iter(pending)
+    start = time.perf_counter()
+    finished = 0
+
+    def progress(export: Export, message: str) -> None:
+        rate = totals["ticks"] / max(time.perf_counter() - start, 1e-9)
+        report("[%d/%d] %s: %s (%s rows/s)" % (finished + totals["skipped"], totals["files"],
+                                                os.path.basename(export.path), message,
+                                                format(int(rate), ",d")))
+
+    def failed(export: Export, error: Exception) -> None:
+        totals["errors"] += 1
+        message = "%s: %s" % (type(error).__name__, error)
+        state.record(export, error=message)
+        progress(export, "error, " + message)
+
+    with ProcessPoolExecutor(max_workers=processes) as parsers, \
+            ThreadPoolExecutor(max_workers=connections) as loaders:
+        # Each future's stage, export and tick count
+        running = dict()
+
+        def submit_parses() -> None:
+            while len(running) < ahead:
+                export = next(queue, None)
+                if export is None:
+                    return
+                running[parsers.submit(parse_export, export.path)] = ("parse", export, 0)
+
+        submit_parses()
+        while running:
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                stage, export, ticks = running.pop(future)
+                if stage == "parse":
+                    try:
+                        batch = future.result()
+                    # Whatever went wrong, only this file failed, so record it and carry on
+                    except Exception as e:
+                        finished += 1
+                        failed(export, e)
+                        continue
+                    running[loaders.submit(load_export, settings, export, batch)] = \
+                        ("load", export, len(batch))
+                    continue
+
+                finished += 1
+                try:
+                    counts = future.result()
+                except Exception as e:
+                    failed(export, e)
+                    continue
+                state.record(export, ticks, counts)
+                totals["loaded"] += 1
+                totals["ticks"] += ticks
+                totals["inserted"] += counts["inserted"]
+                totals["deleted"] += counts["deleted"]
+                progress(export, "%s ticks, %d inserted, %d deleted" % (
+                    format(ticks, ",d"), counts["inserted"], counts["deleted"]))
+            submit_parses()
+
+    totals["seconds"] = time.perf_counter() - start
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("source", help="a directory of <user id>.csv exports, or a manifest CSV")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="parser processes, one per CPU by default")
+    parser.add_argument("--connections", type=int, default=4,
+                        help="users loaded at once, each on its own database connection")
+    parser.add_argument("--state", default=None,
+                        help="where finished files are recorded, next to the source by default")
+    parser.add_argument("--restart", action="store_true", help="forget finished files and load everything")
+    args = parser.parse_args()
+
+    settings = {name: getattr(config, name) for name in dir(config) if name.isupper()}
+    if settings.get("MYSQL_POOL_SIZE"):
+        # Every loader thread gets its own pooled connection
+        settings["MYSQL_POOL_SIZE"] = max(settings["MYSQL_POOL_SIZE"], args.connections)
+
+    exports = list_exports(args.source)
+    state = ImportState(args.state or os.path.abspath(args.source).rstrip(os.sep) + ".import-state")
+    if args.restart:
+        state.clear()
+    try:
+        totals = run_import(settings, exports, state, processes=args.processes,
+                            connections=args.connections)
+    except KeyboardInterrupt:
+        print("Interrupted, run the same command again to resume")
+        sys.exit(130)
+    finally:
+        state.close()
+
+    print("%d files: %d loaded, %d skipped, %d failed. %s ticks, %d inserted, %d deleted" % (
+        totals["files"], totals["loaded"], totals["skipped"], totals["errors"],
+        format(totals["ticks"], ",d"), totals["inserted"], totals["deleted"]))
+    if totals.get("seconds"):
+        print("%.1fs, %s rows/s" % (totals["seconds"], format(int(totals["ticks"] / totals["seconds"]), ",d")))
+    if totals["errors"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,65 @@
-"""Check that the database has appropriate tables for MPV, add them if not."""
+"""Check that the database has appropriate tables for MPV, add them if not.
 
+Run with `--migrate` to move ticks from the per-user tables into the shared
+`ticks` table (used when TICK_STORAGE = "shared"). Add `--keep` to leave the
+per-user tables in place after copying them. With STORAGE_ENGINE = "sqlite"
+this only creates the SQLite database, which is also done on first use.
+"""
+
+import argparse
 import csv
 import os
+import uuid
 
 import mysql.connector
 from mysql.connector import Error
 
+from .. import config
 from ..config import MYSQL_ADDRESS, MYSQL_PASSWD, MYSQL_TABLE, MYSQL_USER
+from ..helpers.database_connection import insert_batches, keyed_tick
+from ..helpers.storage import MYSQL, REFERENCE_VALUES, add_type_masks, sqlite_connect
 
 
 _GRADE_CODES = 'grade_codes.csv'
 
+_CREATE_TICKS = """CREATE TABLE IF NOT EXISTS `ticks`(
+    `id` INT UNSIGNED NOT NULL AUTO_INCREMENT,
+    `user_id` INT UNSIGNED NOT NULL,
+    `date` DATE NOT NULL,
+    `name` CHAR(100) CHARACTER SET utf8 NOT NULL,
+    `pitches` SMALLINT UNSIGNED NOT NULL,
+    `style` TINYINT UNSIGNED NULL,
+    `lead_style` TINYINT UNSIGNED NULL,
+    `type` VARCHAR(18) CHARACTER SET utf8 NOT NULL,
+    `type_mask` SMALLINT UNSIGNED NOT NULL DEFAULT 0,
+    `height` MEDIUMINT UNSIGNED NULL,
+    `code` MEDIUMINT UNSIGNED NOT NULL,
+    `tick_key` CHAR(40) NOT NULL DEFAULT '',
+    PRIMARY KEY(`id`),
+    KEY `user_date` (`user_id`, `date`),
+    KEY `user_type_code` (`user_id`, `type`, `code`));"""
+
+# Workers cache the reference tables until this version stamp changes
+_CREATE_META = """CREATE TABLE IF NOT EXISTS `meta`(
+    `name` CHAR(32) NOT NULL,
+    `value` CHAR(64) NOT NULL,
+    PRIMARY KEY(`name`));"""
+
 
 def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--migrate", action="store_true",
+                        help="copy per-user tick tables into `ticks`")
+    parser.add_argument("--keep", action="store_true",
+                        help="keep per-user tables after migrating them")
+    args = parser.parse_args()
+
+    if getattr(config, "STORAGE_ENGINE", "mysql") == "sqlite":
+        settings = {name: getattr(config, name) for name in dir(config) if name.isupper()}
+        sqlite_connect(settings).close()
+        print("MPV SQLite database successfully configured")
+        return
+
     dirname = os.path.dirname(__file__)
     filename = os.path.join(dirname, _GRADE_CODES)
     # Connect to database
@@ -49,8 +96,10 @@ def main():
         tables.append(row[0])
 
     # Loop through required tables, adding them if they aren't in the database
+    built = False
     for i in req_tables:
         if i not in tables:
+            built = True
 
             # Show user current table operation
             print("Building: " + MYSQL_TABLE + "." + i)
@@ -74,18 +123,9 @@ def main():
             # Populate the specific table
             values = list()
             insert = "INSERT INTO `%s` " % (i)
-            if i == "style":
-                values = ["Solo", "TR", "Follow", "Lead", "Flash",
-                          "Attempt", "Send"]
-                insert += "(`style`) VALUES"
-            elif i == "lead_style":
-                values = ["Onsight", "Flash", "Redpoint", "Pinkpoint",
-                          "Fell/Hung"]
-                insert += "(`lead_style`) VALUES"
-            elif i == "type":
-                values = ["Sport", "Trad", "Boulder", "TR", "Aid",
-                          "Alpine", "Ice", "Mixed", "Snow", "Blank"]
-                insert += "(`type`) VALUES"
+            if i in REFERENCE_VALUES:
+                values = REFERENCE_VALUES[i]
+                insert += "(`%s`) VALUES" % (i,)
             elif i == "code":
                 try:
                     csv_file = open(filename)
@@ -128,10 +168,80 @@ def main():
                           " and try again.")
                     close_db_exit(cursor, connection)
 
+    # Shared tick table for TICK_STORAGE = "shared"
+    try:
+        cursor.execute(_CREATE_TICKS)
+    except Error as e:
+        print(e)
+        print("db_setup Error: Could not create the `ticks` table.")
+        close_db_exit(cursor, connection)
+
+    # Per-user yearly totals and grade counts maintained by db_load
+    try:
+        for create in MYSQL.create_summaries:
+            cursor.execute(create)
+    except Error as e:
+        print(e)
+        print("db_setup Error: Could not create the summary tables.")
+        close_db_exit(cursor, connection)
+
+    # Type bitmasks for `ticks` tables created before they existed
+    try:
+        if add_type_masks(cursor):
+            print("Added `type_mask` to `ticks`, summaries are rebuilt on each user's next load")
+    except Error as e:
+        print(e)
+        print("db_setup Error: Could not add `type_mask` to the `ticks` table.")
+        close_db_exit(cursor, connection)
+
+    # Stamp a new reference version if any lookup table was (re)built
+    try:
+        cursor.execute(_CREATE_META)
+        stamp = "REPLACE" if built else "INSERT IGNORE"
+        cursor.execute(stamp + " INTO `meta` (`name`, `value`) VALUES"
+                       " ('reference_version', %s);", (uuid.uuid4().hex,))
+    except Error as e:
+        print(e)
+        print("db_setup Error: Could not write the reference version.")
+        close_db_exit(cursor, connection)
+
     print("MPV database successfully configured")
+
+    if args.migrate:
+        try:
+            migrate_user_tables(cursor, connection, keep=args.keep)
+        except Error as e:
+            print(e)
+            print("db_setup Error: Migration stopped. Tables that were" +
+                  " already migrated are complete, run it again to resume.")
     close_db_exit(cursor, connection)
 
 
+def migrate_user_tables(cursor, connection, keep=False):
+    """Copy every per-user tick table into the shared `ticks` table."""
+    select = """SELECT table_name FROM information_schema.tables WHERE
+             table_schema = %s AND table_name REGEXP '^[0-9]+$';"""
+    cursor.execute(select, (MYSQL_TABLE,))
+    user_tables = [row[0] for row in cursor.fetchall()]
+
+    select = """SELECT `date`, `name`, `pitches`, `style`, `lead_style`,
+             `type`, `height`, `code` FROM `%d`;"""
+    for table in user_tables:
+        userid = int(table)
+        # Move each user in one transaction so a failure can be rerun safely
+        connection.start_transaction()
+        cursor.execute(select % (userid,))
+        ticks = [keyed_tick(tuple(row)) for row in cursor.fetchall()]
+        cursor.execute("DELETE FROM `ticks` WHERE `user_id` = %s;", (userid,))
+        insert_batches(cursor, userid, ticks, shared=True)
+        if not keep:
+            cursor.execute("DROP TABLE `%d`;" % (userid,))
+        connection.commit()
+        print("Migrated: %s (%d ticks)" % (table, len(ticks)))
+
+    print("Migrated %d user tables into `ticks`" % (len(user_tables),))
+
+
 def close_db_exit(cursor, connection):
     cursor.close()
     connection.close()
@@ -0,0 +1,44 @@
+"""Warm up the app in the gunicorn master before it forks its workers.
+
+Importing pandas and Bokeh and loading the grade and reference tables takes
+most of a worker's startup time and a good part of its memory. Done once in
+the master, every worker starts with them already loaded, sharing the pages
+copy-on-write instead of each holding its own copy. See gunicorn.conf.py.
+"""
+
+import gc
+import importlib
+from typing import Dict
+
+from .errors.exeptions import DatabaseException
+from .helpers.storage import DB_ERRORS
+
+
+# The modules the /data pipeline, the stats API and the drawing functions load on first use
+PRELOAD_MODULES = ("pandas", "app.pipeline", "bokeh.embed", "bokeh.models",
+                   "bokeh.plotting", "bokeh.transform")
+
+
+def preload(config: Dict) -> None:
+    """Import the heavy modules and load the shared tables into this process."""
+    for module in PRELOAD_MODULES:
+        importlib.import_module(module)
+
+    from .analytics import get_codes
+    from .helpers.database_connection import db_close, db_connect, db_cursor
+    from .helpers.reference_data import get_reference_data
+    get_codes()
+    try:
+        # A plain connection, so no pooled socket is inherited by the workers
+        connection = db_connect(config=dict(config, MYSQL_POOL_SIZE=0))
+        cursor = db_cursor(connection)
+        get_reference_data(cursor)
+        db_close(cursor, connection)
+    except (DatabaseException,) + DB_ERRORS:
+        # Workers load the reference data themselves once the database is up
+        pass
+
+    # Keep the workers' garbage collector from writing to the shared pages
+    gc.collect()
+    if hasattr(gc, "freeze"):
+        gc.freeze()
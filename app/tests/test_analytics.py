@@ -0,0 +1,94 @@
+import io
+
+import pandas as pd
+
+import datetime
+
+from .test_data.mp_api_response import test_tick_columns
+from ..analytics import TickSummary, batch_ticks, grade_histogram, grade_stats, prepare_ticks, year_stats
+from ..benchmarks.ticks import generate_export
+from ..helpers.tick_batch import TickBatch
+from ..helpers.tick_filter import TickFilter
+
+
+class TestAnalytics:
+    columns = test_tick_columns
+    rows = [['2018-06-01', 'A', 1, 'Lead', 'Redpoint', 'Sport', '', 6600],
+            ['2018-06-02', 'B', 1, 'Lead', 'Onsight', 'Sport', '40', 6600],
+            ['2018-06-03', 'C', 2, 'Lead', 'Onsight', 'Sport', '60', 7500],
+            ['2018-06-04', 'D', 3, 'Follow', '', 'Trad, Alpine', '', 2500],
+            ['2019-01-01', 'E', '', 'Send', '', 'Boulder', '', 20050],
+            ['0000-00-00', 'F', 1, 'Send', '', '', '', 0]]
+
+    def ticks(self) -> pd.DataFrame:
+        return prepare_ticks(pd.DataFrame(self.rows, columns=self.columns))
+
+    def test_prepare_ticks(self) -> None:
+        """Asserts blank values get the same fix-ups as db_load and multi-types count as their first type."""
+        ticks = self.ticks()
+        assert ticks["year"].tolist() == [2018, 2018, 2018, 2018, 2019, 1969]
+        assert ticks["type"].tolist() == ["Sport", "Sport", "Sport", "Trad", "Boulder", "Blank"]
+        assert ticks["pitches"].tolist() == [1, 1, 2, 3, 1, 1]
+
+    def test_bad_dates(self) -> None:
+        """Asserts ticks without a date count under 1969, and ticks with a broken date are dropped."""
+        rows = self.rows + [['2019-02-30', 'G', 1, 'Send', '', 'Boulder', '', 20050],
+                            ['someday', 'H', 1, 'Send', '', 'Boulder', '', 20050]]
+        df = pd.DataFrame(rows, columns=self.columns)
+        assert prepare_ticks(df)["year"].tolist() == [2018, 2018, 2018, 2018, 2019, 1969]
+        batch = TickBatch.from_frame(df)
+        assert batch.years().tolist() == [2018, 2018, 2018, 2018, 2019, 1969]
+        assert list(batch.iter_names()) == ["A", "B", "C", "D", "E", "F"]
+
+    def test_year_stats(self) -> None:
+        """Asserts default heights fill in blank lengths and boulders count as problems."""
+        stats = year_stats(self.ticks())
+        assert stats == {"years": [1969, 2018, 2019], "height": [0, 325, 8], "pitches": [1, 7, 0],
+                         "routes": [1, 4, 0], "problems": [0, 0, 1], "total_pitches": 9}
+
+    def test_grade_stats(self) -> None:
+        """Asserts per-tick points, the grade axis and the yearly mode/median labels."""
+        stats = grade_stats(grade_histogram(self.ticks()))
+        assert list(stats) == ["Sport", "Trad", "Alpine", "Boulder"]
+        assert stats["Trad"] == stats["Alpine"]
+        sport = stats["Sport"]
+        assert sport["axis"] == ["5.12a", "5.12d"]
+        assert sport["grades"] == ["5.12a", "5.12a", "5.12d"]
+        assert sport["years"] == [2018, 2018, 2018]
+        assert sport["mode_values"] == sport["mean_values"] == ["5.12a"]
+
+    def test_filtered_summary(self) -> None:
+        """Asserts a filtered summary only folds in the ticks the filter keeps."""
+        df = pd.DataFrame(self.rows, columns=self.columns)
+        alpine = TickSummary(TickFilter(type="Alpine"))
+        alpine.add(df)
+        assert alpine.year_stats()["routes"] == [1]
+        assert list(alpine.grade_stats()) == ["Alpine"]
+
+        june = TickSummary(TickFilter(start=datetime.date(2018, 6, 2), end=datetime.date(2018, 6, 3),
+                                      style="Lead"))
+        june.add(TickBatch.from_frame(df))
+        assert june.year_stats()["pitches"] == [3]
+        assert june.grade_stats()["Sport"]["grades"] == ["5.12a", "5.12d"]
+
+
+class TestSyntheticTicks:
+    def test_generate_export(self) -> None:
+        """Asserts synthetic exports are repeatable and parse like a real tick list."""
+        export = generate_export(500, seed=1)
+        assert export == generate_export(500, seed=1)
+        df = pd.read_csv(io.BytesIO(export), usecols=test_tick_columns, na_filter=False)
+        ticks = prepare_ticks(df)
+        assert len(ticks) == 500
+        assert year_stats(ticks)["total_pitches"] == ticks["pitches"].sum()
+        assert {"Sport", "Boulder", "Trad"} <= set(ticks["type"])
+
+    def test_tick_batch(self) -> None:
+        """Asserts a TickBatch prepares the same ticks as the DataFrame it was built from."""
+        df = pd.read_csv(io.BytesIO(generate_export(2000, seed=2)), usecols=test_tick_columns,
+                         na_filter=False)
+        batch = TickBatch.from_frame(df)
+        assert len(batch) == 2000
+        expected = prepare_ticks(df)
+        pd.testing.assert_frame_equal(batch_ticks(batch), expected, check_dtype=False)
+        assert grade_stats(grade_histogram(batch_ticks(batch))) == grade_stats(grade_histogram(expected))
@@ -0,0 +1,156 @@
+import io
+import os
+import tempfile
+import time
+
+import pytest
+
+from ..benchmarks.ticks import generate_export
+from ..helpers.cache import FileCache, MemoryCache, cache_directory, get_cache
+from ..helpers.mountain_project import CachedResponse, MountainProjectHandler
+
+
+class TestCaches:
+    def test_memory_lru(self) -> None:
+        """Asserts the least recently used entry is evicted first."""
+        cache = MemoryCache(ttl=60, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1 and cache.get("c") == 3
+
+    def test_memory_ttl(self) -> None:
+        """Asserts expired entries are only returned by lookup(), marked stale."""
+        cache = MemoryCache(ttl=60)
+        cache.set("a", 1, ttl=-1)
+        assert cache.get("a") is None
+        assert cache.lookup("a") == (1, False)
+
+    def test_file_cache_shared(self, tmp_path) -> None:
+        """Asserts entries written by one FileCache are read by another on the same directory."""
+        writer = FileCache(str(tmp_path), ttl=60)
+        reader = FileCache(str(tmp_path), ttl=60)
+        writer.set("user:a@example.com", {"id": 1})
+        assert reader.get("user:a@example.com") == {"id": 1}
+        writer.set("expired", 2, ttl=-1)
+        assert reader.lookup("expired") == (2, False)
+
+    def test_file_cache_eviction(self, tmp_path) -> None:
+        """Asserts the file cache stays within its entry and byte limits, dropping the oldest files."""
+        cache = FileCache(str(tmp_path), ttl=60, max_entries=2)
+        cache.set("a", 1)
+        old = time.time() - 100
+        os.utime(cache._path("a"), (old, old))
+        cache.set("b", 2)
+        cache.set("c", 3)
+        assert cache.get("a") is None
+        assert cache.get("b") == 2 and cache.get("c") == 3
+
+        small = FileCache(str(tmp_path / "small"), ttl=60, max_bytes=1)
+        small.set("a", b"x" * 100)
+        assert small.get("a") is None
+
+    def test_get_cache(self, tmp_path) -> None:
+        """Asserts caches are off without a backend and memoized per namespace."""
+        assert get_cache(None, "mp") is None
+        assert get_cache("memory", "mp") is get_cache("memory", "mp")
+        assert isinstance(get_cache("file", "mp", directory=str(tmp_path)), FileCache)
+
+    def test_default_directory_private(self, tmp_path, monkeypatch) -> None:
+        """Asserts the default cache directory is made private, and refused if others can write to it."""
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+        directory = cache_directory()
+        assert directory == str(tmp_path / "mpv-cache")
+        assert os.stat(directory).st_mode & 0o077 == 0
+        assert cache_directory(str(tmp_path / "configured")) == str(tmp_path / "configured")
+        # Only readable by others, so it is closed up rather than refused
+        os.chmod(directory, 0o755)
+        cache_directory()
+        assert os.stat(directory).st_mode & 0o077 == 0
+
+        os.chmod(directory, 0o777)
+        with pytest.raises(PermissionError):
+            cache_directory()
+        with pytest.raises(PermissionError):
+            get_cache("file", "planted")
+
+
+class MockSession:
+    """Answers Session.get() with canned responses and records the headers sent."""
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.headers = []
+
+    def get(self, url, params=None, headers=None, **kwargs):
+        self.headers.append(headers)
+        return self.responses.pop(0)
+
+
+class TestResponseCache:
+    def test_fresh_entry_skips_network(self) -> None:
+        """Asserts a repeat lookup, like a units toggle, is served without a request."""
+        session = MockSession(CachedResponse(200, b'{"id": 1, "name": "A"}', {}))
+        cache = MemoryCache(ttl=60)
+        for _ in range(2):
+            api = MountainProjectHandler(email="A@example.com", api_key="key", session=session, cache=cache)
+            api.fetch_user()
+            assert api.parse_user_data()["mp_id"] == 1
+        assert len(session.headers) == 1
+
+    def test_revalidation(self) -> None:
+        """Asserts an expired entry is revalidated with its ETag and reused on a 304."""
+        session = MockSession(CachedResponse(304, b"", {}))
+        cache = MemoryCache(ttl=60)
+        cache.set("ticks:1", CachedResponse(200, b"old", {"ETag": '"v1"'}), ttl=-1)
+        api = MountainProjectHandler(email="a@example.com", api_key="key", session=session, cache=cache)
+        api._mp_id = 1
+        response = api.fetch_tick_list()
+        assert response.content == b"old"
+        assert session.headers == [{"If-None-Match": '"v1"'}]
+        assert cache.get("ticks:1").content == b"old"
+
+
+class StreamedBody(io.BytesIO):
+    """A raw response body that records how far it has been read."""
+    decode_content = False
+
+
+class StreamedResponse:
+    """A live response to stream=True, which must be read through `raw`."""
+    status_code = 200
+    headers = {"ETag": '"v1"'}
+
+    def __init__(self, body: bytes):
+        self.raw = StreamedBody(body)
+
+    @property
+    def content(self) -> bytes:
+        raise AssertionError("the whole body was read into memory")
+
+
+class TestStreamedCache:
+    def test_streamed_export_cached(self, tmp_path) -> None:
+        """Asserts a streamed export is read in chunks and cached once it has all been read."""
+        body = generate_export(20000, seed=1)
+        response = StreamedResponse(body)
+        cache = FileCache(str(tmp_path))
+        api = MountainProjectHandler(email="a@example.com", api_key="key", session=MockSession(response),
+                                     cache=cache)
+        api._mp_id = 1
+        api.fetch_tick_list(stream=True)
+        batches = api.iter_tick_batches(chunksize=1000)
+        first = next(batches)
+        assert len(first) == 1000
+        assert 0 < response.raw.tell() < len(body)
+        assert cache.get("ticks:1") is None
+        assert sum(len(batch) for batch in batches) == 20000 - 1000
+        cached = cache.get("ticks:1")
+        assert cached.content == body and cached.headers == {"ETag": '"v1"'}
+
+        # The next request is served from the cache
+        again = MountainProjectHandler(email="a@example.com", api_key="key", session=MockSession(), cache=cache)
+        again._mp_id = 1
+        again.fetch_tick_list(stream=True)
+        assert sum(len(batch) for batch in again.iter_tick_batches(chunksize=1000)) == 20000
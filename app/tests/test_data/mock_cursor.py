@@ -0,0 +1,15 @@
+class MockCursor:
+    """Records the statements sent to it and replays canned fetchall() rows."""
+    def __init__(self, rows=None):
+        self.rows = rows or []
+        self.executed = []
+        self.batches = []
+
+    def execute(self, operation, params=None):
+        self.executed.append((operation, params))
+
+    def executemany(self, operation, seq_params):
+        self.batches.append(list(seq_params))
+
+    def fetchall(self):
+        return self.rows
@@ -29,6 +29,9 @@ test_user_data = {
     'success': 1
 }
 
+# The tick export columns the parser reads
+test_tick_columns = ["Date", "Route", "Pitches", "Style", "Lead Style", "Route Type", "Length",
+                     "Rating Code"]
 test_ticks_response = b'Date,Route,Rating,Notes,URL,Pitches,Location,"Avg Stars","Your Stars",Style,"Lead Style","Route Type","Your Rating",Length,"Rating Code"\n2018-06-01,Sprayathon,5.13c,,https://www.mountainproject.com/route/105753589/sprayathon,1,"Colorado > Rifle > Rifle Mountain Park > The Arsenal",3.9,-1,Lead,Redpoint,Sport,,,9200\n'
 test_expected_data = [['2018-06-01', 'Sprayathon', 1, 'Lead', 'Redpoint', 'Sport', '', 9200]]
 test_processed_csv = [['2019-11-23', 'Hello Kitty', 1, 'Lead', 'Redpoint', 'Sport', '40', 6600], ['2019-11-23', 'Train to Busan', 1, 'Lead', 'Flash', 'Sport', '40', 5300], ['2019-11-23', "Molly's Stealthy Ride", 1, 'Lead', 'Redpoint', 'Sport', '50', 2500], ['2019-11-23', 'Marvelous', 1, 'Lead', 'Onsight', 'Sport', '50', 3400], ['2019-11-16', 'Super Trooper (Right Exit)', 1, 'Attempt', '', 'Boulder', '12', 20700], ['2019-11-16', 'Snarf', 1, 'Send', '', 'Boulder', '10', 20400], ['2019-11-16', 'To Hook or Not To Hook', 1, 'Flash', '', 'Boulder', '8', 20200], ['2019-11-16', 'Under Appreciated', 1, 'Flash', '', 'Boulder', '10', 20100], ['2019-11-16', 'Underpants', 1, 'Flash', '', 'Boulder', '10', 20100], ['2019-11-09', 'Super Trooper (Right Exit)', 1, 'Attempt', '', 'Boulder', '12', 20700], ['2019-11-09', 'Panthro', 1, 'Flash', '', 'Boulder', '10', 20400], ['2019-11-09', 'Snarf', 1, 'Flash', '', 'Boulder', '10', 20400], ['2019-11-09', 'Weird Dudes With Small Dogs', 1, 'Flash', '', 'Boulder', '12', 20200], ['2019-11-09', 'Creepy Guy', 2, 'Flash', '', 'Boulder', '10', 20100], ['2019-11-03', 'Super Trooper (Right Exit)', 1, 'Attempt', '', 'Boulder', '12', 20700], ['2019-11-03', 'Hooker', 1, 'Send', '', 'Boulder', '10', 20100], ['2019-11-03', 'Blow', 1, 'Send', '', 'Boulder', '10', 20100], ['2019-11-03', 'We Make A Sexy Time', 2, 'Flash', '', 'Boulder', '10', 20005], ['2019-11-01', '5.12a sport', 1, 'Lead', 'Onsight', 'Sport', '', 6600], ['2019-11-01', '5.11d sport', 2, 'Lead', 'Onsight', 'Sport', '', 5500], ['2019-11-01', '5.11 a/b Sport', 1, 'Lead', 'Onsight', 'Sport', '', 4800], ['2019-11-01', '5.10b sport', 1, 'Lead', 'Onsight', 'Sport', '', 2900], ['2019-11-01', '5.9 sport', 1, 'Lead', 'Flash', 'Sport', '', 2400], ['2019-10-26', 'Middle Warm Up', 1, 'Send', '', 'Boulder', '12', 20100], ['2019-10-25', 'Mellow', 1, 'Solo', '', 'Trad, TR', '50', 1400], ['2019-10-25', 'Left Warm Up', 1, 'Flash', '', 'Boulder', '12', 20008], ['2019-10-25', 'The Crystal Methodology', 1, 'Send', '', 'Boulder', '10', 20550], ['2019-10-01', '5.12c sport', 1, 'Lead', 'Fell/Hung', 'Sport', '', 7200], ['2019-10-01', '5.12b sport', 1, 'Lead', 'Fell/Hung', 'Sport', '', 6900], ['2019-10-01', '5.11d sport', 1, 'Lead', 'Onsight', 'Sport', '', 5500], ['2019-10-01', '5.11 a/b Sport', 1, 'Lead', 'Onsight', 'Sport', '', 4800], ['2019-10-01', '5.10d sport', 1, 'Lead', 'Onsight', 'Sport', '', 3500], ['2019-10-01', '5.10a sport', 1, 'Lead', 'Flash', 'Sport', '', 2600], ['2019-09-28', '5.12b sport', 1, 'Lead', '', 'Sport', '', 6900], ['2019-09-28', '5.11d sport', 1, 'Lead', 'Onsight', 'Sport', '', 5500], ['2019-09-28', '5.11b sport', 1, 'Lead', 'Onsight', 'Sport', '', 4900], ['2019-09-28', '5.11 a/b Sport', 1, 'Lead', 'Onsight', 'Sport', '', 4800], ['2019-09-28', '5.10d sport', 1, 'Lead', 'Onsight', 'Sport', '', 3500], ['2019-09-28', '5.10a sport', 2, 'Lead', 'Onsight', 'Sport', '', 2600], ['2019-09-22', 'V0 boulder', 1, 'Send', '', 'Boulder', '', 20008], ['2019-09-22', 'Lava Lunge SDS', 1, 'Attempt', '', 'Boulder, Alpine', '', 20600], ['2019-09-22', 'Hungry Eyes', 1, 'Send', '', 'Boulder, Alpine', '12', 20200], ['2019-09-22', 'Hymenoptera (AKA the Gargoyle)', 1, 'Attempt', '', 'Boulder, Alpine', '', 20610], ['2019-09-15', 'Lava Lunge SDS', 1, 'Attempt', '', 'Boulder, Alpine', '', 20600], ['2019-09-15', 'Seizure of Strength', 1, 'Send', '', 'Boulder, Alpine', '15', 20500], ['2019-09-15', 'Quail Hunting With Dick Cheney', 1, 'Attempt', '', 'Boulder, Alpine', '', 20650], ['2019-09-15', 'Tick Tick Boom', 1, 'Flash', '', 'Boulder, Alpine', '', 20300], ['2019-09-15', 'Hungry Eyes', 2, 'Flash', '', 'Boulder, Alpine', '12', 20200], ['2019-09-15', 'The Cooler', 2, 'Flash', '', 'Boulder, Alpine', '10', 20100], ['2019-09-13', 'Rancho Deluxe', 1, 'Lead', 'Flash', 'Sport', '70', 4900], ['2019-09-13', 'Spur Corner', 1, 'Lead', 'Onsight', 'Trad', '80', 2900], ['2019-09-13', 'Eddie K', 1, 'Lead', 'Onsight', 'Sport', '50', 3500], ['2019-09-13', 'Happy Boschday', 1, 'Lead', 'Onsight', 'Sport', '50', 2600], ['2019-09-13', 'Flake Fest', 1, 'Lead', 'Redpoint', 'Sport', '75', 2900], ['2019-09-08', 'Lie', 1, 'Send', '', 'Boulder', '7', 20400], ['2019-09-08', 'Hostile', 1, 'Send', '', 'Boulder', '8', 20200], ['2019-09-08', 'Vicarious', 1, 'Send', '', 'Boulder', '10', 20500], ['2019-09-08', 'Devour', 1, 'Send', '', 'Boulder', '10', 20100], ['2019-09-08', 'Dogs Eating Dogs', 1, 'Send', '', 'Boulder', '10', 20100], ['2019-09-08', 'Rabbit Hole', 2, 'Send', '', 'Boulder', '20', 20008], ['2019-09-08', 'Moist', 1, 'Send', '', 'Boulder', '15', 20100], ['2019-09-02', 'Cream', 1, 'Flash', '', 'Boulder, Alpine', '8', 20100], ['2019-09-02', 'Peaches and Cream', 1, 'Send', '', 'Boulder, Alpine', '', 20500], ['2019-09-02', 'Peaches', 1, 'Flash', '', 'Boulder, Alpine', '12', 20300], ['2019-09-02', 'RocknRolla', 1, 'Flash', '', 'Boulder, Alpine', '', 20008], ['2019-09-02', 'One Foot in the Grave', 2, 'Flash', '', 'Boulder, Alpine', '10', 20008], ['2019-09-02', "Just Can't Get Enough", 1, 'Send', '', 'Boulder, Alpine', '12', 20210], ['2019-09-01', 'Whisky in the Morning', 2, 'Send', '', 'Boulder', '8', 20008], ['2019-09-01', 'Big Shooter', 2, 'Send', '', 'Boulder', '8', 20210], ['2019-09-01', 'More Than a Carpenter', 1, 'Send', '', 'Boulder', '15', 20400], ['2019-08-24', 'Unnamed', 1, 'Lead', 'Onsight', 'Trad, TR', '50', 2200], ['2019-08-24', 'Expectations', 2, 'Lead', 'Onsight', 'Trad', '115', 2200], ['2019-08-24', "Beginner's Lead", 1, 'Lead', 'Redpoint', 'Trad, TR', '40', 1800], ['2019-08-18', 'Beehive Traverse', 1, 'Solo', '', 'Trad, Alpine', '2700', 1400], ['2019-08-15', 'Sparerib', 3, 'Lead', 'Onsight', 'Trad', '225', 2100], ['2019-08-15', 'Silver Foxes', 3, 'Lead', 'Onsight', 'Trad', '350', 2800], ['2019-08-15', 'Watchtower Standard Route', 3, 'Lead', 'Onsight', 'Trad', '250', 2100], ['2019-08-11', 'Dam in the Rain', 1, 'Lead', 'Redpoint', 'Sport', '65', 2600], ['2019-08-11', 'Flake Fest', 1, 'Lead', 'Fell/Hung', 'Sport', '75', 2900], ['2019-08-11', 'Yellowstone Poseidon Adventures', 1, 'Lead', 'Redpoint', 'Sport', '80', 2400], ['2019-08-10', 'Unknown', 1, 'Lead', 'Fell/Hung', 'Trad', '35', 3000], ['2019-08-10', 'Bozeman Pies', 1, 'Lead', 'Fell/Hung', 'Sport', '45', 4600], ['2019-08-10', 'Sxe Phil', 1, 'Lead', 'Flash', 'Sport', '45', 2600], ['2019-08-10', 'Crowd Pleaser', 1, 'Lead', 'Onsight', 'Trad', '35', 2100], ['2019-08-08', 'Shady Business', 2, 'Lead', 'Onsight', 'Sport', '85', 4600], ['2019-08-08', 'Sunday Driver', 1, 'Lead', 'Onsight', 'Sport', '90', 2900], ['2019-08-08', 'Point Break', 1, 'Lead', 'Onsight', 'Sport', '80', 2600], ['2019-08-08', "Sully's Route", 2, 'Follow', '', 'Sport', '90', 2600], ['2019-08-04', 'The Thief', 1, 'Lead', 'Onsight', 'Sport', '45', 4900], ['2019-08-04', 'The Twitch', 1, 'Lead', 'Flash', 'Sport', '60', 4600], ['2019-08-04', 'Chutes and Ladders', 1, 'Lead', 'Flash', 'Sport', '', 2300], ['2019-08-04', 'Underworld', 1, 'Lead', 'Onsight', 'Sport', '65', 2600], ['2019-08-04', 'No Cowboys', 1, 'Lead', 'Redpoint', 'Sport', '80', 3500], ['2019-08-03', 'Unknown', 1, 'Lead', 'Onsight', 'Sport', '50', 3000], ['2019-08-03', 'Tall Boy', 1, 'Lead', 'Redpoint', 'Sport', '100', 2400], ['2019-08-03', 'Drowning in Flame', 1, 'Lead', 'Onsight', 'Sport', '70', 4600], ['2019-08-03', 'Burning in Water', 1, 'Lead', 'Flash', 'Sport', '75', 2900], ['2019-08-03', 'Serenity Now', 1, 'Lead', 'Redpoint', 'Sport', '65', 2400], ['2019-08-03', 'Barfly', 1, 'Lead', 'Fell/Hung', 'Sport', '60', 4900], ['2019-07-30', 'Prospects of Paid Time Off', 1, 'Lead', 'Fell/Hung', 'Sport', '90', 6600], ['2019-07-30', 'Facelift', 1, 'Lead', 'Onsight', 'Sport', '60', 3200], ['2019-07-30', 'Pug Addicts', 1, 'Lead', 'Flash', 'Sport', '35', 2400], ['2019-07-30', 'Addled Ambitions', 1, 'Lead', 'Flash', 'Sport', '45', 2100], ['2019-07-28', 'Walk Up', 2, 'Solo', '', 'Trad, TR', '45', 800], ['2019-07-28', 'Tattoo', 2, 'Lead', 'Flash', 'Sport', '40', 4600], ['2019-07-28', 'Malarious', 1, 'Lead', 'Onsight', 'Sport', '40', 4600], ['2019-07-28', 'Campbell', 2, 'Lead', 'Flash', 'Sport, TR', '25', 1800], ['2019-07-28', 'Lefty', 1, 'Lead', 'Flash', 'Sport', '35', 2200], ['2019-07-21', 'Hole in the Bucket', 1, 'Lead', 'Fell/Hung', 'Sport', '40', 7200], ['2019-07-21', 'Super Jesus', 1, 'Lead', 'Fell/Hung', 'Sport', '', 4700], ['2019-07-21', 'Ignition', 1, 'Lead', 'Redpoint', 'Sport', '40', 4600], ['2019-07-21', 'Swamp Thing', 1, 'Lead', 'Fell/Hung', 'Sport', '50', 8900], ['2019-07-21', 'Warm Up Route', 1, 'Lead', 'Fell/Hung', 'Sport', '20', 7500], ['2019-07-20', 'Front Row Seat', 1, 'Lead', 'Onsight', 'Trad', '50', 1800], ['2019-07-20', 'The Fugitive', 1, 'TR', '', 'Trad', '80', 6900], ['2019-07-17', 'Soft in the Middle', 1, 'Lead', 'Fell/Hung', 'Trad, Sport', '70', 5100], ['2019-07-17', 'Bowling for Buicks', 3, 'Lead', 'Fell/Hung', 'Sport', '80', 6600], ['2019-07-17', 'Spare Tire', 1, 'Lead', 'Redpoint', 'Trad, Sport', '90', 2900], ['2019-07-14', "Don't Yank On This", 1, 'Flash', '', 'Boulder', '12', 20300], ['2019-07-14', 'Osteoporosis', 1, 'Send', '', 'Boulder', '10', 20300], ['2019-07-14', 'Wave Runner', 1, 'Flash', '', 'Boulder', '20', 20400], ['2019-07-14', 'Wave Rider', 1, 'Send', '', 'Boulder', '15', 20100], ['2019-07-14', "Julia's Hueco Problem", 1, 'Send', '', 'Boulder', '15', 20100], ['2019-07-14', "Pete's Hueco Problem", 1, 'Send', '', 'Boulder', '15', 20008], ['2019-07-02', '5.12d sport', 1, 'Lead', 'Fell/Hung', 'Sport', '', 7500], ['2019-07-02', '5.12b sport', 2, 'Lead', 'Fell/Hung', 'Sport', '', 6900], ['2019-07-02', '5.12a sport', 1, 'Lead', 'Fell/Hung', 'Sport', '', 6600], ['2019-07-02', '5.10b sport', 1, 'Lead', 'Flash', 'Sport', '', 2900], ['2019-07-02', '5.10d sport', 1, 'Lead', 'Onsight', 'Sport', '', 3500], ['2019-07-02', '5.9 sport', 2, 'Lead', 'Onsight', 'Sport', '', 2400], ['2019-06-29', 'The Searchers', 1, 'Lead', 'Onsight', 'Sport', '45', 5200], ['2019-06-29', 'Poke in Your Pocket', 1, 'Lead', 'Onsight', 'Sport', '60', 3500], ['2019-06-29', 'Hole in the Wall', 1, 'Lead', 'Redpoint', 'Sport', '95', 4600], ['2019-06-29', 'Bury the Hatchet', 1, 'Lead', 'Redpoint', 'Sport', '60', 3200], ['2019-06-28', "A Drinking Man's Game", 1, 'Lead', 'Onsight', 'Sport', '60', 5200], ['2019-06-28', 'Total Eclipse of the Heart', 1, 'Lead', 'Fell/Hung', 'Sport', '70', 7200], ['2019-06-28', 'Hole in the Wall', 1, 'Lead', 'Onsight', 'Sport', '95', 4600], ['2019-06-28', 'Bury the Hatchet', 1, 'Lead', 'Flash', 'Sport', '60', 3200], ['2019-06-28', 'Cake and Ice Cream', 1, 'Lead', 'Redpoint', 'Sport', '60', 2400], ['2019-06-27', 'Campground Host', 1, 'Lead', 'Onsight', 'Sport', '60', 2900], ['2019-06-27', 'Cake and Ice Cream', 1, 'Lead', 'Flash', 'Sport', '60', 2400], ['2019-06-23', 'Fright Train', 1, 'Lead', 'Onsight', 'Sport', '60', 4600], ['2019-06-23', 'Legos', 1, 'TR', '', 'Sport', '45', 2400], ['2019-06-23', 'Lincoln Logs', 1, 'Lead', 'Onsight', 'Sport', '40', 2400], ['2019-06-23', 'Public Service Announcement', 1, 'Lead', 'Onsight', 'Sport', '40', 2100], ['2019-06-15', 'Pageant of the Transmundane', 3, 'Lead', 'Redpoint', 'Sport', '70', 7200], ['2019-06-15', 'Porcelain Wall', 1, 'Lead', 'Onsight', 'Sport', '70', 5200], ['2019-06-15', 'Stone Cold Stunner', 1, 'Lead', 'Onsight', 'Sport', '70', 2600], ['2019-06-15', 'Hillbilly Heaven', 1, 'TR', '', 'Sport', '70', 2600], ['2019-06-15', 'Himalayas Calling', 1, 'Lead', 'Redpoint', 'Sport', '70', 4600], ['2019-06-15', "Lion's Den", 1, 'Lead', 'Fell/Hung', 'Sport', '70', 6600], ['2019-06-09', 'Look Ma, No Hands', 1, 'Lead', 'Onsight', 'Sport', '50', 2100], ['2019-06-09', 'Pull It Over', 1, 'Lead', 'Onsight', 'Sport', '55', 3200], ['2019-06-09', 'The Amazing Chuck and Grace', 1, 'Lead', 'Onsight', 'Sport', '70', 3200], ['2019-06-09', "Can't Kill Yourself", 1, 'Lead', 'Onsight', 'Sport', '60', 4900], ['2019-06-09', 'Gobis in the Dark', 1, 'Lead', 'Onsight', 'Sport', '45', 1800], ['2019-06-09', 'Jens', 1, 'Lead', 'Onsight', 'Sport', '55', 1800], ['2019-06-02', "Lil' Dude", 1, 'Flash', '', 'Boulder', '8', 20100], ['2019-06-02', 'Close Shave', 1, 'Send', '', 'Boulder', '20', 20200], ['2019-06-02', 'Fungislide', 1, 'Send', '', 'Boulder', '12', 20300], ['2019-06-02', 'The Scourge of the Bin Men', 1, 'Flash', '', 'Boulder', '8', 20200], ['2019-06-02', 'H Maddas', 1, 'Flash', '', 'Boulder', '25', 20100], ['2019-06-02', 'Surely', 1, 'Flash', '', 'Boulder', '10', 20008], ['2019-06-02', 'Maeby', 1, 'Flash', '', 'Boulder', '8', 20008], ['2019-06-02', 'Wave Rider', 3, 'Send', '', 'Boulder', '15', 20100], ['2019-06-01', 'Straw Man', 2, 'Lead', 'Fell/Hung', 'Sport', '30', 8600], ['2019-06-01', 'Uber Ass', 1, 'Lead', 'Fell/Hung', 'Sport', '50', 6600], ['2019-06-01', 'Spare Tire', 1, 'Lead', 'Redpoint', 'Trad, Sport', '90', 2900], ['2019-05-25', 'Waiting Room', 2, 'Send', '', 'Boulder', '15', 20110], ['2019-05-25', 'Venom', 2, 'Flash', '', 'Boulder', '15', 20008], ['2019-05-25', 'Not For The Faint of Height', 2, 'Flash', '', 'Boulder', '10', 20270], ['2019-05-25', 'Pebble Wrangler', 2, 'Flash', '', 'Boulder', '8', 20100], ['2019-05-25', "Easy Like Joe's Mom", 2, 'Send', '', 'Boulder', '10', 20110], ['2019-05-25', 'Eve, The Mother of Cain', 2, 'Flash', '', 'Boulder', '10', 20100], ['2019-05-25', "Bozo's Porno Circus", 2, 'Send', '', 'Boulder', '10', 20008], ['2019-05-25', 'Just Put Your Fingers In It', 2, 'Flash', '', 'Boulder', '15', 20100], ['2019-05-25', "Leapin' Llamas", 2, 'Flash', '', 'Boulder', '10', 20100], ['2019-05-25', 'Booger', 2, 'Flash', '', 'Boulder', '10', 20008], ['2019-05-12', 'Sub-Zero', 1, 'Lead', 'Fell/Hung', 'Sport', '45', 7200], ['2019-05-12', 'Moose Knuckle (aka Pinoe)', 1, 'Lead', 'Onsight', 'Sport', '90', 3500], ['2019-05-12', 'On the Job Training', 1, 'Lead', 'Fell/Hung', 'Sport', '50', 5400], ['2019-05-12', 'Weapons of Mass Destruction', 1, 'Lead', 'Fell/Hung', 'Sport', '45', 7200], ['2019-05-12', "It's-It", 1, 'Lead', 'Onsight', 'Sport', '85', 4600], ['2019-05-04', 'No Moral Values', 2, 'TR', '', 'Sport', '55', 2500], ['2019-05-04', 'Pearl Necklace', 1, 'Lead', 'Fell/Hung', 'Sport', '80', 2600], ['2019-04-26', 'Chasing the Dragon', 1, 'Lead', 'Fell/Hung', 'Trad', '110', 6700], ['2019-04-26', 'Amaretto Corner', 1, 'Lead', 'Onsight', 'Trad', '', 3100], ['2019-04-26', 'Coyne Crack', 1, 'TR', '', 'Trad', '', 5500], ['2019-04-26', 'Unamed 5.8', 1, 'Lead', 'Redpoint', 'Trad', '40', 2100], ['2019-04-25', 'Power Play', 1, 'Lead', 'Flash', 'Trad', '50', 5000], ['2019-04-25', 'Batteries Not Included', 1, 'Lead', 'Redpoint', 'Trad', '60', 2500], ['2019-04-14', 'Hello Kitty', 1, 'Lead', 'Redpoint', 'Sport', '40', 6600], ['2019-04-14', 'White Panda', 2, 'TR', '', 'Sport', '60', 5300], ['2019-04-14', 'Drive-By Shooting', 1, 'TR', '', 'Trad', '55', 2900], ['2019-04-13', 'French Connection', 1, 'Lead', 'Redpoint', 'Sport', '75', 2600], ['2019-04-13', 'The Rock Whisperer', 1, 'Lead', 'Redpoint', 'Sport', '70', 4600], ['2019-04-13', 'Out of the Whole', 1, 'Lead', 'Redpoint', 'Sport, TR', '60', 5200], ['2019-04-13', 'Crack to Nowhere', 1, 'Lead', 'Fell/Hung', 'Sport', '60', 2900], ['2019-04-07', 'The Kingdom', 1, 'Lead', 'Redpoint', 'Trad', '90', 2400], ['2019-04-05', 'The Kingdom', 1, 'Lead', 'Fell/Hung', 'Trad', '90', 2400], ['2019-04-05', 'White Panda', 2, 'Lead', 'Redpoint', 'Sport', '60', 5300], ['2019-03-31', 'Lack of Vision', 2, 'Lead', 'Fell/Hung', 'Sport', '', 6900], ['2019-03-31', 'Pretty Polly', 1, 'Lead', 'Onsight', 'Sport', '40', 3500], ['2019-03-31', 'The Good', 1, 'Lead', 'Flash', 'Sport', '80', 5200], ['2019-03-31', 'The Left is Right', 1, 'Lead', 'Onsight', 'Sport', '40', 3200], ['2019-03-30', 'Lack of Vision', 2, 'Lead', 'Fell/Hung', 'Sport', '', 6900], ['2019-03-30', 'The Ugly', 2, 'Lead', 'Flash', 'Sport', '90', 4600], ['2019-03-22', 'Lack of Vision', 1, 'Lead', 'Fell/Hung', 'Sport', '', 6900], ['2019-03-22', 'Shock and Awe', 2, 'Lead', 'Redpoint', 'Sport', '75', 6600], ['2019-03-22', 'Feeding the Rat', 1, 'Lead', 'Onsight', 'Sport', '50', 4600], ['2019-03-22', 'The Bad', 1, 'Lead', 'Redpoint', 'Sport', '60', 2600], ['2019-03-20', 'Citation', 1, 'Lead', 'Onsight', 'Sport', '80', 5200], ['2019-03-20', 'Black Thing', 1, 'Lead', 'Onsight', 'Sport', '80', 5100], ['2019-03-20', 'Skunk Weed', 2, 'Lead', 'Redpoint', 'Sport', '', 4800], ['2019-03-20', 'Primitive Man', 1, 'Lead', 'Onsight', 'Sport', '40', 2900], ['2019-03-20', 'Styling', 1, 'Lead', 'Redpoint', 'Sport', '40', 2500], ['2019-03-19', 'Sanitary Landfill', 1, 'Lead', 'Flash', 'Sport', '80', 2900], ['2019-03-19', 'Pink Slip', 1, 'Lead', 'Redpoint', 'Sport', '60', 7100], ['2019-03-19', 'Dust in your eyes', 1, 'TR', '', 'Sport', '40', 2600], ['2019-03-19', 'Lichen the Jam', 1, 'Lead', 'Onsight', 'Trad, Sport', '40', 2700], ['2019-03-17', 'Fire in the belly', 1, 'Lead', 'Flash', 'Sport', '60', 3500], ['2019-03-17', 'Skunk Cabbage', 2, 'Lead', 'Redpoint', 'Sport', '', 6900], ['2019-03-17', 'Ziplock', 1, 'Lead', 'Onsight', 'Sport', '80', 4800], ['2019-03-17', "Warm n' Fuzzy", 2, 'Lead', 'Onsight', 'Sport', '40', 2900], ['2019-03-16', 'North Shore (Short Subject)', 1, 'Lead', 'Onsight', 'Sport', '50', 4600], ['2019-03-16', 'Casual Cruise', 1, 'Lead', 'Onsight', 'Sport', '60', 2600], ['2019-03-16', 'Air-ete', 1, 'Lead', 'Onsight', 'Sport', '60', 2600], ['2019-03-16', 'Styling', 1, 'Lead', 'Flash', 'Sport', '40', 2500], ['2019-03-16', 'Boys, Like Jen', 1, 'Lead', 'Flash', 'Sport', '45', 2600], ['2019-03-09', '5.12c sport', 3, 'Lead', 'Fell/Hung', 'Sport', '', 7200], ['2019-03-09', '5.11c sport', 2, 'Lead', 'Onsight', 'Sport', '', 5200], ['2019-03-09', '5.11 a/b Sport', 1, 'Lead', 'Onsight', 'Sport', '', 4800], ['2019-03-09', '5.10c sport', 1, 'TR', '', 'Sport', '', 3200], ['2019-03-09', '5.10d sport', 2, 'Lead', 'Flash', 'Sport', '', 3500], ['2019-03-09', '5.10b sport', 1, 'Lead', 'Flash', 'Sport', '', 2900], ['2019-03-09', '5.9 sport', 1, 'Lead', 'Flash', 'Sport', '', 2400], ['2019-03-06', '5.12c sport', 2, 'Lead', 'Fell/Hung', 'Sport', '', 7200], ['2019-03-06', '5.11c sport', 1, 'Lead', 'Flash', 'Sport', '', 5200], ['2019-03-06', '5.11 a/b Sport', 1, 'Lead', 'Onsight', 'Sport', '', 4800], ['2019-03-06', '5.10d sport', 3, 'Lead', 'Onsight', 'Sport', '', 3500], ['2019-03-06', '5.10a sport', 3, 'Lead', 'Onsight', 'Sport', '', 2600], ['2019-03-06', '5.9 sport', 1, 'TR', '', 'Sport', '', 2400], ['2019-03-02', '5.12a sport', 1, 'Lead', 'Flash', 'Sport', '', 6600], ['2019-03-02', '5.12b sport', 1, 'Lead', 'Redpoint', 'Sport', '', 6900], ['2019-03-02', '5.11d sport', 2, 'Lead', 'Fell/Hung', 'Sport', '', 5500], ['2019-03-02', '5.11 a/b Sport', 4, 'Lead', 'Onsight', 'Sport', '', 4800], ['2019-03-02', '5.10d sport', 1, 'Lead', 'Onsight', 'Sport', '', 3500], ['2019-03-02', '5.10a sport', 2, 'Lead', 'Onsight', 'Sport', '', 2600], ['2019-02-20', '5.10b sport', 1, 'Lead', 'Onsight', 'Sport', '', 2900], ['2019-02-20', '5.10c sport', 1, 'Lead', 'Onsight', 'Sport', '', 3200], ['2019-02-20', '5.11 a/b Sport', 3, 'Lead', 'Onsight', 'Sport', '', 4800], ['2019-02-20', '5.12a sport', 4, 'Lead', 'Fell/Hung', 'Sport', '', 6600], ['2019-02-20', '5.9 sport', 2, 'Lead', 'Onsight', 'Sport', '', 2400], ['2019-01-26', 'Drive-By Shooting', 1, 'Lead', 'Redpoint', 'Trad', '55', 2900], ['2019-01-26', 'Alluvial Ecstasy', 1, 'Lead', 'Redpoint', 'Sport', '50', 3200], ['2019-01-26', 'Slope on a Rope', 1, 'Lead', 'Redpoint', 'Sport', '50', 2900], ['2019-01-26', "Molly's Stealthy Ride", 1, 'Lead', 'Redpoint', 'Sport', '50', 2500], ['2019-01-13', 'Sweeping with Mr. Brownstone', 1, 'Lead', 'Onsight', 'Trad', '120', 2600], ['2019-01-13', 'Substandard', 1, 'Follow', '', 'Trad', '120', 2100], ['2019-01-13', 'Beartrap Jam', 1, 'Lead', 'Flash', 'Trad', '90', 2400], ['2018-12-16', 'Balcony Route', 1, 'Lead', 'Redpoint', 'Sport', '50', 3500], ['2018-12-16', 'Warm Up Center', 1, '', '', 'Boulder', '15', 20008], ['2018-12-16', 'Warm Up Left', 1, 'Send', '', 'Boulder', '10', 20100], ['2018-12-16', 'Warm Up Right', 1, 'Send', '', 'Boulder', '15', 20005], ['2018-12-16', 'Drive-By Shooting', 1, 'Lead', 'Flash', 'Trad', '55', 2900], ['2018-12-16', 'North Face', 1, 'Send', '', 'Boulder', '8', 20400], ['2018-12-16', 'GSW', 1, 'Follow', '', 'Trad', '50', 2600], ['2018-12-16', 'GSW - Left', 1, 'Lead', 'Onsight', 'Trad', '50', 2600], ['2018-12-15', 'The Bad', 1, 'Lead', 'Onsight', 'Sport', '60', 2600], ['2018-12-09', "Bridget's Problem", 1, 'Flash', '', 'Boulder', '10', 20300], ['2018-12-09', 'Scoop Thing', 1, 'Flash', '', 'Boulder', '10', 20008], ['2018-12-09', 'Vert Thing', 1, 'Flash', '', 'Boulder', '8', 20100], ['2018-12-09', 'Ice Dragon', 1, 'Send', '', 'Boulder', '25', 20500], ['2018-12-09', 'Human Sacrifice', 1, 'Flash', '', 'Boulder', '8', 20100], ['2018-12-09', 'Mostly Shade', 1, 'Send', '', 'Boulder', '8', 20100], ['2018-12-09', 'Scruffy Looking Nerf Herder', 1, 'Send', '', 'Boulder', '10', 20200], ['2018-12-08', 'Sheep Herder', 1, 'Send', '', 'Boulder', '8', 20400], ['2018-12-08', 'Z-Crack', 1, 'Flash', '', 'Boulder', '10', 20100], ['2018-12-08', 'Z-Face', 1, 'Send', '', 'Boulder', '10', 20100], ['2018-12-08', 'Boys At Work', 1, 'Send', '', 'Boulder', '', 20300], ['2018-12-08', 'Warm Up Left', 1, 'Flash', '', 'Boulder', '10', 20100], ['2018-12-08', 'Warm Up Center', 1, '', '', 'Boulder', '15', 20008], ['2018-12-08', 'Warm Up Right', 1, 'Send', '', 'Boulder', '15', 20005], ['2018-12-08', 'Bear Trap Slap', 1, 'Send', '', 'Boulder', '10', 20400], ['2018-12-08', 'Short Days and Nasty Nights', 1, 'Send', '', 'Boulder', '10', 20400], ['2018-12-08', 'Nails', 3, 'Flash', '', 'Boulder', '10', 20300], ['2018-12-08', 'Hatch Fest', 1, 'Flash', '', 'Boulder', '10', 20075], ['2018-12-08', 'B.T. Downclimb', 1, 'Flash', '', 'Boulder', '10', 20005], ['2018-11-21', '5.10b sport', 2, 'TR', '', 'Sport', '', 2900], ['2018-11-21', '5.10c sport', 1, 'TR', '', 'Sport', '', 3200], ['2018-11-21', '5.11a sport', 2, 'TR', '', 'Sport', '', 4600], ['2018-11-21', '5.12a sport', 1, 'TR', '', 'Sport', '', 6600], ['2018-11-14', 'Chill Wind', 1, 'Send', '', 'Boulder', '8', 20200], ['2018-11-14', 'Wind of Change', 1, 'Send', '', 'Boulder', '10', 20008], ['2018-11-14', "Blowin' in the Wind", 1, 'Send', '', 'Boulder', '10', 20100], ['2018-11-14', 'Against the Wind', 1, 'Send', '', 'Boulder', '10', 20110], ['2018-11-14', 'Yesteryear', 1, 'Send', '', 'Boulder', '10', 20500], ['2018-11-14', 'Sheep Herder', 1, 'Send', '', 'Boulder', '8', 20400], ['2018-11-13', 'The Noses Right Off Our Faces', 1, 'Follow', '', 'Trad', '50', 2100], ['2018-11-13', 'Sweeping with Mr. Brownstone', 1, 'Lead', 'Redpoint', 'Trad', '120', 2600], ['2018-11-07', 'V2 boulder', 1, 'Send', '', 'Boulder', '', 20200], ['2018-11-07', 'V4 boulder', 1, 'Flash', '', 'Boulder', '', 20400], ['2018-10-29', 'Tana', 1, '', '', 'Boulder', '8', 20200], ['2018-10-28', 'Sheep Herder', 1, '', '', 'Boulder', '8', 20400], ['2018-10-28', 'Barley Pop', 1, '', '', 'Boulder', '10', 20270], ['2018-10-28', 'Mon', 1, '', '', 'Boulder', '8', 20300], ['2018-10-28', 'Orange Crystal', 1, '', '', 'Boulder', '15', 20100], ['2018-10-28', 'Choke Cherry', 1, '', '', 'Boulder', '15', 20100], ['2018-10-26', 'Sweeping with Mr. Brownstone', 1, 'TR', '', 'Trad', '120', 2600], ['2018-10-26', 'Substandard', 1, 'Follow', '', 'Trad', '120', 2100], ['2018-10-26', 'Moai Crack', 1, 'Follow', '', 'Trad', '50', 2400], ['2018-10-26', 'In Spite of Ourselves', 1, 'Lead', 'Redpoint', 'Trad', '70', 4900], ['2018-10-24', 'Unknown Wind', 1, '', '', 'Boulder', '8', 20310], ['2018-10-24', 'Tick Season', 1, '', '', 'Boulder', '15', 20210], ['2018-10-24', 'Jaguar Warrior', 1, '', '', 'Boulder', '12', 20200], ['2018-10-24', 'Mostly Shade', 1, '', '', 'Boulder', '8', 20100], ['2018-10-24', 'Scruffy Looking Nerf Herder', 1, '', '', 'Boulder', '10', 20200], ['2018-10-24', 'Neat Right', 1, '', '', 'Boulder', '9', 20300], ['2018-10-24', 'Neat Center', 1, '', '', 'Boulder', '8', 20100], ['2018-10-24', 'Neat Left', 1, '', '', 'Boulder', '4', 20008], ['2018-10-24', 'Neat Right Sit Start', 1, '', '', 'Boulder', '10', 20400], ['2018-10-20', 'Young Jedi', 1, '', '', 'Boulder', '8', 20170], ['2018-10-20', 'Globe Trotter', 1, '', '', 'Boulder', '15', 20300], ['2018-10-20', 'Bungholeo', 1, '', '', 'Boulder', '10', 20200], ['2018-10-20', 'Beltar', 1, '', '', 'Boulder', '15', 20100], ['2018-10-20', 'Baby Bear', 1, '', '', 'Boulder', '12', 20200], ['2018-10-20', 'Little Nosey Girl Who Should Have Minded Her Manners', 1, '', '', 'Boulder', '20', 20010], ['2018-10-20', 'Grumpy Old Men', 1, '', '', 'Boulder', '25', 20008], ['2018-10-17', 'Against the Wind', 1, 'Solo', '', 'Boulder', '10', 20110], ['2018-10-17', "Blowin' in the Wind", 1, 'Solo', '', 'Boulder', '10', 20100], ['2018-10-17', 'Wind of Change', 1, 'Solo', '', 'Boulder', '10', 20008], ['2018-10-17', 'Bridge Over Troubled Waters', 1, 'Solo', '', 'Boulder', '12', 20008], ['2018-10-17', 'Neat Right', 1, 'Solo', '', 'Boulder', '9', 20300], ['2018-10-17', 'Neat Center', 1, 'Solo', '', 'Boulder', '8', 20100], ['2018-10-17', 'Neat Left', 1, 'Solo', '', 'Boulder', '4', 20008], ['2018-09-29', 'The Noses Right Off Our Faces', 1, 'Follow', '', 'Trad', '50', 2100], ['2018-09-29', 'In Spite of Ourselves', 1, 'Lead', 'Fell/Hung', 'Trad', '70', 4900], ['2018-09-29', 'The Jack Attack', 3, 'Lead', 'Onsight', 'Trad', '200', 2200], ['2018-09-26', 'V1 boulder', 1, 'Solo', '', 'Boulder', '', 20100], ['2018-09-26', 'V0 boulder', 2, 'Solo', '', 'Boulder', '', 20008], ['2018-09-26', 'V2 boulder', 1, 'Solo', '', 'Boulder', '', 20200], ['2018-09-23', "Sully's Route", 1, 'Follow', '', 'Sport', '90', 2600], ['2018-09-23', 'Beach Break', 1, 'Lead', 'Redpoint', 'Sport', '80', 2600], ['2018-09-23', 'Commie Bastards', 1, 'Lead', 'Onsight', 'Sport', '60', 2900], ['2018-09-23', 'One Bullet to Many', 1, 'TR', '', 'Sport', '65', 3200], ['2018-09-23', 'Dam in the Rain', 1, 'Lead', 'Onsight', 'Sport', '65', 2600], ['2018-09-22', 'Toprope Problems', 2, 'Follow', '', 'TR', '40', 2100], ['2018-09-22', 'Crocodile Crack', 1, 'Lead', 'Redpoint', 'Trad, TR', '35', 2400], ['2018-09-16', 'Standard Route Direct Finish', 1, 'Lead', 'Redpoint', 'Trad', '100', 2400], ['2018-09-16', 'Tigger', 2, 'Lead', 'Onsight', 'Trad', '140', 2800], ['2018-09-16', 'Orange Crack', 1, 'Lead', 'Redpoint', 'Trad', '300', 5000], ['2018-09-15', 'Big Shooter', 1, 'Solo', '', 'Boulder', '8', 20210], ['2018-09-15', 'Whisky in the Morning', 1, 'Solo', '', 'Boulder', '8', 20008], ['2018-09-09', 'The Snaz', 5, 'Lead', 'Fell/Hung', 'Trad, Alpine', '', 2600], ['2018-09-01', 'Spare Tire', 1, 'Lead', 'Fell/Hung', 'Trad, Sport', '90', 2900], ['2018-09-01', 'Thing In Between', 1, 'Follow', '', 'Trad', '80', 2400], ['2018-09-01', 'Tigger', 1, 'Lead', 'Redpoint', 'Trad', '140', 2800], ['2018-09-01', 'Standard Route', 1, 'Lead', 'Redpoint', 'Trad', '300', 2200], ['2018-08-29', 'Crystal Delight', 1, 'Follow', '', 'Trad', '100', 2100], ['2018-08-29', 'Fire Escape', 1, 'Lead', 'Redpoint', 'Trad', '100', 2400], ['2018-08-29', 'Diesel Driver', 2, 'Lead', 'Onsight', 'Trad', '130', 2400], ['2018-08-26', 'Red Bone', 1, 'Lead', 'Onsight', 'Sport', '30', 3200], ['2018-08-26', 'Cocalahishkit', 1, 'Lead', 'Flash', 'Sport', '70', 2100], ['2018-08-26', "Can't Roller Skate in a Buffalo Herd", 1, 'Follow', '', 'Sport', '70', 2100], ['2018-08-26', 'Buffaloed', 1, 'TR', '', 'Sport', '70', 4600], ['2018-08-19', 'Play the Piano Drunk', 2, 'Lead', 'Fell/Hung', 'Sport', '60', 5500], ['2018-08-19', 'Unknown 11', 1, 'Lead', 'Onsight', 'Sport', '45', 4900], ['2018-08-19', 'Bang for Buck', 1, 'Lead', 'Onsight', 'Sport', '45', 2800], ['2018-08-19', 'Tall Boy', 1, 'Follow', '', 'Sport', '100', 2400], ['2018-08-19', 'Serenity Now', 1, 'Lead', 'Flash', 'Sport', '65', 2400], ['2018-08-18', 'Dos Gauchos', 2, 'Lead', 'Flash', 'Trad, Alpine', '450', 3000], ['2018-08-11', 'Sacred Silence', 8, 'Lead', 'Flash', 'Sport, Alpine', '1000', 5000], ['2018-08-05', 'War All the Time', 1, 'Lead', 'Fell/Hung', 'Sport', '50', 6600], ['2018-08-05', 'Dirty Bird', 1, 'Lead', 'Flash', 'Sport', '70', 2100], ['2018-08-05', 'Belly Full of Beer', 1, 'Lead', 'Flash', 'Sport', '75', 2400], ['2018-08-05', 'Lumber Jack', 1, 'Lead', 'Onsight', 'Sport', '80', 3300], ['2018-08-05', "Takin' Care of Business", 1, 'Lead', 'Flash', 'Sport', '70', 2600], ['2018-08-05', 'Love is a Dog from Hell', 1, 'TR', '', 'Sport', '70', 2600], ['2018-08-04', 'Super Jesus', 2, 'Lead', 'Redpoint', 'Sport', '', 4700], ['2018-08-04', "Noah's Nursery", 1, 'Lead', 'Fell/Hung', 'Sport', '', 4900], ['2018-08-04', 'Sunset Arete', 1, 'TR', '', 'Sport', '', 4900], ['2018-08-04', 'Two Minutes in Heaven', 1, 'Lead', 'Redpoint', 'Sport', '40', 2600], ['2018-08-04', 'Batman', 1, 'Follow', '', 'Sport', '40', 2100], ['2018-07-29', 'Sea Bucket', 1, 'Lead', 'Onsight', 'Sport', '55', 2400], ['2018-07-29', 'Snorkeling in the Sink', 1, 'Lead', 'Flash', 'Sport', '60', 2600], ['2018-07-29', 'Under the Sea', 1, 'Lead', 'Onsight', 'Sport', '55', 2600], ['2018-07-29', 'Under the Tree', 1, 'Lead', 'Flash', 'Sport', '60', 2400], ['2018-07-28', "Cutthroats Don't Wear Plaid", 2, 'Lead', 'Onsight', 'Trad, Sport', '50', 2600], ['2018-07-28', 'Righteous are the Brave', 1, 'Follow', '', 'Trad', '50', 2100], ['2018-07-28', '5.11c sport', 1, 'TR', '', 'Sport', '', 5200], ['2018-07-28', 'Anniversary Crack', 1, 'Lead', 'Onsight', 'Trad', '80', 2900], ['2018-07-28', "Phil em' Up", 1, 'TR', '', 'Sport', '', 2600], ['2018-07-27', 'Himalayas Calling', 1, 'Lead', 'Onsight', 'Sport', '70', 4600], ['2018-07-26', 'Cat Nip', 1, 'Lead', 'Fell/Hung', 'Sport', '60', 4600], ['2018-07-26', "Lion's Den", 1, 'TR', '', 'Sport', '70', 6600], ['2018-07-26', '5.9 sport', 1, 'Lead', 'Flash', 'Sport', '', 2400], ['2018-07-26', 'Snap Dragon', 1, 'Lead', 'Redpoint', 'Sport', '40', 2400], ['2018-07-26', 'Labors of Lust', 1, 'Lead', 'Onsight', 'Sport', '50', 2600], ['2018-07-23', 'Dream Weaver', 2, 'Lead', 'Redpoint', 'Trad, TR', '40', 2400], ['2018-07-22', 'Dusty Gozangas', 1, 'Lead', 'Onsight', 'Sport', '40', 4600], ['2018-07-22', 'LIttle Brittle', 2, 'Lead', 'Fell/Hung', 'Sport', '40', 4600], ['2018-07-22', 'Happy Time Harry', 1, 'Lead', 'Onsight', 'Sport', '70', 4600], ['2018-07-21', 'Shoulder Crack', 1, 'TR', '', 'Trad, TR', '50', 2100], ['2018-07-21', 'The Gobbler', 1, 'TR', '', 'Trad, TR', '50', 2400], ['2018-07-21', "Mike's Butt Cheeks", 1, 'Lead', 'Redpoint', 'Trad, TR', '50', 3000], ['2018-07-21', 'Morning Blues', 1, 'TR', '', 'TR', '40', 3200], ['2018-07-21', 'Between The Lines', 1, 'TR', '', 'Trad', '30', 1800], ['2018-07-21', 'Left Side', 1, 'Lead', 'Onsight', 'Trad', '30', 2100], ['2018-07-14', 'No Cowboys', 2, 'Lead', 'Onsight', 'Sport', '80', 3500], ['2018-07-14', 'Far From The Sea', 1, 'Lead', 'Onsight', 'Sport', '80', 3200], ['2018-07-14', 'Address Unknown', 1, 'Lead', 'Onsight', 'Sport', '70', 2600], ['2018-07-11', 'Ignition', 3, 'Lead', 'Onsight', 'Sport', '40', 4600], ['2018-07-11', 'Two Minutes in Heaven', 1, 'Lead', 'Onsight', 'Sport', '40', 2600], ['2018-07-04', 'Original Route, aka Javaman', 5, 'Lead', 'Redpoint', 'Trad, Alpine', '700', 3000], ['2018-06-27', 'First Best', 1, 'Lead', 'Redpoint', 'Trad', '70', 2700], ['2018-06-27', 'Standard Route Direct Finish', 1, 'Lead', 'Redpoint', 'Trad', '100', 2400], ['2018-06-27', 'Orange Crack', 1, 'Lead', 'Fell/Hung', 'Trad', '300', 5000], ['2018-06-27', 'Tigger', 1, 'Follow', '', 'Trad', '140', 2800], ['2018-06-24', 'Amber', 1, 'Lead', 'Onsight', 'Sport', '120', 2100], ['2018-06-24', 'Servus', 1, 'Follow', '', 'Sport', '250', 3000], ['2018-06-23', 'Free Fall', 2, 'Lead', 'Onsight', 'Trad, Sport', '200', 2600], ['2018-06-20', 'Blind Black Babies', 2, 'TR', '', 'Trad, Sport', '75', 2400], ['2018-06-20', 'Rosebush Crack', 2, 'Follow', '', 'Trad', '70', 2400], ['2018-06-20', "Roy's Variation", 1, 'Lead', 'Redpoint', 'Trad, TR', '60', 2600], ['2018-06-20', 'Cardiac Bypass', 1, 'Lead', 'Redpoint', 'Trad, Sport', '55', 2900], ['2018-06-20', 'The Spiral', 1, 'Lead', 'Redpoint', 'Trad', '55', 2000], ['2018-06-12', 'Raccoon Soup aka Thunderbolts', 1, 'TR', '', 'Trad, TR', '', 5300], ['2018-06-12', 'Five-Ten Crack', 2, 'Follow', '', 'Trad', '', 2600], ['2018-06-12', 'Rincon', 1, 'Lead', 'Flash', 'Trad', '', 4600], ['2018-06-11', 'Levada', 1, 'TR', '', 'Sport', '80', 2100], ['2018-06-11', 'Lambada', 2, 'Lead', 'Flash', 'Sport', '60', 2800], ['2018-06-11', 'Turkey Jerky', 1, 'Lead', 'Onsight', 'Sport', '80', 3100], ['2018-06-11', 'Berga', 1, 'TR', '', 'Sport', '80', 2400], ['2018-06-11', 'Beasto', 1, 'Lead', 'Flash', 'Sport', '70', 2700], ['2018-06-06', 'The Fiver', 2, 'Lead', 'Redpoint', 'Trad', '70', 2100], ['2018-06-06', 'Theoretically', 3, 'TR', '', 'Trad, TR', '60', 3200], ['2018-06-06', 'Theoretically', 10, 'TR', '', 'Trad, TR', '60', 3200], ['2018-06-03', 'The Ramp', 4, 'Lead', 'Redpoint', 'Trad, Alpine', '750', 1800], ['2018-05-30', 'Rosebush Crack', 1, 'Follow', '', 'Trad', '70', 2400], ['2018-05-30', 'Blind Black Babies', 1, 'Lead', 'Redpoint', 'Trad, Sport', '75', 2400], ['2018-05-30', '5.6 Crack', 2, 'Follow', '', 'Trad', '65', 1600], ['2018-05-30', 'Wide Crack', 1, 'TR', '', 'Trad', '45', 1800], ['2018-05-30', 'Theoretically', 1, 'Lead', 'Redpoint', 'Trad, TR', '60', 3200], ['2018-05-26', 'Right Side', 2, 'TR', '', 'TR', '50', 2100], ['2018-05-26', 'Righteous are the Brave', 2, 'Lead', 'Redpoint', 'Trad', '50', 2100], ['2018-05-25', 'Tigger', 2, 'Follow', '', 'Trad', '140', 2800], ['2018-05-25', 'Orange Crack', 1, 'Lead', 'Redpoint', 'Trad', '300', 5000], ['2018-05-25', 'The Dagger', 2, 'Follow', '', 'Trad', '40', 2100], ['2018-05-24', '5.11a trad', 2, 'Solo', '', 'Trad', '', 4600], ['2018-05-24', 'Wizards Well', 2, 'Solo', '', 'Trad', '45', 2500], ['2018-05-24', 'The Fiver', 2, 'Solo', '', 'Trad', '70', 2100], ['2018-05-20', 'Suprise Inside', 1, 'Lead', 'Flash', 'Sport', '60', 2600], ['2018-05-20', 'Manly Fingertips', 1, 'TR', '', 'Sport', '50', 3200], ['2018-05-20', 'Ladyfingers', 2, 'Lead', 'Onsight', 'Trad', '60', 2400], ['2018-05-20', 'Righteous are the Brave', 1, 'Follow', '', 'Trad', '50', 2100], ['2018-05-16', 'Rosebush Crack', 2, 'Lead', 'Redpoint', 'Trad', '70', 2400], ['2018-05-16', "Jerry's Variation", 1, 'TR', '', 'Trad', '45', 1900], ['2018-05-16', "Jerry's Route", 1, 'Lead', 'Redpoint', 'Trad', '45', 2200], ['2018-05-14', 'Fatman', 2, 'Lead', 'Redpoint', 'Sport', '55', 2600], ['2018-05-14', 'The Natural', 3, 'TR', '', 'Sport', '55', 2900], ['2018-05-12', 'Windigo', 1, 'Lead', 'Onsight', 'Sport', '50', 3500], ['2018-05-12', '5.10c sport', 1, 'TR', '', 'Sport', '', 3200], ['2018-05-12', '5.9 sport', 1, 'Lead', 'Onsight', 'Sport', '', 2400], ['2018-05-12', 'Pocket Hunter', 1, 'Lead', 'Flash', 'Sport', '35', 2900], ['2018-05-12', 'Twelve Nations', 1, 'Lead', 'Onsight', 'Sport', '90', 2300], ['2018-05-09', 'The Natural', 1, 'Lead', 'Redpoint', 'Sport', '55', 2900], ['2018-05-09', 'Hiroshima', 1, 'Lead', 'Redpoint', 'Sport', '60', 2400], ['2018-05-09', 'Fatman', 2, 'Lead', 'Redpoint', 'Sport', '55', 2600], ['2018-05-06', 'Flake Fest', 2, 'Lead', 'Onsight', 'Sport', '75', 2900], ['2018-05-06', 'The Rock Whisperer', 1, 'Lead', 'Onsight', 'Sport', '70', 4600], ['2018-05-06', 'Out of the Whole', 1, 'TR', '', 'Sport, TR', '60', 5200], ['2018-05-06', 'Unfilled Dreams', 2, 'Lead', 'Flash', 'Sport', '75', 2400], ['2018-05-06', 'Reindeer Games', 1, 'Lead', 'Onsight', 'Sport', '50', 2600], ['2018-05-05', 'Unnamed', 1, 'Lead', 'Flash', 'Sport', '50', 2900], ['2018-05-05', 'Duck and Cover', 1, 'Lead', 'Redpoint', 'Sport', '60', 2600], ['2018-05-05', 'Hiroshima', 1, 'Lead', 'Flash', 'Sport', '60', 2400], ['2018-05-05', 'Nagasaki', 2, 'Lead', 'Redpoint', 'Sport', '65', 2100], ['2018-04-28', 'Constitution Crack', 1, 'Lead', 'Flash', 'Trad', '80', 1800], ['2018-04-28', 'Dark Horse', 1, 'Lead', 'Flash', 'Trad', '60', 2900], ['2018-04-28', 'The Waltz', 3, 'Lead', 'Flash', 'Trad', '300', 2100], ['2018-04-22', 'Ashes of Stone', 1, 'Lead', 'Flash', 'Trad, Sport', '190', 2400], ['2018-04-22', 'Skyline Arete', 5, 'Lead', 'Redpoint', 'Trad', '500', 1600], ['2018-04-21', 'Pinnacle Dihedral', 2, 'TR', '', 'Trad', '60', 2100], ['2018-04-21', 'The Spiral', 1, 'TR', '', 'Trad', '55', 2000], ['2018-04-21', 'Cardiac Bypass', 2, 'Lead', 'Redpoint', 'Trad, Sport', '55', 2900], ['2018-04-21', 'The Fiver', 2, 'Lead', 'Redpoint', 'Trad', '70', 2100], ['2018-04-15', 'Dancing Bare Naked Ladies', 1, 'Lead', 'Redpoint', 'Sport', '45', 1800], ['2018-04-14', 'In Spite of Ourselves', 1, 'Lead', 'Fell/Hung', 'Trad', '70', 4900], ['2018-04-14', 'The Noses Right Off Our Faces', 1, 'TR', '', 'Trad', '50', 2100], ['2018-04-14', 'Alluvial Ecstasy', 2, 'TR', '', 'Sport', '50', 3200], ['2018-04-14', 'Slope on a Rope', 1, 'Lead', 'Onsight', 'Sport', '50', 2900], ['2018-04-14', '"5.9" Corner', 1, 'Lead', 'Onsight', 'Trad', '50', 2100], ['2018-04-14', 'Moai Crack', 3, 'Lead', 'Redpoint', 'Trad', '50', 2400], ['2018-04-04', 'What a Crack Up', 1, 'Lead', 'Onsight', 'Sport, TR', '', 2600], ['2018-04-04', 'No Laughing Matter', 1, 'Lead', 'Flash', 'Sport', '60', 2300], ['2018-04-04', 'Just For Laughs', 1, 'Lead', 'Onsight', 'Sport', '60', 3200], ['2018-04-04', 'Pretty Woman', 1, 'Lead', 'Fell/Hung', 'Sport', '', 4800], ['2018-04-04', 'Kitty Hawk', 1, 'Lead', 'Onsight', 'Sport', '', 3100], ['2018-04-04', 'Wall Street', 1, 'TR', '', 'Sport', '', 2900], ['2018-04-04', 'Main Street', 1, 'Lead', 'Onsight', 'Sport, TR', '', 2400], ['2018-04-03', 'Light in the Loafers', 1, 'Lead', 'Onsight', 'Sport', '40', 2600], ['2018-04-03', 'Light My Fire', 1, 'Lead', 'Onsight', 'Sport', '40', 2600], ['2018-04-03', 'I Saw the Light', 1, 'Lead', 'Onsight', 'Sport', '40', 2600], ['2018-04-03', "All 'Lit Up", 1, 'Lead', 'Onsight', 'Sport', '40', 2400], ['2018-04-03', 'Lighten Up', 1, 'Lead', 'Onsight', 'Sport', '40', 2400], ['2018-04-03', 'Lights Out', 1, 'Lead', 'Onsight', 'Sport', '40', 2400], ['2018-04-01', 'Substandard', 1, 'Follow', '', 'Trad', '120', 2100], ['2018-04-01', "Molly's Stealthy Ride", 2, 'Lead', 'Redpoint', 'Sport', '50', 2500], ['2018-04-01', 'Sweeping with Mr. Brownstone', 2, 'TR', '', 'Trad', '120', 2600], ['2018-03-23', 'Pinnacle Standard', 3, 'Follow', '', 'Trad', '75', 1600], ['2018-03-23', 'Silent Rock', 1, 'Lead', 'Onsight', 'Trad, Sport', '35', 2600], ['2018-03-23', '5.6 trad', 5, 'Lead', 'Onsight', 'Trad', '', 1600], ['2018-03-11', 'The Hunted', 1, 'Solo', '', 'Sport, TR', '60', 1800], ['2018-03-11', 'The Hunter', 2, 'Solo', '', 'Sport, TR', '60', 1800], ['2018-03-11', 'Campground Beatdown', 5, 'Solo', '', 'Sport, TR', '70', 2400], ['2018-03-11', 'Fat F*&% Five', 4, 'Solo', '', 'Sport, TR', '65', 2400], ['2018-03-09', '5.12a sport', 1, 'TR', '', 'Sport', '', 6600], ['2018-03-09', '5.11d sport', 1, 'TR', '', 'Sport', '', 5500], ['2018-03-09', '5.11 a/b Sport', 2, 'TR', '', 'Sport', '', 4800], ['2018-03-09', '5.10d sport', 2, 'TR', '', 'Sport', '', 3500], ['2018-03-09', '5.10c sport', 2, 'TR', '', 'Sport', '', 3200], ['2018-03-09', '5.9 sport', 1, 'TR', '', 'Sport', '', 2400], ['2018-03-09', '5.10b sport', 1, 'TR', '', 'Sport', '', 2900], ['2018-03-09', '5.10b trad', 1, 'TR', '', 'Trad', '', 2900], ['2018-02-07', '5.11 a/b Sport', 1, 'Lead', 'Redpoint', 'Sport', '', 4800], ['2018-02-07', '5.10d sport', 3, 'Lead', 'Onsight', 'Sport', '', 3500], ['2018-02-07', '5.10c sport', 2, 'TR', '', 'Sport', '', 3200], ['2018-02-07', '5.10b sport', 4, 'Lead', 'Onsight', 'Sport', '', 2900], ['2017-12-17', '5.12a sport', 1, 'TR', '', 'Sport', '', 6600], ['2017-12-17', '5.10d sport', 1, 'Lead', 'Onsight', 'Sport', '', 3500], ['2017-12-17', '5.11a sport', 1, 'Lead', 'Onsight', 'Sport', '', 4600], ['2017-12-17', '5.10c sport', 1, 'Lead', 'Onsight', 'Sport', '', 3200], ['2017-12-17', '5.10b sport', 2, 'Lead', 'Onsight', 'Sport', '', 2900], ['2017-12-17', '5.10a sport', 1, 'Lead', 'Redpoint', 'Sport', '', 2600], ['2017-12-17', '5.8 sport', 1, 'Lead', 'Onsight', 'Sport', '', 2100], ['2017-12-12', '5.11a sport', 1, 'Lead', 'Onsight', 'Sport', '', 4600], ['2017-12-12', '5.10d sport', 2, 'Lead', 'Onsight', 'Sport', '', 3500], ['2017-12-10', '5.10b sport', 4, 'Lead', 'Onsight', 'Sport', '', 2900], ['2017-12-10', '5.9 sport', 2, 'Lead', 'Onsight', 'Sport', '', 2400], ['2017-11-25', "Industrial Disease aka Dead Moonies Don't Sell Flowers", 1, 'TR', '', 'Sport, TR', '70', 5200], ['2017-11-25', 'Flight 67 to Stockholm', 1, 'TR', '', 'Sport', '', 4800], ['2017-11-25', 'Fast Boat to China', 1, 'Lead', 'Onsight', 'Trad', '60', 2200], ['2017-11-25', 'Forgotten Names', 1, 'TR', '', 'Sport', '70', 5400], ['2017-11-25', 'Darker is Better', 1, 'Lead', 'Onsight', 'Trad', '60', 1800], ['2017-11-01', '5.11 a/b Sport', 3, 'TR', '', 'Sport', '', 4800], ['2017-11-01', '5.10d sport', 4, 'TR', '', 'Sport', '', 3500], ['2017-11-01', '5.10b sport', 1, 'TR', '', 'Sport', '', 2900], ['2017-11-01', '5.9 sport', 1, 'TR', '', 'Sport', '', 2400], ['2017-11-01', '5.8 sport', 1, 'TR', '', 'Sport', '', 2100], ['2017-10-28', 'The Ant Route', 1, 'TR', '', 'Sport', '65', 2400], ['2017-10-28', 'Bar Wrench Route', 2, 'TR', '', 'Sport', '65', 1800], ['2017-09-27', 'Blood and Bolts', 1, 'Lead', '', 'Sport', '90', 2100], ['2017-09-27', 'Beach Break', 1, 'Lead', 'Fell/Hung', 'Sport', '80', 2600], ['2017-09-27', "Sully's Route", 1, 'Lead', 'Flash', 'Sport', '90', 2600], ['2017-09-27', 'Bush-Wacked Piano', 1, 'Lead', '', 'Sport', '65', 2600], ['2017-09-17', "Kennedy's Route", 1, 'TR', '', 'Trad, TR', '45', 4600], ['2017-09-17', 'Crocodile Crack', 3, 'Lead', 'Flash', 'Trad, TR', '35', 2400], ['2017-09-04', 'Southwest Face', 3, 'Lead', 'Flash', 'Trad', '450', 2100], ['2017-09-04', 'Dogleg Crack', 2, 'Lead', 'Fell/Hung', 'Trad', '', 4600], ['2017-09-02', 'Standard Route', 1, 'Lead', 'Redpoint', 'Trad', '300', 2200], ['2017-09-02', 'Orange Crack', 2, 'Lead', 'Redpoint', 'Trad', '300', 5000], ['2017-09-02', 'Tigger', 1, 'Lead', 'Redpoint', 'Trad', '140', 2800], ['2017-09-02', 'Thing In Between', 1, 'TR', '', 'Trad', '80', 2400], ['2017-08-30', 'Beehive Traverse', 1, 'Solo', '', 'Trad, Alpine', '2700', 1400], ['2017-08-27', 'Legacy', 6, 'Lead', 'Onsight', 'Trad, Alpine', '850', 1800], ['2017-08-23', 'The EZ Route (Lower Half)', 6, 'Lead', 'Onsight', 'Trad, Alpine', '900', 2500], ['2017-08-20', 'Direct West Arete', 6, 'Lead', 'Flash', 'Trad, Alpine', '850', 1800], ['2017-08-09', 'White Crystals Crack', 5, 'Lead', 'Onsight', 'Trad, Alpine', '600', 1800], ['2017-08-02', 'Standard Route Direct Finish', 1, 'Follow', '', 'Trad', '100', 2400], ['2017-08-02', 'Orange Crack', 3, 'Lead', 'Fell/Hung', 'Trad', '300', 5000], ['2017-07-29', 'Pedro', 1, 'Lead', 'Onsight', 'Sport', '60', 2900], ['2017-07-29', 'Hippy Bandana', 1, 'Lead', 'Flash', 'Sport', '35', 2500], ['2017-07-29', 'Loose and Dirty', 1, 'Lead', 'Onsight', 'Trad', '50', 1800], ['2017-07-27', 'Last of the Wild Ones Variation', 2, 'TR', '', 'Trad, Sport', '50', 4600], ['2017-07-27', 'Theoretically', 3, 'TR', '', 'Trad, TR', '60', 3200], ['2017-07-27', 'Cardiac Bypass', 1, 'Lead', 'Fell/Hung', 'Trad, Sport', '55', 2900], ['2017-07-27', 'The Spiral', 1, 'Lead', 'Onsight', 'Trad', '55', 2000], ['2017-07-22', 'Leap of Faith', 4, 'Lead', 'Onsight', 'Trad, Alpine', '420', 3200], ['2017-07-19', "Roy's Variation", 1, 'Lead', 'Redpoint', 'Trad, TR', '60', 2600], ['2017-07-19', "Jerry's Variation", 2, 'TR', '', 'Trad', '45', 1900], ['2017-07-19', 'Wide Crack', 1, 'Lead', 'Redpoint', 'Trad', '45', 1800], ['2017-07-16', "Jerry's Variation", 1, 'Lead', 'Redpoint', 'Trad', '45', 1900], ['2017-07-16', 'Cardiac Bypass', 1, 'Lead', 'Fell/Hung', 'Trad, Sport', '55', 2900], ['2017-07-16', 'Wide Crack', 1, 'Lead', 'Redpoint', 'Trad', '45', 1800], ['2017-07-15', 'Original Route, aka Javaman', 5, 'Lead', 'Flash', 'Trad, Alpine', '700', 3000], ['2017-07-09', 'Black Parade', 3, 'Lead', 'Fell/Hung', 'Sport', '', 4900], ['2017-07-09', 'Snap Dragon', 1, 'Lead', 'Onsight', 'Sport', '40', 2400], ['2017-07-09', 'Taste of Grit', 1, 'Lead', 'Onsight', 'Sport', '', 1600], ['2017-06-29', '5.6 Crack', 2, 'Lead', 'Redpoint', 'Trad', '65', 1600], ['2017-06-29', "Jerry's Route", 1, 'Lead', 'Redpoint', 'Trad', '45', 2200], ['2017-06-29', 'Pinnacle Standard', 2, 'Lead', 'Redpoint', 'Trad', '75', 1600], ['2017-06-25', 'The Ramp', 5, 'Lead', 'Onsight', 'Trad, Alpine', '750', 1800], ['2017-06-22', 'Wide Crack', 1, 'TR', '', 'Trad', '45', 1800], ['2017-06-22', '5.6 Crack', 2, 'Lead', 'Redpoint', 'Trad', '65', 1600], ['2017-06-22', 'Pinnacle Dihedral', 2, 'Lead', 'Redpoint', 'Trad', '60', 2100], ['2017-06-21', '5.11a trad', 4, 'Solo', '', 'Trad', '', 4600], ['2017-06-21', '5.9 trad', 2, 'Solo', '', 'Trad', '', 2400], ['2017-06-18', 'Crack to Nowhere', 1, 'Lead', 'Onsight', 'Sport', '60', 2900], ['2017-06-18', 'Yellowstone Poseidon Adventures', 2, 'Lead', 'Onsight', 'Sport', '80', 2400], ['2017-06-18', 'Quick Tease', 2, 'Lead', 'Onsight', 'Sport', '65', 2400], ['2017-06-18', 'Lead Between the Lines', 1, 'Lead', 'Onsight', 'Sport', '45', 2900], ['2017-06-18', 'Dancing Bare Naked Ladies', 1, 'Lead', 'Onsight', 'Sport', '45', 1800], ['2017-06-04', 'Pocket Protector', 2, 'Lead', 'Onsight', 'Sport', '70', 2600], ['2017-06-04', 'Unknown', 2, 'Lead', 'Onsight', 'Sport', '50', 2100], ['2017-06-04', 'Campground Beatdown', 3, 'Lead', 'Onsight', 'Sport, TR', '70', 2400], ['2017-06-04', 'Fat F*&% Five', 2, 'Lead', 'Onsight', 'Sport, TR', '65', 2400], ['2017-06-04', 'Pocket Pool', 1, 'Lead', 'Onsight', 'Sport', '50', 2600], ['2017-06-04', 'The Hunter', 2, 'Lead', '', 'Sport, TR', '60', 1800], ['2017-06-04', 'The Hunted', 1, 'Lead', 'Onsight', 'Sport, TR', '60', 1800], ['2017-05-27', 'Honey Bee Ridge', 6, 'Lead', 'Redpoint', 'Trad', '700', 2100], ['2017-05-21', 'Proboscis', 3, 'Lead', 'Onsight', 'Trad', '300', 2200], ['2017-05-15', "Molly's Stealthy Ride", 1, 'Lead', 'Onsight', 'Sport', '50', 2500], ['2017-05-15', 'Substandard', 2, 'Lead', 'Flash', 'Trad', '120', 2100], ['2017-05-15', 'The Noses Right Off Our Faces', 1, 'TR', '', 'Trad', '50', 2100], ['2017-05-15', 'Moai Crack', 1, 'Lead', 'Onsight', 'Trad', '50', 2400], ['2017-05-03', 'The Dagger', 1, 'Lead', 'Onsight', 'Trad', '40', 2100], ['2017-05-03', 'Standard Route', 3, 'Lead', 'Onsight', 'Trad', '300', 2200], ['2017-04-23', "Jerry's Route", 1, 'Follow', '', 'Trad', '45', 2200], ['2017-04-22', 'Rosebush Crack', 1, 'Lead', 'Redpoint', 'Trad', '70', 2400], ['2017-04-22', 'Blind Black Babies', 1, 'TR', '', 'Trad, Sport', '75', 2400], ['2017-04-22', 'Slanting Dihedral', 1, 'Lead', 'Redpoint', 'Trad', '65', 2400], ['2017-04-19', 'Slanting Dihedral', 2, 'TR', '', 'Trad', '65', 2400], ['2017-04-19', 'Wide Crack', 2, 'TR', '', 'Trad', '45', 1800], ['2017-04-19', '5.6 Crack', 2, 'TR', '', 'Trad', '65', 1600], ['2017-04-19', 'The Fiver', 2, 'Lead', 'Redpoint', 'Trad', '70', 2100], ['2017-04-06', 'Ithaca Connection', 1, 'Lead', 'Onsight', 'Trad', '', 2400], ['2017-04-05', 'Skyline Arete', 4, 'Lead', 'Onsight', 'Trad', '500', 1600], ['2017-04-01', 'The Ripple', 1, '', '', 'Sport', '50', 2100], ['2017-04-01', 'Undertow', 1, '', '', 'Sport', '45', 2400], ['2017-04-01', 'Boat Belay', 1, '', '', 'Sport', '70', 2900], ['2017-04-01', 'Josh Was Grounded', 1, '', '', 'Sport', '70', 2500], ['2017-04-01', 'Boat Belay', 1, '', '', 'Sport', '70', 2900], ['2017-04-01', 'French Connection', 1, '', '', 'Sport', '75', 2600], ['2017-04-01', 'French Connection', 1, '', '', 'Sport', '75', 2600], ['2017-03-26', 'Child\'s Play (or "Senseless Bummer")', 1, '', '', 'Sport', '70', 2400], ['2017-03-26', 'No Moral Values', 1, '', '', 'Sport', '55', 2500], ['2017-03-26', 'No Moral Values', 1, '', '', 'Sport', '55', 2500], ['2017-03-19', 'Thin Chance', 1, 'TR', '', 'Ice', '80', 32250], ['2017-03-19', 'White Zombie', 1, 'TR', '', 'Mixed', '60', 0], ['2017-03-19', 'Fat Chance', 2, 'TR', '', 'Ice', '90', 32000], ['2017-03-18', 'Thing In Between', 1, 'TR', '', 'Trad', '80', 2400], ['2017-03-18', 'Tigger', 1, 'TR', '', 'Trad', '140', 2800], ['2017-03-18', 'First Best', 5, 'TR', '', 'Trad', '70', 2700], ['2017-01-23', 'Wide Crack', 1, 'TR', '', 'Trad', '45', 1800], ['2017-01-23', "Jerry's Variation", 1, 'TR', '', 'Trad', '45', 1900], ['2017-01-23', '5.6 Crack', 2, 'Lead', 'Redpoint', 'Trad', '65', 1600], ['2017-01-18', 'Pinnacle Standard', 2, 'Lead', 'Redpoint', 'Trad', '75', 1600], ['2017-01-18', 'Pinnacle Dihedral', 1, 'TR', '', 'Trad', '60', 2100], ['2017-01-05', 'Genesis I', 3, 'TR', '', 'TR, Ice', '60', 32250], ['2016-12-12', 'Genesis I', 3, 'TR', '', 'TR, Ice', '60', 32250], ['2016-11-29', 'Mental Physics', 1, '', '', 'Trad', '200', 1800], ['2016-11-29', 'The Eye', 1, '', '', 'Trad', '150', 1400], ['2016-11-28', "Mike's Books", 2, '', '', 'Trad', '180', 1600], ['2016-11-28', 'Water Chute', 1, '', '', 'Trad', '60', 2900], ['2016-11-28', 'Overhang Bypass', 2, '', '', 'Trad', '100', 1800], ['2016-11-12', 'Unknown Left of Let the Healing Begin', 1, 'TR', '', 'TR', '30', 3200], ['2016-11-12', 'Stranger in a Strange Land', 1, 'Lead', 'Onsight', 'Trad, TR', '60', 2100], ['2016-11-12', 'Peopleburg', 1, '', '', 'Sport', '35', 2100], ['2016-11-12', 'Peopleburg', 1, '', '', 'Sport', '35', 2100], ['2016-11-12', 'Let the Healing Begin', 1, '', '', 'Sport', '35', 2400], ['2016-11-12', 'Sn4tchbuckl3r', 1, '', '', 'Sport', '40', 2600], ['2016-11-12', 'Land of the Lost', 1, '', '', 'Sport', '50', 2400], ['2016-11-03', '5.6 Crack', 1, '', '', 'Trad', '65', 1600], ['2016-11-03', '5.6 Crack', 1, '', '', 'Trad', '65', 1600], ['2016-11-03', 'Rosebush Crack', 1, '', '', 'Trad', '70', 2400], ['2016-11-03', 'Blind Black Babies', 1, '', '', 'Trad, Sport', '75', 2400], ['2016-11-02', 'Standard Route', 3, '', '', 'Trad', '160', 2500], ['2016-11-01', 'Crummy Up', 1, '', '', 'Trad, Sport', '30', 2400], ['2016-10-27', 'Grit', 1, '', '', 'Boulder', '8', 20008], ['2016-10-27', 'Gritty', 1, '', '', 'Boulder', '8', 20200], ['2016-10-27', 'Wave Rider', 1, '', '', 'Boulder', '15', 20100], ['2016-10-27', 'G.I. Ben', 1, '', '', 'Boulder', '10', 20008], ['2016-10-27', 'G.I. Ben', 1, '', '', 'Boulder', '10', 20008], ['2016-10-27', 'Buffy Slab', 1, '', '', 'Boulder', '10', 20008], ['2016-10-27', 'Yo Quiero', 1, '', '', 'Boulder', '18', 20008], ['2016-10-27', 'Men on the Moon', 1, '', '', 'Boulder', '15', 20008], ['2016-10-27', 'Beltar', 1, '', '', 'Boulder', '15', 20100], ['2016-10-27', 'Freshly Sheared Sheep', 1, '', '', 'Boulder', '10', 20008], ['2016-10-27', 'Bad Ass Mountaineers', 1, '', '', 'Boulder', '12', 20005], ['2016-10-27', 'Bon', 1, '', '', 'Boulder', '10', 20008], ['2016-10-27', "Julia's Hueco Problem", 1, '', '', 'Boulder', '15', 20100], ['2016-10-27', "Pete's Hueco Problem", 1, '', '', 'Boulder', '15', 20008], ['2016-10-27', 'Baby Bear', 1, '', '', 'Boulder', '12', 20200], ['2016-10-26', 'Blind Black Babies', 2, 'TR', '', 'Trad, Sport', '75', 2400], ['2016-10-26', 'Rosebush Crack', 4, 'TR', '', 'Trad', '70', 2400], ['2016-10-26', 'Strawberry Crack', 4, 'TR', '', 'Trad', '80', 1800], ['2016-10-05', 'Snag', 1, '', '', 'Trad', '65', 1800], ['2016-10-05', 'The Vegan', 1, '', '', 'Sport', '65', 2000], ['2016-10-05', 'Pair of Loaded Guns', 1, '', '', 'Sport', '70', 2500], ['2016-10-05', 'Trail Boss', 1, '', '', 'Sport', '70', 2900], ['2016-09-06', 'White Trash Summer', 1, 'TR', '', 'Trad', '90', 2600], ['2016-09-06', 'Glass Catcher', 1, '', '', 'Trad', '100', 2100], ['2016-09-06', 'Fire Escape', 1, '', '', 'Trad', '100', 2400], ['2016-09-06', 'Crystal Delight', 1, '', '', 'Trad', '100', 2100], ['2016-08-31', 'Schools Out', 1, '', '', 'Sport', '55', 2600], ['2016-08-31', 'Dodge Ball', 1, '', '', 'Sport', '50', 2100], ['2016-08-31', 'Peer Pressure', 1, '', '', 'Sport', '50', 2300], ['2016-08-31', 'Physical Development', 1, '', '', 'Sport', '50', 2800], ['2016-08-12', 'Southwest Friction', 1, '', '', 'Sport', '', 1400], ['2016-08-12', 'Kim', 1, '', '', 'Trad', '', 1600], ['2016-08-12', 'Little Old Crack aka Boulder Hop', 1, '', '', 'Trad', '40', 1600], ['2016-08-12', 'Sugar Crack', 2, '', '', 'Trad', '', 1800], ['2016-08-10', 'East Face', 1, '', '', 'Snow, Alpine', '', 900], ['2016-08-07', 'Righteous are the Brave', 1, '', '', 'Trad', '50', 2100], ['2016-08-07', 'Warm Up Route Left Most Anchors', 1, '', '', 'TR', '55', 3000], ['2016-08-07', 'Warm Up Route Left Most Anchors', 1, '', '', 'TR', '55', 3000], ['2016-08-07', 'Warm Up Route Left Most Anchors', 1, '', '', 'TR', '55', 3000], ['2016-08-02', 'Robin', 1, '', '', 'Sport', '40', 2200], ['2016-08-02', 'Batman', 1, '', '', 'Sport', '40', 2100], ['2016-08-02', 'Batman', 1, '', '', 'Sport', '40', 2100], ['2016-08-02', 'Left Prow', 1, '', '', 'Sport', '40', 3100], ['2016-06-27', 'Northwest Ridge', 1, '', '', 'Trad, Alpine', '600', 900], ['2016-06-17', 'Pinnacle Standard', 1, '', '', 'Trad', '75', 1600], ['2016-06-14', 'Nagasaki', 1, '', '', 'Sport', '65', 2100], ['2016-06-14', 'Nagasaki', 1, '', '', 'Sport', '65', 2100], ['2016-06-14', 'Duck and Cover', 1, '', '', 'Sport', '60', 2600], ['2016-06-14', 'The Natural', 1, '', '', 'Sport', '55', 2900], ['2016-06-14', 'Fatman', 1, '', '', 'Sport', '55', 2600], ['2016-06-10', 'Honey Bee Ridge', 5, 'Lead', 'Onsight', 'Trad', '700', 2100], ['2016-05-18', "Jerry's Route", 1, 'Follow', '', 'Trad', '45', 2200], ['2016-05-18', "Jerry's Route", 1, '', '', 'Trad', '45', 2200], ['2016-05-18', 'Wide Crack', 1, '', '', 'Trad', '45', 1800], ['2016-05-18', 'Theoretically', 1, '', '', 'Trad, TR', '60', 3200], ['2016-05-18', 'Wizards Well', 1, '', '', 'Trad', '45', 2500], ['2016-05-18', 'Pinnacle Standard', 1, '', '', 'Trad', '75', 1600], ['2016-05-14', 'No Moral Values', 1, '', '', 'Sport', '55', 2500], ['2016-05-14', 'Endless Summer', 1, '', '', 'Sport', '70', 3200], ['2016-05-14', 'Pearl Necklace', 1, '', '', 'Sport', '80', 2600], ['2016-05-14', 'In Search of Sunrise', 1, '', '', 'Sport', '70', 2900], ['2016-05-04', 'Tigger', 2, '', '', 'Trad', '140', 2800], ['2016-05-04', 'Thing In Between', 1, '', '', 'Trad', '80', 2400], ['2016-05-04', 'Orange Crack', 3, '', '', 'Trad', '300', 5000], ['2016-05-03', "Jerry's Route", 1, '', '', 'Trad', '45', 2200], ['2016-05-03', 'The Fiver', 1, '', '', 'Trad', '70', 2100], ['2016-05-03', 'Theoretically', 1, '', '', 'Trad, TR', '60', 3200], ['2016-04-14', 'West Point Crack', 3, '', '', 'Trad', '', 2100], ['2016-04-13', 'Leftover Stuff', 1, '', '', 'Sport', '110', 3000], ['2016-04-13', 'Hot Stuff', 1, '', '', 'Sport', '135', 3000], ['2016-04-13', "Hey Good Lookin'", 1, '', '', 'Sport', '140', 5500], ['2016-04-13', 'Pretty Woman', 1, '', '', 'Sport', '95', 2600], ['2016-04-12', 'Marry Me, Becky', 1, '', '', 'Trad', '', 2900], ['2016-04-12', 'The Mummy', 1, '', '', 'Trad', '40', 2100], ['2016-04-12', 'The Short Tour', 1, '', '', 'Trad', '40', 2900], ['2016-04-09', 'Right of Trash Can Alley', 2, '', '', 'Trad', '200', 2400], ['2016-04-07', 'Smashmouth', 4, '', '', 'Trad', '400', 5000], ['2016-04-06', 'Cave Route', 1, '', '', 'Trad', '50', 1900], ['2016-04-06', 'Tales of Flails', 1, '', '', 'Trad', '130', 2600], ['2016-04-06', 'Cherry Crack', 1, '', '', 'Trad', '140', 3200], ['2016-04-06', 'Intruder', 1, '', '', 'Trad', '65', 5300], ['2016-03-29', 'Friction Face Panty Waist', 1, '', '', 'Sport', '80', 2200], ['2016-03-29', 'Eat My Shorts', 1, '', '', 'Sport', '80', 1800], ['2016-03-29', 'Spikes and Twine', 2, '', '', 'Trad', '150', 2400], ['2016-03-29', 'Marshall Amp', 1, '', '', 'Sport', '105', 4900], ['2016-03-29', 'One-Eyed Jacks', 1, '', '', 'Sport', '50', 4800], ['2016-03-24', 'Caustic Cock', 1, '', '', 'Sport', '40', 4900], ['2016-03-24', 'Have a Beer with Fear', 1, '', '', 'Sport', '60', 4800], ['2016-03-24', 'You Are What You Eat', 1, '', '', 'Trad', '60', 1400], ['2016-03-24', 'Risk Brothers Roof', 1, '', '', 'Trad', '60', 4600], ['2016-03-24', 'Caliban', 1, '', '', 'Sport', '60', 2200], ['2016-03-20', 'Do-Do Love', 1, '', '', 'Sport', '60', 2400], ['2016-03-20', 'Touch of Grey', 1, '', '', 'Sport', '70', 2600], ['2016-03-20', 'Finger Injection', 1, '', '', 'Sport', '50', 3200], ['2016-03-20', 'Short Dog', 1, '', '', 'Sport', '50', 6600], ['2016-03-20', 'Shell Shock', 1, 'Lead', 'Onsight', 'Sport', '60', 5200], ['2016-03-15', 'Under the Boardwalk', 1, '', '', 'Sport', '50', 4600], ['2016-03-15', 'Cling Free', 1, '', '', 'Sport', '30', 6800], ['2016-03-15', 'Far Cry From Josh', 1, '', '', 'Sport', '45', 2700], ['2016-03-15', "Don't Scare the Bat!", 1, '', '', 'Sport', '50', 4600], ['2016-03-08', 'High Caliber', 1, 'Lead', 'Redpoint', 'Sport', '55', 6600], ['2016-03-08', 'Small Arms', 1, 'Follow', '', 'Sport', '55', 2100], ['2016-03-08', 'Young Guns', 1, '', '', 'Sport', '50', 2900], ['2016-03-05', 'Clay Pigeon', 1, '', '', 'Sport', '55', 4600], ['2016-03-05', 'Mini-Gun', 1, '', '', 'Sport', '40', 1600], ['2016-03-05', 'Twin Weapons of Mass Distraction', 1, '', '', 'Sport', '40', 2500], ['2016-03-05', 'FN Five-seveN', 1, '', '', 'Sport', '30', 1800], ['2016-03-05', 'Trigger Happy', 1, '', '', 'Sport', '40', 1600], ['2016-03-05', 'Bushmaster', 1, '', '', 'Sport', '50', 2100], ['2016-03-05', 'Pistol Whipped', 1, '', '', 'Sport', '40', 2900], ['2016-03-05', 'Quick Draw', 1, '', '', 'Sport', '50', 2100], ['2016-02-29', 'Unimpeachable Groping', 7, '', '', 'Sport', '760', 2900], ['2016-02-21', 'High Caliber', 1, '', '', 'Sport', '55', 6600], ['2016-02-21', 'High Caliber', 1, '', '', 'Sport', '55', 6600], ['2016-02-21', 'High Caliber', 1, '', '', 'Sport', '55', 6600], ['2016-02-21', 'Small Arms', 1, '', '', 'Sport', '55', 2100], ['2016-02-08', 'Dark Shadows', 4, '', '', 'Trad', '350', 2100], ['2016-02-06', 'Campus Problem', 1, '', '', 'Boulder', '8', 20400], ['2016-02-06', 'Six pack', 1, '', '', 'Boulder', '11', 20008], ['2016-02-06', 'Northeast Face Center', 1, '', '', 'Boulder', '10', 20100], ['2016-02-06', "Jenna's Jewelry", 1, '', '', 'Boulder', '10', 20350], ['2016-02-06', 'The Spreader', 1, '', '', 'Boulder', '10', 20008], ['2016-02-06', 'Fear and Loathing, III', 1, '', '', 'Sport', '70', 6600], ['2016-02-05', 'Gelatin Pooch', 1, '', '', 'Sport', '60', 2600], ['2016-02-05', 'Pump First, Pay Later', 1, '', '', 'Sport', '60', 2900], ['2016-02-05', 'American Sportsman', 1, '', '', 'Sport', '50', 2900], ['2016-01-29', 'Dark Shadows', 4, '', '', 'Trad', '350', 2100], ['2016-01-29', 'Have a Beer with Fear', 1, '', '', 'Sport', '60', 4800], ['2016-01-29', 'Maneater', 1, '', '', 'Sport', '', 6600], ['2016-01-23', 'Southeast Face - SDS', 1, '', '', 'Boulder', '', 20470], ['2016-01-23', 'Betty', 1, '', '', 'Boulder', '10', 20100], ['2016-01-23', 'Put Your Shoes on Arete', 1, '', '', 'Boulder', '10', 20210], ['2016-01-23', 'Prefunk', 1, '', '', 'Boulder', '10', 20008], ['2016-01-23', 'Fluffer', 1, '', '', 'Boulder', '15', 20150], ['2016-01-23', "Jones'n", 1, '', '', 'Boulder', '12', 20410], ['2016-01-23', 'The Spreader', 1, '', '', 'Boulder', '10', 20008], ['2016-01-20', 'Navajo', 1, '', '', 'Sport', '', 2600], ['2016-01-20', 'Mega Poser', 1, '', '', 'Sport', '40', 6600], ['2016-01-13', 'Pickled Cock', 1, '', '', 'Sport', '50', 5200], ['2016-01-13', 'Caustic Cock', 1, '', '', 'Sport', '40', 4900], ['2016-01-13', 'Wonderstuff', 1, '', '', 'Sport', '35', 7500], ['2016-01-03', 'Sundial', 1, '', '', 'Boulder', '', 20008], ['2016-01-03', 'High Noon', 1, '', '', 'Boulder', '12', 20200], ['2016-01-03', 'Wonderstuff', 1, '', '', 'Sport', '35', 7500], ['2016-01-02', 'Cherry Garcia', 1, '', '', 'Boulder', '15', 20300], ['2016-01-02', 'Jugs', 1, '', '', 'Boulder', '18', 20100], ['2015-12-31', 'Gelatin Pooch', 1, '', '', 'Sport', '60', 2600], ['2015-12-31', "Buck's Muscle World", 1, '', '', 'Sport', '50', 2300], ['2015-12-31', 'Gridlock', 1, '', '', 'Sport', '50', 4600], ['2015-12-30', 'Working for Peanuts', 1, '', '', 'Sport', '60', 2500], ['2015-12-30', 'Claimjumpers Special', 1, '', '', 'Sport', '75', 3200], ['2015-12-30', 'Turtle Wax', 1, '', '', 'Sport', '50', 4900], ['2015-12-30', 'Sunny and Steep', 1, '', '', 'Sport', '50', 5500], ['2015-12-29', 'I Disagree', 1, '', '', 'Boulder', '12', 20100], ['2015-12-29', 'The Wave', 1, '', '', 'Boulder', '15', 20300], ['2015-12-29', 'Flying Chuckwalla', 1, '', '', 'Sport', '45', 1800], ['2015-12-29', 'Cow Lick Co. Crag', 1, '', '', 'Sport', '80', 1800], ['2015-12-29', 'Potato Chips', 1, '', '', 'Boulder', '12', 20200], ['2015-12-04', 'Memoirs of a Daisha', 1, '', '', 'Sport', '50', 1800], ['2015-12-04', 'The Flying Daisha', 1, '', '', 'Sport', '45', 1600], ['2015-12-04', 'Man Servant', 1, '', '', 'Sport', '55', 2500], ['2015-12-04', 'Monkeys on Magoo', 1, '', '', 'Sport', '55', 2600], ['2015-12-04', 'Commodus', 1, '', '', 'Sport', '65', 2900], ['2015-12-04', "Ceasar's Tossed Salad", 1, '', '', 'Sport', '75', 3200], ['2015-12-04', 'Centurion', 1, '', '', 'Sport', '65', 2600], ['2015-12-04', 'Acree Prime', 1, '', '', 'Sport', '40', 1800], ['2015-12-04', 'Aphrodite', 1, '', '', 'Sport', '45', 1800], ['2015-12-04', 'Sybarite', 1, '', '', 'Sport', '45', 2400], ['2015-12-03', 'Chickens in Space', 1, '', '', 'Trad', '50', 2400], ['2015-12-03', "Mike's Crack", 1, '', '', 'Trad', '50', 2900], ['2015-12-03', 'Sliders', 1, '', '', 'Trad', '55', 1800], ['2015-11-21', 'Comic Relief Direct', 1, '', '', 'Sport', '30', 2100], ['2015-11-21', 'Backlash', 1, '', '', 'Sport', '80', 2600], ['2015-11-21', 'Violator, The', 1, '', '', 'Sport', '', 4600], ['2015-11-21', 'Super Final', 1, '', '', 'Sport', '', 6900], ['2015-11-19', 'Coco Puffs', 1, '', '', 'Trad, Sport', '40', 1900], ['2015-11-19', 'Violator, The', 1, '', '', 'Sport', '', 4600], ['2015-11-19', 'Deathblow', 1, '', '', 'Sport', '45', 4900], ['2015-11-19', 'Super Final', 1, '', '', 'Sport', '', 6900], ['2015-11-17', 'Indecent Exposure', 1, '', '', 'Sport', '55', 5200], ['2015-11-17', 'Double Trouble', 1, '', '', 'Sport', '50', 2600], ['2015-11-17', 'Keeper of the Flame', 1, '', '', 'Sport', '90', 5500], ['2015-11-17', 'Backlash', 1, '', '', 'Sport', '80', 2600], ['2015-11-16', 'Comic Relief Direct', 1, '', '', 'Sport', '30', 2100], ['2015-11-16', 'Comic Relief Left', 1, '', '', 'Sport', '30', 2200], ['2015-11-16', 'Deathblow', 1, '', '', 'Sport', '45', 4900], ['2015-11-13', 'It', 1, '', '', 'Sport', '30', 2600], ['2015-11-13', 'Christine', 1, '', '', 'Sport', '80', 2600], ['2015-11-13', 'Brother in Arms', 1, '', '', 'Sport', '80', 2900], ['2015-11-13', 'Pet Semetery', 1, '', '', 'Sport', '40', 4600], ['2015-11-13', 'Deathblow', 1, '', '', 'Sport', '45', 4900], ['2015-11-08', 'Menace Alert', 1, '', '', 'Sport', '50', 2500], ['2015-11-08', 'Chewy', 1, '', '', 'Sport', '40', 2900], ['2015-11-08', 'Narcissus', 1, '', '', 'Sport', '55', 6600], ['2015-11-07', 'Whinerlamer', 1, '', '', 'Sport', '40', 2400], ['2015-11-07', 'Bongo', 1, '', '', 'Sport', '70', 1800], ['2015-11-07', 'Masuko', 1, '', '', 'Sport', '70', 4600], ['2015-10-24', 'Suburbia', 1, '', '', 'Sport', '', 3100], ['2015-10-24', 'Slamdance Cosmopolis (aka It Takes a Village)', 1, '', '', 'Sport', '50', 2600], ['2015-10-24', 'The List', 1, '', '', 'Sport', '', 3000], ['2015-10-24', 'Cactus Drop', 1, '', '', 'Sport', '70', 3500], ['2015-10-19', "D's Dry Dream", 1, '', '', 'Sport', '65', 2600], ['2015-10-19', 'Table Top', 1, '', '', 'Trad', '55', 2900], ['2015-10-19', 'High Plains Whimper', 1, '', '', 'Sport, TR', '45', 1800], ['2015-10-19', 'Mrs. Hen Places a Peck', 1, '', '', 'Sport, TR', '70', 5500], ['2015-10-18', 'Zamboni Man', 1, '', '', 'Sport', '50', 3300], ['2015-10-18', 'Hollow Flake', 1, '', '', 'Trad', '80', 1600], ['2015-10-18', 'Kansas Honey', 3, '', '', 'Trad, TR', '125', 2400], ['2015-10-18', 'Stories for Boys', 1, '', '', 'Trad, Sport', '80', 4600], ['2015-10-16', 'Wholly Holey', 1, '', '', 'Sport', '60', 2100], ['2015-10-16', "Pack 'o Bobs", 1, '', '', 'Sport', '50', 2100], ['2015-10-16', 'Punkin Puss & Mushmouse aka Bow of the Titanic', 1, '', '', 'Sport', '45', 2600], ['2015-10-16', 'Deck Chairs on the Titanic', 1, '', '', 'Sport, TR', '50', 2600], ['2015-10-13', 'Double Trouble', 1, '', '', 'Sport', '60', 2900], ['2015-10-13', 'Blasphemy', 1, '', '', 'Sport', '70', 4600], ['2015-10-13', 'Panic Attack', 1, '', '', 'Sport', '60', 6600], ['2015-10-12', "JT's Route", 1, '', '', 'Sport', '80', 2900], ['2015-10-12', 'Fred On Air', 1, '', '', 'Sport', '80', 3500], ['2015-10-12', 'Panic Attack', 1, '', '', 'Sport', '60', 6600], ['2015-10-09', 'Usual Suspects', 1, '', '', 'Trad', '75', 2200], ['2015-10-09', 'The Beer Float', 1, '', '', 'Trad', '65', 2400], ['2015-10-09', 'The Wiggle Room', 1, '', '', 'Trad', '60', 2700], ['2015-10-05', 'Morgantown', 1, '', '', 'Sport', '40', 2900], ['2015-10-04', 'Time To Power (1st pitch only)', 1, '', '', 'Sport', '', 2400], ['2015-10-04', 'Nine Gallon Buckets', 2, '', '', 'Sport', '90', 3200], ['2015-10-04', 'Toxic', 1, '', '', 'Sport', '50', 4900], ['2015-10-04', 'Entering Relativity', 1, '', '', 'Sport', '100', 4600], ['2015-10-03', 'Float Like a Butterfly', 1, '', '', 'Sport, TR', '40', 2900], ['2015-10-03', 'Low Blow', 1, '', '', 'Sport', '35', 2600], ['2015-10-03', 'Immortal Beloved', 1, '', '', 'Sport', '50', 2400], ['2015-09-24', 'Dogleg Crack', 1, '', '', 'Trad', '60', 2200], ['2015-09-24', 'Lock and Pop', 1, '', '', 'Boulder', '8', 20300], ['2015-09-24', 'Marathon Man', 1, '', '', 'Boulder', '10', 20008], ['2015-09-24', 'Slabstraction', 1, '', '', 'Boulder', '', 20008], ['2015-09-24', 'Breadline', 1, '', '', 'Boulder', '10', 20008], ['2015-09-24', 'Sunny and Steep', 1, '', '', 'Boulder', '10', 20200], ['2015-09-23', 'Alpine Feel', 1, '', '', 'Boulder', '', 20008], ['2015-09-22', 'The Fault', 1, '', '', 'Trad', '', 1600], ['2015-09-22', 'Smut', 1, '', '', 'Trad', '70', 2600], ['2015-09-22', 'Mr. Clean', 1, '', '', 'Trad', '', 3200], ['2015-09-22', 'Mr. Clean', 1, '', '', 'Trad', '', 3200], ['2015-09-22', 'Smut', 1, '', '', 'Trad', '70', 2600], ['2015-09-21', 'The Hueco Route', 1, '', '', 'Boulder', '', 20100], ['2015-09-21', 'The Dish', 1, '', '', 'Boulder', '', 20100], ['2015-09-21', 'The Scoop', 1, '', '', 'Boulder', '', 20200], ['2015-09-21', 'The Break', 1, '', '', 'Boulder', '', 20200], ['2015-09-21', 'No Pain No Grain', 1, '', '', 'Boulder', '12', 20500], ['2015-09-20', 'Minnie', 1, '', '', 'Boulder', '', 20100], ['2015-09-20', 'Mickey', 1, '', '', 'Boulder', '', 20008], ['2015-09-20', 'Heel Hook Left', 1, '', '', 'Boulder', '', 20100], ['2015-09-20', 'Schisthead', 1, '', '', 'Boulder', '', 20200], ['2015-09-20', 'The Devonian Fish', 1, '', '', 'Boulder', '', 20008], ['2015-09-20', 'No Pitons Here', 1, '', '', 'Boulder', '', 20008], ['2015-09-17', 'Breakfast of Champions', 1, '', '', 'Trad', '40', 2600], ['2015-09-17', "Roger's Corner", 1, '', '', 'Trad', '120', 2400], ['2015-09-16', "Roger's Corner", 1, '', '', 'Trad', '120', 2400], ['2015-09-15', 'Aries (aka The Lizard)', 5, '', '', 'Trad', '250', 2200], ['2015-09-13', 'Right Wing', 4, '', '', 'Trad', '500', 3500], ['2015-09-11', 'Twister', 1, '', '', 'Boulder', '', 20100], ['2015-09-10', 'Bullethead East', 4, '', '', 'Trad', '500', 3200], ['2015-09-09', 'Octopus Garden in the Shade', 1, '', '', 'Trad, TR', '60', 2100], ['2015-09-08', 'Fur Bodysuit', 1, '', '', 'Sport', '30', 2900], ['2015-09-08', "Dark Don't Lie", 1, '', '', 'Sport', '82', 4600], ['2015-09-07', 'Black Butterfly', 1, '', '', 'Trad', '50', 2400], ['2015-09-07', 'Veils of Illusion', 1, '', '', 'Trad, TR', '50', 2400], ['2015-09-07', "The World's Toughest Milkman", 1, '', '', 'Trad', '50', 2200], ['2015-08-31', 'The Voices Told Me', 1, '', '', 'Sport', '90', 2400], ['2015-08-31', 'Exodus', 1, '', '', 'Sport', '', 3200], ['2015-08-31', 'Lichen in my Eye', 1, '', '', 'Sport', '', 2900], ['2015-08-31', 'Fairies Wear Boots', 1, '', '', 'Sport', '', 2900], ['2015-08-31', 'Tachycardia', 1, '', '', 'Sport', '', 4600], ['2015-08-27', "Desperado's Last Ride", 1, '', '', 'Sport', '80', 3500], ['2015-08-27', 'Baywatch', 3, '', '', 'Sport', '300', 4600], ['2015-08-27', 'Mermaid', 4, '', '', 'Sport', '300', 4600], ['2015-08-25', 'True Grit', 6, '', '', 'Sport', '560', 2900], ['2015-08-25', 'Touch', 1, '', '', 'Sport', '70', 4900], ['2015-08-24', 'Turtle Mountain', 1, '', '', 'Sport', '80', 2900], ['2015-08-24', 'Mardi Gras', 1, '', '', 'Sport', '', 4600], ['2015-08-19', 'Cadillac Jack', 1, '', '', 'Sport', '80', 2400], ['2015-08-19', 'End Dance', 1, '', '', 'Sport', '', 3400], ['2015-08-19', "Why Won't She Sleep With Me?", 1, '', '', 'Sport', '', 5200], ['2015-08-18', 'Joy', 10, '', '', 'Trad', '2000', 1600], ['2015-08-17', 'Choss Toss', 1, '', '', 'Sport', '45', 4600], ['2015-08-17', 'Johnny Mnemonic', 1, '', '', 'Sport', '60', 2600], ['2015-08-17', 'Meathooks', 1, '', '', 'Sport', '60', 4600], ['2015-08-12', 'Boot Camp', 1, '', '', 'Sport', '30', 1800], ['2015-08-12', 'G.I. Joe', 1, '', '', 'Sport', '40', 2900], ['2015-08-12', 'Illicit Engagement', 1, '', '', 'Sport', '70', 4900], ['2015-08-12', 'Kamikaze', 1, '', '', 'Sport', '', 3200], ['2015-08-08', 'Cripple Crack', 1, '', '', 'Trad', '75', 1800], ['2015-08-08', 'Fear and Smear', 1, '', '', 'Trad, TR', '30', 2400], ['2015-08-06', 'The Mutt and Jeff', 5, '', '', 'Trad', '600', 2100], ['2015-08-02', 'Upper Exum Ridge', 12, '', '', 'Trad, Alpine', '1700', 1500], ['2015-07-27', 'What you see is what you get', 1, '', '', 'Sport', '45', 2100], ['2015-07-27', 'Move it or Lose it', 1, '', '', 'Sport', '45', 3500], ['2015-07-21', 'Cold Forged Steel', 5, '', '', 'Trad, Alpine', '450', 2900], ['2015-07-18', 'The Fiver', 1, '', '', 'Trad', '70', 2100], ['2015-07-18', 'Wizards Well', 1, '', '', 'Trad', '45', 2500], ['2015-07-18', "Jerry's Route", 1, '', '', 'Trad', '45', 2200], ['2015-07-13', 'White Line', 2, '', '', 'Trad', '200', 2100], ['2015-07-12', 'Dream Weaver', 1, '', '', 'Trad, TR', '40', 2400], ['2015-07-12', "Mike's Butt Cheeks", 1, '', '', 'Trad, TR', '50', 3000], ['2015-07-12', 'Cruise Control', 1, '', '', 'Trad', '50', 3000], ['2015-07-12', 'Automatic Pilot', 1, '', '', 'Trad, TR', '40', 2100], ['2015-07-12', "Beginner's Lead", 1, '', '', 'Trad, TR', '40', 1800], ['2015-06-30', 'Ping Ridge', 7, '', '', 'Trad, Alpine', '1000', 1800], ['2015-06-27', 'Open Book', 5, '', '', 'Trad, Alpine', '800', 2100], ['2015-06-19', "Mountaineer's Route", 7, '', '', 'Trad, Alpine', '', 2400], ['2015-06-17', 'Southern Arches', 4, '', '', 'Trad', '850', 2200], ['2015-06-16', 'Snakes and Ladders', 1, '', '', 'Trad', '50', 2300], ['2015-06-16', 'Z-Crack', 1, '', '', 'Trad', '50', 2500], ['2015-06-16', 'Morning Glory', 3, '', '', 'Sport', '250', 3400], ['2015-06-15', 'Sinocranium', 7, '', '', 'Sport', '650', 2100], ['2015-06-15', 'Theater of Shadows', 4, '', '', 'Sport', '500', 1600], ['2015-06-13', 'Samsquanch', 1, '', '', 'Sport', '50', 3000], ['2015-06-13', 'The Yeti', 1, '', '', 'Sport', '50', 2400], ['2015-06-13', 'The Goblin', 1, '', '', 'Sport', '45', 3200], ['2015-06-13', 'Calcaneous', 1, '', '', 'Sport', '40', 5200], ['2015-06-13', '1', 1, '', '', 'Sport', '50', 2900], ['2015-06-13', '2', 1, '', '', 'Sport', '50', 4900], ['2015-06-12', 'The Fairy', 1, '', '', 'Sport', '', 2500], ['2015-06-12', 'Alpha Graphic', 1, '', '', 'Sport', '60', 2100], ['2015-06-12', 'Holy Toledo', 1, '', '', 'Sport', '', 2800], ['2015-06-08', 'Butterfingers', 1, '', '', 'Sport', '59', 2400], ['2015-06-08', 'Caress of Steel', 1, '', '', 'Sport', '', 2600], ['2015-06-08', 'Rincon', 1, '', '', 'Sport', '35', 3200], ['2015-06-08', 'Drunken Midget', 1, '', '', 'Sport', '40', 2600], ['2015-06-08', 'Unknown', 1, '', '', 'Sport', '40', 5500], ['2015-06-05', "Eagle's Nest", 5, '', '', 'Sport', '250', 3200], ['2015-06-05', 'The Minister', 1, '', '', 'Sport', '40', 4800], ['2015-06-05', 'Groundwork', 1, '', '', 'Sport', '80', 5200], ['2015-06-03', 'Zen Fen', 1, '', '', 'Sport', '60', 2400], ['2015-06-03', 'Meet the Buddha', 1, '', '', 'Sport', '60', 2600], ['2015-06-03', '49', 1, '', '', 'Sport', '80', 6600], ['2015-06-03', 'Blind In The Water', 1, '', '', 'Sport', '35', 4600], ['2015-06-03', '49', 1, '', '', 'Sport', '80', 6600], ['2015-06-03', 'Exit Wound', 3, '', '', 'Sport', '160', 2500], ['2015-06-01', 'Minienticer', 1, '', '', 'Sport', '80', 2400], ['2015-06-01', 'The Minister', 1, '', '', 'Sport', '40', 4800], ['2015-06-01', '49', 1, '', '', 'Sport', '80', 6600], ['2015-06-01', '49', 1, '', '', 'Sport', '80', 6600], ['2015-05-31', 'Lungshot', 1, '', '', 'Sport', '35', 2400], ['2015-05-31', 'Ted', 1, '', '', 'Sport', '60', 2900], ['2015-05-31', '245 North', 1, '', '', 'Sport', '95', 2900], ['2015-05-31', 'Godfrees', 1, '', '', 'Sport', '50', 4900], ['2015-05-30', 'Sphere', 1, '', '', 'Boulder', '', 20008], ['2015-05-30', 'Lamar', 1, '', '', 'Boulder', '', 20100], ['2015-05-30', 'Sphere Slab (Real Name?)', 1, '', '', 'Boulder', '', 20008], ['2015-05-30', 'Bad Genes', 1, '', '', 'Boulder', '', 20300], ['2015-05-30', "Pimpn' Jeans", 1, '', '', 'Boulder', '', 20350], ['2015-05-30', 'Self Service', 1, '', '', 'Boulder', '15', 20400], ['2015-05-30', 'Super Sloper', 1, '', '', 'Boulder', '', 20300], ['2015-05-30', 'Snake Bite', 1, '', '', 'Boulder', '', 20300], ['2015-05-28', 'Jongleur Grey', 1, '', '', 'Sport', '30', 4600], ['2015-05-28', 'Shark Bait', 1, '', '', 'Sport', '70', 5500], ['2015-05-28', 'Mr. Slate', 1, '', '', 'Sport', '70', 2900], ['2015-05-26', 'The Abyss', 1, '', '', 'Sport', '80', 4600], ['2015-05-26', 'Sporte', 1, '', '', 'Sport', '', 3200], ['2015-05-26', 'True Value', 1, '', '', 'Sport', '70', 4600], ['2015-05-26', 'Mr. Slate', 1, '', '', 'Sport', '70', 2900], ['2015-05-24', 'Blackened', 1, '', '', 'Sport', '40', 2600], ['2015-05-24', 'Bats in the Belfry', 1, '', '', 'Sport', '', 4600], ['2015-05-24', 'Pretty Pasties', 1, '', '', 'Sport', '', 4900], ['2015-05-24', 'Genesis', 1, '', '', 'Sport', '', 3500], ['2015-05-23', 'Slots O Fun', 1, '', '', 'Sport', '35', 2600], ['2015-05-23', 'Edge your Bets', 1, '', '', 'Sport', '35', 2600], ['2015-05-23', 'Last Episode', 1, '', '', 'Sport', '', 3200], ['2015-05-23', 'Sacrificial Lizard', 1, '', '', 'Sport', '60', 4800], ['2015-05-22', 'I Am Pokey', 1, '', '', 'Sport', '45', 2100], ['2015-05-22', 'Mickey Goes to Vegas', 1, '', '', 'Sport', '65', 2400], ['2015-05-22', 'Dealers Choice', 1, '', '', 'Sport', '60', 2800], ['2015-05-22', 'Roll the Dice', 1, '', '', 'Sport', '55', 3500], ['2015-05-22', "You Don't Know Jack $%^", 1, '', '', 'Sport', '', 2400], ['2015-05-22', "You Don't Know Jack $%^", 1, '', '', 'Sport', '', 2400], ['2015-04-30', 'Unknown 4 Bolt Sport Route', 1, '', '', 'Sport, TR', '25', 2100], ['2015-04-29', 'Elk City Sidepull', 1, '', '', 'Trad, TR', '25', 1800], ['2015-04-29', 'Meadowlark Perch', 1, '', '', 'Trad, TR', '25', 2100], ['2015-04-29', 'Lightning Bolt Flakes', 1, '', '', 'Trad, TR', '25', 2200], ['2015-04-23', 'I Like Turtles', 1, '', '', 'Boulder', '8', 20400], ['2015-04-23', 'The Underbelly', 1, '', '', 'Boulder', '5', 20300], ['2015-04-23', 'Unknown V1', 1, '', '', 'Boulder', '6', 20110], ['2015-04-23', 'Owen', 1, '', '', 'Boulder', '18', 20008], ['2015-04-04', 'New Rule', 1, '', '', 'Sport', '70', 2400], ['2015-04-04', 'The Hurricane', 1, '', '', 'Sport', '80', 6900], ['2015-04-04', 'Tractatus', 1, '', '', 'Sport', '50', 4600], ['2015-04-04', "Jumpin' the Gun", 1, '', '', 'Sport', '85', 5300], ['2015-04-01', 'Moby Grape', 2, '', '', 'Trad', '', 1800], ['2015-04-01', 'Original Sin', 1, '', '', 'Sport', '', 2400], ['2015-04-01', 'Breakfast in America', 1, '', '', 'Trad', '40', 5300], ['2015-03-28', 'Stinger', 1, '', '', 'Trad', '70', 2200], ['2015-03-28', 'Bee Positive', 1, '', '', 'Trad', '70', 2200], ['2015-03-28', 'Is This For Real?', 1, '', '', 'Trad', '50', 3000], ['2015-03-28', 'The Real Thing', 1, '', '', 'Sport', '70', 6700], ['2015-03-28', 'Reality Check', 1, '', '', 'Trad', '50', 7200], ['2015-03-24', '5th of July', 1, '', '', 'Sport', '', 2400], ['2015-03-24', 'Deuces Wild', 1, '', '', 'Sport', '145', 2600], ['2015-03-24', 'Overpass', 1, '', '', 'Sport, TR', '', 5200], ['2015-03-17', 'Slots of Fun', 1, '', '', 'Boulder', '', 20200], ['2015-03-17', 'Center Start', 1, '', '', 'Boulder', '', 20100], ['2015-03-17', 'Center Direct', 1, '', '', 'Boulder', '15', 20300], ['2015-03-17', "Mr. Trujillo's Big Day", 1, '', '', 'Boulder', '12', 20210], ['2015-03-16', 'Leftover Lover', 1, '', '', 'Boulder', '', 20008], ['2015-03-16', 'Kick Start', 1, '', '', 'Boulder', '', 20008], ['2015-03-16', 'The Pregnancy Arete', 1, '', '', 'Boulder', '', 20210], ['2015-03-16', 'Middle Man', 1, '', '', 'Boulder', '8', 20200], ['2015-03-16', 'Hueco Cranks', 1, '', '', 'Boulder', '10', 20200], ['2015-03-16', 'Hueco Cranks', 1, '', '', 'Boulder', '10', 20200], ['2015-03-14', 'Smell the Meat', 1, '', '', 'Trad', '100', 3000], ['2015-03-14', 'Cube Steaks', 1, '', '', 'Trad', '110', 3000], ['2015-03-14', 'The Switch', 1, '', '', 'Trad', '90', 3000], ['2015-03-13', 'Big Guy', 1, '', '', 'Trad', '120', 4700], ['2015-03-13', 'Wavy Gravy', 1, '', '', 'Trad', '70', 3000], ['2015-03-13', 'Sicilian', 1, '', '', 'Trad', '', 5300], ['2015-03-11', "No Beggin'", 1, '', '', 'Trad', '50', 2300], ['2015-03-11', "Walkin' Talkin' Bob", 1, '', '', 'Trad', '50', 2600], ['2015-03-11', 'Flight Time', 1, '', '', 'Trad', '50', 6600], ['2015-03-11', 'Hot Fun Sunday', 1, '', '', 'Trad', '70', 5000], ['2015-03-11', 'Fintastic', 1, '', '', 'Trad', '50', 3000], ['2015-03-10', "Binou's Crack", 1, '', '', 'Trad', '', 2200], ['2015-03-10', 'Drainpipe', 1, '', '', 'Trad', '', 3300], ['2015-03-10', 'Fuel Injected Hardbody', 1, '', '', 'Trad', '70', 6700], ['2015-03-08', 'Middle Crack', 1, '', '', 'Trad', '60', 6700], ['2015-03-08', 'Warm-Up Handcrack', 1, '', '', 'Trad', '100', 3000], ['2015-03-07', 'Fertile Crescent', 1, '', '', 'Trad', '80', 2400], ['2015-03-07', 'Dirt Cheap', 1, '', '', 'Trad', '70', 3300], ['2015-03-07', 'Sicilian', 1, '', '', 'Trad', '', 5300], ['2015-03-07', 'Black Uhuru', 1, '', '', 'Trad', '120', 3300], ['2015-03-03', 'Jug Haul', 1, '', '', 'Sport', '40', 2400], ['2015-03-03', 'Change of Scene', 1, '', '', 'Sport', '90', 2600], ['2015-03-03', 'Clumsy', 1, '', '', 'Sport', '40', 6600], ['2015-03-02', 'Sunny Up', 1, '', '', 'Sport', '40', 2100], ['2015-03-02', 'Sunshine Superman', 1, '', '', 'Sport', '40', 2600], ['2015-03-02', 'Good Day Sunshine', 1, '', '', 'Sport', '40', 3200], ['2015-03-02', 'Lost In The Middle', 1, '', '', 'Sport', '50', 6900], ['2015-03-02', 'Good to be Awake', 1, '', '', 'Sport', '50', 4800], ['2015-03-01', 'Reaching Rayane', 1, '', '', 'Sport', '70', 2400], ['2015-03-01', 'Three Giant Steps', 1, '', '', 'Sport', '85', 2600], ['2015-02-27', 'Soft Core', 1, '', '', 'Sport', '45', 2100], ['2015-02-27', 'Fine Day', 1, '', '', 'Sport', '45', 2600], ['2015-02-27', 'Lock Down', 1, '', '', 'Sport', '55', 3200], ['2015-02-26', 'Sam I Am', 1, '', '', 'Sport', '70', 1900], ['2015-02-26', "Ryane's Revenge", 1, '', '', 'Sport', '35', 2600], ['2015-02-26', 'Room For Improvement', 1, '', '', 'Sport', '45', 3500], ['2015-02-26', 'Lost In The Middle', 1, '', '', 'Sport', '50', 6900], ['2015-02-25', 'Taylor Made', 1, '', '', 'Sport', '65', 2100], ['2015-02-25', 'Route 66', 1, '', '', 'Sport', '65', 2500], ['2015-02-25', 'Welcome to New Jack City', 1, '', '', 'Sport', '60', 2600], ['2015-02-25', 'Espresso', 1, '', '', 'Sport', '35', 3200], ['2015-02-25', 'Lost In The Middle', 1, '', '', 'Sport', '50', 6900], ['2015-02-24', 'White Head', 1, '', '', 'Sport', '40', 2400], ['2015-02-24', 'White Out', 1, '', '', 'Sport', '45', 2900], ['2015-02-24', 'Stemroids', 1, '', '', 'Sport', '45', 4600], ['2015-02-24', 'Snow White', 1, '', '', 'Sport', '45', 3500], ['2015-02-24', 'Whiter Shade Of Pale', 1, '', '', 'Sport', '35', 2100], ['2015-02-21', 'Lotta Balls', 3, '', '', 'Trad', '420', 2100], ['2015-02-20', 'Range of Motion', 1, '', '', 'Sport', '40', 3500], ['2015-02-20', 'Super Guide', 1, '', '', 'Sport', '45', 4600], ['2015-02-19', 'Triassic Sands', 6, '', '', 'Trad', '700', 3000], ['2015-02-18', 'Monkey Crack', 1, '', '', 'Boulder', '20', 20100], ['2015-02-18', 'Right of Crack', 1, '', '', 'Boulder', '20', 20200], ['2015-02-18', 'Center Face', 1, '', '', 'Boulder', '20', 20250], ['2015-02-18', 'Monkey Bar', 1, '', '', 'Boulder', '20', 20200], ['2015-02-18', 'Hyperglide (aka Monkey Pinch)', 1, '', '', 'Boulder', '20', 20500], ['2015-02-17', 'Diet Delight', 3, '', '', 'Trad', '400', 2200], ['2015-02-16', 'Poundcake', 1, '', '', 'Sport, TR', '40', 2100], ['2015-02-16', "Mic's Master", 1, '', '', 'Sport', '55', 2900], ['2015-02-16', 'Good Morning', 1, '', '', 'Sport', '60', 4900], ['2015-02-16', 'Far Cry From Josh', 1, '', '', 'Sport', '45', 2700], ['2015-02-16', 'Just in from L.A.', 1, '', '', 'Sport', '45', 3500], ['2015-02-14', 'Northwest Flake', 1, '', '', 'Boulder', '12', 20008], ['2015-02-14', 'Devoted Traverse', 1, '', '', 'Boulder', '', 20500], ['2015-02-13', 'Problem A', 1, '', '', 'Boulder', '8', 20008], ['2015-02-13', 'Parliament', 1, '', '', 'Boulder', '8', 20008], ['2015-02-13', 'Up For The Down Stoke', 1, '', '', 'Boulder', '10', 20400], ['2015-02-13', 'Problem A', 1, '', '', 'Boulder', '10', 20100], ['2015-02-13', 'The Crack Problem', 1, '', '', 'Boulder', '10', 20400], ['2015-02-12', 'Western Round Up', 1, '', '', 'Boulder', '12', 20100], ['2015-02-12', 'Carrot Top', 1, '', '', 'Boulder', '12', 20300], ['2015-02-12', 'Dance Mix', 1, '', '', 'Boulder', '12', 20200], ['2015-02-11', 'Flush', 1, '', '', 'Boulder', '8', 20000], ['2015-02-10', 'Split Melon', 1, '', '', 'Boulder', '', 20005], ['2015-02-10', 'Fractured Personality', 1, '', '', 'Boulder', '', 20008], ['2015-02-10', 'Heavenly Path', 1, '', '', 'Boulder', '25', 20100], ['2015-02-09', 'Whiskey, Beer and Spliff Hits for Breakfast', 1, '', '', 'Boulder', '12', 20400], ['2015-02-09', 'Funkadella Bdelia', 1, '', '', 'Boulder', '8', 20008], ['2015-02-08', 'Low-Angle Arete', 1, '', '', 'Boulder', '10', 20000], ['2015-02-08', 'Problem A', 1, '', '', 'Boulder', '8', 20210], ['2015-02-08', 'Funkadella Bdelia', 1, '', '', 'Boulder', '8', 20008], ['2015-02-08', 'Sun Spot', 1, '', '', 'Boulder', '12', 20200], ['2015-02-08', 'Sun Spot Right', 1, '', '', 'Boulder', '15', 20400], ['2015-02-08', 'Hands Free Slab', 1, '', '', 'Boulder', '8', 20008], ['2015-02-08', 'Hands On Slab', 1, '', '', 'Boulder', '8', 20000], ['2015-02-05', "Ain't But the One Way", 1, '', '', 'Boulder', '15', 20010], ['2015-02-05', 'Corner Route', 1, '', '', 'Boulder', '18', 20010], ['2015-02-05', 'Monkey Hang', 1, '', '', 'Boulder', '', 20270], ['2015-02-04', 'The Crack', 1, '', '', 'Boulder', '12', 20008], ['2015-02-04', 'Garden Pest', 1, '', '', 'Boulder', '12', 20010], ['2015-02-04', 'Pocket Pussy', 1, '', '', 'Boulder', '10', 20075], ['2015-02-04', 'Prozac Nation', 1, '', '', 'Boulder', '15', 20200], ['2015-02-04', 'Emma', 1, '', '', 'Boulder', '15', 20200], ['2015-02-04', 'The Overhanging Nose', 1, '', '', 'Boulder', '10', 20010], ['2015-02-04', 'World Shut Your Mouth', 1, '', '', 'Boulder', '12', 20200], ['2015-02-02', 'Son of Claudius Rufus', 1, '', '', 'Boulder', '', 20500], ['2015-02-02', 'Slap Happy', 1, '', '', 'Boulder', '12', 20300], ['2015-02-02', 'Which Road', 1, '', '', 'Boulder', '15', 20000], ['2015-02-02', 'High Road', 1, '', '', 'Boulder', '25', 20008], ['2015-02-02', 'Any Which Way', 1, '', '', 'Boulder', '10', 20010], ['2015-02-02', 'Solarium', 1, '', '', 'Boulder', '15', 20400], ['2015-02-02', 'Slap Happy', 1, '', '', 'Boulder', '12', 20300], ['2015-02-02', 'Wavy Gravy', 1, '', '', 'Boulder', '10', 20200], ['2015-02-01', 'The Space Suit', 1, '', '', 'Boulder', '15', 20300], ['2015-02-01', 'Still Life', 1, '', '', 'Boulder', '10', 20200], ['2015-02-01', 'Hands Free Slab', 1, '', '', 'Boulder', '8', 20008], ['2015-02-01', 'Hands On Slab', 1, '', '', 'Boulder', '8', 20000], ['2015-01-31', 'Birthday Mantel', 1, '', '', 'Boulder', '12', 20008], ['2015-01-31', 'The Way Down', 1, '', '', 'Boulder', '10', 20000], ['2015-01-31', 'Birthday Left', 1, '', '', 'Boulder', '10', 20100], ['2015-01-31', 'Birthday Direct', 1, '', '', 'Boulder', '12', 20300], ['2015-01-31', 'Birthday Skyline', 1, '', '', 'Boulder', '12', 20300], ['2015-01-31', 'Hero Roof', 1, '', '', 'Boulder', '14', 20008], ['2015-01-31', 'Buttermilk Stem', 1, '', '', 'Boulder', '15', 20100], ['2015-01-29', 'Mother Earth', 1, '', '', 'Boulder', '15', 20008], ['2015-01-29', 'Hole in my Heart', 1, '', '', 'Boulder', '15', 20100], ['2015-01-29', "Grant's Christmas Present", 1, '', '', 'Boulder', '10', 20100], ['2015-01-29', 'Ketron Classic', 1, '', '', 'Boulder', '', 20400], ['2015-01-29', 'Kling and Smirk', 1, '', '', 'Boulder', '', 20210], ['2015-01-28', 'Paradise', 1, '', '', 'Sport', '115', 2400], ['2015-01-28', 'Pocket Dance', 1, '', '', 'Sport', '115', 3200], ['2015-01-28', 'Love Stinks', 1, '', '', 'Sport', '115', 4600], ['2015-01-28', 'Love Stinks', 1, '', '', 'Sport', '115', 4600], ['2015-01-28', 'Hardly Wallbanger', 1, '', '', 'Sport', '90', 3200], ['2015-01-26', "Ain't But the One Way", 1, '', '', 'Boulder', '15', 20010], ['2015-01-26', 'Masterbeat', 1, '', '', 'Boulder', '10', 20100], ['2015-01-26', 'Headbangers Ball', 1, '', '', 'Boulder', '10', 20100], ['2015-01-26', 'Beer Tumor Right', 1, '', '', 'Boulder', '10', 20400], ['2015-01-26', 'Beer Tumor', 1, '', '', 'Boulder', '10', 20300], ['2015-01-25', 'Breaking Wind', 1, '', '', 'Sport', '75', 1800], ['2015-01-25', 'High Seas', 1, '', '', 'Sport', '75', 1800], ['2015-01-25', 'Babushka', 1, '', '', 'Sport', '80', 2100], ['2015-01-25', 'Crowd Pleaser', 1, '', '', 'Sport', '80', 2400], ['2015-01-25', 'Hip Pockets', 1, '', '', 'Trad, Sport', '100', 4600], ['2015-01-25', 'Chillin at the Grill', 1, '', '', 'Sport', '70', 5200], ['2015-01-23', 'Smooth as Silk', 1, '', '', 'Trad', '80', 2100], ['2015-01-23', 'Anacram', 1, '', '', 'Trad', '80', 3200], ['2015-01-23', 'Cakewalk', 1, '', '', 'Trad', '90', 2200], ['2015-01-22', 'Sail Away', 1, '', '', 'Trad', '60', 2000], ['2015-01-22', 'Illusion Dweller', 1, '', '', 'Trad', '100', 2900], ['2015-01-22', 'Loose Lady', 1, '', '', 'Trad', '90', 2600], ['2015-01-21', 'Double Cross', 1, '', '', 'Trad', '95', 1900], ['2015-01-21', 'Orphan', 1, '', '', 'Trad', '80', 2400], ['2015-01-21', 'Hobbit Roof', 1, '', '', 'Trad', '40', 3500], ['2015-01-19', 'Overseer', 1, '', '', 'Trad', '120', 2400], ['2015-01-19', 'Tossed Green', 1, '', '', 'Trad', '60', 2600], ['2015-01-19', 'Crescent Wrench', 1, '', '', 'Trad', '30', 3500], ['2015-01-18', 'Lazy Day', 1, '', '', 'Trad', '60', 1800], ['2015-01-18', 'Quivering Lips', 1, '', '', 'Trad', '50', 2100], ['2015-01-18', 'Dog Day Afternoon', 1, '', '', 'Trad', '70', 2900], ['2015-01-18', 'Exorcist', 1, '', '', 'Trad', '60', 2600], ['2015-01-17', 'Hand Wobler Delight', 1, '', '', 'Trad', '80', 2400], ['2015-01-16', 'The Swift', 3, '', '', 'Trad', '400', 1800], ['2015-01-16', 'LA Woman', 1, '', '', 'Sport', '90', 4600], ['2015-01-11', 'Turtle Piss', 1, '', '', 'Sport', '50', 1600], ['2015-01-11', 'Jam on Jam', 1, '', '', 'Trad, TR', '30', 1600], ['2015-01-11', 'Corona Club', 1, '', '', 'Sport, TR', '60', 2300], ['2015-01-11', 'Y Crack', 1, '', '', 'Trad, TR', '65', 2500], ['2015-01-10', 'Ride the Wild', 1, '', '', 'Sport', '50', 2400], ['2015-01-07', "George's Buttress", 1, '', '', 'Trad, TR', '70', 1800], ['2015-01-07', 'Centerpiece', 1, '', '', 'Trad', '100', 2700], ['2015-01-06', 'Endgame', 5, '', '', 'Trad', '600', 2800], ['2015-01-04', 'No More Credit From the Liquor Store', 3, '', '', 'Sport', '', 3000], ['2015-01-04', 'Tour Buses Welcome', 4, '', '', 'Sport', '320', 3000], ['2015-01-04', 'The Inevitable Awaits You', 3, '', '', 'Sport', '300', 4600], ['2015-01-03', 'Mystery of the Desert', 5, '', '', 'Trad', '', 2400], ['2014-12-31', 'Nightstalker', 1, '', '', 'Trad', '120', 2400], ['2014-12-31', 'Mud Shark', 1, '', '', 'Sport', '75', 1900], ['2014-12-31', 'Grand Wazoo', 1, '', '', 'Sport', '60', 2400], ['2014-12-31', 'Burnt Weenie Sandwich', 1, '', '', 'Sport', '60', 3100], ['2014-12-30', 'Dikohe', 2, '', '', 'Trad', '165', 2200], ['2014-12-30', 'Batman', 1, '', '', 'Trad', '70', 2400], ['2014-12-30', 'Batline', 1, '', '', 'Trad', '100', 2300], ['2014-12-27', 'Unknown', 1, '', '', 'Sport', '50', 2400], ['2014-12-27', 'Mr. Jibbers', 1, '', '', 'Sport', '45', 1600], ['2014-12-27', 'Bob Marley Meets Master Ganj', 1, '', '', 'Sport', '45', 4900], ['2014-12-27', 'New Kids on the Block', 1, '', '', 'Sport', '40', 2800], ['2014-12-27', 'Duran Duran', 1, '', '', 'Sport', '60', 6600], ['2014-12-25', 'Wood', 1, '', '', 'Sport', '50', 1800], ['2014-12-25', 'Plum Loco', 1, '', '', 'Sport', '40', 3200], ['2014-12-25', 'Plum Loco', 1, '', '', 'Sport', '40', 3200], ['2014-12-25', 'Wine-A-Rita', 1, '', '', 'Sport', '40', 4600], ['2014-12-24', 'Northern Swine Overhang', 1, '', '', 'Boulder', '', 20010], ['2014-12-24', 'Easy Swine Sitdown', 1, '', '', 'Boulder', '', 20008], ['2014-12-24', "Beginner's Route", 1, '', '', 'TR', '30', 1400], ['2014-12-24', 'Unknown', 1, '', '', 'Boulder', '', 20008], ['2014-12-22', 'The Three Star V2', 1, '', '', 'Boulder', '16', 20200], ['2014-12-22', 'Miss Potato Head', 1, '', '', 'Boulder', '10', 20010], ['2014-12-22', 'Pressure Drop', 1, '', '', 'Boulder', '12', 20150], ['2014-12-22', 'Bananas on Acid', 1, '', '', 'Sport', '40', 6600], ['2014-12-22', 'She Can Bolt', 1, '', '', 'Sport', '55', 2300], ['2014-12-21', 'The Throne', 1, '', '', 'Sport', '50', 2100], ['2014-12-21', 'Unknown', 1, '', '', 'Sport', '50', 2400], ['2014-12-21', '96 Degrees', 1, '', '', 'Sport', '60', 3500], ['2014-12-21', 'New Kids on the Block', 1, '', '', 'Sport', '40', 2800], ['2014-12-21', 'Little Caterpillar', 1, '', '', 'Sport', '35', 6900], ['2014-12-20', 'Prickly Proctologist', 1, '', '', 'Sport', '50', 1800], ['2014-12-20', 'She Can Bolt', 1, '', '', 'Sport', '55', 2300], ['2014-12-20', 'Captain Blueberry', 1, '', '', 'Sport', '', 4600], ['2014-12-20', 'Major Raspberry', 1, '', '', 'Sport', '50', 3500], ['2014-12-20', "Chris's Route (name will change)", 1, '', '', 'Sport', '55', 2600], ['2014-12-20', 'Banana Peel', 1, '', '', 'Sport', '45', 5200], ['2014-12-17', 'Thunderbird', 1, '', '', 'Boulder', '15', 20110], ['2014-12-16', 'Skimmer', 1, '', '', 'Boulder', '10', 20300], ['2014-12-16', 'T-Bone Shuffle', 1, '', '', 'Boulder', '', 20400], ['2014-12-16', 'Girls of Juarez', 1, '', '', 'Boulder', '15', 20400], ['2014-12-15', 'Spud Boy', 1, '', '', 'Boulder', '10', 20100], ['2014-12-15', 'Eye Gouger', 1, '', '', 'Boulder', '8', 20005], ['2014-12-15', 'Woman Of Leisure', 1, '', '', 'Boulder', '15', 20100], ['2014-12-15', 'Unknown Left Overhang', 1, '', '', 'Boulder', '25', 20100], ['2014-12-13', 'Term Crack', 1, '', '', 'Boulder', '10', 20100], ['2014-12-13', 'Mid-term', 1, '', '', 'Boulder', '10', 20100], ['2014-12-13', 'Memento', 1, '', '', 'Boulder', '10', 20008], ['2014-12-13', 'Long Term Memory', 1, '', '', 'Boulder', '10', 20008], ['2014-12-13', 'Skimmer', 1, '', '', 'Boulder', '10', 20300], ['2014-12-12', 'Name Dropper', 1, '', '', 'Boulder', '', 20300], ['2014-12-12', 'Nobody Here Gets Out Alive', 1, '', '', 'Boulder', '', 20200], ['2014-12-12', 'Unknown Left Overhang', 1, '', '', 'Boulder', '25', 20100], ['2014-11-11', 'Knob Wall', 1, '', '', 'Trad', '80', 1600], ['2014-11-11', 'White Gold', 1, '', '', 'Trad', '80', 2500], ['2014-11-11', 'Cinco de Mayo', 1, '', '', 'Sport', '40', 3400], ['2014-11-11', 'Oyster', 1, '', '', 'Sport', '80', 2600], ['2014-11-11', 'Rabies', 1, '', '', 'Sport', '75', 4600], ['2014-11-10', 'Yum Yum Tree', 1, '', '', 'Trad', '120', 1900], ['2014-11-10', 'Truth or Consequences', 1, '', '', 'Trad', '100', 2100], ['2014-11-08', 'Tourist Route', 1, '', '', 'Boulder', '', 20200], ['2014-11-08', 'Spiderman Arete', 1, '', '', 'Boulder', '', 20270], ['2014-11-08', 'Spiderman Traverse', 1, '', '', 'Boulder', '', 20400], ['2014-11-08', 'Zen Slab', 1, '', '', 'Boulder', '', 20200], ['2014-11-08', 'Sourwood Sit', 1, '', '', 'Boulder', '', 20400], ['2014-11-05', 'Double Trouble', 1, '', '', 'Boulder', '15', 20350], ['2014-11-04', 'Little Bit of Hueco', 1, '', '', 'Boulder', '20', 20008], ['2014-11-04', 'The Zero Hero', 1, '', '', 'Boulder', '', 20008], ['2014-11-03', 'Bulge in My Pants', 1, '', '', 'Boulder', '', 20200], ['2014-11-03', 'Tough Love', 1, '', '', 'Boulder', '15', 20450], ['2014-11-03', 'Super Mario', 1, '', '', 'Boulder', '15', 20300], ['2014-11-03', 'Luigi', 1, '', '', 'Boulder', '15', 20300], ['2014-11-03', 'Belly Button', 1, '', '', 'Boulder', '', 20300], ['2014-11-02', 'Big Men, Small Airplanes', 1, '', '', 'Trad', '75', 3400], ['2014-11-02', 'The Sound of One Finger Bleeding', 1, '', '', 'Trad', '75', 2200], ['2014-10-31', 'Incredarete', 1, '', '', 'Boulder', '', 20100], ['2014-10-31', 'Red House', 1, '', '', 'Boulder', '', 20700], ['2014-10-31', 'Art of the Vogi', 1, '', '', 'Boulder', '', 20400], ['2014-10-30', "Finger Lockin' Good", 1, '', '', 'Trad', '90', 3100], ['2014-10-30', 'Prerequisite for Excellence', 1, '', '', 'Trad', '80', 2100], ['2014-10-30', 'Multiple Use Area', 1, '', '', 'Trad', '90', 2400], ['2014-10-30', 'In Pursuit of Excellence', 1, '', '', 'Trad', '90', 2500], ['2014-10-30', 'Passages', 1, '', '', 'Trad', '90', 2100], ['2014-10-28', 'Fire Crack Flake', 1, '', '', 'Boulder', '12', 20100], ['2014-10-28', 'Super Mario', 1, '', '', 'Boulder', '', 20400], ['2014-10-28', 'Pancake Mantle', 1, '', '', 'Boulder', '5', 20200], ['2014-10-27', 'Pocket Pool', 1, '', '', 'Sport', '70', 2400], ['2014-10-27', 'Pocket Pool', 1, '', '', 'Sport', '70', 2400], ['2014-10-27', 'Therapist', 1, '', '', 'Sport', '60', 2500], ['2014-10-27', "Something's Always Wrong", 1, '', '', 'Sport', '80', 3500], ['2014-10-27', 'Fish-eyed Fool', 1, '', '', 'Sport', '70', 2900], ['2014-10-25', 'Flexorsizer', 1, 'Solo', '', 'Boulder', '', 20650], ['2014-10-21', 'It', 1, '', '', 'Sport', '30', 2600], ['2014-10-21', 'Pet Semetery', 1, '', '', 'Sport', '40', 4600], ['2014-10-21', 'The Shining', 1, '', '', 'Sport', '30', 6900], ['2014-10-21', 'Brother in Arms', 1, '', '', 'Sport', '80', 2900], ['2014-10-21', 'Best Seat In The House', 1, '', '', 'Sport', '85', 2400], ['2014-10-21', 'Alchemy', 1, '', '', 'Sport', '50', 4600], ['2014-10-19', "Buddha's Belly", 1, '', '', 'Boulder', '8', 20400], ['2014-10-19', 'Slam Dunk', 1, '', '', 'Boulder', '', 20500], ['2014-10-18', 'Hemlock Arete', 1, '', '', 'Boulder', '', 20400], ['2014-10-17', 'Huecool Junior', 1, '', '', 'Sport', '', 3200], ['2014-10-17', 'Rover B. Dog', 1, '', '', 'Sport', '50', 2600], ['2014-10-17', 'Blade Loafer', 1, '', '', 'Trad, Sport', '40', 2900], ['2014-10-17', 'Dinosaur Jr.', 1, '', '', 'Sport', '60', 3200], ['2014-09-25', 'Moots Madness', 1, '', '', 'Sport', '40', 2600], ['2014-09-25', 'Fibrulator', 1, '', '', 'Trad', '80', 4900], ['2014-09-25', 'Supercrack (aka Crack Attack)', 1, '', '', 'Trad', '80', 2500], ['2014-09-24', 'Boltergeist', 1, '', '', 'Sport', '95', 2800], ['2014-09-24', 'International Route of Pancakes', 1, '', '', 'Sport', '35', 2100], ['2014-09-24', 'Pre-emptive Strike', 1, '', '', 'Sport', '90', 3200], ['2014-09-24', 'Cosmic Trigger', 1, '', '', 'Sport', '80', 6900], ['2014-09-23', 'Different Strokes', 1, '', '', 'Sport', '50', 5200], ['2014-09-23', 'Murano', 1, '', '', 'Sport', '75', 3200], ['2014-09-23', 'Random Precision', 1, '', '', 'Sport', '60', 4900], ['2014-09-23', 'Johnny B. Good', 1, '', '', 'Sport', '80', 4600], ['2014-09-23', "DaVinci's Left Ear", 1, '', '', 'Sport', '60', 3100], ['2014-09-21', 'Paraphernalia', 1, '', '', 'Sport', '60', 3100], ['2014-09-20', 'Tarantella', 1, '', '', 'Sport', '90', 2600], ['2014-09-20', 'Clyde the Mega Dude', 1, '', '', 'Sport', '60', 5100], ['2014-09-20', 'Gangsta', 1, '', '', 'Sport', '30', 6600], ['2014-09-20', 'Rocking Chair', 1, '', '', 'Trad, Sport', '60', 2300], ['2014-09-20', 'Ticks Are For Kids', 1, '', '', 'Sport', '60', 2600], ['2014-09-19', 'Solstice', 1, '', '', 'Sport', '70', 6600], ['2014-09-19', 'Comic Relief Direct', 1, '', '', 'Sport', '30', 2100], ['2014-09-19', 'Comic Relief Left', 1, '', '', 'Sport', '30', 2200], ['2014-09-19', 'Shadowhawk', 1, '', '', 'Sport', '90', 2400], ['2014-09-19', 'Spawn', 1, '', '', 'Sport', '90', 3100], ['2014-09-19', 'Pet Semetery', 1, '', '', 'Sport', '40', 4600], ['2014-09-19', 'Gunslinger', 1, '', '', 'Sport', '50', 5500], ['2014-09-19', 'Gunslinger', 1, '', '', 'Sport', '50', 5500], ['2014-09-17', 'Procrastination', 1, '', '', 'Sport', '30', 1800], ['2014-09-17', 'Electrocutioner', 1, '', '', 'Sport', '50', 2200], ['2014-09-17', 'Electrocutioner', 1, '', '', 'Sport', '50', 2200], ['2014-09-17', 'Wild at Heart', 1, '', '', 'Sport', '', 4600], ['2014-09-17', 'Alaska', 1, '', '', 'Sport', '', 2900], ['2014-09-16', 'Express Checkout Line', 1, '', '', 'Sport', '', 2400], ['2014-09-16', 'Psychotherapy', 1, '', '', 'Sport', '', 2900], ['2014-09-16', 'Earthbound Misfit', 1, '', '', 'Sport', '55', 2600], ['2014-09-16', 'Deetle Dumps', 1, '', '', 'Sport', '', 2100], ['2014-09-16', "Big Wall Greg's Chicken Shack", 1, '', '', 'Sport, TR', '', 1600], ['2014-09-06', 'Yellow Jacket', 1, '', '', 'Boulder', '12', 20200], ['2014-09-05', 'Hotness', 1, '', '', 'Sport', '90', 2200], ['2014-09-05', 'Vertical Alluvium', 1, '', '', 'Trad, Sport', '80', 2600], ['2014-09-05', 'Lemon Peel', 1, '', '', 'Sport', '80', 2900], ['2014-09-04', 'Backyard Playground', 1, '', '', 'Boulder', '12', 20400], ['2014-09-04', 'Unknown', 1, '', '', 'Boulder', '10', 20200], ['2014-09-04', 'V2', 1, '', '', 'Boulder', '', 20200], ['2014-09-02', 'The Maiden Voyage aka The Red Dihedral', 5, '', '', 'Trad', '', 2300], ['2014-09-01', 'Pinnacle Gully - Wowie Zowie', 1, '', '', 'Sport', '50', 2100], ['2014-09-01', 'Little Finger aka Penis Rock - South Face', 1, '', '', 'Sport', '20', 3200], ['2014-08-31', "Bob's Crack", 1, '', '', 'Trad', '70', 2600], ['2014-08-30', 'Merotica', 1, '', '', 'Boulder', '12', 20400], ['2014-08-30', 'The Ref', 1, '', '', 'Boulder', '', 20008], ['2014-08-30', 'Yardage', 1, '', '', 'Boulder', '', 20008], ['2014-08-30', 'Hash Mark', 1, '', '', 'Boulder', '', 20008], ['2014-08-24', 'Man Hands', 1, '', '', 'Trad, Sport', '80', 3500], ['2014-08-24', 'Lady Fingers', 1, '', '', 'Trad, Sport', '80', 3200], ['2014-08-24', 'Crandall Hammer Arete', 1, '', '', 'Sport', '50', 3500], ['2014-08-24', 'Heat Stroke', 1, '', '', 'Sport', '50', 6600], ['2014-08-19', 'The Campground', 1, '', '', 'Trad', '150', 1900], ['2014-08-17', 'J-Crack', 4, '', '', 'Trad', '', 2500], ['2014-08-16', 'The Martyr', 2, '', '', 'Trad', '300', 2500], ['2014-08-02', 'The Happy Pier', 1, '', '', 'Sport', '45', 5200], ['2014-08-02', 'Therapist', 1, '', '', 'Sport', '50', 5200], ['2014-08-02', "Laura's Arete", 1, '', '', 'Sport', '50', 2400], ['2014-08-02', 'Death Star Compactor', 1, '', '', 'Sport', '45', 2200], ['2014-07-19', 'Five and Dime', 1, '', '', 'Sport', '50', 3000], ['2014-07-19', 'Kwik-E-Mart', 1, '', '', 'Sport', '50', 4900], ['2014-07-19', 'Self Serve', 1, '', '', 'Sport', '', 3500], ['2014-07-19', 'Pump and Run', 1, '', '', 'Sport', '', 5500], ['2014-07-18', 'My Left Foot', 3, '', '', 'Sport', '200', 8800], ['2014-07-18', 'Giant Dihedral', 2, '', '', 'Trad', '190', 2100], ['2014-07-04', 'Swiss Cheese', 1, '', '', 'Boulder', '10', 20400], ['2014-07-04', 'Unknown V4', 1, '', '', 'Boulder', '10', 20400], ['2014-06-29', 'Skyline Pig', 2, '', '', 'Sport', '', 3100], ['2014-06-29', 'Rapture', 1, '', '', 'Sport', '55', 8600], ['2014-06-28', 'Ice Age', 1, '', '', 'Sport', '80', 4900], ['2014-06-28', 'Corneal Abrasion', 1, '', '', 'Sport', '45', 1600], ['2014-06-28', 'Brain Freeze', 1, '', '', 'Sport', '120', 3500], ['2014-06-06', 'Reefer Madness', 1, '', '', 'Sport', '', 4600], ['2014-06-06', 'Vixen', 1, '', '', 'Sport', '', 3200], ['2014-06-06', 'The Decider', 1, '', '', 'Sport', '100', 2800], ['2014-06-04', 'El Sol', 1, '', '', 'Sport', '45', 1600], ['2014-06-04', 'El Sol', 1, '', '', 'Sport', '45', 1600], ['2014-06-04', 'El Sol', 1, '', '', 'Sport', '45', 1600], ['2014-06-04', 'El Sol', 1, '', '', 'Sport', '45', 1600], ['2014-06-04', 'El Sol', 1, '', '', 'Sport', '45', 1600], ['2014-06-04', 'Monosmear', 1, '', '', 'Sport', '50', 2100], ['2014-06-04', 'In the Way', 1, '', '', 'Sport', '60', 1600], ['2014-06-04', "Old'n", 1, '', '', 'Sport', '55', 1500], ['2014-06-04', 'Esse Curve', 1, '', '', 'Sport', '', 1800], ['2014-06-04', 'The Good Stuff', 1, '', '', 'Sport', '', 1800], ['2014-06-04', 'Bound in Blood', 1, '', '', 'Sport', '', 2100], ['2014-06-04', 'Big E', 1, '', '', 'Sport', '80', 1600], ['2014-06-04', 'Honeymoon Down Under', 1, '', '', 'Sport', '85', 1900], ['2014-06-04', 'Aborigine', 1, '', '', 'Sport', '55', 1800], ['2014-06-04', 'Dreamtime', 1, '', '', 'Sport', '50', 1500], ['2014-06-04', 'Tempest Toast', 1, '', '', 'Sport', '110', 1800], ['2014-06-04', 'Virgin Bolters', 1, '', '', 'Sport', '70', 2300], ['2014-06-04', 'Just Happens', 1, '', '', 'Sport', '60', 2300], ['2014-06-04', 'Jumping the Gun', 1, '', '', 'Sport', '70', 2400], ['2014-06-04', 'Snubnose', 1, '', '', 'Sport', '45', 2300], ['2014-06-04', 'Storm Surge', 1, '', '', 'Sport', '65', 2500], ['2014-06-04', 'Wake to Wake', 1, '', '', 'Sport', '55', 2400], ['2014-06-04', 'The Mad Scientist', 1, '', '', 'Sport', '100', 2100], ['2014-06-04', "Pike's Peak", 1, '', '', 'Sport', '100', 1800], ['2014-06-04', 'Electric Swimming Pool', 1, '', '', 'Sport', '85', 2400], ['2014-06-04', 'The Mantel of the Leprechaun', 1, '', '', 'Sport', '80', 2400], ['2014-06-04', 'Nose in a Day', 1, '', '', 'Sport', '105', 1500], ['2014-06-04', 'Nose in a Day', 1, '', '', 'Sport', '105', 1500], ['2014-06-04', "Billy's Ghost Dance", 1, '', '', 'Sport', '105', 1500], ['2014-06-04', "Billy's Ghost Dance", 1, '', '', 'Sport', '105', 1500], ['2014-06-01', 'Potholes', 1, '', '', 'Sport', '60', 1800], ['2014-05-17', 'Northeast Corner', 1, '', '', 'Boulder', '', 20008], ['2014-05-03', 'Single Gun Theory', 1, '', '', 'Sport', '', 5200], ['2014-05-03', 'Not So Killer Bees', 1, '', '', 'Sport', '', 3500], ['2014-05-03', 'The Opportunist', 1, '', '', 'Sport', '70', 2400], ['2014-05-02', 'Blind Faith', 2, '', '', 'Trad', '200', 2600], ['2014-05-02', 'The Bastille Crack', 5, '', '', 'Trad', '350', 1800], ['2014-04-25', 'The Overleaf', 2, '', '', 'Trad', '', 2200], ['2014-04-25', 'EZ Street', 3, '', '', 'Trad, Sport', '', 1600], ['2014-04-25', 'The Leaner', 1, '', '', 'Trad', '80', 3200], ['2014-04-24', 'El Sol', 1, '', '', 'Sport', '45', 1600], ['2014-04-24', 'Helios', 1, '', '', 'Sport', '45', 1800], ['2014-04-24', 'Eclipse This', 1, '', '', 'Sport', '50', 2500], ['2014-04-24', 'Up Until Sunrise', 1, '', '', 'Sport', '', 5500], ['2014-04-18', 'Moby Grape', 2, '', '', 'Trad', '', 1800], ['2014-04-18', 'Life on the Run', 1, '', '', 'Trad', '50', 2600], ['2014-04-12', 'Jump Start', 1, '', '', 'Trad', '60', 2400], ['2014-04-12', 'Awkward Teenage Dating', 1, '', '', 'Trad, TR', '50', 1600], ['2014-04-12', 'Reptillian Wall', 1, '', '', 'Trad, TR', '50', 1600], ['2014-04-12', 'Left Handed Jew', 1, '', '', 'Trad, TR', '70', 1900], ['2014-04-11', 'Upper Lip', 1, '', '', 'Trad', '70', 1900], ['2014-04-11', 'Schooldaze', 3, '', '', 'Trad', '', 1500], ['2014-03-28', 'Reservoir Dogs', 1, '', '', 'Boulder', '15', 20350], ['2014-03-17', 'Right Unknown', 1, '', '', 'Boulder', '', 20500], ['2014-03-17', 'Left Unknown', 1, '', '', 'Boulder', '', 20500], ['2014-03-17', 'Unknown V2', 1, '', '', 'Boulder', '', 20200], ['2014-03-14', 'Center or Regular Problem aka Fire and Ice Simulator', 1, '', '', 'Boulder', '', 20075], ['2014-03-14', 'Left Side Arete', 1, '', '', 'Boulder', '', 20100], ['2014-03-14', 'Circus Trick', 1, '', '', 'Boulder', '8', 20200], ['2014-03-14', "Breashears' Crack", 1, '', '', 'Boulder', '', 20170], ['2014-03-14', 'Missile', 1, '', '', 'Boulder', '', 20500], ['2014-03-06', 'Floater aka Center Route', 1, '', '', 'Boulder', '', 20500], ['2014-03-06', 'The Rail', 1, '', '', 'Boulder', '', 20100], ['2014-02-16', "She's Got a Full Set of Camalots!", 1, '', '', 'Trad, Sport', '80', 3200], ['2014-02-16', 'Candy for Big Kids', 1, '', '', 'Sport', '60', 3400], ['2014-02-16', 'Crystal', 1, '', '', 'Sport', '60', 4900], ['2014-02-14', 'Lost in Space Direct', 4, '', '', 'Trad', '', 2400], ['2014-01-12', 'Hey Ranger!', 3, '', '', 'Trad', '', 1500], ['2014-01-03', 'Chicken Dance', 2, '', '', 'Trad', '270', 1500], ['2014-01-03', "Biscuits 'n' Gravy", 3, '', '', 'Trad', '380', 1400], ['2013-12-27', "Biscuits 'n' Gravy", 3, '', '', 'Trad', '380', 1400], ['2013-12-18', 'Better Lock Next Time', 5, '', '', 'Trad', '450', 2900], ['2013-12-01', 'Unknown Dyno', 1, '', '', 'Boulder', '', 20310], ['2013-12-01', 'Traverse', 1, '', '', 'Boulder', '', 20600], ['2013-11-29', 'Washington Irving', 1, '', '', 'Trad', '130', 1600], ['2013-11-03', 'High Tides', 1, '', '', 'Sport', '35', 4600], ['2013-11-03', 'High Tides', 1, '', '', 'Sport', '35', 4600], ['2013-11-02', 'Five Finger Discount', 1, '', '', 'Sport', '100', 2600], ['2013-11-02', "Skippin' Stones", 1, '', '', 'Sport', '65', 5200], ['2013-11-02', "Skippin' Stones", 1, '', '', 'Sport', '65', 5200], ['2013-11-02', 'Mineral Museum', 1, '', '', 'Trad, Sport', '75', 2400], ['2013-11-02', 'Herb-A-Med-Veg-A-Matic', 1, '', '', 'Sport', '95', 4900], ['2013-11-02', 'Learning to Crawl', 1, '', '', 'Sport', '100', 2600], ['2013-10-25', 'Super Best Friends', 1, '', '', 'Sport', '95', 6900], ['2013-10-25', "Gettin' Lucky in Kentucky", 1, '', '', 'Sport', '60', 2900], ['2013-10-25', 'Moonshine', 1, '', '', 'Sport', '60', 2600], ['2013-10-25', 'Moonshine', 1, '', '', 'Sport', '60', 2600], ['2013-10-25', 'Sunbeam', 1, '', '', 'Sport', '65', 3200], ['2013-10-23', 'Fire and Brimstone', 1, '', '', 'Sport', '90', 3500], ['2013-10-23', 'Breakfast Burrito', 1, '', '', 'Sport', '80', 3200], ['2013-10-23', 'Naked Lunch', 1, '', '', 'Sport', '80', 6600], ['2013-10-23', 'Slick and the 9mm', 1, '', '', 'Sport', '60', 2900], ['2013-10-22', 'Single Finger Salute', 1, '', '', 'Sport', '55', 3200], ['2013-10-22', 'The Second Labor of Hercules', 1, '', '', 'Sport', '50', 3400], ['2013-10-22', 'Ghost in the Machine', 1, '', '', 'Sport', '60', 3500], ['2013-10-22', 'One Brick Shy', 1, '', '', 'Sport', '80', 3200], ['2013-10-22', 'Scar Tissue', 1, '', '', 'Sport', '45', 6600], ['2013-10-22', 'Hippocrite', 1, '', '', 'Sport', '45', 6600], ['2013-10-20', 'The Shining', 1, '', '', 'Trad', '30', 2400], ['2013-10-20', 'Dog Fight (a.k.a. Circa Man)', 1, '', '', 'Sport', '60', 3500], ['2013-10-20', 'Out For Justice', 1, '', '', 'Sport', '65', 4900], ['2013-10-20', 'Deep Six', 1, '', '', 'Sport', '110', 6900], ['2013-10-19', 'Bombs Bursting', 1, '', '', 'Trad', '60', 2100], ['2013-10-19', 'Party Time', 2, '', '', 'Trad', '110', 1800], ['2013-10-19', 'Calypso III', 1, '', '', 'Trad', '60', 1500], ['2013-10-19', 'Where Lizards Dare', 1, '', '', 'Trad, Aid', '70', 2900], ['2013-10-18', 'Abby Gabby Goo', 1, '', '', 'Sport', '30', 2100], ['2013-10-18', 'Tanduay Time', 1, '', '', 'Sport', '60', 3500], ['2013-10-18', 'Tapeworm', 3, '', '', 'Sport', '80', 7500], ['2013-10-16', 'Flutterby Blue', 1, '', '', 'Sport', '40', 2400], ['2013-10-16', 'Little Viper', 1, '', '', 'Sport', '50', 2900], ['2013-10-16', 'Trundling Kentucky', 1, '', '', 'Sport', '50', 2100], ['2013-10-15', 'Captain Blonde Sinks The Ship', 1, '', '', 'Sport', '75', 4700], ['2013-10-15', 'Hijacked Project', 1, '', '', 'Sport', '47', 2400], ['2013-10-15', 'One-Armed Bandit', 1, '', '', 'Sport', '80', 2400], ['2013-10-07', 'True Religon', 2, '', '', 'Trad', '', 3200], ['2013-10-06', 'No Chute aka Rip Cord', 1, '', '', 'Trad', '50', 2600], ['2013-10-06', 'Illegal Smile', 1, '', '', 'Trad', '80', 2100], ['2013-10-06', 'Pete and Benz', 2, '', '', 'Trad', '190', 1800], ['2013-09-28', 'Jewel Of The Wild', 1, '', '', 'Sport', '', 6600], ['2013-09-27', 'Tottering into Antiquity', 1, '', '', 'Sport', '65', 3200], ['2013-09-27', 'My Testosterone Poisoned Friend', 1, '', '', 'Sport', '70', 2900], ['2013-09-23', 'Too Much Beef and Not Enough Meat', 1, '', '', 'Sport', '75', 2400], ['2013-09-22', 'Natty Dread', 1, '', '', 'Sport', '80', 4900], ['2013-09-22', 'The New Philanthropists', 1, '', '', 'Sport, TR', '70', 5100], ['2013-09-21', "Jason's Argonaut", 1, '', '', 'Sport', '75', 2600], ['2013-09-21', 'The Rose', 1, '', '', 'Sport', '75', 1800], ['2013-08-25', 'Lower Bolted Face', 1, '', '', 'Sport, TR', '', 2300], ['2013-08-25', 'Unknown at Creekside', 1, '', '', 'Trad, TR', '', 1500], ['2013-08-25', 'Downclimb Route', 1, '', '', 'Trad', '', 1300], ['2013-08-18', 'Right-Facing Corner', 1, '', '', 'Trad', '50', 2400], ['2013-08-18', 'Balance', 1, '', '', 'Sport', '50', 2200], ['2013-08-16', 'Dark Side Roofs', 1, '', '', 'Sport', '65', 4600], ['2013-08-16', 'Oscar de la Cholla', 1, '', '', 'Sport', '75', 2400], ['2013-08-16', 'Kalahari Sidewinder', 1, '', '', 'Sport', '40', 2100], ['2013-08-16', 'Tractatus', 1, '', '', 'Sport', '50', 4600], ['2013-08-09', 'Lumina', 1, '', '', 'Sport', '', 2400], ['2013-08-09', 'Dark Side Roofs', 1, '', '', 'Sport', '65', 4600], ['2013-08-09', 'Alcohollica', 1, '', '', 'Sport', '70', 2200], ['2013-08-09', 'Heretic', 1, '', '', 'Sport', '60', 2100], ['2013-08-09', 'Pig City Nights', 1, '', '', 'Sport', '60', 2100], ['2013-08-09', 'The Apple Cracks', 1, '', '', 'Sport', '70', 1800], ['2013-08-04', 'The Disclaimer', 1, '', '', 'Sport', '80', 5100], ['2013-08-04', 'Crickets in the Cabbage', 1, '', '', 'Sport', '80', 3500], ['2013-08-04', 'Slick Willard', 1, '', '', 'Sport', '', 2400], ['2013-08-04', 'Climbing By The Brooks', 1, '', '', 'Sport', '', 2100], ['2013-07-19', 'Unknown (Compression Northeast)', 1, '', '', 'Boulder', '10', 20270], ['2013-07-06', 'Work It', 1, '', '', 'Boulder', '10', 20100], ['2013-07-06', 'Troll Rockover', 1, '', '', 'Boulder', '12', 20200], ['2013-07-06', 'Guiding Light A.K.A Round Up', 1, '', '', 'Boulder', '15', 20300], ['2013-07-06', 'The Troll Pull', 1, '', '', 'Boulder', '10', 20200], ['2013-07-06', 'The Troll Cave', 1, '', '', 'Boulder', '15', 20300], ['2013-07-05', 'The Nordwand', 2, '', '', 'Sport', '', 4900], ['2013-07-05', 'Radometer in the Red Zone', 1, '', '', 'Sport', '65', 5100], ['2013-07-05', 'Lunchmoney', 1, '', '', 'Sport', '100', 2500], ['2013-07-05', 'Power Trip', 1, '', '', 'Sport', '40', 6600], ['2013-06-30', 'The Tower', 1, '', '', 'Sport', '100', 2600], ['2013-06-28', 'Overhanging Arete', 1, '', '', 'Boulder', '', 20570], ['2013-06-28', 'Thing Behind The Wedge aka The Hangboard', 1, '', '', 'Boulder', '13', 20100], ['2013-06-28', 'The Wave', 1, '', '', 'Boulder', '', 20200], ['2013-06-22', 'Graduation Crack Arete Variation', 1, '', '', 'Boulder', '12', 20200], ['2013-06-22', 'South Arete', 1, '', '', 'Boulder', '12', 20300], ['2013-06-22', 'Route 5 aka The Graduation Crack', 1, '', '', 'Boulder', '16', 20100], ['2013-06-21', 'Unknown V4', 1, '', '', 'Boulder', '10', 20400], ['2013-06-21', 'Unknown V7 aka Slapper', 1, '', '', 'Boulder', '12', 20700], ['2013-06-16', 'Cherry Top Rip (Name Unknown)', 1, '', '', 'Boulder, Alpine', '10', 20500], ['2013-06-15', 'Zorro Warmup', 1, '', '', 'Boulder, Alpine', '', 20100], ['2013-06-15', 'The Ladder', 1, '', '', 'Boulder, Alpine', '10', 20200], ['2013-06-15', 'Broken Arrow Left', 1, '', '', 'Boulder, Alpine', '12', 20300], ['2013-06-15', 'Broken Arrow Right (FKA Anorexic Gymnast)', 1, '', '', 'Boulder, Alpine', '12', 20410], ['2013-06-14', 'Baja Ha Ha', 1, '', '', 'Sport', '90', 4600], ['2013-06-14', 'High H20', 1, '', '', 'Sport', '65', 3500], ['2013-06-14', 'Re-Thinking the Ethics', 1, '', '', 'Sport', '45', 2600], ['2013-06-14', 'Wake to Wake', 1, '', '', 'Sport', '55', 2400], ['2013-06-02', 'Crescent Corner', 2, '', '', 'Sport', '100', 2500], ['2013-06-02', 'Mighty Thor', 1, '', '', 'Sport', '120', 3200], ['2013-06-01', 'Street Knowledge', 1, '', '', 'Sport', '', 6900], ['2013-05-27', 'The Iron Maiden', 1, '', '', 'Sport', '', 2600], ['2013-05-27', 'Norman Rockshoes', 1, '', '', 'Sport', '', 2500], ['2013-05-27', 'Whackbusher', 1, '', '', 'Trad', '', 1600], ['2013-05-27', 'The Rack', 1, '', '', 'Sport', '', 3500], ['2013-05-25', 'Swiss Cheese', 1, '', '', 'Boulder', '10', 20400], ['2013-05-19', "People's Choice", 4, '', '', 'Sport', '', 3000], ['2013-05-19', 'Lawsuit', 1, '', '', 'Sport', '', 2700], ['2013-05-19', 'L.A. Law', 1, '', '', 'Sport', '', 2600], ['2013-05-19', 'Officer Friendly', 1, '', '', 'Sport', '45', 5100], ['2013-05-19', 'The Great Escape', 1, '', '', 'Sport', '', 7000], ['2013-05-18', 'Deuces Wild', 1, '', '', 'Sport', '145', 2600], ['2013-05-18', 'Night Stick', 1, '', '', 'Sport', '60', 4900], ['2013-05-18', 'Pervade', 1, '', '', 'Sport', '60', 3200], ['2013-05-18', 'The Great Escape', 1, '', '', 'Sport', '', 7000], ['2013-05-12', 'The G Route', 1, '', '', 'Sport', '80', 6900], ['2013-05-12', 'Stinger', 1, '', '', 'Trad', '70', 2200], ['2013-05-12', 'Bee Positive', 1, '', '', 'Trad', '70', 2200], ['2013-05-12', 'Gator Boy', 1, '', '', 'TR', '50', 5000], ['2013-05-11', 'Crack Parallel', 2, '', '', 'Trad', '', 1800], ['2013-05-05', 'Sockeye', 1, '', '', 'Sport', '45', 2600], ['2013-05-05', 'Call to Arms', 1, '', '', 'Sport', '60', 6600], ['2013-05-05', 'Wild Kippers', 1, '', '', 'Sport', '48', 4600], ['2013-05-05', 'Sand Dollar', 1, '', '', 'Sport', '80', 2700], ['2013-05-04', "Let's Do It Again, Daddy", 1, '', '', 'Trad', '80', 2100], ['2013-05-04', 'Gay Blade', 1, '', '', 'Sport', '50', 4700], ['2013-05-04', 'Altered State', 1, '', '', 'Trad', '70', 3300], ['2013-04-29', 'Cobble Wobble', 1, '', '', 'Sport', '65', 3200], ['2013-04-29', 'Scurvy Dog', 1, '', '', 'Sport', '60', 2400], ['2013-04-29', 'Super Arete', 1, '', '', 'Sport', '80', 2100], ['2013-04-28', 'Swiss Arete', 1, '', '', 'Sport', '40', 6600], ['2013-04-28', 'Bats in the Belfry', 1, '', '', 'Sport', '', 4600], ['2013-04-28', 'Wind Chill', 1, '', '', 'Sport', '40', 2600], ['2013-04-28', 'Mickey Goes to Vegas', 1, '', '', 'Sport', '65', 2400], ['2013-04-27', 'Genesis', 1, '', '', 'Sport', '', 3500], ['2013-04-27', 'Slots O Fun', 1, '', '', 'Sport', '35', 2600], ['2013-04-27', 'Edge your Bets', 1, '', '', 'Sport', '35', 2600], ['2013-04-27', "Double or Nothin'", 1, '', '', 'Sport', '', 2400], ['2013-04-27', 'Ante Up', 1, '', '', 'Sport', '35', 2200], ['2013-04-25', 'The Fin', 1, '', '', 'Boulder', '12', 20150], ['2013-04-25', 'Left Arete', 1, '', '', 'Boulder', '16', 20008], ['2013-04-25', 'Right Arete', 1, '', '', 'Boulder', '12', 20010], ['2013-04-25', 'Left Arete', 1, '', '', 'Boulder', '10', 20300], ['2013-04-23', 'Regular Route', 3, '', '', 'Trad', '250', 1800], ['2013-04-22', 'Whodunit', 8, '', '', 'Trad', '800', 2400], ['2013-04-22', 'The Wave', 1, '', '', 'Boulder', '10', 20010], ['2013-04-22', 'Look At This', 1, '', '', 'Boulder', '8', 20005], ['2013-04-18', 'Sail Away', 1, '', '', 'Trad', '60', 2000], ['2013-04-17', 'Hands Up', 1, '', '', 'Trad', '50', 3500], ['2013-04-17', 'Hot Fudge', 1, '', '', 'Trad', '70', 2400], ['2013-04-17', 'Scrumdillyishus', 1, '', '', 'Trad', '80', 1800], ['2013-04-16', 'Pig F**ker', 1, '', '', 'Boulder', '13', 20010], ['2013-04-16', 'Yardarm', 1, '', '', 'Boulder', '13', 20100], ['2013-04-16', 'Slick Willie', 1, '', '', 'Boulder', '14', 20200], ['2013-04-16', 'Descent Route', 1, '', '', 'Boulder', '20', 20000], ['2013-04-16', 'Caveman', 1, '', '', 'Boulder', '30', 20650], ['2013-04-16', 'Saturday Night Live', 1, '', '', 'Boulder', '13', 20400], ['2013-04-16', 'Gem', 1, '', '', 'Trad', '60', 2100], ['2013-04-16', 'Boulderado (aka California Face)', 1, '', '', 'Sport', '100', 4600], ['2013-04-16', 'Colorado Crack', 1, '', '', 'Trad', '100', 2400], ['2013-04-14', 'Pop Quiz (aka Brown on Butter)', 1, '', '', 'Trad', '70', 4700], ['2013-04-14', 'Big Guy', 1, '', '', 'Trad', '120', 4700], ['2013-04-14', 'Wavy Gravy', 1, '', '', 'Trad', '70', 3000], ['2013-04-13', 'Lady Pillar', 1, '', '', 'Trad', '110', 2700], ['2013-04-13', 'Annunaki', 1, '', '', 'Trad', '50', 5300], ['2013-04-13', "Casey's Route", 1, '', '', 'Trad', '70', 3300], ['2013-04-13', 'Brodie Machine', 1, '', '', 'Trad', '60', 2400], ['2013-04-13', "Charlie's Pillar", 1, '', '', 'Trad', '60', 2100], ['2013-03-30', 'Evening Stroll', 1, '', '', 'Trad, TR', '', 2100], ['2013-03-30', 'Evening Stroll', 1, '', '', 'Trad, TR', '', 2100], ['2013-03-30', 'Chinook', 1, '', '', 'Trad', '', 2500], ['2013-03-15', 'Lost in Space Direct', 4, '', '', 'Trad', '', 2400], ['2013-02-17', 'Ethics? What Ethics?', 1, '', '', 'Sport', '65', 4900], ['2013-02-17', 'Aerial Solution', 1, '', '', 'Sport', '', 3200], ['2013-02-17', 'Primal Scream', 1, '', '', 'Sport', '', 2500], ['2013-02-17', 'Tired Arms Recovery Program (T.A.R.P.)', 1, '', '', 'Sport', '50', 2400], ['2013-02-17', 'Living in America', 1, '', '', 'Sport', '', 6600], ['2013-02-08', 'Karma Mechanic', 1, '', '', 'Sport', '60', 2900], ['2013-02-08', 'Barney', 1, '', '', 'Sport', '', 2500], ['2013-02-08', 'Pedestrian Gene Pool', 1, '', '', 'Sport', '', 4700], ['2013-02-02', 'In Search of Unicorns', 1, '', '', 'Trad', '50', 5000], ['2013-02-02', 'Honky Jam Ass Crack', 1, '', '', 'Trad', '', 1800], ['2013-02-02', 'Gobble Up', 1, '', '', 'Trad', '', 2100], ['2013-01-26', 'Patrick Hedgeclipper', 1, '', '', 'Sport', '', 5200], ['2013-01-26', 'Beta Slave', 1, '', '', 'Sport', '', 3300], ['2013-01-26', 'Lothar', 1, '', '', 'Sport, TR', '', 2500], ['2013-01-19', 'Svengali', 1, '', '', 'Sport', '', 4600], ['2013-01-19', 'Castlewood Capers', 1, '', '', 'Sport', '', 4800], ['2013-01-19', 'Phalloid Void', 1, '', '', 'Sport', '', 3100], ['2013-01-19', 'Bat Face', 1, '', '', 'Sport', '', 2600], ['2013-01-18', 'Cowboy Boot Crack', 1, '', '', 'Trad, TR', '80', 1600], ['2013-01-18', 'Finger Ramp', 1, '', '', 'Sport', '100', 1900], ['2013-01-18', 'New Era', 2, '', '', 'Trad', '270', 1800], ['2013-01-17', 'Electric Swimming Pool', 1, '', '', 'Sport', '85', 2400], ['2013-01-05', 'Le Petit Verdon', 1, '', '', 'Sport', '40', 2200], ['2013-01-05', 'From Russia With Love', 1, '', '', 'Sport', '50', 2600], ['2013-01-05', 'Rock Frog', 1, '', '', 'Sport', '25', 3200], ['2013-01-05', 'You Were Meant For Me', 1, '', '', 'Sport', '25', 1500], ['2012-12-22', 'Handcrack', 1, '', '', 'Boulder', '15', 20100], ['2012-12-01', 'North Ridge', 2, '', '', 'Trad', '', 1800], ['2012-11-24', 'Bat Face', 1, '', '', 'Sport', '', 2600], ['2012-11-18', 'Credibility Gap', 2, '', '', 'Sport', '', 2500], ['2012-11-16', 'Beta Slave', 1, '', '', 'Sport', '', 3300], ['2012-11-16', 'Entry Level', 1, '', '', 'Sport', '', 2200], ['2012-11-03', 'Dad Speaks Parley', 1, '', '', 'Sport', '35', 3500], ['2012-11-03', 'Randy Speaks Farsi', 1, '', '', 'Sport', '50', 4600], ['2012-10-25', 'Air Ride Equipped', 1, '', '', 'Sport', '65', 4600], ['2012-10-25', 'Geezers Go Sport', 1, '', '', 'Sport', '80', 4900], ['2012-10-23', 'Pogue Ethics', 1, '', '', 'Sport', '80', 2500], ['2012-10-23', 'Creature Feature', 1, '', '', 'Trad, Sport', '100', 2400], ['2012-10-23', 'Twinkie', 1, '', '', 'Sport', '80', 6600], ['2012-10-22', 'Chimp', 1, '', '', 'Sport', '60', 2900], ['2012-10-22', 'To Defy The Laws Of Tradition', 1, '', '', 'Sport', '60', 2600], ['2012-10-22', 'Souders Crack', 1, '', '', 'Trad', '80', 5000], ['2012-10-21', 'Monkey in the Middle', 1, '', '', 'Sport', '80', 4600], ['2012-10-21', 'Hippocrite', 1, '', '', 'Sport', '45', 6600], ['2012-10-20', "Gettin' Lucky in Kentucky", 1, '', '', 'Sport', '60', 2900], ['2012-10-20', 'Fifth Bolt Faith', 1, '', '', 'Sport', '55', 3200], ['2012-10-20', 'Momma Cindy', 1, '', '', 'Sport', '70', 4600], ['2012-10-20', 'Edge-a-Sketch', 1, '', '', 'Sport', '70', 4600], ['2012-09-29', 'Self Service', 1, '', '', 'Boulder', '15', 20400], ['2012-09-29', "Gettin' Warmer", 1, '', '', 'Boulder', '', 20200], ['2012-09-29', 'Warm Me Up, Scotty', 1, '', '', 'Boulder', '', 20100], ['2012-09-29', 'Self Service', 1, '', '', 'Boulder', '15', 20400], ['2012-09-29', "Pimpn' Jeans", 1, '', '', 'Boulder', '', 20350], ['2012-09-29', 'Bad Genes', 1, '', '', 'Boulder', '', 20300], ['2012-09-29', 'Northwest Arete', 1, '', '', 'Boulder', '10', 20200], ['2012-09-29', "Don't Leave Too Soon", 1, '', '', 'Boulder', '15', 20300], ['2012-09-28', "Dem' Bones", 1, '', '', 'Boulder', '12', 20300], ['2012-09-28', 'Cave Man', 1, '', '', 'Boulder', '15', 20400], ['2012-09-28', 'Better Than Coffee', 1, '', '', 'Boulder', '15', 20300], ['2012-09-28', 'Kill by Numbers', 1, '', '', 'Boulder', '8', 20500], ['2012-09-28', 'Kill by Numbers', 1, '', '', 'Boulder', '8', 20500], ['2012-09-27', 'The Angler', 1, '', '', 'Boulder', '15', 20200], ['2012-09-23', 'Crime and Punishment', 1, '', '', 'Sport', '', 6600], ['2012-09-23', 'Malmsteen', 1, '', '', 'Sport', '90', 3500], ['2012-09-23', 'Small Fry', 1, '', '', 'Sport', '90', 3100], ['2012-09-23', 'Street Knowledge', 1, '', '', 'Sport', '', 6900], ['2012-09-22', 'Pile Driver', 1, '', '', 'Sport', '', 4900], ['2012-09-22', 'Costello', 1, '', '', 'Sport', '60', 4600], ['2012-09-22', 'Merry Maids', 1, '', '', 'Sport', '', 2600], ['2012-09-22', 'Vortex aka Fat Slags', 1, '', '', 'Sport', '60', 2400], ['2012-09-16', 'Cries and Crimpers', 1, '', '', 'Boulder', '', 20100], ['2012-09-16', 'Northwest Face', 1, '', '', 'Boulder', '', 20100], ['2012-09-03', 'Learning Curve', 1, '', '', 'Sport', '50', 2300], ['2012-09-03', 'Passing the Baton', 1, '', '', 'Sport', '50', 2000], ['2012-09-03', 'YngYngYng', 1, '', '', 'Sport', '50', 3200], ['2012-09-03', 'Kawasaki Hood Ornament', 1, '', '', 'Sport', '50', 4900], ['2012-09-02', 'Wishbone Dihedral', 1, '', '', 'Sport', '80', 4900], ['2012-09-01', "Beginner's Luck", 1, '', '', 'Sport', '50', 1600], ['2012-09-01', 'Too Much Nooky, Not Enough Sleep', 1, '', '', 'Sport', '50', 2100], ['2012-08-25', 'Unknown', 1, '', '', 'Boulder', '', 20008], ['2012-08-25', 'Unknown', 1, '', '', 'Boulder', '', 20008], ['2012-08-25', 'V3 aka Big Air', 1, '', '', 'Boulder', '20', 20300], ['2012-08-19', 'East Face Crimps', 1, '', '', 'Boulder', '8', 20300], ['2012-08-18', 'Unknown V4', 1, '', '', 'Boulder', '10', 20400], ['2012-08-12', 'Kappa.2', 1, '', '', 'Boulder', '15', 20008], ['2012-08-12', 'Phi.1', 1, '', '', 'Boulder', '12', 20008], ['2012-08-12', 'Punjabi by Nature', 1, '', '', 'Boulder', '', 20250], ['2012-08-01', 'Stalactite', 1, '', '', 'Boulder', '', 20200], ['2012-08-01', 'The Wave', 1, '', '', 'Boulder', '', 20200], ['2012-08-01', 'The Rail', 1, '', '', 'Boulder', '', 20100], ['2012-08-01', 'V0 aka Crack 1', 1, '', '', 'Boulder', '20', 20005], ['2012-07-13', 'V0 aka Crack 1', 1, '', '', 'Boulder', '20', 20005], ['2012-07-13', 'The Wave', 1, '', '', 'Boulder', '', 20200], ['2012-07-13', 'Northwest Arete', 1, '', '', 'Boulder', '', 20100], ['2012-07-08', 'Punks and Old Men', 1, '', '', 'Sport', '', 2100], ['2012-07-08', 'Frozen in Time', 1, '', '', 'Sport', '60', 6600], ['2012-07-07', 'Tenth Avenue Freeze-Out', 1, '', '', 'Sport', '60', 5200], ['2012-07-07', 'Frozen in Time', 1, '', '', 'Sport', '60', 6600], ['2012-07-07', 'Unknown Crack', 1, '', '', 'Sport', '50', 3000], ['2012-07-07', 'Hemisphere', 1, '', '', 'Sport', '70', 2500], ['2012-06-23', 'Captain Nemo', 2, '', '', 'Trad', '80', 3500], ['2012-06-23', 'War Zone', 1, '', '', 'Trad, Sport', '', 4900], ['2012-06-23', 'Penis Dimension', 1, '', '', 'Trad', '', 3200], ['2012-06-23', 'Climb and Punishment', 1, '', '', 'Trad', '80', 2500], ['2012-06-09', 'The Divine Ms M.', 4, '', '', 'Trad, Sport', '', 2300], ['2012-06-09', 'Unknown between Divine Miss M & Erotic Plants', 4, '', '', 'Sport', '370', 2500], ['2012-06-09', 'Fractured Fairytales', 6, '', '', 'Sport', '800', 1800], ['2012-06-03', 'No Chute aka Rip Cord', 1, '', '', 'Trad', '50', 2600], ['2012-06-03', 'Illegal Smile', 1, '', '', 'Trad', '80', 2100], ['2012-06-03', 'Pete and Benz', 2, '', '', 'Trad', '190', 1800], ['2012-06-02', "Turkey's Delight", 3, '', '', 'Trad', '', 1800], ['2012-05-28', 'Reptile Tears', 1, '', '', 'Trad', '100', 3300], ['2012-05-28', 'W.A.S.P. (What About Some Pesticide?)', 1, '', '', 'Trad', '70', 1800], ['2012-05-27', 'Turkey Foot Crack', 1, '', '', 'Trad', '', 2600], ['2012-05-27', 'Fallen Angels', 2, '', '', 'Trad', '170', 2900], ['2012-05-27', 'Deception Past', 1, '', '', 'Trad', '80', 2900], ['2012-05-22', 'River Dance', 1, '', '', 'Trad', '95', 2100], ['2012-05-20', '5.8, My Ass', 1, '', '', 'Trad', '80', 2400], ['2012-05-20', 'Futile Attraction', 1, '', '', 'Trad', '50', 5300], ['2012-05-20', 'The Cooler', 1, '', '', 'TR', '40', 3300], ['2012-05-19', 'Nightime Madness', 1, '', '', 'Trad', '', 1800], ['2012-05-11', 'Crack Parallel', 2, '', '', 'Trad', '', 1800], ['2012-04-28', 'Cliff Break Fern', 1, '', '', 'Trad', '80', 2000], ['2012-04-28', 'Don King Crack', 1, '', '', 'Trad', '75', 2700], ['2012-04-28', 'Gorilla in Manilla', 1, '', '', 'Trad', '80', 2500], ['2012-04-27', 'Unknown Pillar', 1, '', '', 'Trad, Sport', '75', 2700], ['2012-04-27', 'Bandito', 1, '', '', 'Trad', '50', 2200], ['2012-04-27', 'Don Juan', 1, '', '', 'Trad', '60', 1600], ['2012-04-26', 'Batteries Not Included', 1, '', '', 'Trad', '60', 2500], ['2012-04-26', 'Unnamed Route R of flower power', 1, '', '', 'Trad', '70', 5300], ['2012-04-26', 'Unamed 5.8', 1, '', '', 'Trad', '40', 2100], ['2012-04-25', 'Generic Crack', 1, '', '', 'Trad', '', 2700], ['2012-04-25', 'Unknown 5.11- (really long thin hands corner)', 2, '', '', 'Trad', '200', 4700], ['2012-04-25', 'Middle Crack', 1, '', '', 'Trad', '60', 6700], ['2012-04-25', 'Warm-Up Handcrack', 1, '', '', 'Trad', '100', 3000], ['2012-04-24', 'Drainpipe', 1, '', '', 'Trad', '', 3300], ['2012-04-24', 'Elephant Man', 1, '', '', 'Trad', '80', 2700], ['2012-04-24', 'Chocolate Corner', 1, '', '', 'Trad', '50', 2500], ['2012-04-23', 'Kor-Ingalls Route', 4, '', '', 'Trad', '', 2500], ['2012-04-22', 'Baby Face', 1, '', '', 'Trad', '100', 2500], ['2012-04-22', 'Kindergarten Crack', 1, '', '', 'Trad', '60', 1400], ['2012-04-22', 'Taylor Made', 1, '', '', 'Trad', '90', 2600], ['2012-04-22', 'Left Hand Crack', 1, '', '', 'Trad', '', 2200], ['2012-04-08', "Stewart's Crack", 4, '', '', 'Trad', '', 2100], ['2012-04-08', 'Straw Turkey', 3, '', '', 'Trad', '', 2600], ['2012-04-07', 'Rasmussen Crack', 1, '', '', 'Trad', '70', 2900], ['2012-04-07', 'Whimsical Dreams', 1, '', '', 'Trad', '', 4900], ['2012-04-07', 'Reefer Madness', 1, '', '', 'Trad', '', 2100], ['2012-04-07', 'Ragger Bagger', 1, '', '', 'Trad', '', 2200], ['2012-04-01', 'Knossos', 4, '', '', 'Sport', '', 2500], ['2012-03-25', 'True Religon', 2, '', '', 'Trad', '', 3200], ['2012-03-25', 'Illegal Smile', 1, '', '', 'Trad', '80', 2100], ['2012-03-25', 'No Chute aka Rip Cord', 1, '', '', 'Trad', '50', 2600], ['2012-03-24', 'Bee Positive', 1, '', '', 'Trad', '70', 2200], ['2012-03-24', 'Storm', 1, '', '', 'Trad', '70', 6900], ['2012-03-24', 'The G Route', 1, '', '', 'Sport', '80', 6900], ['2012-03-24', 'Stinger', 1, '', '', 'Trad', '70', 2200], ['2012-03-24', 'Real Black Velvet', 1, '', '', 'Sport', '70', 5200], ['2012-03-23', 'The Army Route', 4, '', '', 'Trad', '', 1500], ['2012-03-22', 'Great White Crime', 1, '', '', 'Trad', '70', 4600], ['2012-03-22', "Satyr's Asshole", 1, '', '', 'Trad', '', 2700], ['2012-03-21', 'Nose in a Day', 1, '', '', 'Sport', '105', 1500], ['2012-03-21', "Billy's Ghost Dance", 1, '', '', 'Sport', '105', 1500], ['2012-03-20', 'North Ridge', 2, '', '', 'Trad', '', 1800], ['2012-03-20', 'West Point Crack', 3, '', '', 'Trad', '', 2100], ['2012-03-20', 'South Ridge', 1, '', '', 'Trad', '45', 1600], ['2012-03-18', 'Lost in Space Direct', 4, '', '', 'Trad', '', 2400], ['2012-03-18', 'Banana Split', 1, '', '', 'Sport', '75', 2600], ['2012-03-18', 'Three-Quarter Ton', 1, '', '', 'Sport', '80', 3100], ['2012-03-14', 'West Point Crack', 3, '', '', 'Trad', '', 2100], ['2012-03-14', 'West Face', 1, '', '', 'Sport, TR', '45', 2400], ['2012-03-14', 'South Ridge', 1, '', '', 'Trad', '45', 1600], ['2012-03-14', 'Big Sky', 1, '', '', 'Sport', '', 1800], ['2012-03-14', '"The Route on the Left" aka Sand in the Vaseline', 1, '', '', 'Sport', '75', 3100], ['2012-03-10', 'The Black Crack', 1, '', '', 'Trad', '', 2500], ['2012-03-10', 'The Gill Crack', 1, '', '', 'Trad, TR', '', 6600], ['2012-03-06', 'Almost French', 1, '', '', 'Sport', '70', 6600], ['2012-03-06', 'High Heeled Tittty Twister', 1, '', '', 'Sport', '75', 2700], ['2012-03-06', "Blackman's Burden", 1, '', '', 'Sport', '75', 3200], ['2012-03-06', 'The Alignment', 1, '', '', 'Sport', '60', 3400], ['2012-03-06', 'Leisure Class', 1, '', '', 'Sport', '80', 5100], ['2012-02-29', 'Illegal Smile', 1, '', '', 'Sport', '80', 4900], ['2012-02-29', 'Crynoid Corner', 1, '', '', 'Sport', '75', 1800], ['2012-02-29', 'Dihedrus', 1, '', '', 'Sport', '75', 2900], ['2012-02-29', 'Lime Street', 1, '', '', 'Sport', '', 4900], ['2012-02-26', 'Toxxxic Entertainment', 1, '', '', 'Sport', '65', 2600], ['2012-02-26', "Down n' Dirty", 1, '', '', 'Sport', '80', 3200], ['2012-02-26', 'Travis is Sole King', 1, '', '', 'Sport', '80', 2600], ['2012-02-26', 'Almost Gothic', 1, '', '', 'Sport', '75', 5500], ['2012-02-19', 'Chunky Monkey', 1, '', '', 'Sport', '60', 3200], ['2012-02-19', 'I Claudius', 1, '', '', 'Sport', '75', 4600], ['2012-02-19', 'Three-Quarter Ton', 1, '', '', 'Sport', '80', 3100], ['2012-02-19', 'Fantasia', 1, '', '', 'Sport', '80', 5200], ['2012-01-29', 'Honky Jam Ass Crack', 1, '', '', 'Trad', '', 1800], ['2012-01-29', 'Left Handed Jew', 1, '', '', 'Trad, TR', '70', 1900], ['2012-01-28', 'Gen X ation (aka Musso Route)', 1, '', '', 'Sport', '', 3500], ['2012-01-28', 'Knot Too Many Roaches', 1, '', '', 'Sport', '55', 2800], ['2012-01-28', 'Poncho and the Three Perverts', 1, '', '', 'Sport', '60', 2000], ['2012-01-28', 'Dillinger', 1, '', '', 'Sport', '65', 2400], ['2012-01-28', 'Large Marge', 1, '', '', 'Sport', '80', 2200], ['2012-01-28', 'Flesh Tuxedo', 1, '', '', 'Sport', '70', 4600], ['2012-01-25', 'V0 aka Crack 1', 1, '', '', 'Boulder', '20', 20005], ['2012-01-25', 'Stalactite', 1, '', '', 'Boulder', '', 20200], ['2012-01-21', 'The Wave', 1, '', '', 'Boulder', '', 20200], ['2012-01-21', 'Wedgie aka The Cube Problem', 1, '', '', 'Boulder', '', 20400], ['2012-01-14', 'Six More Bottles of Bosco', 1, '', '', 'Sport', '80', 2700], ['2012-01-14', 'Muscle Beach', 1, '', '', 'Sport', '80', 4600], ['2012-01-14', 'Purple Toe Nails', 1, '', '', 'Sport', '80', 5200], ['2012-01-14', 'Travis is Sole King', 1, '', '', 'Sport', '80', 2600], ['2012-01-04', 'Unknown (Compression Northeast)', 1, '', '', 'Boulder', '10', 20270], ['2012-01-04', 'Traverse', 1, '', '', 'Boulder', '', 20210], ['2011-12-18', 'Cornerstone', 1, '', '', 'Sport', '80', 4800], ['2011-12-18', "Damn Right I've Got the Moves", 1, '', '', 'Sport', '55', 2200], ['2011-12-18', 'Cheers', 1, '', '', 'Sport', '70', 2100], ['2011-12-18', 'Access All Areas', 1, '', '', 'Sport', '60', 3500], ['2011-12-17', 'Great White Crime', 1, '', '', 'Trad', '70', 4600], ['2011-12-17', 'Vanishing Point', 1, '', '', 'Trad', '', 3500], ['2011-12-17', 'Jump Start', 1, '', '', 'Trad', '60', 2400], ['2011-11-27', 'Steppenwolf', 1, '', '', 'Trad', '', 2400], ['2011-11-27', 'Whimsical Dreams', 1, '', '', 'Trad', '', 4900], ['2011-11-27', "Hummingbird Way aka Snively's Crack", 1, '', '', 'Trad', '', 2400], ['2011-11-26', "Ladies' Night In Buffalo", 1, '', '', 'Sport', '', 2300], ['2011-11-26', 'Heretic', 1, '', '', 'Sport', '60', 2100], ['2011-11-26', 'Alcohollica', 1, '', '', 'Sport', '70', 2200], ['2011-11-26', 'Season Down Under', 1, '', '', 'Sport', '50', 2900], ['2011-11-26', 'Number 1 Super Guy', 1, '', '', 'Sport', '', 4600], ['2011-11-20', 'Gobble Up', 1, '', '', 'Trad', '', 2100], ['2011-11-20', 'Straw Turkey', 3, '', '', 'Trad', '', 2600], ['2011-11-13', 'Curious George', 1, '', '', 'Sport', '50', 4600], ['2011-11-13', 'Regroovable', 1, '', '', 'Sport', '', 4900], ['2011-11-13', 'The Dune', 1, '', '', 'Sport', '70', 2600], ['2011-11-12', 'Beginning of the End a/k/a Sandy Monster', 1, '', '', 'Sport', '65', 2500], ['2011-11-12', "Bob's Buttress Crack", 1, '', '', 'Trad', '60', 2200], ['2011-10-11', 'Rat Stew', 1, '', '', 'Sport', '75', 2600], ['2011-10-11', 'Return of Manimal', 1, '', '', 'Sport', '85', 3500], ['2011-10-11', 'Send Me on My Way', 1, '', '', 'Sport', '75', 2300], ['2011-10-11', "Gettin' Lucky in Kentucky", 1, '', '', 'Sport', '60', 2900], ['2011-10-11', 'Tall Cool One', 1, '', '', 'Sport', '60', 2400], ['2011-10-10', 'The King Lives On', 1, '', '', 'Sport', '80', 2900], ['2011-10-10', 'Johnny B. Good', 1, '', '', 'Sport', '80', 4600], ['2011-10-09', 'Environmental Impact', 2, '', '', 'Trad', '', 1800], ['2011-10-09', 'Razorback', 1, '', '', 'Trad', '35', 1600], ['2011-09-25', 'Strawberry Jam', 1, '', '', 'Trad', '', 1300], ['2011-09-25', 'Pro Sweat', 1, '', '', 'Sport', '', 2400], ['2011-09-25', 'Sweat', 1, '', '', 'Trad', '', 1800], ['2011-09-18', 'Cave Crack', 1, '', '', 'Trad', '', 1600], ['2011-09-18', 'Jack Knife', 1, '', '', 'Trad', '', 1500], ['2011-09-18', 'Easier Than It Looks', 3, '', '', 'Trad', '300', 1500], ['2011-09-03', '4T (Tufa Tufa Tufa Traverse)', 1, '', '', 'Boulder', '60', 20100], ['2011-09-03', 'The Shield', 1, '', '', 'Boulder', '', 20100], ['2011-08-31', 'A Wing And A Prayer', 1, '', '', 'Boulder', '10', 20100], ['2011-08-31', 'You Want A Piece Of Me', 1, '', '', 'Boulder', '8', 20010], ['2011-08-31', 'Social Feedback', 1, '', '', 'Boulder', '10', 20200], ['2011-08-28', 'Freddie vs. Jason', 1, '', '', 'Sport', '25', 2600], ['2011-08-27', "Specter's Touch", 1, '', '', 'Sport', '40', 3200], ['2011-08-27', 'Seven Gorgons Breathing', 1, '', '', 'Sport', '45', 4600], ['2011-08-27', 'Icy Touch of a Dimensional Shambler', 1, '', '', 'Sport', '30', 2900], ['2011-08-27', 'Invisible Slayer of the Mad Arab Abdul Alhazrad', 1, '', '', 'Sport', '40', 4600], ['2011-08-14', 'Getting Out Of Texas', 1, '', '', 'Boulder', '5', 20270], ['2011-08-14', 'Teenage Drama', 1, '', '', 'Boulder', '8', 20075], ['2011-08-14', 'Eye Of The Cyclops', 1, '', '', 'Boulder', '12', 20010], ['2011-08-14', 'Eat The Children First', 1, '', '', 'Boulder', '6', 20210], ['2011-08-06', 'Las Plagas', 1, '', '', 'Boulder', '15', 20300], ['2011-08-06', 'Uroboros', 1, '', '', 'Boulder', '10', 20010], ['2011-08-06', 'Poop Chute Arete', 1, '', '', 'Boulder', '12', 20008], ['2011-08-06', 'Teenage Direct', 1, '', '', 'Boulder', '8', 20200], ['2011-08-06', 'Yard Sit', 1, '', '', 'Boulder', '8', 20300], ['2011-07-24', 'River Chimps', 1, '', '', 'Sport', '30', 2600], ['2011-07-21', 'UFO', 1, '', '', 'Boulder', '15', 20400], ['2011-07-20', 'Free At Last', 1, '', '', 'Boulder', '15', 20008], ['2011-07-17', 'Confused Arete', 1, '', '', 'Boulder', '20', 20005], ['2011-07-17', 'Tall Cool Blue One', 1, '', '', 'Boulder', '25', 20008], ['2011-07-17', 'Mission Impossible', 1, '', '', 'Boulder', '15', 20075], ['2011-07-17', 'Tomcat', 1, '', '', 'Boulder', '15', 20008], ['2011-07-17', 'Mission Direct', 1, '', '', 'Boulder', '10', 20010], ['2011-07-17', 'Mission Enough', 1, '', '', 'Boulder', '15', 20008], ['2011-07-13', "PeeWee's", 1, '', '', 'TR', '40', 3100], ['2011-07-10', 'Bisector', 1, '', '', 'Sport, TR', '', 2600], ['2011-07-09', 'I Never Called You a Beast', 1, '', '', 'Sport', '20', 1600], ['2011-07-09', 'Maggie\x92s Farm', 1, '', '', 'Sport', '20', 1600], ['2011-07-09', 'Zoe\x92s First Step', 1, '', '', 'Sport', '20', 2100], ['2011-07-03', '"Just Dyno To The Top!"', 1, '', '', 'Boulder', '12', 20100], ['2011-07-02', 'I Sharted', 1, '', '', 'Boulder', '10', 20210], ['2011-07-02', 'Rape Alley', 1, '', '', 'Boulder', '12', 20008], ['2011-07-02', 'Mary K', 1, '', '', 'Boulder', '12', 20010], ['2011-07-02', 'Pond Sex', 1, '', '', 'Boulder', '10', 20008], ['2011-07-02', 'Daycare', 1, '', '', 'Boulder', '5', 20075], ['2011-06-26', 'Social Feedback', 1, '', '', 'Boulder', '10', 20200], ['2011-06-26', 'You Want A Piece Of Me', 1, '', '', 'Boulder', '8', 20010], ['2011-06-26', 'Wahrer Of The Worlds', 1, '', '', 'Boulder', '14', 20300], ['2011-06-25', "Jumpin' Hump", 1, '', '', 'Boulder', '10', 20008], ['2011-06-25', "Home Is Wherever I'm With You", 1, '', '', 'Boulder', '20', 20100], ['2011-06-25', 'Pond Sex', 1, '', '', 'Boulder', '10', 20008], ['2011-06-25', 'Honor and Obligation', 1, '', '', 'Boulder', '12', 20270], ['2011-06-25', 'Mary K', 1, '', '', 'Boulder', '12', 20010], ['2011-06-25', 'Mary K', 1, '', '', 'Boulder', '12', 20010], ['2011-06-25', 'Right around the "EYE"', 1, '', '', 'Boulder', '10', 20008], ['2011-06-25', 'Flying Irishman', 1, '', '', 'Boulder', '12', 20100], ['2011-06-19', 'Butt Rock', 1, '', '', 'Boulder', '10', 20200], ['2011-06-19', 'Pond Sex', 1, '', '', 'Boulder', '10', 20008], ['2011-06-19', 'Loose Dog', 1, '', '', 'Boulder', '10', 20008], ['2011-06-19', 'Mary K', 1, '', '', 'Boulder', '12', 20010], ['2011-06-19', 'Happy Birthday', 1, '', '', 'Boulder', '12', 20008], ['2011-06-19', '187', 1, '', '', 'Boulder', '12', 20075], ['2011-06-18', 'Still Dre', 1, '', '', 'Boulder', '14', 20300], ['2011-06-18', '187', 1, '', '', 'Boulder', '12', 20075], ['2011-06-18', 'Snoop Scoop', 1, '', '', 'Boulder', '10', 20008], ['2011-06-18', 'A Wing And A Prayer', 1, '', '', 'Boulder', '10', 20100], ['2011-06-18', 'The Long Wave', 1, '', '', 'Boulder', '10', 20010], ['2011-06-18', 'The Screamer', 1, '', '', 'Boulder', '6', 20008], ['2011-06-18', 'Heathen In A Handbasket', 1, '', '', 'Boulder', '8', 20200], ['2011-06-12', 'Grendel', 1, '', '', 'Sport', '30', 2400], ['2011-06-12', 'Crawling Chaos', 1, '', '', 'Sport', '30', 2600], ['2011-06-04', '4T (Tufa Tufa Tufa Traverse)', 1, '', '', 'Boulder', '60', 20100], ['2011-06-04', 'Afterburn LS', 1, '', '', 'Boulder', '12', 20100], ['2011-06-04', 'V Seventeen', 1, '', '', 'Boulder', '10', 20008], ['2011-06-04', 'Guy Smiley', 1, '', '', 'Boulder', '12', 20100], ['2011-06-04', 'Main Wall Unknown 2', 1, '', '', 'Boulder', '12', 20075], ['2011-06-04', 'Main Wall Unknown 1', 1, '', '', 'Boulder', '12', 20075], ['2011-05-30', 'Full Of Moxy', 1, '', '', 'Boulder', '10', 20310], ['2011-05-30', 'Fungus Among Us', 1, '', '', 'Boulder', '10', 20200], ['2011-05-30', 'Superstition', 1, '', '', 'Boulder', '10', 20200], ['2011-05-30', 'Slab Shot', 1, '', '', 'Boulder', '', 20100], ['2011-05-28', 'Idiot Free America', 1, '', '', 'Boulder', '15', 20170], ['2011-05-28', 'Craw Magnen', 1, '', '', 'Boulder', '10', 20410], ['2011-05-28', 'V Seventeen Dyno Variation', 1, '', '', 'Boulder', '10', 20300], ['2011-05-28', 'V Seventeen', 1, '', '', 'Boulder', '10', 20008], ['2011-05-21', 'Secret  Nemesis', 1, '', '', 'Boulder', '', 20300], ['2011-05-14', 'Pumper Number 9', 1, '', '', 'Trad', '25', 2500], ['2011-05-14', 'The Squirts Wall', 1, '', '', 'Boulder', '15', 20050], ['2011-05-14', 'The Squirts Wall', 1, '', '', 'Boulder', '15', 20050], ['2011-05-14', 'Purina', 1, '', '', 'Aid', '30', 0], ['2011-05-14', 'Top Choice', 1, '', '', 'Trad, TR', '30', 2700], ['2011-05-07', 'Miriams', 1, '', '', 'Boulder', '12', 20110], ['2011-05-07', 'Simmer Down', 1, '', '', 'Boulder', '10', 20300], ['2011-05-07', 'The Board Walk', 1, '', '', 'Boulder', '20', 20100], ['2011-04-30', 'Pedro, Paddle Harder!', 1, '', '', 'Sport', '30', 2900], ['2011-04-30', 'Pocket Protector', 1, '', '', 'Sport', '30', 1600], ['2011-04-23', 'Jug Crack', 1, '', '', 'Sport', '35', 2100], ['2011-04-23', "Nikki's Flake", 1, '', '', 'Sport', '30', 2600], ['2011-04-17', "Gettin' High", 1, '', '', 'Sport', '100', 2100], ['2011-04-17', "Nikki's Flake", 1, '', '', 'Sport', '30', 2600], ['2011-04-16', 'Got a Dollar?', 1, '', '', 'Sport', '', 1800], ['2011-04-15', 'Maggie\x92s Farm', 1, '', '', 'Sport', '20', 1600], ['2011-04-15', 'I Never Called You a Beast', 1, '', '', 'Sport', '20', 1600], ['2011-04-15', 'Deviance (aka 5.10 roof)', 1, '', '', 'Sport', '50', 2600], ['2011-04-15', 'Eight Flake', 1, '', '', 'Sport', '', 2100], ['2011-04-15', 'Prototype', 1, '', '', 'Sport', '', 3200], ['2011-03-25', 'Nemesis', 1, '', '', 'Boulder', '15', 20010], ['2011-03-19', 'Que Lindo', 1, '', '', 'Boulder', '15', 20100], ['2011-03-12', 'Que Lindo', 1, '', '', 'Boulder', '15', 20100], ['2011-03-05', 'Unknown Left Overhang', 1, '', '', 'Boulder', '25', 20100], ['2011-03-05', 'Mrs. Potatohead', 1, '', '', 'Boulder', '8', 20100], ['2011-03-05', 'Barnstormer', 1, '', '', 'Boulder', '15', 20100], ['2011-03-05', 'Pull the Pin', 1, '', '', 'Boulder', '', 20100], ['2011-03-05', 'In the Bucket of Parts', 1, '', '', 'Boulder', '18', 20200], ['2011-03-05', 'The Backscratcher', 1, '', '', 'Boulder', '', 20100], ['2011-03-04', 'Spud Boy', 1, '', '', 'Boulder', '10', 20100], ['2011-03-04', 'Eye Gouger', 1, '', '', 'Boulder', '8', 20005], ['2011-03-04', 'Woman Of Leisure', 1, '', '', 'Boulder', '15', 20100], ['2011-03-04', 'Nobody Here Gets Out Alive', 1, '', '', 'Boulder', '', 20200], ['2011-03-04', 'Nobody Here Gets Out Alive', 1, '', '', 'Boulder', '', 20200], ['2011-03-03', '7-10 Split', 1, '', '', 'Boulder', '15', 20008], ['2011-03-03', 'Wonderhole', 1, '', '', 'Boulder', '10', 20100], ['2011-03-03', 'The Melon Patch', 1, '', '', 'Boulder', '', 20008], ['2011-03-03', 'Split Crack', 1, '', '', 'Boulder', '20', 20008], ['2011-03-02', 'Picnic Jugs', 1, '', '', 'Boulder', '25', 20005], ['2011-03-02', 'T-Bone Shuffle', 1, '', '', 'Boulder', '', 20400], ['2011-03-02', 'Name Dropper', 1, '', '', 'Boulder', '', 20300], ['2011-02-19', 'Walk In The High Country', 5, '', '', 'Sport', '500', 2100], ['2011-02-19', 'Sugar Cone', 1, '', '', 'Boulder', '15', 20300], ['2011-02-12', 'Crying Over Spilt Milk', 1, '', '', 'Boulder', '15', 20110], ['2011-02-12', 'Lactose Intolerant', 1, '', '', 'Boulder', '8', 20400], ['2011-02-06', 'A Wing And A Prayer', 1, '', '', 'Boulder', '10', 20100], ['2011-02-06', 'The Screamer', 1, '', '', 'Boulder', '6', 20008], ['2011-02-05', 'Baby Saucer Direct', 1, '', '', 'Boulder', '6', 20010], ['2011-02-05', 'Sol Worship', 1, '', '', 'Boulder', '9', 20100], ['2011-01-30', 'Dirty Deed', 1, '', '', 'Trad', '20', 1900], ['2011-01-30', 'Clingwrap', 1, '', '', 'Trad', '25', 2000], ['2011-01-29', 'Easier Than It Looks', 3, '', '', 'Trad', '300', 1500], ['2011-01-29', 'Hang On Motherfucker!', 1, '', '', 'Trad', '30', 1800], ['2011-01-29', 'Amazon Boulder', 1, '', '', 'Sport', '25', 2900], ['2011-01-29', 'South American Crack', 1, '', '', 'Trad', '30', 2200], ['2011-01-22', 'Rotten Corner', 1, '', '', 'Trad', '50', 2200], ['2011-01-22', 'Not Bad For A Fat Guy', 1, '', '', 'Boulder', '8', 20200], ['2011-01-22', 'Goats Can Climb This', 1, '', '', 'Boulder', '15', 20010], ['2011-01-22', 'Hollow Man', 1, '', '', 'Boulder', '12', 20010], ['2011-01-22', 'Eiger Sanction', 1, '', '', 'Boulder', '10', 20008], ['2011-01-18', 'The Truth Is Out There', 1, '', '', 'Boulder', '10', 20010], ['2011-01-18', 'A Wing And A Prayer', 1, '', '', 'Boulder', '10', 20100], ['2011-01-08', 'Baby Saucer Traverse', 1, '', '', 'Boulder', '15', 20010], ['2011-01-08', 'Just Say Yes To Drugs', 1, '', '', 'Boulder', '8', 20010], ['2011-01-08', 'Wanna Throw Up?', 1, '', '', 'Boulder', '8', 20100], ['2011-01-08', "They Don't Get Much Easier Than This", 1, '', '', 'Boulder', '8', 20008], ['2011-01-08', 'Baby Saucer Direct', 1, '', '', 'Boulder', '6', 20010], ['2011-01-08', 'One Man Down and a Hole in the Ground', 1, '', '', 'Boulder', '8', 20010], ['2011-01-08', 'Some Days Are Better Than Others', 1, '', '', 'Boulder', '8', 20008], ['2011-01-01', 'Icy Touch of a Dimensional Shambler', 1, '', '', 'Sport', '30', 2900], ['2010-12-28', 'Easier Than It Looks', 3, '', '', 'Trad', '300', 1500], ['2010-12-27', 'Sweat', 1, '', '', 'Trad', '', 1800], ['2010-12-27', 'Jack Knife', 1, '', '', 'Trad', '', 1500], ['2010-12-18', 'The Scream', 1, '', '', 'Boulder', '15', 20200], ['2010-12-18', 'Abase', 1, '', '', 'Boulder', '15', 20300], ['2010-12-17', 'Yukon Cornelius', 1, '', '', 'Boulder', '7', 20005], ['2010-12-17', 'The Long Wave', 1, '', '', 'Boulder', '10', 20010], ['2010-12-17', 'The eyebrow', 1, '', '', 'Boulder', '11', 20300], ['2010-12-11', "Hastur's Insanity", 1, '', '', 'Sport', '50', 3500], ['2010-12-11', "Balrog's S&M Whip", 1, '', '', 'Sport', '30', 3200], ['2010-12-10', 'Like A G6', 1, '', '', 'Boulder', '8', 20100], ['2010-12-10', 'The Screamer', 1, '', '', 'Boulder', '6', 20008], ['2010-12-10', 'Wanksters Make The World Go Round', 1, '', '', 'Boulder', '8', 20100], ['2010-12-10', 'Heathen In A Handbasket', 1, '', '', 'Boulder', '8', 20200], ['2010-12-08', 'Finger Crack', 1, '', '', 'Boulder', '15', 20008], ['2010-12-08', 'Vile Betrayer', 1, '', '', 'Boulder', '20', 20200], ['2010-12-08', 'The Chin', 1, '', '', 'Boulder', '12', 20008], ['2010-12-08', 'Bozo', 1, '', '', 'Boulder', '10', 20150], ['2010-12-08', 'Jaws', 1, '', '', 'Boulder', '10', 20150], ['2010-12-04', 'Flathead Direct', 1, '', '', 'Boulder', '10', 20005], ['2010-12-04', 'Layback Flake 101', 1, '', '', 'Boulder', '20', 20005], ['2010-11-28', 'Nyarlathotep Arises From The Blackness Of 27 Centuries', 1, '', '', 'Sport', '35', 4900], ['2010-11-27', 'Green Slime vs. Bag Of Devouring', 1, '', '', 'Sport', '40', 2900], ['2010-11-27', 'Freddie vs. Jason', 1, '', '', 'Sport', '25', 2600], ['2010-11-26', 'Zilchlessness', 1, '', '', 'Boulder', '20', 20008], ['2010-11-26', 'Chimney Crack', 1, '', '', 'Trad', '40', 1600], ['2010-11-26', 'Will All The Real Spray Lords Please Stand Up', 1, '', '', 'Boulder', '10', 20100], ['2010-11-26', 'A Swimming Pool With No Bodies', 1, '', '', 'Boulder', '7', 20110], ['2010-11-26', 'Skull Fracture', 1, '', '', 'Boulder', '10', 20075], ['2010-11-20', 'Trollkind', 1, '', '', 'Sport', '20', 2500], ['2010-11-14', 'All Embracing', 1, '', '', 'Boulder', '10', 20008], ['2010-11-14', 'Will All The Real Spray Lords Please Stand Up', 1, '', '', 'Boulder', '10', 20100], ['2010-11-14', 'Chimney Crack', 1, '', '', 'Trad', '40', 1600], ['2010-11-14', 'Skull Fracture', 1, '', '', 'Boulder', '10', 20075], ['2010-11-14', 'Stress Fracture', 1, '', '', 'Boulder', '15', 20100], ['2010-11-14', "Don't Void Your Pants", 1, '', '', 'Boulder', '20', 20075], ['2010-11-07', 'Walk In The High Country', 5, '', '', 'Sport', '500', 2100], ['2010-10-30', 'Easier Than It Looks', 3, '', '', 'Trad', '300', 1500], ['2010-10-30', 'Pumper Number 9', 1, '', '', 'Trad', '25', 2500], ['2010-10-27', 'Smorgasbord', 1, '', '', 'Trad', '', 1600], ['2010-10-27', 'Texas Flakes', 1, '', '', 'Trad', '', 1400], ['2010-10-24', 'Herman Munster', 1, '', '', 'Sport', '30', 2400], ['2010-10-17', 'Sky Full of Dementors', 1, '', '', 'Sport', '30', 2500], ['2010-10-17', 'Invisible Slayer of the Mad Arab Abdul Alhazrad', 1, '', '', 'Sport', '40', 4600], ['2010-10-10', 'Miriams', 1, '', '', 'Boulder', '12', 20110], ['2010-10-10', 'Afterburn LS', 1, '', '', 'Boulder', '12', 20100], ['2010-10-03', 'Fight Crack', 1, '', '', 'Boulder', '12', 20300], ['2010-09-26', 'Sweat', 1, '', '', 'Trad', '', 1800], ['2010-09-26', 'No Sweat', 1, '', '', 'Trad', '', 1400], ['2010-09-26', 'Mystery and Imagination', 1, '', '', 'Sport', '60', 2100], ['2010-09-18', 'Harder Than it Looks', 1, '', '', 'Sport', '', 1600], ['2010-09-18', 'Texas Flakes', 1, '', '', 'Trad', '', 1400], ['2010-09-11', "Ben's Dilemma", 1, '', '', 'Trad, TR', '35', 2400], ['2010-09-04', 'Serpentine Traverse', 1, '', '', 'Boulder', '20', 20300], ['2010-09-04', 'Finger Crack', 1, '', '', 'Boulder', '15', 20008], ['2010-08-28', 'Brown Eyed Girl', 1, '', '', 'Sport', '70', 2600], ['2010-08-28', 'Boilerplate', 1, '', '', 'Sport', '50', 2100], ['2010-08-27', 'Eureka', 1, '', '', 'Sport', '70', 1600], ['2010-08-27', 'The Arrowhead', 1, '', '', 'Trad', '60', 1800], ['2010-08-15', 'Blue', 1, '', '', 'TR', '25', 1800], ['2010-08-14', 'Johnny B. Good', 1, '', '', 'Sport', '80', 4600], ['2010-08-14', '27 Years of Climbing', 1, '', '', 'Sport', '65', 2100], ['2010-08-14', 'Lucky Duck Soup', 1, '', '', 'Sport', '50', 1500], ['2010-08-14', 'The Perfect Pint', 1, '', '', 'Trad', '45', 1400], ['2010-08-07', 'Full Cavity Search', 1, '', '', 'Trad', '60', 2100], ['2010-08-07', 'High Anxiety', 1, '', '', 'Trad', '75', 1800], ['2010-08-07', 'Red Wine', 1, '', '', 'Trad', '25', 2100], ['2010-07-24', "Herbert West's Weird Instruments", 1, '', '', 'Sport', '35', 2600], ['2010-07-24', 'Sand Worms Shake The Planet', 1, '', '', 'Sport', '30', 2500], ['2010-07-17', "Beginner's Bitch", 1, '', '', 'Trad', '', 1900], ['2010-07-17', 'Middle Crack', 1, '', '', 'Trad', '', 2100], ['2010-07-17', "Bastard's Moan", 1, '', '', 'Trad', '', 1800], ['2010-07-10', 'Lunch Rock Direct', 1, '', '', 'Boulder', '25', 20100], ['2010-06-26', 'Jack Knife', 1, '', '', 'Trad', '', 1500], ['2010-06-26', 'Hard Hands', 1, '', '', 'Trad', '30', 2600], ['2010-06-26', 'Orient Express', 1, '', '', 'Sport', '', 2400], ['2010-06-17', 'Texas Is The Reason For The Season', 1, '', '', 'Boulder', '10', 20100], ['2010-06-17', 'Teenage Drama', 1, '', '', 'Boulder', '8', 20075], ['2010-06-06', 'Abash', 1, '', '', 'Boulder', '15', 20300], ['2010-06-05', 'Sidewinder', 1, '', '', 'Sport', '30', 3200], ['2010-06-03', 'Mark of the Beast', 3, '', '', 'Sport', '', 2200], ['2010-05-09', 'Diagonal Crack', 1, '', '', 'Sport', '40', 1800], ['2010-05-09', 'Gravity Sac Traverse', 1, '', '', 'Sport', '40', 2900], ['2010-05-08', 'Tall Cool Blue One', 1, '', '', 'Boulder', '25', 20008], ['2010-04-03', 'Creeping Doom', 1, '', '', 'Sport', '30', 2100], ['2010-04-03', 'Trollkind', 1, '', '', 'Sport', '20', 2500], ['2010-03-28', '5.10 Layback', 1, '', '', 'TR', '35', 2700], ['2010-02-27', 'Milk Jugs', 1, '', '', 'Boulder', '10', 20200], ['2010-02-13', 'Saguaro', 1, '', '', 'Boulder', '15', 20010], ['2010-02-13', 'Idaho', 1, '', '', 'Boulder', '12', 20200], ['2010-02-05', 'Begin With The Beginning', 1, '', '', 'Boulder', '10', 20010], ['2010-02-05', 'Layback Flake 101', 1, '', '', 'Boulder', '20', 20005], ['2010-02-02', 'Name Dropper', 1, '', '', 'Boulder', '', 20300], ['2010-02-01', 'Thunderbird', 1, '', '', 'Boulder', '15', 20110], ['2010-01-31', 'The Nock', 1, '', '', 'Sport', '25', 2100], ['2010-01-31', 'Star Fighter', 1, '', '', 'Sport', '25', 2600], ['2010-01-23', 'Udderly Fantastic', 1, '', '', 'Boulder', '8', 20200], ['2010-01-23', 'Zanzibar', 1, '', '', 'Boulder', '', 20210], ['2010-01-10', 'Turkey Hooks', 1, '', '', 'Sport', '', 2100], ['2010-01-10', 'Butter Ball', 1, '', '', 'Sport', '', 2100], ['2010-01-01', 'Eight Flake', 1, '', '', 'Sport', '', 2100], ['2009-12-27', "Fat Chicks Tryin' to Be Sexy", 1, '', '', 'Sport', '', 2600], ['2009-12-27', 'Go For the Jugular', 1, '', '', 'Sport', '35', 2600], ['2009-12-27', 'Got a Dollar?', 1, '', '', 'Sport', '', 1800], ['2009-12-27', 'Crack Ate the Pipe', 1, '', '', 'Sport', '', 2100], ['2009-12-27', 'Annie Up', 1, '', '', 'Sport', '', 1600], ['2009-12-26', 'Grendel', 1, '', '', 'Sport', '30', 2400], ['2009-12-26', 'Icy Touch of a Dimensional Shambler', 1, '', '', 'Sport', '30', 2900], ['2009-12-20', 'Miriams', 1, '', '', 'Boulder', '12', 20110], ['2009-12-19', 'Afterburn LS', 1, '', '', 'Boulder', '12', 20100], ['2009-11-28', 'Bed Rock', 1, '', '', 'TR', '', 1800], ['2009-11-27', 'Taco Time', 1, '', '', 'Sport, TR', '', 1600], ['2009-11-26', 'High Anxiety', 1, '', '', 'Trad', '75', 1800], ['2009-11-26', 'Mr. Clean', 1, '', '', 'Trad', '65', 2100], ['2009-11-22', 'Thin Crack', 1, '', '', 'TR', '35', 3000], ['2009-11-15', '22-Eyed Beholder Hovering Near By', 1, '', '', 'Sport', '25', 2400], ['2009-11-15', 'Warg Riders', 1, '', '', 'Sport', '40', 2100], ['2009-11-08', 'High Anxiety', 1, '', '', 'Trad', '75', 1800], ['2009-11-07', 'Foolish', 1, '', '', 'Trad', '', 1800], ['2009-11-07', 'Worm Hole', 1, '', '', 'Sport', '70', 2100], ['2009-11-07', 'Crack Pipe', 1, '', '', 'Trad', '70', 2400], ['2009-11-01', "Beginner's Bitch", 1, '', '', 'Trad', '', 1900], ['2009-11-01', "Bastard's Moan", 1, '', '', 'Trad', '', 1800], ['2009-11-01', 'Milk Jugs', 1, '', '', 'Boulder', '10', 20200], ['2009-09-27', 'V0 aka Crack 1', 1, '', '', 'Boulder', '20', 20005], ['2009-09-27', 'Galley Center', 1, '', '', 'Boulder', '', 20100], ['2009-09-21', "Karen's Problem", 1, '', '', 'Boulder', '12', 20008], ['2009-09-02', 'Bass Boomer', 1, '', '', 'Boulder', '5', 20075], ['2009-08-31', 'Loose Dog', 1, '', '', 'Boulder', '10', 20008], ['2009-08-31', 'Daycare', 1, '', '', 'Boulder', '5', 20075], ['2009-08-28', 'Eye Of The Cyclops', 1, '', '', 'Boulder', '12', 20010], ['2009-08-28', 'Happy Birthday', 1, '', '', 'Boulder', '12', 20008], ['2009-08-26', 'Mary K', 1, '', '', 'Boulder', '12', 20010], ['2009-08-21', 'The Long Wave', 1, '', '', 'Boulder', '10', 20010], ['2009-08-21', 'A Wing And A Prayer', 1, '', '', 'Boulder', '10', 20100], ['2009-08-15', 'Guy Smiley', 1, '', '', 'Boulder', '12', 20100], ['2009-08-15', "I'm Lichen This", 1, '', '', 'Boulder', '15', 20008], ['2009-07-06', 'The Screamer', 1, '', '', 'Boulder', '6', 20008]]
@@ -1,8 +1,223 @@
+import gzip
+import json
+import re
+import time
+from unittest import mock
+
 import pytest
 
+from ..benchmarks.fake_mp import start_server
+from ..helpers.metrics import metrics
+from ..helpers.mountain_project import CachedResponse
+
 
 def test_index(app: pytest.fixture) -> None:
     """Assert that a status code of 200 is returned from /"""
     with app.test_client() as client:
         index = client.get('/')
         assert index.status == '200 OK'
+
+
+def test_data_in_process(app: pytest.fixture) -> None:
+    """Assert the test account page renders from the tick list alone with the pandas engine."""
+    app.config["ANALYTICS_ENGINE"] = "pandas"
+    app.config["DB_PERSIST_TICKS"] = False
+    with app.test_client() as client:
+        data = client.post('/data', data={"test": "yes"})
+        assert data.status == '200 OK'
+        assert "Dev's Stats" in data.data.decode()
+        assert "Sport Grades By Year" in data.data.decode()
+
+
+def test_pool_status(app: pytest.fixture) -> None:
+    """Assert pool usage is reported as JSON."""
+    with app.test_client() as client:
+        status = client.get('/status/pool')
+        assert status.status == '200 OK'
+        assert "pools" in status.get_json()
+
+
+def test_data_graph_cache(app: pytest.fixture, monkeypatch: pytest.fixture) -> None:
+    """Assert an unchanged tick list is served from the graph cache without drawing figures."""
+    app.config["ANALYTICS_ENGINE"] = "pandas"
+    app.config["DB_PERSIST_TICKS"] = False
+    app.config["GRAPH_CACHE"] = "memory"
+    with app.test_client() as client:
+        first = client.post('/data', data={"test": "yes"})
+
+        def fail(*args, **kwargs):
+            raise AssertionError("graphs were redrawn")
+        monkeypatch.setattr("app.pipeline.draw_graphs", fail)
+        second = client.post('/data', data={"test": "yes"})
+        assert second.status == '200 OK'
+        assert second.data == first.data
+
+
+def test_data_streamed(app: pytest.fixture) -> None:
+    """Assert parsing the tick list in chunks renders the same page as parsing it whole."""
+    app.config["ANALYTICS_ENGINE"] = "pandas"
+    app.config["DB_PERSIST_TICKS"] = False
+    with app.test_client() as client:
+        whole = client.post('/data', data={"test": "yes"})
+        app.config["TICK_CHUNK_SIZE"] = 100
+        streamed = client.post('/data', data={"test": "yes"})
+        assert streamed.status == '200 OK'
+        # Bokeh gives every figure fresh ids, so compare the totals and graph titles instead
+        total = re.compile(rb"<h4>Total:.*?</h4>", re.S)
+        assert total.search(streamed.data).group() == total.search(whole.data).group()
+        assert re.findall(rb"\w+ Grades By Year", streamed.data) == re.findall(rb"\w+ Grades By Year", whole.data)
+
+
+def test_data_job_mode(app: pytest.fixture, tmp_path: pytest.fixture) -> None:
+    """Assert job mode redirects to a poll page and collapses repeat requests into one job."""
+    app.config["ANALYTICS_ENGINE"] = "pandas"
+    app.config["DB_PERSIST_TICKS"] = False
+    app.config["JOB_MODE"] = True
+    app.config["CACHE_DIR"] = str(tmp_path)
+    app.config["TEST_ACCT"] = "demo@example.com"
+    with app.test_client() as client:
+        first = client.post('/data', data={"test": "yes"})
+        second = client.post('/data', data={"test": "yes"})
+        assert first.status == '303 SEE OTHER'
+        assert first.headers["Location"] == second.headers["Location"]
+        job_id = first.headers["Location"].split("job=")[1]
+
+        for _ in range(100):
+            status = client.get('/status/job/' + job_id).get_json()
+            if status["status"] not in ("queued", "running"):
+                break
+            time.sleep(0.1)
+        assert status["status"] == "done"
+        page = client.get(first.headers["Location"])
+        assert page.status == '200 OK'
+        assert "Dev's Stats" in page.data.decode()
+        assert client.get('/data?job=unknown').status == '404 NOT FOUND'
+    # The job database never holds the email itself
+    assert b"demo@example.com" not in (tmp_path / "jobs.sqlite3").read_bytes()
+
+
+def test_metrics(app: pytest.fixture, tmp_path: pytest.fixture) -> None:
+    """Assert /data reports stage timings and /metrics adds up every worker's files."""
+    app.config["ANALYTICS_ENGINE"] = "pandas"
+    app.config["DB_PERSIST_TICKS"] = False
+    app.config["METRICS_DIR"] = str(tmp_path)
+    with app.test_client() as client:
+        data = client.post('/data', data={"test": "yes"})
+        timing = data.headers["Server-Timing"]
+        for stage in ("fetch_user", "parse_tick_list", "grade_scatter", "render_template"):
+            assert stage + ";dur=" in timing
+
+        # Another worker's series are added to this one's
+        own = [value for name, labels, value in metrics.snapshot()["counters"]
+               if name == "mpv_requests_total" and ("endpoint", "/data") in labels
+               and ("status", "200") in labels][0]
+        (tmp_path / "1.json").write_text(
+            '{"counters": [["mpv_requests_total", [["endpoint", "/data"], ["status", "200"]], 2]],'
+            ' "histograms": []}')
+        exported = client.get('/metrics').data.decode()
+        assert 'mpv_stage_seconds_count{stage="parse_tick_list"}' in exported
+        assert 'mpv_requests_total{endpoint="/data",status="200"} %r' % (own + 2,) in exported
+
+
+def test_data_sqlite(app: pytest.fixture, tmp_path: pytest.fixture) -> None:
+    """Assert the SQL stats on an embedded SQLite database draw the same page as the pandas engine."""
+    app.config["MPV_DEV"] = False
+    app.config["STORAGE_ENGINE"] = "sqlite"
+    app.config["SQLITE_PATH"] = str(tmp_path / "mpv.sqlite3")
+    with app.test_client() as client:
+        with open("test_ticks.csv", "rb") as ticks:
+            export = ticks.read()
+        user = b'{"id": 1111, "name": "Dev"}'
+
+        class Session:
+            def get(self, url, **kwargs):
+                return CachedResponse(200, user if url.endswith("get-user") else export, {})
+        with mock.patch("app.pipeline.get_session", return_value=Session()):
+            stored = client.post('/data', data={"test": "yes"})
+            app.config["ANALYTICS_ENGINE"] = "pandas"
+            in_process = client.post('/data', data={"test": "yes"})
+        assert stored.status == '200 OK'
+        total = re.compile(rb"<h4>Total:.*?</h4>", re.S)
+        assert total.search(stored.data).group() == total.search(in_process.data).group()
+        # The engines list the types in different orders
+        assert sorted(re.findall(rb"\w+ Grades By Year", stored.data)) == \
+            sorted(re.findall(rb"\w+ Grades By Year", in_process.data))
+
+
+def test_api_stats(app: pytest.fixture) -> None:
+    """Assert the stats API matches the page totals, compresses on request and honours the ETag."""
+    app.config["ANALYTICS_ENGINE"] = "pandas"
+    app.config["DB_PERSIST_TICKS"] = False
+    with app.test_client() as client:
+        plain = client.post('/api/stats', data={"test": "yes"})
+        assert plain.status == '200 OK'
+        stats = plain.get_json()
+        assert stats["user"] == "Dev"
+        assert len(stats["years"]["year"]) == len(stats["years"]["height"])
+        sport = stats["grades"]["Sport"]
+        assert len(sport["year"]) == len(sport["grade"]) == len(sport["count"])
+        assert max(sport["grade"]) < len(sport["axis"])
+
+        page = client.post('/data', data={"test": "yes"}).data.decode()
+        assert "{:,d} feet".format(stats["total_height"]) in page
+
+        packed = client.post('/api/stats', data={"test": "yes"}, headers={"Accept-Encoding": "gzip"})
+        assert packed.headers["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(packed.data)) == stats
+        again = client.post('/api/stats', data={"test": "yes"},
+                            headers={"If-None-Match": plain.headers["ETag"]})
+        assert again.status == '304 NOT MODIFIED' and again.headers["ETag"] == plain.headers["ETag"]
+        assert client.get('/api/stats?test=yes').status == '405 METHOD NOT ALLOWED'
+        assert client.post('/api/stats', data={"email": "nope"}).status == '422 UNPROCESSABLE ENTITY'
+
+
+def test_filters(app: pytest.fixture) -> None:
+    """Assert the date, type and style filters narrow the stats on /data and the stats API."""
+    app.config["ANALYTICS_ENGINE"] = "pandas"
+    app.config["DB_PERSIST_TICKS"] = False
+    with app.test_client() as client:
+        everything = client.post('/api/stats', data={"test": "yes"}).get_json()
+        stats = client.post('/api/stats', data={"test": "yes", "type": "Sport", "style": "Lead",
+                                                 "start": "2019-01-01", "end": "2019-12-31"})
+        assert stats.status == '200 OK'
+        stats = stats.get_json()
+        assert stats["filter"] == {"start": "2019-01-01", "end": "2019-12-31", "type": "Sport", "style": "Lead"}
+        assert list(stats["grades"]) == ["Sport"] and set(stats["grades"]["Sport"]["year"]) == {2019}
+        assert stats["years"]["year"] == [2019]
+        assert 0 < stats["years"]["routes"][0] < everything["years"]["routes"][everything["years"]["year"].index(2019)]
+
+        page = client.post('/data', data={"test": "yes", "type": "Sport", "start": "2015-01-01"})
+        assert page.status == '200 OK'
+        assert b"Sport ticks" in page.data and b"Trad Grades By Year" not in page.data
+
+        assert client.post('/api/stats', data={"test": "yes", "type": "Walking"}).status == '422 UNPROCESSABLE ENTITY'
+        reversed_dates = client.post('/data', data={"test": "yes", "start": "2016-01-01", "end": "2015-01-01"})
+        assert reversed_dates.status == '422 UNPROCESSABLE ENTITY'
+
+
+def test_data_rate_limit(app: pytest.fixture, tmp_path: pytest.fixture) -> None:
+    """Assert an email fetched from Mountain Project too often is turned away with a Retry-After header."""
+    server = start_server(users=5, min_ticks=20, max_ticks=40)
+    app.config.update(MPV_DEV=False, MP_BASE_URL=server.url, MP_CACHE="memory", CACHE_DIR=str(tmp_path),
+                      ANALYTICS_ENGINE="pandas", DB_PERSIST_TICKS=False, WTF_CSRF_ENABLED=False,
+                      RATE_LIMIT=1, TEST_ACCT="demo@example.com")
+    form = {"email": "climber@example.com", "units": "feet"}
+    try:
+        with app.test_client() as client:
+            assert client.post('/data', data=form).status == '200 OK'
+            # Served from the Mountain Project cache, so not counted
+            assert client.post('/data', data=dict(form, units="meters")).status == '200 OK'
+            assert server.counts == {"get_user": 1, "tick_export": 1}
+            app.config["MP_CACHE"] = None
+            limited = client.post('/data', data=form)
+            assert limited.status == '429 TOO MANY REQUESTS'
+            assert 0 < int(limited.headers["Retry-After"]) <= 60
+            limited = client.post('/api/stats', data=form)
+            assert limited.status == '429 TOO MANY REQUESTS'
+            assert 0 < int(limited.headers["Retry-After"]) <= 60
+            # The demo link's account is shared by every visitor, so it is never limited
+            for _ in range(2):
+                assert client.post('/api/stats', data={"test": "yes"}).status == '200 OK'
+    finally:
+        server.shutdown()
+        server.server_close()
\ No newline at end of file
@@ -0,0 +1,81 @@
+import statistics
+from decimal import Decimal
+
+from _pytest.monkeypatch import MonkeyPatch
+
+from .test_data.mock_cursor import MockCursor
+from ..graphing import get_all_grade_data, get_year_stats, graph_cache_key, height_climbed, pitches_climbed, \
+    tick_digest
+from ..helpers.reference_data import ReferenceData
+
+
+class TestYearStats:
+    rows = [(2018, Decimal(475), Decimal(7), Decimal(5), Decimal(4), Decimal(2)),
+            (2019, Decimal(8), Decimal(1), None, Decimal(0), Decimal(1))]
+
+    def test_get_year_stats(self) -> None:
+        """Asserts every year comes from a single grouped query and is converted to ints."""
+        cursor = MockCursor(rows=self.rows)
+        stats = get_year_stats(cursor, 1234)
+        assert len(cursor.executed) == 1
+        assert "GROUP BY `year`" in cursor.executed[0][0]
+        assert "WHEN 'Trad' THEN 150" in cursor.executed[0][0]
+        assert stats == {"years": [2018, 2019], "height": [475, 8], "pitches": [5, 0],
+                         "routes": [4, 0], "problems": [2, 1], "total_pitches": 8}
+
+    def test_graphs_share_year_stats(self) -> None:
+        """Asserts the graphs don't query the database when handed the yearly totals."""
+        cursor = MockCursor()
+        stats = get_year_stats(MockCursor(rows=self.rows), 1234)
+        height = height_climbed(cursor, 1234, "meters", year_stats=stats)
+        pitches = pitches_climbed(cursor, 1234, year_stats=stats)
+        assert cursor.executed == []
+        assert height["total"] == "147"
+        assert pitches["total"] == 8
+        assert len(height["plot"]) == len(pitches["plot"]) == 2
+
+
+class TestGradeData:
+    codes = [(1000, "5.6"), (1500, "5.9"), (2000, "5.10a"), (2500, "5.10b"), (20000, "V0"), (20100, "V1")]
+    rows = [("Sport", 2018, 1000, 2), ("Sport", 2018, 2000, 2), ("Sport", 2018, 2500, 1),
+            ("Sport", 2019, 1500, 3), ("Boulder", 2019, 20000, 1), ("Boulder", 2019, 20100, 1)]
+
+    def test_one_query_for_all_types(self, monkeypatch: MonkeyPatch) -> None:
+        """Asserts one grouped query gives each type's grades, modes and medians."""
+        monkeypatch.setattr("app.graphing.get_reference_data", lambda cursor: ReferenceData({}, self.codes))
+        cursor = MockCursor(rows=self.rows)
+        stats = get_all_grade_data(cursor, 1234)
+        assert len(cursor.executed) == 1
+        assert "GROUP BY" in cursor.executed[0][0]
+        assert list(stats) == ["Sport", "Boulder"]
+
+        labels = dict(self.codes)
+        for type, data in stats.items():
+            ticks = [(year, code) for t, year, code, count in self.rows if t == type for _ in range(count)]
+            assert data["years"] == [year for year, _ in ticks]
+            assert data["grades"] == [labels[code] for _, code in ticks]
+            for i, year in enumerate(data["mode_years"]):
+                # Same results as the original per-year loop
+                year_codes = [code for y, code in ticks if y == year]
+                assert data["mode_values"][i] == labels[max(year_codes, key=year_codes.count)]
+                median = statistics.median(year_codes)
+                nearest = min(labels, key=lambda code: (abs(code - median), code))
+                assert data["mean_values"][i] == labels[nearest]
+        assert stats["Sport"]["axis"] == ["5.6", "5.9", "5.10a", "5.10b"]
+
+
+class TestGraphCacheKey:
+    def test_graph_cache_key(self) -> None:
+        """Asserts the key changes with the ticks and the units, and nothing else."""
+        ticks = [['2018-06-01', 'Sprayathon', 1, 'Lead', 'Redpoint', 'Sport', '', 9200]]
+        key = graph_cache_key(tick_digest(ticks), "feet")
+        assert key == graph_cache_key(tick_digest([list(ticks[0])]), "feet")
+        assert key != graph_cache_key(tick_digest(ticks), "meters")
+        assert key != graph_cache_key(tick_digest(ticks + ticks), "feet")
+
+    def test_tick_digest_running(self) -> None:
+        """Asserts folding ticks in chunks gives the same digest as all at once."""
+        ticks = [[i, "route"] for i in range(5)]
+        digest = tick_digest(ticks[:2])
+        tick_digest(ticks[2:], digest)
+        assert digest.hexdigest() == tick_digest(ticks).hexdigest()
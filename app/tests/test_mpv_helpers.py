@@ -1,22 +1,60 @@
+import datetime
+import io
+import sys
+import threading
+import time
 from typing import Dict
 
+import numpy as np
+import pandas as pd
 import pytest
 import requests
 from _pytest.monkeypatch import MonkeyPatch
-from mysql.connector import CMySQLConnection, MySQLConnection
+from mysql.connector import CMySQLConnection, Error, MySQLConnection
 
-from .test_data.mp_api_response import test_expected_data, test_processed_csv, test_ticks_response, test_user_data
+from .test_data.mock_cursor import MockCursor
+from .test_data.mp_api_response import test_expected_data, test_processed_csv, test_tick_columns, test_ticks_response, \
+    test_user_data
 from ..errors.exeptions import *
-from ..helpers.database_connection import db_connect, db_close
-from ..helpers.mountain_project import MountainProjectHandler
+from ..helpers.database_connection import ConnectionPool, PooledConnection, db_connect, db_close, db_load, get_pool, \
+    insert_batches, keyed_tick, normalize_tick, normalize_ticks, sync_ticks, tick_key, tick_source
+from .. import pipeline
+from ..analytics import TickSummary, grade_histogram, grade_stats, nearest_codes, prepare_ticks
+from ..graphing import get_all_grade_data, get_grades, get_summary_stats, get_types, get_year_stats
+from ..benchmarks.fake_mp import start_server
+from ..benchmarks.ticks import generate_export
+from ..benchmarks.load import percentile
+from ..helpers.mountain_project import JitteredRetry, MountainProjectHandler, get_session
+from ..helpers.reference_data import ReferenceData, clear_reference_data, get_reference_data
+from ..helpers.single_flight import RateLimiter, SingleFlight, rate_limit
+from ..helpers.storage import MYSQL, REFERENCE_VALUES, SQLITE, dialect, type_mask
+from ..helpers.summary import read_year_summary, refresh_summaries
+from ..helpers.tick_filter import TickFilter
+from ..pipeline import query_stats
+from ..setup import bulk_import
+from ..setup.bulk_import import ImportState, list_exports, run_import
+from ..startup import preload
 from app import create_app
 
 
+_PAIRS = {table: {value: i for i, value in enumerate(values, 1)}
+          for table, values in REFERENCE_VALUES.items()}
+
+
+def batch_keys(data) -> list:
+    """Get the tick_key of every tick in parsed batches, which db_load matches on."""
+    return [tick_key(tick) for tick in normalize_ticks(_PAIRS, data)]
+
+
+def row_keys(rows) -> list:
+    return [tick_key(normalize_tick(_PAIRS, row)) for row in rows]
+
+
 class TestDatabaseHelpers:
     def test_connect(self):
         """Asserts the database connection is made, closes and confirms closed connection."""
         app = create_app()  # Bypass app fixture. Root config settings are used instead of test config.
-        connection = db_connect(config=app.config)
+        connection = db_connect(config=dict(app.config, MYSQL_POOL_SIZE=0))
         assert not connection.autocommit
         assert connection.is_connected()
         assert isinstance(connection, (MySQLConnection, CMySQLConnection))
@@ -25,14 +63,555 @@ class TestDatabaseHelpers:
         db_close(cursor, connection)
         assert connection.is_connected() is False
 
+    def test_pooled_connect(self) -> None:
+        """Asserts a pooled connection is handed back to the pool still open, and borrowed again."""
+        app = create_app()  # Like test_connect, this needs the MySQL database set up with db_setup
+        config = dict(app.config, MYSQL_POOL_SIZE=1)
+        try:
+            connection = db_connect(config=config)
+        except DatabaseException:
+            pytest.skip("no MySQL server to test against")
+        assert isinstance(connection, PooledConnection)
+        assert not connection.autocommit
+        pool = get_pool(config)
+        in_use = pool.stats()["in_use"]
+        borrowed = connection._connection
+
+        cursor = connection.cursor()
+        db_close(cursor, connection)
+        assert pool.stats()["in_use"] == in_use - 1
+        assert borrowed.is_connected()
+
+        again = db_connect(config=config)
+        assert again._connection is borrowed
+        db_close(again.cursor(), again)
+
+    def test_multi_type_strict_mode(self) -> None:
+        """Asserts multi-type ticks are summarized under MySQL's strict sql_mode, without casting warnings."""
+        app = create_app()  # Like test_connect, this needs the MySQL database set up with db_setup
+        try:
+            connection = db_connect(config=dict(app.config, MYSQL_POOL_SIZE=0))
+        except DatabaseException:
+            pytest.skip("no MySQL server to test against")
+        cursor = connection.cursor()
+        try:
+            cursor.execute("SET SESSION sql_mode = 'STRICT_TRANS_TABLES,ERROR_FOR_DIVISION_BY_ZERO';")
+            cursor.execute(MYSQL.create_user_table.replace("CREATE TABLE", "CREATE TEMPORARY TABLE", 1) % (1,))
+            rows = [['2019-01-01', 'D', 1, 'Lead', '', 'Trad, Alpine', '', 2500],
+                    ['2019-01-02', 'E', 1, '', '', 'Boulder', '', 20050]]
+            insert_batches(cursor, 1, [keyed_tick(normalize_tick(_PAIRS, row)) for row in rows])
+            refresh_summaries(cursor, 1, *tick_source(1))
+            cursor.execute("SHOW WARNINGS;")
+            assert cursor.fetchall() == []
+            assert read_year_summary(cursor, 1) == [(2019, 150 + 8, 2, 1, 1, 1)]
+        finally:
+            # Leave no summary rows behind for the test user
+            connection.rollback()
+            cursor.close()
+            connection.close()
+
     def test_failed_db_connection(self) -> None:
         """Asserts that errors raised during the connection process due to improper config values are caught."""
         with pytest.raises(DatabaseException):
             db_connect(config={})
 
+    def test_normalize_tick(self) -> None:
+        """Asserts blank CSV values get the same fix-ups the row-by-row insert applied."""
+        pairs = {"style": {"Lead": 4}, "lead_style": {"Redpoint": 3},
+                 "type": {"Sport": 1, "Trad": 2, "Blank": 10}}
+        assert normalize_tick(pairs, test_expected_data[0]) == \
+            ('2018-06-01', 'Sprayathon', 1, 4, 3, 1, None, 9200)
+        assert normalize_tick(pairs, ['0000-00-00', '', 0, '', '', 'Trad, Sport', '', 0]) == \
+            ('1969-12-31', 'None', 1, None, None, '2,1', None, 0)
+        assert normalize_tick(pairs, ['', 'X', 2, 'Lead', '', '', '40', 100])[5] == 10
+
+    def test_insert_batches(self) -> None:
+        """Asserts ticks are sent in executemany chunks no larger than the batch size."""
+        cursor = MockCursor()
+        ticks = [(i,) for i in range(5)]
+        assert insert_batches(cursor, 1234, iter(ticks), batch_size=2) == 5
+        assert [len(batch) for batch in cursor.batches] == [2, 2, 1]
+        assert sum(cursor.batches, []) == ticks
+
+    @staticmethod
+    def route_tick(i: int) -> tuple:
+        return keyed_tick(("2018-06-01", "route %d" % i, 1, None, None, 1, None, 0))
+
+    def test_sync_ticks(self) -> None:
+        """Asserts only new ticks are inserted and only removed ticks are deleted."""
+        kept, repeat, removed, added = [self.route_tick(i) for i in range(4)]
+        cursor = MockCursor(rows=[(1, kept[-1]), (2, repeat[-1]), (3, repeat[-1]), (4, removed[-1])])
+        counts = sync_ticks(cursor, 1234, [kept, repeat, added])
+        assert counts == {"inserted": 1, "deleted": 2}
+        assert cursor.batches == [[added]]
+        assert sorted(cursor.executed[-1][1]) == [2, 4]
+
+    def test_sync_ticks_shared(self) -> None:
+        """Asserts shared storage reads and writes the `ticks` table filtered by user id."""
+        tick = self.route_tick(1)
+        cursor = MockCursor(rows=[(7, "stale")])
+        sync_ticks(cursor, 1234, [tick], shared=True)
+        assert "FROM `ticks` WHERE `user_id` = 1234" in cursor.executed[0][0]
+        assert cursor.executed[1][0].startswith("DELETE FROM `ticks`")
+        assert cursor.batches == [[(1234,) + tick]]
+
+    def test_tick_source(self) -> None:
+        """Asserts the per-user table is selected whole and the shared table by user id."""
+        assert tick_source(1234) == ("`1234`", "TRUE")
+        assert tick_source("1234", shared=True) == ("`ticks`", "`user_id` = 1234")
+
+    def test_sync_ticks_unchanged(self) -> None:
+        """Asserts an unchanged export does not write anything."""
+        ticks = [self.route_tick(i) for i in range(3)]
+        cursor = MockCursor(rows=[(i + 1, tick[-1]) for i, tick in enumerate(ticks)])
+        assert sync_ticks(cursor, 1234, ticks) == {"inserted": 0, "deleted": 0}
+        assert len(cursor.executed) == 1
+        assert cursor.batches == []
+
+
+class TestSQLiteStorage:
+    rows = [['2018-06-01', 'A', 1, 'Lead', 'Redpoint', 'Sport', 40, 6600],
+            ['2018-06-02', 'B', 2, 'Follow', '', 'Trad, Alpine', '', 2500],
+            ['0000-00-00', 'C', '', 'Send', '', 'Boulder', '', 20050]]
+
+    def test_db_load(self, tmp_path) -> None:
+        """Asserts ticks load into, and re-sync against, an embedded SQLite database."""
+        config = {"STORAGE_ENGINE": "sqlite", "SQLITE_PATH": str(tmp_path / "mpv.sqlite3")}
+        assert db_load(1234, self.rows, config=config) == {"inserted": 3, "deleted": 0}
+        assert db_load(1234, self.rows[:2], config=config) == {"inserted": 0, "deleted": 1}
+
+        connection = db_connect(config=config)
+        cursor = connection.cursor()
+        assert dialect(cursor) is SQLITE
+        assert cursor.execute("PRAGMA journal_mode;").fetchone()[0] == "wal"
+        cursor.execute("SELECT YEAR(`date`), `type` + 0 FROM `1234` ORDER BY `id`;")
+        assert cursor.fetchall() == [(2018, 1), (2018, 2)]
+        db_close(cursor, connection)
+
+    def test_summaries(self, tmp_path) -> None:
+        """Asserts db_load keeps the summary tables in step with the stored ticks."""
+        config = {"STORAGE_ENGINE": "sqlite", "SQLITE_PATH": str(tmp_path / "mpv.sqlite3")}
+        db_load(1234, self.rows, config=config)
+        db_load(1234, self.rows[:2], config=config)
+
+        connection = db_connect(config=config)
+        cursor = connection.cursor()
+        summary = get_summary_stats(cursor, 1234)
+        assert summary == (get_year_stats(cursor, 1234), get_all_grade_data(cursor, 1234))
+        assert summary[0]["years"] == [2018]
+        assert summary[0]["height"] == [40 + 150]
+        # Nothing summarized for this user, so the caller falls back to the ticks
+        assert get_summary_stats(cursor, 5678) is None
+        db_close(cursor, connection)
+
+    def test_multi_type(self, tmp_path) -> None:
+        """Asserts a multi-type tick is graded under each of its types but totalled once."""
+        config = {"STORAGE_ENGINE": "sqlite", "SQLITE_PATH": str(tmp_path / "mpv.sqlite3")}
+        db_load(1234, self.rows, config=config)
+        assert type_mask("2,6") == 0b100010
+
+        connection = db_connect(config=config)
+        cursor = connection.cursor()
+        grade_data = get_all_grade_data(cursor, 1234)
+        assert grade_data["Trad"]["grades"] == grade_data["Alpine"]["grades"] == ["5.9+"]
+        assert sorted(get_types(cursor, 1234)) == ["Alpine", "Boulder", "Sport", "Trad"]
+        assert get_grades(cursor, 1234, "Alpine") == ["5.9+"]
+        assert get_year_stats(cursor, 1234)["routes"] == [0, 2]
+        db_close(cursor, connection)
+
+        df = pd.DataFrame(self.rows, columns=test_tick_columns)
+        assert grade_stats(grade_histogram(prepare_ticks(df))) == grade_data
+
+    def test_first_listed_type(self, tmp_path) -> None:
+        """Asserts the yearly totals count a multi-type tick as its first listed type, like pandas."""
+        config = {"STORAGE_ENGINE": "sqlite", "SQLITE_PATH": str(tmp_path / "mpv.sqlite3")}
+        rows = [['2019-01-01', 'D', 1, 'Lead', '', 'Trad, Sport', '', 2500],
+                ['2019-01-02', 'E', 1, '', '', '', '', 2500],
+                ['2019-01-03', 'F', 1, '', '', 'TR, Boulder', '', 2500]]
+        db_load(1234, rows, config=config)
+
+        connection = db_connect(config=config)
+        cursor = connection.cursor()
+        year_stats = get_summary_stats(cursor, 1234)[0]
+        assert year_stats == get_year_stats(cursor, 1234)
+        assert (year_stats["height"], year_stats["routes"]) == ([150 + 0 + 50], [3])
+        db_close(cursor, connection)
+
+        summary = TickSummary()
+        summary.add(pd.DataFrame(rows, columns=test_tick_columns))
+        assert summary.year_stats() == year_stats
+
+    def test_filters(self, tmp_path) -> None:
+        """Asserts filtered stats from the ticks, the summaries and pandas agree."""
+        config = {"STORAGE_ENGINE": "sqlite", "SQLITE_PATH": str(tmp_path / "mpv.sqlite3")}
+        db_load(1234, self.rows, config=config)
+        df = pd.DataFrame(self.rows, columns=test_tick_columns)
+        filters = [TickFilter(type="Alpine"), TickFilter(style="Lead"),
+                   TickFilter(start=datetime.date(2018, 6, 2)),
+                   TickFilter(start=datetime.date(2018, 1, 1), end=datetime.date(2018, 12, 31))]
+
+        connection = db_connect(config=config)
+        cursor = connection.cursor()
+        for tick_filter in filters:
+            stats = (get_year_stats(cursor, 1234, tick_filter=tick_filter),
+                     get_all_grade_data(cursor, 1234, tick_filter=tick_filter))
+            summary = TickSummary(tick_filter)
+            summary.add(df)
+            assert stats == (summary.year_stats(), summary.grade_stats())
+            if tick_filter.whole_years():
+                assert get_summary_stats(cursor, 1234, tick_filter) == stats
+            else:
+                assert get_summary_stats(cursor, 1234, tick_filter) is None
+        assert get_year_stats(cursor, 1234, tick_filter=filters[0])["height"] == [150]
+        assert list(get_all_grade_data(cursor, 1234, tick_filter=filters[1])) == ["Sport"]
+
+        # The date range is answered from the index, not a scan of the table
+        cursor.execute("EXPLAIN QUERY PLAN SELECT * FROM `1234` AS `t` WHERE TRUE"
+                       + filters[2].sql({})[0] + ";", filters[2].sql({})[1])
+        assert "1234_date" in str(cursor.fetchall())
+        db_close(cursor, connection)
+
+
+class TestBulkImport:
+    def test_run_import(self, tmp_path) -> None:
+        """Asserts exports load in parallel, bad files are reported, and a rerun resumes."""
+        exports = tmp_path / "exports"
+        exports.mkdir()
+        for user_id in (101, 102, 103):
+            (exports / ("%d.csv" % user_id)).write_bytes(generate_export(50 + user_id, seed=user_id))
+        (exports / "104.csv").write_bytes(b"not,a,tick,export\n1,2,3,4\n")
+        (exports / "notes.txt").write_text("skipped")
+        settings = {"STORAGE_ENGINE": "sqlite", "SQLITE_PATH": str(tmp_path / "mpv.sqlite3")}
+        state = ImportState(str(tmp_path / "state.sqlite3"))
+        messages = list()
+
+        found = list_exports(str(exports))
+        assert [export.user_id for export in found] == [101, 102, 103, 104]
+        totals = run_import(settings, found, state, processes=2, connections=1, report=messages.append)
+        assert (totals["loaded"], totals["errors"], totals["ticks"]) == (3, 1, 151 + 152 + 153)
+        assert totals["inserted"] == totals["ticks"]
+        assert any("104.csv: error, ValueError" in message for message in messages)
+
+        connection = db_connect(config=settings)
+        cursor = connection.cursor()
+        cursor.execute("SELECT COUNT(*) FROM `102`;")
+        assert cursor.fetchall() == [(152,)]
+        db_close(cursor, connection)
+
+        # Only the failed file and the changed one are loaded again
+        (exports / "101.csv").write_bytes(generate_export(40, seed=101))
+        manifest = tmp_path / "manifest.csv"
+        manifest.write_text("user_id,path\n" + "".join("%d,exports/%d.csv\n" % (i, i) for i in (101, 102, 103, 104)))
+        again = run_import(settings, list_exports(str(manifest)), state, processes=2, connections=2,
+                           report=messages.append)
+        assert (again["skipped"], again["loaded"], again["errors"]) == (2, 1, 1)
+        assert (again["ticks"], again["inserted"], again["deleted"]) == (40, 0, 151 - 40)
+        state.close()
+
+    def test_load_failure(self, tmp_path, monkeypatch) -> None:
+        """Asserts any error loading one user is recorded against that file and the rest still load."""
+        for user_id in (101, 102, 103):
+            (tmp_path / ("%d.csv" % user_id)).write_bytes(generate_export(20, seed=user_id))
+        settings = {"STORAGE_ENGINE": "sqlite", "SQLITE_PATH": str(tmp_path / "mpv.sqlite3")}
+
+        def db_load(userid, data, config=None):
+            if userid == 102:
+                raise KeyError("type")
+            return real_load(userid, data, config=config)
+        real_load = bulk_import.db_load
+        monkeypatch.setattr(bulk_import, "db_load", db_load)
+        state = ImportState(str(tmp_path / "state.sqlite3"))
+        messages = list()
+        totals = run_import(settings, list_exports(str(tmp_path)), state, processes=1, connections=2,
+                            report=messages.append)
+        assert (totals["loaded"], totals["errors"]) == (2, 1)
+        assert any("102.csv: error, KeyError" in message for message in messages)
+
+        monkeypatch.setattr(bulk_import, "db_load", real_load)
+        again = run_import(settings, list_exports(str(tmp_path)), state, processes=1, connections=2,
+                           report=messages.append)
+        assert (again["skipped"], again["loaded"], again["errors"]) == (2, 1, 0)
+        state.close()
+
+
+class ReferenceCursor(MockCursor):
+    """Answers the reference table queries, with a settable version stamp."""
+    def __init__(self, version="a"):
+        super().__init__()
+        self.version = version
+        self.tables = {"style": [(1, "Lead")], "lead_style": [(1, "Onsight")],
+                       "type": [(1, "Sport")], "code": [(1500, "5.9"), (1000, "5.6"), (2000, "5.10a")]}
+
+    def fetchall(self):
+        operation = self.executed[-1][0]
+        if "`meta`" in operation:
+            return [(self.version,)]
+        return self.tables[operation.split("`")[-2]]
+
+
+class TestReferenceData:
+    def test_nearest_codes(self) -> None:
+        """Asserts values map to the closest of the sorted code labels, the lower one on a tie."""
+        reference = ReferenceData({}, [(1500, "5.9"), (1000, "5.6"), (2000, "5.10a")])
+        codes = pd.Series(reference.code_labels, index=reference.code_ids)
+        assert nearest_codes(np.array([1000, 1250, 1251, 500, 9000, 1500]), codes) == \
+            ["5.6", "5.6", "5.9", "5.6", "5.10a", "5.9"]
+
+    def test_cached_until_version_changes(self) -> None:
+        """Asserts the tables are read once and reloaded only on a new version stamp."""
+        clear_reference_data()
+        cursor = ReferenceCursor()
+        first = get_reference_data(cursor, max_age=0)
+        assert first.pairs["style"] == {"Lead": 1}
+        assert get_reference_data(cursor, max_age=0) is first
+        # The version is checked twice, the tables are only read once
+        assert len(cursor.executed) == 6
+        cursor.version = "b"
+        assert get_reference_data(cursor, max_age=60) is first
+        second = get_reference_data(cursor, max_age=0)
+        assert second is not first and second.version == "b"
+        clear_reference_data()
+
+    def test_preload(self, tmp_path, monkeypatch) -> None:
+        """Asserts preloading imports the pipeline and loads the reference data ahead of the workers."""
+        monkeypatch.setattr("gc.freeze", lambda: None, raising=False)
+        clear_reference_data()
+        config = {"STORAGE_ENGINE": "sqlite", "SQLITE_PATH": str(tmp_path / "mpv.sqlite3")}
+        preload(config)
+        assert "app.pipeline" in sys.modules and "bokeh.plotting" in sys.modules
+        cursor = ReferenceCursor()
+        # Served from the cache without reading the tables again
+        assert get_reference_data(cursor).pairs["type"]["Sport"] == 1
+        assert not cursor.executed
+        clear_reference_data()
+
+
+class TestSingleFlight:
+    def run_together(self, flights, func, count=3) -> list:
+        """Run func through each flight in its own thread, all at once."""
+        results = [None] * count
+        errors = [None] * count
+
+        def run(i):
+            try:
+                results[i] = flights[i % len(flights)].run("a@example.com", func, i)
+            except Exception as e:
+                errors[i] = e
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+        for thread in threads:
+            thread.start()
+            time.sleep(0.02)
+        for thread in threads:
+            thread.join()
+        return results, errors
+
+    def test_coalesced(self, tmp_path) -> None:
+        """Asserts concurrent runs for a key, in two workers' runners, share one call."""
+        calls = list()
+
+        def slow(i):
+            calls.append(i)
+            time.sleep(0.3)
+            return {"run": i}
+        # Two runners on one directory stand in for two gunicorn workers
+        flights = [SingleFlight(str(tmp_path)), SingleFlight(str(tmp_path))]
+        results, errors = self.run_together(flights, slow)
+        assert calls == [0]
+        assert results == [{"run": 0}] * 3
+        # A run that starts after the last one finished does the work again
+        assert flights[0].run("a@example.com", slow, 5) == {"run": 5}
+
+    def test_errors_shared(self, tmp_path) -> None:
+        """Asserts runs that waited on a failed run get its error instead of retrying."""
+        calls = list()
+
+        def fail(i):
+            calls.append(i)
+            time.sleep(0.3)
+            raise MPAPIException
+        results, errors = self.run_together([SingleFlight(str(tmp_path))], fail)
+        assert calls == [0]
+        assert all(isinstance(error, MPAPIException) for error in errors)
+
+    def test_results_bounded(self, tmp_path) -> None:
+        """Asserts the shared results are evicted beyond the byte limit."""
+        flight = SingleFlight(str(tmp_path), max_bytes=250000)
+        for i in range(5):
+            flight.run("user-%d@example.com" % (i,), lambda: "x" * 100000)
+        results = tmp_path / "results"
+        assert sum(entry.stat().st_size for entry in results.iterdir()) <= 250000
+        assert len(list(results.iterdir())) == 2
+
+    def test_locks_removed(self, tmp_path) -> None:
+        """Asserts lock files no run holds are removed, while runs for a key still coalesce."""
+        flight = SingleFlight(str(tmp_path))
+        for i in range(5):
+            flight.run("user-%d@example.com" % (i,), lambda: i)
+        # Only the last run's file is left, it was still held when results were evicted
+        assert len(list((tmp_path / "locks").iterdir())) == 1
+
+        calls = list()
+
+        def slow(i):
+            calls.append(i)
+            time.sleep(0.3)
+            return {"run": i}
+        results, errors = self.run_together([flight, SingleFlight(str(tmp_path))], slow)
+        assert calls == [0] and results == [{"run": 0}] * 3
+
+    def test_rate_limit(self, tmp_path) -> None:
+        """Asserts runs past the limit are refused with the time until the next window."""
+        limiter = RateLimiter(str(tmp_path / "limits.sqlite3"), limit=2, window=60)
+        assert limiter.hit("a") is None and limiter.hit("a") is None
+        assert 0 < limiter.hit("a") <= 60
+        assert limiter.hit("b") is None
+
+        config = {"CACHE_DIR": str(tmp_path), "RATE_LIMIT": 1, "TEST_ACCT": "demo@example.com"}
+        rate_limit(config, "a@example.com")
+        with pytest.raises(TooManyRequestsException):
+            rate_limit(config, " A@example.com")
+        # Every demo visitor shares the test account, so it is never limited
+        for _ in range(3):
+            rate_limit(config, "demo@example.com")
+
+
+class TestMountainProjectSession:
+    def test_session_reused(self) -> None:
+        """Asserts handlers in one process share a keep-alive session with retries mounted."""
+        first = MountainProjectHandler(email="test@example.com", api_key="")
+        second = MountainProjectHandler(email="test@example.com", api_key="")
+        assert first._session is second._session
+        retry = first._session.get_adapter("https://www.mountainproject.com").max_retries
+        assert isinstance(retry, JitteredRetry)
+        assert 429 in retry.status_forcelist and 503 in retry.status_forcelist
+
+    def test_jittered_backoff(self) -> None:
+        """Asserts the backoff stays within the exponential bound."""
+        retry = JitteredRetry(total=5, backoff_factor=1).increment(method="GET", url="/").increment(
+            method="GET", url="/")
+        for _ in range(20):
+            assert 0 <= retry.get_backoff_time() <= 2
+
+
+class MockConnection:
+    """Stands in for a MySQL connection handed out by ConnectionPool."""
+    def __init__(self):
+        self.connected = True
+        self.closed = False
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FailingCursor:
+    def execute(self, *args, **kwargs) -> None:
+        raise Error("Lost connection to MySQL server during query")
+
+    def close(self) -> None:
+        pass
+
+
+class FailingConnection(MockConnection):
+    """A connection whose every query fails."""
+    def cursor(self) -> FailingCursor:
+        return FailingCursor()
+
+
+class TestConnectionPool:
+    def test_reuse(self) -> None:
+        """Asserts a returned connection is handed out again instead of opening a new one."""
+        pool = ConnectionPool(MockConnection, size=2, max_overflow=0)
+        first = pool.get()
+        raw = first._connection
+        first.close()
+        second = pool.get()
+        assert second._connection is raw
+        assert pool.stats()["open"] == 1
+        assert pool.stats()["in_use"] == 1
+
+    def test_overflow_and_timeout(self) -> None:
+        """Asserts overflow connections are closed on return and borrowers time out when exhausted."""
+        pool = ConnectionPool(MockConnection, size=1, max_overflow=1, timeout=0.01)
+        first, second = pool.get(), pool.get()
+        with pytest.raises(DatabaseException):
+            pool.get()
+        assert pool.stats()["timeouts"] == 1
+        assert pool.stats()["utilization"] == 1
+        overflow = second._connection
+        first.close()
+        second.close()
+        assert overflow.closed
+        assert pool.stats()["idle"] == 1
+
+    def test_recycle_on_error(self) -> None:
+        """Asserts invalidated and dead connections are replaced rather than reused."""
+        pool = ConnectionPool(MockConnection, size=2, max_overflow=0)
+        failed = pool.get()
+        raw = failed._connection
+        failed.invalidate()
+        failed.close()
+        assert raw.closed
+        dead = pool.get()
+        dead._connection.connected = False
+        dead_raw = dead._connection
+        dead.close()
+        fresh = pool.get()
+        assert fresh._connection is not dead_raw
+        assert pool.stats()["recycled"] == 2
+
+    def test_query_failure_returns_connection(self, monkeypatch) -> None:
+        """Asserts a failed stats query discards its pooled connection and raises DatabaseException."""
+        pool = ConnectionPool(FailingConnection, size=1, max_overflow=1, timeout=0.01)
+        monkeypatch.setattr(pipeline, "db_connect", lambda config: pool.get())
+        for _ in range(pool.size + pool.max_overflow + 1):
+            with pytest.raises(DatabaseException):
+                query_stats({}, 1)
+        assert pool.stats()["open"] == 0 and pool.stats()["in_use"] == 0
+        assert pool.stats()["recycled"] == 3
+
+
+class TestLoadHarness:
+    def test_fake_server(self) -> None:
+        """Asserts the app's handler fetches users and tick exports from the fake Mountain Project server."""
+        server = start_server(users=5, min_ticks=20, max_ticks=40)
+        try:
+            api = MountainProjectHandler(email="climber@example.com", api_key="key", base_url=server.url,
+                                         session=get_session(retries=0))
+            api.fetch_user()
+            user = api.parse_user_data()
+            assert user["mp_id"] == server.user_id("Climber@example.com ")
+            assert user["name"] == "user-%d" % (user["mp_id"],)
+            api.fetch_tick_list()
+            assert len(api.parse_tick_list()["data"]) == server.tick_count(user["mp_id"])
+            assert server.counts == {"get_user": 1, "tick_export": 1}
+
+            server.error_rate = 1
+            with pytest.raises(MPAPIException):
+                api.fetch_user()
+                api.parse_user_data()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_percentile(self) -> None:
+        """Asserts nearest-rank percentiles of sorted latencies."""
+        latencies = [float(i) for i in range(1, 101)]
+        assert [percentile(latencies, p) for p in (0.5, 0.95, 0.99, 1)] == [50, 95, 99, 100]
+        assert percentile([0.2], 0.99) == 0.2
+        assert percentile([], 0.5) == 0
+
 
 class MockResponse:
-    """Mocks a requests.get() response, and feeds mock data to functions requiring external API data."""
+    """Mocks a Session.get() response, and feeds mock data to functions requiring external API data."""
     @staticmethod
     def json() -> Dict:
         return test_user_data
@@ -51,13 +630,13 @@ class TestMountainProjectHandler:
             email="test_email@example.com", api_key='test_key', dev_env=False)
 
         cls.monkeypatch = MonkeyPatch()
-        # Apply monkeypatch to requests.get()
-        cls.monkeypatch.setattr(requests, "get", cls.mock_get)
+        # Apply monkeypatch to requests.Session.get()
+        cls.monkeypatch.setattr(requests.Session, "get", cls.mock_get)
 
     @staticmethod
     def mock_get(*args, **kwargs) -> MockResponse:
         """
-        When requests.get() is called, return our MockResponse object.
+        When Session.get() is called, return our MockResponse object.
         This includes access to all MockResponse methods and properties.
         """
         return MockResponse()
@@ -78,7 +657,28 @@ class TestMountainProjectHandler:
         data = self.api_prod.parse_tick_list()
 
         assert data["status"] == 0
-        assert data["data"] == test_expected_data
+        assert batch_keys(data["data"]) == row_keys(test_expected_data)
+
+    def test_mp_api_tick_batches(self) -> None:
+        """Confirms streaming the tick list in chunks yields the same rows as a full parse."""
+        self.api_prod.fetch_tick_list()
+        chunks = list(self.api_prod.iter_tick_batches(chunksize=1))
+        assert len(chunks) == 1
+        assert batch_keys(chunks) == row_keys(test_expected_data)
+
+    def test_mp_raw_stream_tick_batches(self) -> None:
+        """Confirms a live response is parsed from its raw stream rather than its content."""
+        header, row = test_ticks_response.split(b"\n", 1)
+
+        class StreamingResponse:
+            raw = io.BytesIO(header + b"\n" + row * 5)
+
+        api = MountainProjectHandler(email="test@example.com", api_key="")
+        api.api_data.update({"tick_list": StreamingResponse()})
+        chunks = list(api.iter_tick_batches(chunksize=2))
+        assert StreamingResponse.raw.decode_content
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+        assert batch_keys(chunks) == row_keys(test_expected_data * 5)
 
     def test_mp_dev_env_user_data(self) -> None:
         """dev_env=True, so simply assert returned data matches _DEV_USER_DATA"""
@@ -101,4 +701,4 @@ class TestMountainProjectHandler:
         """Ensure when dev_env=True that the processed test_ticks.csv file is the output of parse_tick_list()"""
         data = self.api_dev.parse_tick_list(dev_env=True)
         assert data["status"] == 0
-        assert data["data"] == test_processed_csv
+        assert batch_keys(data["data"]) == row_keys(test_processed_csv)
@@ -0,0 +1,19 @@
+"""Gunicorn settings for the Docker image.
+
+By default the app is loaded once in the master and warmed up by
+app.startup.preload() before the workers fork, so they share pandas, Bokeh
+and the reference data copy-on-write. Set MPV_PRELOAD=0 to have each worker
+load the app itself, importing the heavy modules on first use.
+"""
+
+import os
+
+bind = os.environ.get("MPV_BIND", "0.0.0.0:5000")
+workers = int(os.environ.get("MPV_WORKERS", 3))
+preload_app = os.environ.get("MPV_PRELOAD", "1") != "0"
+
+
+def when_ready(server):
+    if server.cfg.preload_app:
+        from app.startup import preload
+        preload(server.app.wsgi().config)